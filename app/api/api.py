@@ -7,10 +7,12 @@ from app.api.endpoints import (
     # Import existing endpoints
     analytics,
     annotations,
+    audit,
     auth,
     components,
     customers,
     documentation,
+    event_stream,
     entity_media,
     enums,
     inventory,
@@ -50,12 +52,14 @@ api_router = APIRouter()
 # Include existing routers
 api_router.include_router(analytics.router, prefix="/analytics", tags=["Analytics"])
 api_router.include_router(annotations.router, prefix="/annotations", tags=["Annotations"])
+api_router.include_router(audit.router, prefix="/audit", tags=["Audit"])
 api_router.include_router(auth.router, prefix="/auth", tags=["Authentication"])
 api_router.include_router(components.router, prefix="/components", tags=["Components"])
 api_router.include_router(customers.router, prefix="/customers", tags=["Customers"])
 api_router.include_router(documentation.router, prefix="/documentation", tags=["Documentation"])
 api_router.include_router(entity_media.router, prefix="/entity-media", tags=["Entity Media"])
 api_router.include_router(enums.router, prefix="/enums", tags=["Enums"])
+api_router.include_router(event_stream.router, prefix="/events", tags=["Events"])
 api_router.include_router(inventory.router, prefix="/inventory", tags=["Inventory"])
 api_router.include_router(materials.router, prefix="/materials", tags=["Legacy Materials"])
 api_router.include_router(media_assets.router, prefix="/media-assets", tags=["Media Assets"])
@@ -10,17 +10,24 @@ import logging
 from datetime import datetime, timezone  # Use timezone aware datetime
 from typing import Generator, Optional, Any, Dict, List, Union
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import jwt, JWTError
 from pydantic import ValidationError, BaseModel
 from sqlalchemy.orm import Session
 from app.services.settings_service import SettingsService
+from app.services.audit_service import AuditService
+from app.services.audit_writer import AuditWriter
+from app.services.entity_audit import USER_ID_KEY as ENTITY_AUDIT_USER_ID_KEY
+from app.services.cache_service import CacheService
+from app.services.role_service import RoleService
 
 # --- App Imports ---
 # Core components
 from app.core import security
+from app.core.app_container import AppContainer
 from app.core.config import settings
+from app.core.events import EventBus, global_event_bus
 from app.core.exceptions import (
     EntityNotFoundException,
 )
@@ -35,6 +42,7 @@ from app.db.models.user import User
 from app.schemas.token import TokenPayload
 
 # --- Services ---
+from app.services.principal_cache import PrincipalCache, restore_principal, snapshot_principal
 from app.services.user_service import UserService
 from app.services.inventory_service import InventoryService
 from app.services.product_service import ProductService
@@ -87,7 +95,9 @@ def get_security_context(current_user: Optional[User] = Depends(get_current_acti
 # --- User Authentication & Authorization Dependencies ---
 
 def get_current_user(
-        db: Session = Depends(get_db), token: str = Depends(oauth2_scheme)
+        db: Session = Depends(get_db),
+        token: str = Depends(oauth2_scheme),
+        request: Request = None,
 ) -> User:
     """Get current authenticated user from JWT token."""
     credentials_exception = HTTPException(
@@ -113,14 +123,34 @@ def get_current_user(
         raise credentials_exception from e
 
     try:
+        user_id = int(token_data.sub)
+        if request is not None:
+            # Lets the API access audit attribute the request
+            request.state.user_id = user_id
+        # Lets the entity audit attribute the request's changes
+        db.info[ENTITY_AUDIT_USER_ID_KEY] = user_id
+
+        # Hot clients are served from the principal cache without a query
+        principal_cache = PrincipalCache.get_instance()
+        token_id = token_data.jti or token_data.iat or token_data.exp
+        if principal_cache.enabled:
+            snapshot = principal_cache.get(user_id, token_id)
+            if snapshot is not None:
+                return restore_principal(db, snapshot)
+        generation = principal_cache.generation
+
         user_repo = UserRepository(session=db)
         user_service = UserService(session=db, repository=user_repo)
-        user_id = int(token_data.sub)
         user = user_service.get_by_id(user_id)
         if user is None:
             logger.warning(f"User with ID {user_id} from token not found in DB.")
             raise credentials_exception
+
+        if principal_cache.enabled:
+            principal_cache.put(user_id, token_id, snapshot_principal(user), generation)
         return user
+    except HTTPException:
+        raise
     except ValueError:
         logger.error(f"Invalid user ID format in token 'sub': {token_data.sub}")
         raise credentials_exception
@@ -185,12 +215,46 @@ class PermissionsChecker:
         logger.debug(f"Permission granted for user {current_user.id}.")
 
 
+# --- Application-Lifetime Dependencies ---
+
+def get_cache_service() -> Optional[CacheService]:
+    """Provides the application's shared CacheService (None before startup)."""
+    container = AppContainer.current()
+    return container.cache_service if container else None
+
+
+def get_event_bus() -> EventBus:
+    """Provides the application's shared EventBus."""
+    container = AppContainer.current()
+    return container.event_bus if container else global_event_bus
+
+
+def get_audit_writer() -> AuditWriter:
+    """Provides the application's write-behind audit writer."""
+    container = AppContainer.current()
+    if container and container.audit_writer:
+        return container.audit_writer
+    return AuditWriter.get_instance()
+
+
 # --- Service Dependency Injectors ---
 
 def get_settings_service(db: Session = Depends(get_db)) -> SettingsService:
     """Provides an instance of SettingsService."""
     logger.debug("Providing SettingsService instance.")
-    return SettingsService(db)
+    return SettingsService(db, cache_service=get_cache_service())
+
+
+def get_audit_service(db: Session = Depends(get_db)) -> AuditService:
+    """Provides an instance of AuditService that records through the audit writer."""
+    logger.debug("Providing AuditService instance.")
+    return AuditService(db, audit_writer=get_audit_writer())
+
+
+def get_role_service(db: Session = Depends(get_db)) -> RoleService:
+    """Provides an instance of RoleService."""
+    logger.debug("Providing RoleService instance.")
+    return RoleService(db, event_bus=get_event_bus(), cache_service=get_cache_service())
 
 
 def get_enum_service(db: Session = Depends(get_db)) -> EnumService:
@@ -221,7 +285,9 @@ def get_property_definition_service(
     return PropertyDefinitionService(
         session=db,
         repository=property_repo,
-        enum_service=enum_service
+        enum_service=enum_service,
+        event_bus=get_event_bus(),
+        cache_service=get_cache_service()
     )
 
 
@@ -235,7 +301,9 @@ def get_material_type_service(
     return MaterialTypeService(
         session=db,
         repository=material_type_repo,
-        property_repository=property_service.repository
+        property_repository=property_service.repository,
+        event_bus=get_event_bus(),
+        cache_service=get_cache_service()
     )
 
 
@@ -255,7 +323,9 @@ def get_dynamic_material_service(
         property_service=property_service,
         material_type_service=material_type_service,
         security_context=security_context,
-        settings_service=settings_service
+        settings_service=settings_service,
+        event_bus=get_event_bus(),
+        cache_service=get_cache_service()
     )
 
 
@@ -268,6 +338,8 @@ def get_pattern_service(db: Session = Depends(get_db)) -> PatternService:
         session=db,
         repository=pattern_repo,
         template_repository=template_repo,
+        event_bus=get_event_bus(),
+        cache_service=get_cache_service(),
     )
 
 
@@ -296,6 +368,8 @@ def get_inventory_service(db: Session = Depends(get_db)) -> InventoryService:
         session=db,
         repository=inv_repo,
         transaction_repository=inv_tx_repo,
+        event_bus=get_event_bus(),
+        cache_service=get_cache_service(),
     )
 
 
@@ -319,7 +393,9 @@ def get_product_service(
         inventory_service=inventory_service,
         pattern_service=pattern_service,
         material_service=material_service,
-        localization_service=localization_service
+        localization_service=localization_service,
+        event_bus=get_event_bus(),
+        cache_service=get_cache_service()
     )
 
 
@@ -444,5 +520,7 @@ def get_tool_service(
     logger.debug("Providing ToolService instance with localization.")
     return ToolService(
         session=db,
-        localization_service=localization_service
+        localization_service=localization_service,
+        event_bus=get_event_bus(),
+        cache_service=get_cache_service()
     )
\ No newline at end of file
@@ -11,17 +11,23 @@ from app.schemas.analytics import (
     DashboardSummary,
     FinancialSummary,
     RevenueSummary,
+    SalesMetrics,
+    RevenueSeries,
     InventoryStockLevels,
     SupplierPerformance,
     CustomerLifetimeValue,
     PricingCalculatorInputs,  # Import new input schema
     PricingCalculatorResults,  # Import new output schema
+    BulkPricingInputs,
+    BulkPricingResults,
 )
 from app.services.dashboard_service import DashboardService
 from app.services.report_service import ReportService
 from app.services.sale_service import SaleService
 from app.services.inventory_service import InventoryService
+from app.services.pricing_service import PricingService
 from app.services.customer_service import CustomerService
+from app.core.exceptions import ValidationException
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -87,7 +93,8 @@ def get_financial_summary(
             detail="Could not retrieve financial summary data.",
         )
 
-    return report.get("data", {})
+    data = report["data"]
+    return {**data, "timestamp": data.get("generated_at")}
 
 
 @router.get(
@@ -130,7 +137,69 @@ def get_revenue_analysis(
             detail="Could not retrieve revenue analysis data.",
         )
 
-    return report.get("data", {})
+    data = report["data"]
+    return {**data, "timestamp": data.get("generated_at")}
+
+
+@router.get(
+    "/sales/metrics",
+    response_model=SalesMetrics,
+    summary="Get Sales Metrics",
+    description="Retrieves revenue, order and status totals for sales in a date range.",
+)
+def get_sales_metrics(
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    session: Session = Depends(deps.get_db),
+    current_user: dict = Depends(deps.get_current_user),
+):
+    """
+    Get sales metrics, aggregated by the database, for a date range.
+    """
+    start_date_obj = datetime.fromisoformat(start_date) if start_date else None
+    end_date_obj = datetime.fromisoformat(end_date) if end_date else None
+
+    service = SaleService(session)
+    return service.get_sales_metrics(start_date_obj, end_date_obj)
+
+
+@router.get(
+    "/sales/revenue",
+    response_model=RevenueSeries,
+    summary="Get Revenue Time Series",
+    description="Retrieves sales revenue bucketed by day, week, month or year.",
+)
+def get_revenue_series(
+    period: str = Query("month", description="Bucket size: day, week, month or year."),
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    session: Session = Depends(deps.get_db),
+    current_user: dict = Depends(deps.get_current_user),
+):
+    """
+    Get a revenue time series; the cost grows with the number of buckets.
+    """
+    end_date_obj = datetime.fromisoformat(end_date) if end_date else datetime.now()
+    start_date_obj = (
+        datetime.fromisoformat(start_date)
+        if start_date
+        else end_date_obj - timedelta(days=365)
+    )
+
+    service = SaleService(session)
+    try:
+        data = service.get_revenue_by_period(period, start_date_obj, end_date_obj)
+    except ValidationException as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)
+        )
+
+    return {
+        "period": period,
+        "start_date": start_date_obj.isoformat(),
+        "end_date": end_date_obj.isoformat(),
+        "data": data,
+    }
 
 
 @router.post(
@@ -233,6 +302,51 @@ def calculate_pricing(
         )
 
 
+@router.post(
+    "/financial/bulk-pricing",
+    response_model=BulkPricingResults,
+    summary="Reprice the Product Catalog",
+    description="Calculates break-even price, suggested price and margin for every product, optionally under what-if cost changes.",
+)
+def bulk_pricing(
+    inputs: BulkPricingInputs,
+    session: Session = Depends(deps.get_db),
+    current_user: dict = Depends(deps.get_current_user),
+):
+    """
+    Price the whole catalog with the pricing calculator's formulas.
+
+    Each product's material, hardware, labor and overhead costs come from the
+    database; the other inputs apply to every product. **costChanges** such
+    as {"material": 8} shows the effect of 8% higher material costs.
+    """
+    service = PricingService(session)
+    try:
+        result = service.reprice_catalog(
+            parameters={
+                "overhead": inputs.overhead,
+                "target_margin": inputs.targetMargin,
+                "shipping_cost": inputs.shippingCost,
+                "packaging_cost": inputs.packagingCost,
+                "platform_fees": inputs.platformFees,
+                "marketing_cost": inputs.marketingCost,
+            },
+            cost_changes=inputs.costChanges,
+            product_type=inputs.productType,
+            limit=inputs.limit,
+        )
+    except ValidationException as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)
+        )
+
+    return {
+        "costChanges": result["cost_changes"],
+        "summary": result["summary"],
+        "products": result["products"],
+    }
+
+
 @router.get(
     "/inventory/stock-levels",
     response_model=InventoryStockLevels,
@@ -350,12 +464,14 @@ def get_customer_lifetime_value(
 
     # Ensure analytics dictionary has expected keys or provide defaults
     return {
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": analytics.get("generated_at", datetime.now().isoformat()),
         "summary": {
             "total_customers": analytics.get("total_customers", 0),
             "active_customers": analytics.get("active_customers", 0),
             "new_customers_30d": analytics.get("new_customers_30d", 0),
+            "customers_with_orders": analytics.get("customers_with_orders", 0),
             "average_lifetime_value": analytics.get("average_lifetime_value", 0.0),
+            "rfm_segments": analytics.get("rfm_segments", {}),
         },
         "top_customers": analytics.get("top_customers", []),
         "customer_distribution": analytics.get("customer_distribution", {}),
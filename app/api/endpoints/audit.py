@@ -0,0 +1,44 @@
+# File: app/api/endpoints/audit.py
+"""
+Audit trail API endpoints.
+
+Reads the entity history recorded by the audit writer.
+"""
+
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from fastapi import APIRouter, Depends, Query
+
+from app.api import deps
+from app.db.models.user import User
+from app.services.audit_service import AuditService
+
+router = APIRouter()
+
+
+@router.get("/{entity_type}/{entity_id}", response_model=List[Dict[str, Any]])
+def get_entity_history(
+        *,
+        audit_service: AuditService = Depends(deps.get_audit_service),
+        current_user: User = Depends(deps.get_current_active_superuser),
+        entity_type: str,
+        entity_id: str,
+        start_date: Optional[datetime] = Query(None, description="Only changes from this time"),
+        end_date: Optional[datetime] = Query(None, description="Only changes until this time"),
+        action: Optional[List[str]] = Query(None, description="Only these actions (create, update, delete)"),
+        limit: int = Query(100, ge=1, le=1000),
+) -> List[Dict[str, Any]]:
+    """
+    Get the recorded changes of an entity, oldest first.
+
+    ``entity_type`` is the model class name, e.g. ``Tool``.
+    """
+    return audit_service.get_entity_history(
+        entity_type,
+        entity_id,
+        start_date=start_date,
+        end_date=end_date,
+        actions=action,
+        limit=limit,
+    )
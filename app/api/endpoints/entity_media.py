@@ -22,7 +22,7 @@ logger = logging.getLogger(__name__)
 @router.get(
     "/entity/{entity_type}/{entity_id}", response_model=List[EntityMediaResponse]
 )
-async def get_entity_media(
+def get_entity_media(
     entity_type: str = Path(
         ..., description="The type of entity (material, tool, supplier, etc.)"
     ),
@@ -50,7 +50,7 @@ async def get_entity_media(
 
 
 @router.get("/media-asset/{media_asset_id}", response_model=List[EntityMediaResponse])
-async def get_entity_media_by_asset(
+def get_entity_media_by_asset(
     media_asset_id: str = Path(..., description="The ID of the media asset"),
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_active_user),
@@ -79,7 +79,7 @@ async def get_entity_media_by_asset(
 @router.get(
     "/thumbnail/{entity_type}/{entity_id}", response_model=Optional[EntityMediaResponse]
 )
-async def get_entity_thumbnail(
+def get_entity_thumbnail(
     entity_type: str = Path(
         ..., description="The type of entity (material, tool, supplier, etc.)"
     ),
@@ -117,7 +117,7 @@ async def get_entity_thumbnail(
 @router.post(
     "", response_model=EntityMediaResponse, status_code=status.HTTP_201_CREATED
 )
-async def create_entity_media(
+def create_entity_media(
     entity_media: EntityMediaCreate,
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_active_user),
@@ -156,7 +156,7 @@ from fastapi import Response  # Add this import at the top
 
 
 @router.delete("/{id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_entity_media(
+def delete_entity_media(
     id: str = Path(..., description="The ID of the entity media association"),
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_active_user),
@@ -187,7 +187,7 @@ async def delete_entity_media(
 
 
 @router.delete("/entity", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_entity_media_by_entity(
+def delete_entity_media_by_entity(
     entity_type: str = Query(
         ..., description="The type of entity (material, tool, supplier, etc.)"
     ),
@@ -1,7 +1,7 @@
 # app/api/endpoints/enums.py
 import logging
 from typing import Dict, List, Any, Optional
-from fastapi import APIRouter, Depends, Query, HTTPException, status, Body
+from fastapi import APIRouter, Depends, Query, HTTPException, status, Body, Request, Response
 from sqlalchemy.orm import Session
 
 # --- Project Imports ---
@@ -11,6 +11,7 @@ from app.api.deps import ( # Updated imports
     get_enum_service # <-- Import the service injector
 )
 from app.services.enum_service import EnumService # For type hinting
+from app.api.file_responses import etag_matches
 from app.db.models.user import User
 from app.db.models.dynamic_enum import EnumType # For direct check
 
@@ -58,14 +59,26 @@ def get_enum_types_endpoint(
     description="Retrieves all values for all enum types, keyed by system_name, with translations for the specified locale."
 )
 def get_all_enums(
+    request: Request,
+    response: Response,
     locale: str = Query("en", description="Locale code for translations (e.g., 'en', 'de')"),
     enum_service: EnumService = Depends(get_enum_service), # Inject Service
     current_user: User = Depends(get_current_active_user),
 ):
-    """API endpoint to get all enum values for a specific locale."""
-    logger.info(f"User '{current_user.email}' requested all enum values for locale '{locale}'.")
-    all_enums = enum_service.get_all_enums(locale)
-    logger.info(f"Returning values for {len(all_enums)} enum types for locale '{locale}'.")
+    """
+    API endpoint to get all enum values for a specific locale.
+
+    Sends an ETag; clients revalidating with If-None-Match get 304 Not Modified
+    while the catalog is unchanged.
+    """
+    logger.debug(f"User '{current_user.email}' requested all enum values for locale '{locale}'.")
+    all_enums, etag = enum_service.get_enum_catalog(locale)
+
+    headers = {"ETag": f'"{etag}"', "Cache-Control": "private, no-cache", "Vary": "Authorization"}
+    if etag_matches(request.headers.get("if-none-match"), headers["ETag"]):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    response.headers.update(headers)
     return all_enums
 
 @router.get(
@@ -0,0 +1,75 @@
+# File: app/api/endpoints/event_stream.py
+"""
+Server-Sent Events push channel.
+
+Streams workflow execution progress and notifications to the client as they
+happen, replacing polling of execution progress and notification lists.
+"""
+
+import logging
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from app.api import deps
+from app.core.exceptions import BusinessRuleException, EntityNotFoundException
+from app.db.models.user import User
+from app.services.event_stream import EventStreamHub
+from app.services.workflow_execution_service import WorkflowExecutionService
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+
+@router.get("/stream")
+async def stream_events(
+        *,
+        db: Session = Depends(deps.get_db),
+        current_user: User = Depends(deps.get_current_active_user),
+        execution_service: WorkflowExecutionService = Depends(deps.get_workflow_execution_service),
+        execution_id: Optional[List[int]] = Query(
+            None, description="Workflow executions to follow, besides the user's own events"
+        ),
+        last_event_id: Optional[str] = Header(
+            None, alias="Last-Event-ID", description="ID of the last event received, to resume"
+        ),
+) -> StreamingResponse:
+    """
+    Stream events for the current user as Server-Sent Events.
+
+    Sends the user's workflow execution events and notifications, plus the
+    events of any execution passed as ``execution_id``. Browsers' EventSource
+    reconnects by itself and sends Last-Event-ID to resume; a ``reset`` event
+    means the missed events are no longer available and the client should
+    refetch its state once. An ``overflow`` event ends a stream that fell
+    behind; reconnecting resumes it.
+    """
+    execution_ids = sorted(set(execution_id or []))
+    for requested_id in execution_ids:
+        try:
+            await run_in_threadpool(execution_service.get_execution, requested_id, current_user.id)
+        except EntityNotFoundException:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Execution with ID {requested_id} not found"
+            )
+        except BusinessRuleException as e:
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e))
+
+    user_id = current_user.id
+    # The stream may stay open for hours; don't hold a pooled connection for it
+    await run_in_threadpool(db.close)
+
+    hub = EventStreamHub.get_instance()
+    client = hub.connect(user_id, execution_ids, last_event_id=last_event_id)
+    logger.info(f"User {user_id} opened an event stream (executions: {execution_ids or 'none'})")
+
+    return StreamingResponse(
+        hub.stream(client),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
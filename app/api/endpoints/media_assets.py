@@ -43,14 +43,17 @@ from app.core.exceptions import (
     EntityNotFoundException,
     BusinessRuleException,
     FileStorageException,
+    StorageException,
 )
+from app.services.image_derivative_service import DERIVATIVE_SIZES
+from app.api.file_responses import conditional_file_response
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
 
 @router.get("/", response_model=MediaAssetListResponse)
-async def list_media_assets(
+def list_media_assets(
     *,
     db: Session = Depends(get_db),
     current_user: Any = Depends(get_current_active_user),
@@ -146,7 +149,7 @@ async def list_media_assets(
 @router.post(
     "/", response_model=MediaAssetResponse, status_code=status.HTTP_201_CREATED
 )
-async def create_media_asset(
+def create_media_asset(
     *,
     db: Session = Depends(get_db),
     current_user: Any = Depends(get_current_active_user),
@@ -191,8 +194,9 @@ import os
 
 
 @router.get("/{asset_id}/preview")
-async def preview_media_asset(
+def preview_media_asset(
     *,
+    request: Request,
     db: Session = Depends(get_db),
     current_user: Any = Depends(get_current_active_user),
     asset_id: str = Path(...),
@@ -213,23 +217,21 @@ async def preview_media_asset(
 
         logger.info(f"Preview request for: {asset_id}, path: {asset.storage_location}")
 
-        # Use service to get file path (handles finding it)
-        # This assumes get_file_content returns a path or raises an error
+        # Resolve the file through the path index
         try:
-            file_path = media_asset_service.find_file_path(
-                asset_id
-            )  # Add find_file_path to service
-            if not file_path or not os.path.exists(file_path):
+            file_path = media_asset_service.find_file_path(asset_id, asset)
+            if not file_path:
                 raise FileNotFoundError("File not found on server.")
 
             logger.info(f"Serving preview from: {file_path}")
-            return FileResponse(
-                path=file_path,
+            return conditional_file_response(
+                request,
+                file_path,
                 media_type=asset.content_type,
+                etag=asset.checksum,
+                filename=asset.file_name,
                 # Use inline for preview
-                headers={
-                    "Content-Disposition": f'inline; filename="{asset.file_name}"'
-                },
+                disposition="inline",
             )
         except (EntityNotFoundException, FileStorageException, FileNotFoundError) as e:
             logger.error(f"File not found for preview {asset_id}: {e}")
@@ -242,106 +244,70 @@ async def preview_media_asset(
         raise HTTPException(status_code=500, detail=str(e))
 
 
-# Helper function for placeholder image colors
-def hsv_to_rgb(h, s, v):
-    import colorsys
-
-    r, g, b = colorsys.hsv_to_rgb(h, s, v)
-    return (int(r * 255), int(g * 255), int(b * 255))
-
-
-@router.get("/{asset_id}/download")
-async def download_media_asset(
+@router.get("/{asset_id}/thumbnail")
+def get_media_asset_thumbnail(
     *,
+    request: Request,
     db: Session = Depends(get_db),
     current_user: Any = Depends(get_current_active_user),
     asset_id: str = Path(...),
+    size: str = Query(
+        "thumb", description=f"Rendition size: {', '.join(DERIVATIVE_SIZES)}"
+    ),
 ):
-    """Download a media asset file."""
-    try:
-        # Get asset
-        service_factory = ServiceFactory(db)
-        media_asset_service = service_factory.get_media_asset_service()
-        asset = media_asset_service.get_media_asset(asset_id)
-
-        if not asset:
-            raise HTTPException(status_code=404, detail="Asset not found")
-
-        # Try the exact same approach that works in the public endpoint
-        storage_path = asset.storage_location
-        alt_path = f"media_assets/{asset_id}_{asset.file_name}"
-
-        if os.path.exists(storage_path):
-            logger.info(f"Serving file from storage_location: {storage_path}")
-            return FileResponse(
-                path=storage_path,
-                media_type=asset.content_type,
-                filename=asset.file_name,
-                headers={
-                    "Content-Disposition": f'attachment; filename="{asset.file_name}"'
-                },
-            )
-        elif os.path.exists(alt_path):
-            logger.info(f"Serving file from alt path: {alt_path}")
-            return FileResponse(
-                path=alt_path,
-                media_type=asset.content_type,
-                filename=asset.file_name,
-                headers={
-                    "Content-Disposition": f'attachment; filename="{asset.file_name}"'
-                },
-            )
-        else:
-            logger.error(
-                f"File not found for {asset_id} at {storage_path} or {alt_path}"
-            )
-            raise HTTPException(status_code=404, detail="File not found")
-
-    except Exception as e:
-        logger.error(f"Download error: {str(e)}", exc_info=True)
-        raise HTTPException(status_code=500, detail=str(e))
+    """
+    Serve a resized WebP rendition of an image asset.
 
+    Renditions are normally rendered in the background after upload; a size
+    that does not exist yet is generated on first request and cached on disk.
+    Decoding and resizing is CPU/disk bound, so this is a plain function that
+    FastAPI runs in its worker threads.
+    """
+    if size not in DERIVATIVE_SIZES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown size '{size}'. Available sizes: {', '.join(DERIVATIVE_SIZES)}",
+        )
 
-@router.get("/{asset_id}/download")
-async def download_media_asset(
-    asset_id: str,
-    request: Request,
-    db: Session = Depends(get_db),
-    current_user: Any = Depends(get_current_active_user),
-):
-    """Download endpoint with fallback to static file serving"""
     try:
-        # Get asset info
         service_factory = ServiceFactory(db)
         media_asset_service = service_factory.get_media_asset_service()
-        asset = media_asset_service.get_media_asset(asset_id)
 
+        asset = media_asset_service.get_media_asset(asset_id)
         if not asset:
-            raise HTTPException(status_code=404, detail="Asset not found")
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Media asset with ID {asset_id} not found",
+            )
+        derivative_path = media_asset_service.get_image_derivative(asset_id, size)
 
-        # For now, create a test file we know will work
-        test_file = f"media_assets/download_{asset_id}.txt"
-        os.makedirs("media_assets", exist_ok=True)
+        return conditional_file_response(
+            request,
+            derivative_path,
+            media_type="image/webp",
+            etag=f"{asset.checksum}-{size}" if asset.checksum else None,
+        )
+    except EntityNotFoundException as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except BusinessRuleException as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except StorageException as e:
+        logger.error(f"Thumbnail error for {asset_id}: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e)
+        )
 
-        with open(test_file, "w") as f:
-            f.write(f"This is a download file for asset {asset_id}")
 
-        # Return test file directly
-        return FileResponse(
-            path=test_file,
-            media_type="text/plain",
-            filename=f"download_{asset.file_name}",
-            headers={
-                "Content-Disposition": f"attachment; filename=download_{asset.file_name}"
-            },
-        )
-    except Exception as e:
-        logger.error(f"Download error: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
+# Helper function for placeholder image colors
+def hsv_to_rgb(h, s, v):
+    import colorsys
+
+    r, g, b = colorsys.hsv_to_rgb(h, s, v)
+    return (int(r * 255), int(g * 255), int(b * 255))
 
 
 @router.get("/{asset_id}/direct-file")
-async def direct_file_access(
+def direct_file_access(
     *,
     db: Session = Depends(get_db),
     current_user: Any = Depends(get_current_active_user),
@@ -382,7 +348,7 @@ async def direct_file_access(
 @router.post(
     "/upload", response_model=MediaAssetResponse, status_code=status.HTTP_201_CREATED
 )
-async def upload_media_asset(
+def upload_media_asset(
     *,
     db: Session = Depends(get_db),
     current_user: Any = Depends(get_current_active_user),
@@ -392,6 +358,9 @@ async def upload_media_asset(
 ):
     """
     Upload a new media asset file.
+
+    Reading, hashing, writing and the DB transaction all block, so this is
+    a plain function that FastAPI runs in its worker threads.
     """
     try:
         # Get services
@@ -402,7 +371,7 @@ async def upload_media_asset(
         try:
             # Set a safe limit to prevent memory issues
             MAX_FILE_SIZE = 100 * 1024 * 1024  # 100 MB
-            file_content = await file.read(MAX_FILE_SIZE + 1)
+            file_content = file.file.read(MAX_FILE_SIZE + 1)
 
             # Check if file size exceeds limit
             if len(file_content) > MAX_FILE_SIZE:
@@ -446,7 +415,7 @@ async def upload_media_asset(
 
 
 @router.get("/{asset_id}", response_model=MediaAssetResponse)
-async def get_media_asset(
+def get_media_asset(
     *,
     db: Session = Depends(get_db),
     current_user: Any = Depends(get_current_active_user),
@@ -480,8 +449,9 @@ async def get_media_asset(
 
 
 @router.get("/{asset_id}/download")
-async def download_media_asset(
+def download_media_asset(
     *,
+    request: Request,
     db: Session = Depends(get_db),
     current_user: Any = Depends(get_current_active_user),
     asset_id: str = Path(...),
@@ -504,34 +474,34 @@ async def download_media_asset(
 
         # Use service to get file path
         try:
-            file_path = media_asset_service.find_file_path(
-                asset_id
-            )  # Add find_file_path to service
-            if not file_path or not os.path.exists(file_path):
+            file_path = media_asset_service.find_file_path(asset_id, asset)
+            if not file_path:
                 raise FileNotFoundError("File not found on server.")
 
             logger.info(f"Serving download from: {file_path}")
             # Serve the file as an attachment
-            return FileResponse(
+            return conditional_file_response(
+                request,
                 file_path,
                 media_type=asset.content_type,
+                etag=asset.checksum,
                 filename=asset.file_name,
                 # Use attachment for download
-                headers={
-                    "Content-Disposition": f'attachment; filename="{asset.file_name}"'
-                },
+                disposition="attachment",
             )
         except (EntityNotFoundException, FileStorageException, FileNotFoundError) as e:
             logger.error(f"File not found for download {asset_id}: {e}")
             raise HTTPException(status_code=404, detail="File not found")
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Download error for {asset_id}: {str(e)}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.put("/{asset_id}", response_model=MediaAssetResponse)
-async def update_media_asset(
+def update_media_asset(
     *,
     db: Session = Depends(get_db),
     current_user: Any = Depends(get_current_active_user),
@@ -573,7 +543,7 @@ async def update_media_asset(
 
 
 @router.post("/{asset_id}/upload", response_model=MediaAssetResponse)
-async def update_media_asset_file(
+def update_media_asset_file(
     *,
     db: Session = Depends(get_db),
     current_user: Any = Depends(get_current_active_user),
@@ -582,6 +552,9 @@ async def update_media_asset_file(
 ):
     """
     Update a media asset's file content.
+
+    Reading, hashing, writing and the DB transaction all block, so this is
+    a plain function that FastAPI runs in its worker threads.
     """
     try:
         # Get services
@@ -592,7 +565,7 @@ async def update_media_asset_file(
         try:
             # Set a safe limit to prevent memory issues
             MAX_FILE_SIZE = 100 * 1024 * 1024  # 100 MB
-            file_content = await file.read(MAX_FILE_SIZE + 1)
+            file_content = file.file.read(MAX_FILE_SIZE + 1)
 
             # Check if file size exceeds limit
             if len(file_content) > MAX_FILE_SIZE:
@@ -634,7 +607,7 @@ async def update_media_asset_file(
 
 
 @router.delete("/{asset_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_media_asset(
+def delete_media_asset(
     *,
     db: Session = Depends(get_db),
     current_user: Any = Depends(get_current_active_user),
@@ -693,7 +666,7 @@ async def delete_media_asset(
 
 
 @router.post("/{asset_id}/tags", response_model=MediaAssetResponse)
-async def add_tags_to_asset(
+def add_tags_to_asset(
     *,
     db: Session = Depends(get_db),
     current_user: Any = Depends(get_current_active_user),
@@ -724,7 +697,7 @@ async def add_tags_to_asset(
 
 
 @router.delete("/{asset_id}/tags", response_model=MediaAssetResponse)
-async def remove_tags_from_asset(
+def remove_tags_from_asset(
     *,
     db: Session = Depends(get_db),
     current_user: Any = Depends(get_current_active_user),
@@ -758,7 +731,7 @@ async def remove_tags_from_asset(
 
 # Add a memory monitoring endpoint as recommended by the optimization guide
 @router.get("/system/memory", include_in_schema=False)
-async def check_memory_usage(
+def check_memory_usage(
     *,
     current_user: Any = Depends(get_current_active_user),
 ):
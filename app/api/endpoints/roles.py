@@ -11,7 +11,7 @@ from typing import Any, List, Optional
 from fastapi import APIRouter, Depends, HTTPException, Query, Path, status, Body
 from sqlalchemy.orm import Session
 
-from app.api.deps import get_current_active_user, get_current_active_superuser
+from app.api.deps import get_current_active_user, get_current_active_superuser, get_role_service
 from app.db.session import get_db
 from app.schemas.role import (
     Role,
@@ -20,7 +20,7 @@ from app.schemas.role import (
     Permission,
     RoleAssignmentCreate,
 )
-from app.services.role_service import RoleService, PermissionService
+from app.services.role_service import PermissionService
 from app.core.exceptions import EntityNotFoundException, BusinessRuleException
 
 router = APIRouter()
@@ -40,7 +40,7 @@ def list_roles(
     """
     Retrieve roles with optional filtering and pagination.
     """
-    role_service = RoleService(db)
+    role_service = get_role_service(db)
     filters = {}
 
     if search:
@@ -61,7 +61,7 @@ def create_role(
 
     This endpoint requires superuser privileges.
     """
-    role_service = RoleService(db)
+    role_service = get_role_service(db)
     try:
         return role_service.create_role(
             name=role_in.name,
@@ -82,7 +82,7 @@ def get_role(
     """
     Get detailed information about a specific role.
     """
-    role_service = RoleService(db)
+    role_service = get_role_service(db)
     try:
         return role_service.get_role_with_permissions(role_id)
     except EntityNotFoundException:
@@ -105,7 +105,7 @@ def update_role(
 
     This endpoint requires superuser privileges.
     """
-    role_service = RoleService(db)
+    role_service = get_role_service(db)
     try:
         return role_service.update_role(role_id, role_in.dict(exclude_unset=True))
     except EntityNotFoundException:
@@ -129,7 +129,7 @@ def delete_role(
 
     This endpoint requires superuser privileges.
     """
-    role_service = RoleService(db)
+    role_service = get_role_service(db)
     try:
         role_service.delete_role(role_id)
     except EntityNotFoundException:
@@ -167,7 +167,7 @@ def assign_role_to_user(
 
     This endpoint requires superuser privileges.
     """
-    role_service = RoleService(db)
+    role_service = get_role_service(db)
     try:
         role_service.assign_role_to_user(assignment.user_id, assignment.role_id)
     except EntityNotFoundException:
@@ -192,7 +192,7 @@ def remove_role_from_user(
 
     This endpoint requires superuser privileges.
     """
-    role_service = RoleService(db)
+    role_service = get_role_service(db)
     role_service.remove_role_from_user(user_id, role_id)
 
 
@@ -213,5 +213,5 @@ def get_user_roles(
             detail="Not enough permissions",
         )
 
-    role_service = RoleService(db)
+    role_service = get_role_service(db)
     return role_service.get_user_roles(user_id)
@@ -40,7 +40,7 @@ logger = logging.getLogger(__name__)
 
 
 @router.get("/", response_model=TagListResponse)
-async def list_tags(
+def list_tags(
     *,
     db: Session = Depends(get_db),
     current_user: Any = Depends(get_current_active_user),
@@ -128,7 +128,7 @@ async def list_tags(
 
 
 @router.post("/", response_model=TagResponse, status_code=status.HTTP_201_CREATED)
-async def create_tag(
+def create_tag(
     *,
     db: Session = Depends(get_db),
     current_user: Any = Depends(get_current_active_user),
@@ -164,7 +164,7 @@ async def create_tag(
 
 
 @router.get("/{tag_id}", response_model=TagResponse)
-async def get_tag(
+def get_tag(
     *,
     db: Session = Depends(get_db),
     current_user: Any = Depends(get_current_active_user),
@@ -198,7 +198,7 @@ async def get_tag(
 
 
 @router.put("/{tag_id}", response_model=TagResponse)
-async def update_tag(
+def update_tag(
     *,
     db: Session = Depends(get_db),
     current_user: Any = Depends(get_current_active_user),
@@ -239,7 +239,7 @@ async def update_tag(
 
 
 @router.delete("/{tag_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_tag(
+def delete_tag(
     *,
     db: Session = Depends(get_db),
     current_user: Any = Depends(get_current_active_user),
@@ -271,7 +271,7 @@ async def delete_tag(
 
 
 @router.get("/{tag_id}/assets")
-async def get_tag_assets(
+def get_tag_assets(
     *,
     db: Session = Depends(get_db),
     current_user: Any = Depends(get_current_active_user),
@@ -325,7 +325,7 @@ async def get_tag_assets(
 
 
 @router.get("/{tag_id}/count", response_model=int)
-async def get_asset_count_by_tag(
+def get_asset_count_by_tag(
     *,
     db: Session = Depends(get_db),
     current_user: Any = Depends(get_current_active_user),
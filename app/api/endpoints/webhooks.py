@@ -32,7 +32,7 @@ router = APIRouter()
 
 
 @router.post("/{platform}/{shop_identifier}", response_model=WebhookResponse)
-async def process_webhook(
+def process_webhook(
     platform: str = Path(..., description="Platform identifier (shopify, etsy, etc.)"),
     shop_identifier: str = Path(..., description="Shop identifier or subdomain"),
     payload: Dict[str, Any] = Body(...),
@@ -169,7 +169,7 @@ async def process_webhook(
 
 
 @router.post("/test/{platform}/{shop_identifier}", response_model=WebhookResponse)
-async def test_webhook(
+def test_webhook(
     platform: str = Path(..., description="Platform identifier (shopify, etsy, etc.)"),
     shop_identifier: str = Path(..., description="Shop identifier or subdomain"),
     event_type: str = Body(..., embed=True),
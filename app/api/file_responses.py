@@ -0,0 +1,78 @@
+# File: app/api/file_responses.py
+"""
+Helpers for serving stored files over HTTP.
+
+Wraps Starlette's FileResponse (which already streams from disk and answers
+``Range``/``If-Range`` requests with 206 partial content) with strong ETags
+taken from stored content checksums, ``If-None-Match`` handling and
+``Cache-Control`` headers.
+"""
+
+from typing import Optional
+
+from fastapi import Request, Response, status
+from fastapi.responses import FileResponse
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Check an If-None-Match header against an ETag.
+
+    Uses the weak comparison RFC 9110 prescribes for If-None-Match.
+
+    Args:
+        if_none_match: Raw If-None-Match header value
+        etag: Quoted ETag of the current representation
+
+    Returns:
+        True if the client's cached copy is current
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (tag.strip() for tag in if_none_match.split(","))
+    return any(tag.removeprefix("W/") == etag for tag in candidates)
+
+
+def conditional_file_response(
+    request: Request,
+    path: str,
+    media_type: Optional[str] = None,
+    etag: Optional[str] = None,
+    filename: Optional[str] = None,
+    disposition: str = "inline",
+    max_age: int = 0,
+) -> Response:
+    """
+    Serve a file with ETag, conditional GET, range and cache headers.
+
+    Args:
+        request: Incoming request (for If-None-Match)
+        path: Path of the file on disk
+        media_type: Content type to send
+        etag: Unquoted strong validator, normally the content checksum;
+            Starlette's mtime/size ETag is used when omitted
+        filename: Filename for the Content-Disposition header
+        disposition: 'inline' or 'attachment'
+        max_age: Seconds the client may reuse its copy without revalidating;
+            0 means revalidate every time (cheap thanks to the ETag)
+
+    Returns:
+        A 304 response if the client's copy is current, otherwise a
+        FileResponse that honours Range requests
+    """
+    headers = {
+        "Cache-Control": f"private, max-age={max_age}" if max_age else "private, no-cache",
+    }
+
+    if etag:
+        quoted_etag = f'"{etag}"'
+        headers["ETag"] = quoted_etag
+        if etag_matches(request.headers.get("if-none-match"), quoted_etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    if filename:
+        headers["Content-Disposition"] = f'{disposition}; filename="{filename}"'
+
+    return FileResponse(path=path, media_type=media_type, headers=headers)
@@ -0,0 +1,117 @@
+# File: app/core/app_container.py
+"""
+Application-lifetime dependencies.
+
+Services are built per request around that request's database session, but
+the collaborators that hold state worth sharing between requests - the cache,
+the event bus, the file store location, the metrics registry, the outbox
+dispatcher and the audit writer - should
+exist once per process. The container is initialized when the application
+starts and shut down when it stops; ServiceFactory and the API dependencies
+take their shared collaborators from it.
+"""
+
+import logging
+import os
+import threading
+from typing import Optional
+
+from app.core.config import settings
+from app.core.events import EventBus, global_event_bus
+from app.core.metrics import MetricsRegistry
+from app.services.cache_service import CacheService
+
+logger = logging.getLogger(__name__)
+
+
+class AppContainer:
+    """
+    Holds the collaborators shared by every request.
+
+    Outside the running application (scripts, tests) no container is
+    initialized and services fall back to building their own collaborators.
+    """
+
+    _instance: Optional["AppContainer"] = None
+    _instance_lock = threading.Lock()
+
+    def __init__(
+            self,
+            cache_service: CacheService,
+            event_bus: EventBus,
+            file_store_path: str,
+            metrics: MetricsRegistry,
+    ):
+        """
+        Initialize the container.
+
+        Args:
+            cache_service: Cache shared by all requests
+            event_bus: Event bus shared by all requests
+            file_store_path: Root directory of the file store
+            metrics: Process-wide metrics registry
+        """
+        self.cache_service = cache_service
+        self.event_bus = event_bus
+        self.file_store_path = file_store_path
+        self.metrics = metrics
+        self.outbox_dispatcher = None
+        self.audit_writer = None
+
+    @classmethod
+    def initialize(cls) -> "AppContainer":
+        """
+        Build the container from settings, if it has not been built yet.
+
+        Returns:
+            The process-wide container
+        """
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls(
+                    cache_service=CacheService(
+                        config={
+                            "max_size": settings.CACHE_MAX_SIZE,
+                            "default_ttl": settings.CACHE_DEFAULT_TTL,
+                            "redis_config": {
+                                "host": settings.CACHE_REDIS_HOST,
+                                "port": settings.CACHE_REDIS_PORT,
+                            },
+                        },
+                        backend_type=settings.CACHE_BACKEND,
+                    ),
+                    event_bus=global_event_bus,
+                    file_store_path=os.path.abspath(settings.MEDIA_ASSETS_BASE_PATH),
+                    metrics=MetricsRegistry.get_instance(),
+                )
+                os.makedirs(cls._instance.file_store_path, exist_ok=True)
+                logger.info(
+                    f"Application container initialized "
+                    f"({cls._instance.cache_service.backend_type} cache)"
+                )
+            return cls._instance
+
+    @classmethod
+    def current(cls) -> Optional["AppContainer"]:
+        """
+        Get the container of the running application.
+
+        Returns:
+            The container, or None if the application has not started
+        """
+        return cls._instance
+
+    @classmethod
+    def shutdown(cls) -> None:
+        """Stop the background workers, drop cached data and release the container."""
+        with cls._instance_lock:
+            container, cls._instance = cls._instance, None
+        if container is None:
+            return
+        stats = container.cache_service.get_stats()
+        logger.info(f"Application container shut down (cache hit rate {stats.get('hit_rate', 0):.1%})")
+        if container.outbox_dispatcher is not None:
+            container.outbox_dispatcher.stop()
+        if container.audit_writer is not None:
+            container.audit_writer.stop()
+        container.cache_service.clear()
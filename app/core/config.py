@@ -81,6 +81,41 @@ class Settings(BaseSettings):
     TRACK_MEMORY_USAGE: bool = True  # Enable memory tracking
     MEMORY_WARNING_THRESHOLD_MB: int = 200  # Early warning
     MEMORY_CRITICAL_THRESHOLD_MB: int = 400  # Critical threshold
+    THREADPOOL_MAX_WORKERS: int = 40  # Threads for sync handlers and run_in_threadpool
+
+    # Application cache (one instance per process, shared by all requests)
+    CACHE_BACKEND: str = "memory"  # memory or redis
+    CACHE_MAX_SIZE: int = 10000  # Entries kept by the memory backend
+    CACHE_DEFAULT_TTL: int = 300  # Seconds, for entries cached without an explicit TTL
+    CACHE_REDIS_HOST: str = "localhost"
+    CACHE_REDIS_PORT: int = 6379
+    PRINCIPAL_CACHE_TTL_SECONDS: int = 30  # Authenticated-user cache lifetime (0 disables)
+
+    # Event outbox delivery
+    OUTBOX_ENABLED: bool = True
+    OUTBOX_WORKERS: int = 4  # Threads delivering events in parallel
+    OUTBOX_BATCH_SIZE: int = 100  # Events claimed per poll
+    OUTBOX_POLL_SECONDS: float = 1.0  # Wait between polls when nothing is due
+    OUTBOX_MAX_ATTEMPTS: int = 10  # Failed deliveries before an event is marked dead
+    OUTBOX_BACKOFF_SECONDS: float = 1.0  # First retry delay; doubles per attempt
+    OUTBOX_MAX_BACKOFF_SECONDS: float = 300.0
+
+    # Event stream (Server-Sent Events push channel)
+    EVENT_STREAM_REPLAY_SIZE: int = 10000  # Recent events kept for resuming clients
+    EVENT_STREAM_CLIENT_QUEUE_SIZE: int = 256  # Events a client may lag before it is disconnected
+    EVENT_STREAM_HEARTBEAT_SECONDS: float = 15.0
+
+    # Audit trail (write-behind buffer)
+    AUDIT_BUFFER_SIZE: int = 50000  # Records buffered before the overflow policy applies
+    AUDIT_BATCH_SIZE: int = 500  # Rows per insert
+    AUDIT_FLUSH_SECONDS: float = 1.0  # Maximum time a record waits in the buffer
+    AUDIT_OVERFLOW_POLICY: str = "drop_oldest"  # drop_oldest, drop_newest or block
+    AUDIT_API_ACCESS: bool = False  # Record every API request in the audit trail
+    AUDIT_ENTITY_CHANGES: bool = True  # Record every committed entity insert, update and delete
+
+    # Inventory Ledger
+    INVENTORY_SNAPSHOT_INTERVAL_HOURS: int = 24  # Stock snapshot period (0 disables)
+    INVENTORY_SNAPSHOT_DAILY_DAYS: int = 90  # Days of daily snapshots kept; older ones are monthly
 
     # SQLCipher
     USE_SQLCIPHER: bool = True
@@ -89,6 +124,11 @@ class Settings(BaseSettings):
         "8f353342c59546db88dd352f883e440e0a413d34149bbdced9b4fc0c84028d9e"
     )
 
+    # File Storage
+    MEDIA_ASSETS_BASE_PATH: str = "media_assets"  # Root of the content-addressed file store
+    FILE_SCRUB_INTERVAL_HOURS: int = 24  # Background integrity scrub period (0 disables)
+    MEDIA_FILE_CHECK_INTERVAL_MINUTES: int = 60  # Missing media file check period (0 disables)
+
     # Key Management
     KEY_MANAGEMENT_METHOD: str = "file"
     KEY_FILE_PATH: str = "/etc/hidesync/dev_db.key"
@@ -153,6 +193,12 @@ class Settings(BaseSettings):
     TRANSLATION_CACHE_TTL: int = 3600  # Cache TTL for translations in seconds (1 hour)
     MAX_TRANSLATION_LENGTH: int = 5000  # Maximum length for translated text content
     MAX_BULK_TRANSLATION_SIZE: int = 100  # Max translations in single bulk operation
+    TRANSLATION_CATALOG_ENABLED: bool = True  # Serve translations from the in-process catalog
+    TRANSLATION_CATALOG_POLL_SECONDS: int = 5  # How often workers check for translation changes
+
+    # Explicit fallback chains per locale, e.g. {"de-AT": ["de-AT", "de", "en"]}.
+    # Locales without an entry fall back through their parent locales to DEFAULT_LOCALE.
+    TRANSLATION_FALLBACK_CHAINS: Dict[str, List[str]] = {}
 
     # Translation Validation Settings
     VALIDATE_ENTITY_EXISTS: bool = True  # Validate entities exist before creating translations
@@ -12,13 +12,16 @@ from typing import (
     Generic,
     Type,
     Coroutine,
+    NamedTuple,
+    Tuple,
 )
 from collections import defaultdict
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field, fields, asdict
 from datetime import datetime, date
 import uuid
 import asyncio
 import logging
+import threading
 import json
 from fastapi import FastAPI
 from dataclasses import dataclass
@@ -57,6 +60,48 @@ class DomainEvent:
                 result[key] = value.isoformat()
         return result
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "DomainEvent":
+        """
+        Rebuild an event from the output of to_dict().
+
+        Only the timestamp is converted back to a datetime; other date fields
+        of subclasses stay ISO strings.
+
+        Args:
+            data: Dictionary produced by to_dict()
+
+        Returns:
+            Event instance
+        """
+        names = {f.name for f in fields(cls)}
+        values = {key: value for key, value in data.items() if key in names}
+        if isinstance(values.get("timestamp"), str):
+            try:
+                values["timestamp"] = datetime.fromisoformat(values["timestamp"])
+            except ValueError:
+                pass
+        return cls(**values)
+
+
+def get_event_class(event_type: str) -> Optional[Type[DomainEvent]]:
+    """
+    Find a DomainEvent subclass by class name.
+
+    Args:
+        event_type: Name of the event class
+
+    Returns:
+        The event class, or None if no loaded class has that name
+    """
+    pending = [DomainEvent]
+    while pending:
+        event_class = pending.pop()
+        if event_class.__name__ == event_type:
+            return event_class
+        pending.extend(event_class.__subclasses__())
+    return None
+
 
 # --- Core Entity Event Definitions ---
 @dataclass(eq=False)
@@ -137,6 +182,18 @@ class ToolReturned(DomainEvent):
     user_id: Optional[int] = None
 
 
+# --- Material Management Event Definitions ---
+@dataclass(eq=False)
+class MaterialStockChanged(DomainEvent):
+    """Event fired when the stock of a dynamic material is adjusted."""
+    material_id: int = 0;
+    previous_quantity: float = 0.0;
+    new_quantity: float = 0.0;
+    change: float = 0.0;
+    reason: str = "";
+    user_id: Optional[int] = None
+
+
 # --- Workflow Management Event Definitions ---
 @dataclass(eq=False)
 class WorkflowCreatedEvent(DomainEvent):
@@ -354,6 +411,29 @@ class WorkflowProgressUpdateEvent(DomainEvent):
 
 
 # --- Event Bus Class ---
+class DispatchPlan(NamedTuple):
+    """
+    Handlers that receive one event class, split by how they are called.
+
+    Plans are built on first publish of an event class from the handlers
+    subscribed to that class and to every class in its MRO, and are reused
+    until the subscriptions change.
+    """
+
+    sync_handlers: Tuple[Callable, ...]
+    async_handlers: Tuple[Callable, ...]
+    sync_batch_handlers: Tuple[Callable, ...]
+    async_batch_handlers: Tuple[Callable, ...]
+
+    @property
+    def is_empty(self) -> bool:
+        """Whether no handler receives the event class."""
+        return not (
+            self.sync_handlers or self.async_handlers
+            or self.sync_batch_handlers or self.async_batch_handlers
+        )
+
+
 class EventBus:
     """
     Central event bus for domain events with both synchronous and asynchronous support.
@@ -361,8 +441,9 @@ class EventBus:
     Features:
     - Thread-safe event publishing and subscription management
     - Support for both sync and async event handlers
+    - Handlers subscribed to an event class also receive its subclasses
+    - Batch publishing, with handlers that can opt into receiving lists
     - Automatic error handling and logging
-    - Type-safe event subscription
     - Background task management for async operations
 
     Usage:
@@ -373,11 +454,63 @@ class EventBus:
         # Asynchronous event handling
         await global_event_bus.subscribe_async(WorkflowStartedEvent, handle_workflow_started_async)
         await global_event_bus.publish_async(WorkflowStartedEvent(execution_id=456))
+
+        # Batches: list handlers get every matching event of a batch in one call
+        global_event_bus.subscribe(EntityUpdatedEvent, index_entities, batch=True)
+        global_event_bus.publish_batch(events)
     """
 
     def __init__(self):
         self.subscribers: Dict[str, List[Callable]] = defaultdict(list)
-        self._lock = asyncio.Lock()
+        self._batch_handlers: Dict[str, Set[Callable]] = defaultdict(set)
+        # Dispatch plans by event class, rebuilt lazily after subscription changes
+        self._plans: Dict[type, DispatchPlan] = {}
+        # Guards subscriptions and plans; held only briefly, so it is safe to
+        # take from both sync code and the event loop
+        self._lock = threading.RLock()
+
+    # --- Dispatch plans ---
+
+    def get_plan(self, event_class: Type[DomainEvent]) -> DispatchPlan:
+        """
+        Get the dispatch plan of an event class.
+
+        Args:
+            event_class: Class of the events to dispatch
+
+        Returns:
+            Handlers receiving events of that class
+        """
+        plan = self._plans.get(event_class)
+        if plan is None:
+            with self._lock:
+                plan = self._plans.get(event_class)
+                if plan is None:
+                    plan = self._build_plan(event_class)
+                    self._plans[event_class] = plan
+        return plan
+
+    def _build_plan(self, event_class: type) -> DispatchPlan:
+        """Collect the handlers of an event class and its bases, most specific first."""
+        seen: Set[Callable] = set()
+        groups: Tuple[List[Callable], ...] = ([], [], [], [])
+        for base in event_class.__mro__:
+            if base is object:
+                continue
+            batch = self._batch_handlers.get(base.__name__, ())
+            for handler in self.subscribers.get(base.__name__, ()):
+                if handler in seen:
+                    continue
+                seen.add(handler)
+                index = (2 if handler in batch else 0) + (1 if asyncio.iscoroutinefunction(handler) else 0)
+                groups[index].append(handler)
+        return DispatchPlan(*(tuple(group) for group in groups))
+
+    def _invalidate_plans(self) -> None:
+        """Drop the dispatch plans after a subscription change."""
+        self._plans = {}
+
+    # --- Publishing ---
 
     def publish(self, event: DomainEvent) -> None:
         """
@@ -392,19 +525,86 @@ class EventBus:
         """
         event_type = type(event).__name__
         logger.debug(f"Publishing sync event {event_type} ID {event.event_id}")
-        subscribers_copy = list(self.subscribers.get(event_type, []))
-        for handler in subscribers_copy:
+        plan = self.get_plan(type(event))
+        for handler in plan.sync_handlers:
             self._call_handler_sync(handler, event, event_type)
+        for handler in plan.sync_batch_handlers:
+            self._call_handler_sync(handler, [event], event_type)
+        for handler in plan.async_handlers + plan.async_batch_handlers:
+            logger.warning(f"Sync call to async handler {handler.__name__} for {event_type}. Use publish_async.")
+
+    def publish_batch(self, events: List[DomainEvent]) -> None:
+        """
+        Publish many events synchronously.
+
+        Per-event handlers are called for each event in order; batch handlers
+        are called once with all the events they receive, in order.
+
+        Args:
+            events: The domain events to publish
+        """
+        batches: Dict[Callable, List[DomainEvent]] = {}
+        for event in events:
+            event_type = type(event).__name__
+            plan = self.get_plan(type(event))
+            for handler in plan.sync_handlers:
+                self._call_handler_sync(handler, event, event_type)
+            for handler in plan.sync_batch_handlers:
+                batches.setdefault(handler, []).append(event)
+            for handler in plan.async_handlers + plan.async_batch_handlers:
+                logger.warning(f"Sync call to async handler {handler.__name__} for {event_type}. Use publish_async.")
+        for handler, handler_events in batches.items():
+            self._call_handler_sync(handler, handler_events, "batch")
+        logger.debug(f"Published batch of {len(events)} events")
+
+    def enqueue(self, session: Any, event: DomainEvent, ordering_key: Optional[str] = None) -> None:
+        """
+        Add an event to the outbox in the caller's transaction.
+
+        Unlike publish(), handlers do not run now: the event is committed (or
+        rolled back) together with the change that raised it, and the outbox
+        dispatcher delivers it afterwards, at least once.
 
-    def _call_handler_sync(self, handler: Callable, event: DomainEvent, event_type: str):
+        Args:
+            session: Database session of the change raising the event
+            event: The domain event to deliver
+            ordering_key: Optional key; events with the same key are delivered
+                in the order they were enqueued (e.g. "workflow_execution:42")
+        """
+        from app.db.models.event_outbox import OutboxEvent
+
+        session.add(OutboxEvent(
+            event_id=event.event_id,
+            event_type=type(event).__name__,
+            payload=json.dumps(event.to_dict(), default=str),
+            ordering_key=ordering_key,
+        ))
+        logger.debug(f"Enqueued event {type(event).__name__} ID {event.event_id} in outbox")
+
+    def get_handlers(self, event_type: Union[str, Type[DomainEvent]]) -> List[Callable]:
+        """
+        Get the handlers subscribed directly to an event type.
+
+        Use get_plan() for the handlers that receive an event class,
+        including those subscribed to its bases.
+
+        Args:
+            event_type: Event class or event type name string
+
+        Returns:
+            Copy of the subscribed handlers, in subscription order
+        """
+        event_type_name = event_type.__name__ if isinstance(event_type, type) else str(event_type)
+        with self._lock:
+            return list(self.subscribers.get(event_type_name, []))
+
+    def _call_handler_sync(self, handler: Callable, event: Any, event_type: str):
         """Handle synchronous event handler execution with error management."""
         try:
-            if asyncio.iscoroutinefunction(handler):
-                logger.warning(f"Sync call to async handler {handler.__name__} for {event_type}. Use publish_async.")
-            else:
-                handler(event)
+            handler(event)
         except Exception as e:
-            logger.error(f"Error in sync handler {handler.__name__} for {event_type} ID {event.event_id}: {e}",
+            event_id = getattr(event, "event_id", f"batch of {len(event)}")
+            logger.error(f"Error in sync handler {handler.__name__} for {event_type} ID {event_id}: {e}",
                          exc_info=True)
 
     async def publish_async(self, event: DomainEvent) -> None:
@@ -418,26 +618,52 @@ class EventBus:
             - Sync handlers are automatically wrapped in asyncio.to_thread()
             - All tasks are gathered with exception handling
         """
-        event_type = type(event).__name__
-        logger.debug(f"Publishing async event {event_type} ID {event.event_id}")
-        async with self._lock:
-            subscribers_copy = list(self.subscribers.get(event_type, []))
-        tasks = [task for handler in subscribers_copy if
-                 (task := self._create_handler_task(handler, event, event_type))]
-        if tasks:
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-            self._log_handler_errors(results, subscribers_copy, event_type, event.event_id)
+        await self.publish_batch_async([event])
 
-    def _create_handler_task(self, handler: Callable, event: DomainEvent, event_type: str) -> Optional[asyncio.Task]:
-        """Create an asyncio task for event handler execution."""
-        try:
-            if asyncio.iscoroutinefunction(handler):
-                return asyncio.create_task(handler(event))
+    async def publish_batch_async(self, events: List[DomainEvent]) -> None:
+        """
+        Publish many events asynchronously.
+
+        Args:
+            events: The domain events to publish
+
+        Note:
+            - Sync handlers run in one thread per handler, not per event
+            - Batch handlers are called once with all the events they receive
+        """
+        calls: Dict[Callable, List[DomainEvent]] = {}
+        batch: Set[Callable] = set()
+        for event in events:
+            plan = self.get_plan(type(event))
+            for handler in plan.sync_handlers + plan.async_handlers:
+                calls.setdefault(handler, []).append(event)
+            for handler in plan.sync_batch_handlers + plan.async_batch_handlers:
+                calls.setdefault(handler, []).append(event)
+                batch.add(handler)
+        if not calls:
+            return
+        event_type = type(events[0]).__name__ if len(events) == 1 else "batch"
+        logger.debug(f"Publishing async {event_type} of {len(events)} events")
+
+        handlers = list(calls)
+        results = await asyncio.gather(
+            *(self._run_handler(handler, calls[handler], handler in batch) for handler in handlers),
+            return_exceptions=True,
+        )
+        self._log_handler_errors(results, handlers, event_type, events[0].event_id)
+
+    async def _run_handler(self, handler: Callable, events: List[DomainEvent], batch: bool) -> None:
+        """Run one handler on its events, off the event loop if it is synchronous."""
+        if asyncio.iscoroutinefunction(handler):
+            if batch:
+                await handler(events)
             else:
-                return asyncio.create_task(asyncio.to_thread(handler, event))
-        except Exception as e:
-            logger.error(f"Error creating task for handler {handler.__name__} for {event_type}: {e}", exc_info=True)
-            return None
+                for event in events:
+                    await handler(event)
+        elif batch:
+            await asyncio.to_thread(handler, events)
+        else:
+            await asyncio.to_thread(lambda: [handler(event) for event in events])
 
     def _log_handler_errors(self, results: List[Any], subscribers: List[Callable], event_type: str, event_id: str):
         """Log any errors that occurred during async handler execution."""
@@ -447,30 +673,47 @@ class EventBus:
                 logger.error(f"Error in handler '{handler_name}' for {event_type} ID {event_id}: {result}",
                              exc_info=result)
 
-    async def subscribe_async(self, event_type: Union[str, Type[DomainEvent]], handler: Callable) -> None:
+    # --- Subscriptions ---
+
+    async def subscribe_async(
+            self,
+            event_type: Union[str, Type[DomainEvent]],
+            handler: Callable,
+            batch: bool = False
+    ) -> None:
         """
         Subscribe to an event type asynchronously.
 
         Args:
             event_type: Event class or event type name string
             handler: Callable to handle the event (sync or async)
+            batch: Call the handler with a list of events instead of one event
         """
-        event_type_name = event_type.__name__ if isinstance(event_type, type) else str(event_type)
-        async with self._lock:
-            self.subscribers[event_type_name].append(handler)
-        logger.debug(f"Subscribed async handler {getattr(handler, '__name__', repr(handler))} to {event_type_name}")
-
-    def subscribe(self, event_type: Union[str, Type[DomainEvent]], handler: Callable) -> None:
+        self.subscribe(event_type, handler, batch=batch)
+
+    def subscribe(
+            self,
+            event_type: Union[str, Type[DomainEvent]],
+            handler: Callable,
+            batch: bool = False
+    ) -> None:
         """
         Subscribe to an event type synchronously.
 
+        The handler also receives events of subclasses of the event type.
+
         Args:
             event_type: Event class or event type name string
             handler: Callable to handle the event (sync or async)
+            batch: Call the handler with a list of events instead of one event
         """
         event_type_name = event_type.__name__ if isinstance(event_type, type) else str(event_type)
-        self.subscribers[event_type_name].append(handler)
-        logger.debug(f"Subscribed sync handler {getattr(handler, '__name__', repr(handler))} to {event_type_name}")
+        with self._lock:
+            self.subscribers[event_type_name].append(handler)
+            if batch:
+                self._batch_handlers[event_type_name].add(handler)
+            self._invalidate_plans()
+        logger.debug(f"Subscribed handler {getattr(handler, '__name__', repr(handler))} to {event_type_name}")
 
     async def unsubscribe_async(self, event_type: Union[str, Type[DomainEvent]], handler: Callable) -> bool:
         """
@@ -483,18 +726,7 @@ class EventBus:
         Returns:
             True if handler was found and removed, False otherwise
         """
-        event_type_name = event_type.__name__ if isinstance(event_type, type) else str(event_type)
-        unsubscribed = False
-        async with self._lock:
-            if event_type_name in self.subscribers:
-                try:
-                    self.subscribers[event_type_name].remove(handler)
-                    unsubscribed = True
-                except ValueError:
-                    pass
-        if unsubscribed:
-            logger.debug(f"Unsubscribed handler {getattr(handler, '__name__', repr(handler))} from {event_type_name}")
-        return unsubscribed
+        return self.unsubscribe(event_type, handler)
 
     def unsubscribe(self, event_type: Union[str, Type[DomainEvent]], handler: Callable) -> bool:
         """
@@ -508,26 +740,28 @@ class EventBus:
             True if handler was found and removed, False otherwise
         """
         event_type_name = event_type.__name__ if isinstance(event_type, type) else str(event_type)
-        if event_type_name in self.subscribers:
+        with self._lock:
             try:
-                self.subscribers[event_type_name].remove(handler)
-                logger.debug(
-                    f"Unsubscribed handler {getattr(handler, '__name__', repr(handler))} from {event_type_name}")
-                return True
+                self.subscribers.get(event_type_name, []).remove(handler)
             except ValueError:
                 return False
-        return False
+            if handler not in self.subscribers[event_type_name]:
+                self._batch_handlers.get(event_type_name, set()).discard(handler)
+            self._invalidate_plans()
+        logger.debug(f"Unsubscribed handler {getattr(handler, '__name__', repr(handler))} from {event_type_name}")
+        return True
 
     async def clear_subscriptions_async(self) -> None:
         """Clear all event subscriptions asynchronously."""
-        async with self._lock:
-            self.subscribers.clear()
-        logger.debug("Cleared all async event subscriptions")
+        self.clear_subscriptions()
 
     def clear_subscriptions(self) -> None:
         """Clear all event subscriptions synchronously."""
-        self.subscribers.clear()
-        logger.debug("Cleared all sync event subscriptions")
+        with self._lock:
+            self.subscribers.clear()
+            self._batch_handlers.clear()
+            self._invalidate_plans()
+        logger.debug("Cleared all event subscriptions")
 
 
 # Global event bus instance - use this throughout the application
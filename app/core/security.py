@@ -6,6 +6,7 @@ This module provides functions for password hashing, token generation,
 and other security-related operations.
 """
 
+import uuid
 from datetime import datetime, timedelta
 from typing import Any, Union, Optional
 
@@ -40,7 +41,13 @@ def create_access_token(
             minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES
         )
 
-    to_encode = {"exp": expire, "sub": str(subject), "type": "access"}
+    to_encode = {
+        "exp": expire,
+        "iat": datetime.utcnow(),
+        "jti": uuid.uuid4().hex,
+        "sub": str(subject),
+        "type": "access",
+    }
     encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
@@ -63,7 +70,13 @@ def create_refresh_token(
     else:
         expire = datetime.utcnow() + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
 
-    to_encode = {"exp": expire, "sub": str(subject), "type": "refresh"}
+    to_encode = {
+        "exp": expire,
+        "iat": datetime.utcnow(),
+        "jti": uuid.uuid4().hex,
+        "sub": str(subject),
+        "type": "refresh",
+    }
     encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
@@ -73,6 +73,7 @@ from app.db.models.customer import Customer
 from app.db.models.supplier import Supplier
 from app.db.models.supplier_history import SupplierHistory
 from app.db.models.supplier_rating import SupplierRating
+from app.db.models.supplier_performance import SupplierPerformance
 
 # Import Inventory & Material Models
 from app.db.models.material import (
@@ -82,7 +83,7 @@ from app.db.models.material import (
     SuppliesMaterial,
 )
 
-from app.db.models.inventory import Inventory, InventoryTransaction
+from app.db.models.inventory import Inventory, InventorySnapshot, InventoryTransaction
 from app.db.models.product import Product
 from app.db.models.storage import (
     StorageLocation,
@@ -139,6 +140,15 @@ from app.db.models.file_metadata import FileMetadata
 from app.db.models.dynamic_enum import EnumType, EnumTranslation
 # --- End Dynamic Enum Management Models ---
 
+# --- Import Event Outbox Model ---
+from app.db.models.event_outbox import OutboxEvent
+
+# --- Import Audit Log Model ---
+from app.db.models.audit import AuditRecord
+
+# --- Import Analytics Rollup Models ---
+from app.db.models.analytics_rollup import PurchaseDailyRollup, SalesDailyRollup
+
 # Define __all__ for explicit namespace export
 __all__ = [
     # Base
@@ -154,6 +164,7 @@ __all__ = [
     "Supplier",
     "SupplierHistory",
     "SupplierRating",
+    "SupplierPerformance",
     # Inventory & Material Models
     "Material",
     "LeatherMaterial",
@@ -162,6 +173,7 @@ __all__ = [
     "WoodMaterial",           # <--- ADDED THIS LINE
     "Inventory",
     "InventoryTransaction",
+    "InventorySnapshot",
     "Product",
     "StorageLocation",
     "StorageCell",
@@ -209,6 +221,13 @@ __all__ = [
     # Dynamic Enum Models
     "EnumType",
     "EnumTranslation",
+    # Event Outbox
+    "OutboxEvent",
+    # Audit Log
+    "AuditRecord",
+    # Analytics Rollups
+    "SalesDailyRollup",
+    "PurchaseDailyRollup",
     # Python Enums (Exporting all imported definitions)
     "SaleStatus",
     "PaymentStatus",
@@ -0,0 +1,69 @@
+# File: app/db/models/analytics_rollup.py
+
+from sqlalchemy import Column, Date, Float, Integer, String, UniqueConstraint
+
+from app.db.models.base import Base
+
+
+class SalesDailyRollup(Base):
+    """
+    Sales totals of one day, channel and product type.
+
+    Derived from sales (by creation day, cancelled sales left out) and
+    processed refunds (by refund day). A sale counts under the product type
+    of its largest line. Rows of a day are rebuilt whenever one of its sales
+    or refunds changes, so analytics read a row per day instead of every
+    order.
+    """
+
+    __tablename__ = "sales_daily_rollups"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    day = Column(Date, nullable=False)
+    channel = Column(String(50), nullable=False, default="")  # "" when unknown
+    product_type = Column(String(50), nullable=False, default="")  # "" when unknown
+    order_count = Column(Integer, nullable=False, default=0)
+    revenue = Column(Float, nullable=False, default=0.0)
+    net_revenue = Column(Float, nullable=False, default=0.0)
+    fees = Column(Float, nullable=False, default=0.0)
+    cogs = Column(Float, nullable=False, default=0.0)
+    refunds = Column(Float, nullable=False, default=0.0)
+    refund_count = Column(Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        UniqueConstraint(
+            "day", "channel", "product_type", name="uq_sales_daily_rollups_key"
+        ),
+    )
+
+    def __repr__(self):
+        return (
+            f"<SalesDailyRollup(day={self.day}, channel='{self.channel}', "
+            f"product_type='{self.product_type}', revenue={self.revenue})>"
+        )
+
+
+class PurchaseDailyRollup(Base):
+    """
+    Purchase totals of one day and supplier, cancelled purchases left out.
+
+    Rebuilt like SalesDailyRollup whenever a purchase of the day changes.
+    """
+
+    __tablename__ = "purchase_daily_rollups"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    day = Column(Date, nullable=False)
+    supplier_id = Column(Integer, nullable=False, default=0)  # 0 when unknown
+    purchase_count = Column(Integer, nullable=False, default=0)
+    spend = Column(Float, nullable=False, default=0.0)
+
+    __table_args__ = (
+        UniqueConstraint("day", "supplier_id", name="uq_purchase_daily_rollups_key"),
+    )
+
+    def __repr__(self):
+        return (
+            f"<PurchaseDailyRollup(day={self.day}, supplier_id={self.supplier_id}, "
+            f"spend={self.spend})>"
+        )
@@ -0,0 +1,39 @@
+# File: app/db/models/audit.py
+
+from sqlalchemy import Column, DateTime, Index, Integer, String, Text
+from datetime import datetime
+
+from app.db.models.base import Base
+
+
+class AuditRecord(Base):
+    """
+    Entry of the audit trail: an entity change, login or API access.
+
+    Rows are append-only and written in batches by the audit writer, so the
+    table has no foreign keys and only the indexes the history queries use.
+    """
+
+    __tablename__ = "audit_log"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    entity_type = Column(String(100), nullable=False)  # Entity class name, "User" or "API"
+    entity_id = Column(String(255), nullable=False)  # Entity ID, user ID or endpoint
+    entity_name = Column(String(255), nullable=True)
+    action = Column(String(50), nullable=False)  # create, update, delete, login_success, "GET 200", ...
+    changes = Column(Text, nullable=True)  # JSON of changed fields with old and new values
+    user_id = Column(Integer, nullable=True)
+    timestamp = Column(DateTime, nullable=False, default=datetime.now)
+    ip_address = Column(String(45), nullable=True)
+    audit_metadata = Column("metadata", Text, nullable=True)  # JSON of additional context
+
+    __table_args__ = (
+        Index("idx_audit_log_entity", "entity_type", "entity_id", "timestamp"),
+        Index("idx_audit_log_user", "user_id", "timestamp"),
+    )
+
+    def __repr__(self):
+        return (
+            f"<AuditRecord(id={self.id}, entity_type='{self.entity_type}', "
+            f"entity_id='{self.entity_id}', action='{self.action}')>"
+        )
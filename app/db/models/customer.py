@@ -10,7 +10,7 @@ and relationship data for tracking customer interactions and sales.
 from typing import List, Optional, Dict, Any, Set, ClassVar
 from datetime import datetime
 
-from sqlalchemy import Column, String, Text, Enum, Integer, ForeignKey, Table
+from sqlalchemy import Column, String, Text, Enum, Integer, ForeignKey, Table, Index
 from sqlalchemy.orm import relationship, validates
 
 from app.db.models.base import AbstractBase, ValidationMixin, AuditMixin, TimestampMixin
@@ -41,6 +41,8 @@ class Customer(AbstractBase, ValidationMixin, AuditMixin, TimestampMixin):
 
     __tablename__ = "customers"
     __validated_fields__: ClassVar[Set[str]] = {"email", "phone", "name"}
+    # Customer analytics check updated_at for changes
+    __table_args__ = (Index("ix_customers_updated_at", "updated_at"),)
 
     # Basic information
     name = Column(String(255), nullable=False)
@@ -10,7 +10,7 @@ UPDATED: Added storage-related reverse relationships to complete the integration
 
 from sqlalchemy import (
     Column, String, Integer, Float, Boolean, Text, ForeignKey, DateTime, JSON,
-    UniqueConstraint, Table
+    UniqueConstraint, Table, Index, and_
 )
 from sqlalchemy.orm import relationship, validates
 from sqlalchemy.ext.hybrid import hybrid_property
@@ -306,6 +306,17 @@ class DynamicMaterial(Base, TimestampMixin):
     thumbnail = Column(String(255))
     created_by = Column(Integer, ForeignKey("users.id"))
 
+    # Indexes only the low-stock materials, in name order, so the low-stock
+    # list is an index scan (the condition must match the repository query)
+    __table_args__ = (
+        Index(
+            "idx_dynamic_materials_low_stock",
+            "name",
+            sqlite_where=and_(quantity <= reorder_point, quantity > 0, status != "discontinued"),
+            postgresql_where=and_(quantity <= reorder_point, quantity > 0, status != "discontinued"),
+        ),
+    )
+
     # Relationships
     material_type = relationship("MaterialType", back_populates="materials")
     property_values = relationship(
@@ -142,4 +142,45 @@ class EntityTranslation(Base):
             'translated_value': self.translated_value,
             'created_at': self.created_at.isoformat() if self.created_at else None,
             'updated_at': self.updated_at.isoformat() if self.updated_at else None
-        }
\ No newline at end of file
+        }
+
+
+class TranslationCatalogVersion(Base):
+    """
+    Change counter for an in-process translation catalog.
+
+    Every write to a catalog's translations bumps its version. Application
+    workers poll this table and reload only the catalogs whose version moved,
+    which keeps their in-memory copies consistent without a shared cache.
+
+    Attributes:
+        catalog: Catalog key (an entity type)
+        version: Monotonically increasing change counter
+        updated_at: Timestamp of the last change
+    """
+    __tablename__ = "translation_catalog_versions"
+
+    catalog: Mapped[str] = mapped_column(
+        String(100),
+        primary_key=True,
+        comment="Catalog key (an entity type)"
+    )
+
+    version: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        comment="Change counter, bumped on every translation write"
+    )
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+        comment="Timestamp of the last change"
+    )
+
+    def __repr__(self) -> str:
+        """String representation for debugging and logging."""
+        return f"<TranslationCatalogVersion(catalog='{self.catalog}', version={self.version})>"
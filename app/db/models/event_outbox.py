@@ -0,0 +1,51 @@
+# File: app/db/models/event_outbox.py
+
+from sqlalchemy import Column, DateTime, Index, Integer, String, Text
+from datetime import datetime
+
+from app.db.models.base import Base
+
+
+class OutboxEvent(Base):
+    """
+    Domain event waiting to be delivered to its handlers.
+
+    Rows are added in the same transaction as the change that raised the
+    event, so an event exists exactly when its change was committed. The
+    outbox dispatcher delivers them to the event bus handlers afterwards,
+    at least once, retrying failed handlers with backoff. Events sharing an
+    ordering key are delivered strictly in insertion order.
+    """
+
+    __tablename__ = "event_outbox"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    event_id = Column(String(36), nullable=False, unique=True)
+    event_type = Column(String(100), nullable=False)
+    payload = Column(Text, nullable=False)  # JSON from DomainEvent.to_dict()
+    ordering_key = Column(String(200), nullable=True)  # Events with a key are delivered in order
+
+    # Delivery state: pending, delivered or dead (gave up after max attempts)
+    status = Column(String(20), nullable=False, default="pending")
+    attempts = Column(Integer, nullable=False, default=0)
+    next_attempt_at = Column(DateTime, nullable=False, default=datetime.now)
+    delivered_handlers = Column(Text, nullable=True)  # JSON list of handlers already run
+    last_error = Column(Text, nullable=True)
+
+    # Claim held by a dispatcher while it works on the row
+    locked_by = Column(String(64), nullable=True)
+    locked_until = Column(DateTime, nullable=True)
+
+    created_at = Column(DateTime, nullable=False, default=datetime.now)
+    delivered_at = Column(DateTime, nullable=True)
+
+    __table_args__ = (
+        Index("idx_event_outbox_due", "status", "next_attempt_at"),
+        Index("idx_event_outbox_ordering", "ordering_key", "status", "id"),
+    )
+
+    def __repr__(self):
+        return (
+            f"<OutboxEvent(id={self.id}, event_type='{self.event_type}', "
+            f"status='{self.status}', attempts={self.attempts})>"
+        )
@@ -24,6 +24,11 @@ class FileMetadata(AbstractBase, ValidationMixin, TimestampMixin):
 
     Tracks information about files stored in the file system, including
     original filename, storage path, size, and associations with entities.
+
+    File contents are stored once per SHA-256 checksum. Every upload gets its
+    own metadata row, and all rows with the same checksum share one blob on
+    disk; ``ref_count`` mirrors the number of rows referencing that blob,
+    soft-deleted rows included, since only a permanent delete releases it.
     """
 
     __tablename__ = "file_meta_data"
@@ -34,7 +39,8 @@ class FileMetadata(AbstractBase, ValidationMixin, TimestampMixin):
     original_filename = Column(String(255), nullable=False)
     content_type = Column(String(100), nullable=False)
     size = Column(Integer, nullable=False, default=0)
-    checksum = Column(String(255))  # For integrity verification
+    checksum = Column(String(255), index=True)  # Content address and integrity check
+    ref_count = Column(Integer, nullable=False, default=1)  # Rows sharing this blob
 
     # Storage information
     storage_path = Column(String(512), nullable=False)
@@ -86,6 +92,7 @@ class FileMetadata(AbstractBase, ValidationMixin, TimestampMixin):
             "content_type": self.content_type,
             "size": self.size,
             "checksum": self.checksum,
+            "ref_count": self.ref_count,
             "storage_path": self.storage_path,
             "public_url": self.public_url,
             "thumbnail_path": self.thumbnail_path,
@@ -20,9 +20,11 @@ from sqlalchemy import (
     Enum,
     Float,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
+    UniqueConstraint,
     and_,
 )
 from sqlalchemy.ext.hybrid import hybrid_property
@@ -31,6 +33,7 @@ from sqlalchemy.orm import foreign, relationship, validates
 # Assuming these base classes and enums are correctly defined elsewhere
 from app.db.models.base import (
     AbstractBase,
+    Base,
     CostingMixin,
     TimestampMixin,
     ValidationMixin,
@@ -68,6 +71,7 @@ class Inventory(AbstractBase, ValidationMixin):
         quantity: Current quantity in stock.
         status: Current inventory status (e.g., IN_STOCK, LOW_STOCK).
         storage_location: Physical location identifier.
+        needs_reorder: Quantity is at or below the item's reorder point.
     """
 
     __tablename__ = "inventory"
@@ -82,6 +86,20 @@ class Inventory(AbstractBase, ValidationMixin):
     quantity = Column(Float, default=0)
     status = Column(Enum(InventoryStatus), default=InventoryStatus.IN_STOCK)
     storage_location = Column(String(100))
+    # Maintained by InventoryService when stock or reorder points change
+    needs_reorder = Column(Boolean, default=False, nullable=False)
+
+    __table_args__ = (
+        # Only the rows needing reorder are indexed, so reorder views read the
+        # small low-stock set rather than the whole inventory
+        Index(
+            "idx_inventory_needs_reorder",
+            "item_type",
+            "item_id",
+            sqlite_where=needs_reorder == True,  # noqa: E712
+            postgresql_where=needs_reorder == True,  # noqa: E712
+        ),
+    )
 
     # --- RELATIONSHIPS (Back-references for the polymorphic one-to-one) ---
     # These allow navigating from an Inventory record back to the specific
@@ -197,6 +215,19 @@ class InventoryTransaction(AbstractBase, ValidationMixin, TimestampMixin):
     sale = relationship("Sale", foreign_keys=[sale_id])
     purchase = relationship("Purchase", foreign_keys=[purchase_id])
 
+    # Covering indexes for ledger scans: one item's history, and everything
+    # recorded in a date range
+    __table_args__ = (
+        Index(
+            "idx_inventory_transactions_item_date",
+            "item_type", "item_id", "transaction_date", "quantity",
+        ),
+        Index(
+            "idx_inventory_transactions_date",
+            "transaction_date", "item_type", "item_id", "quantity",
+        ),
+    )
+
     @validates("quantity")
     def validate_quantity(self, key: str, quantity: float) -> float:
         """Validate transaction quantity (cannot be zero)."""
@@ -216,3 +247,34 @@ class InventoryTransaction(AbstractBase, ValidationMixin, TimestampMixin):
     def __repr__(self) -> str:
         """Return string representation of the InventoryTransaction."""
         return f"<InventoryTransaction(id={self.id}, type='{self.transaction_type}', item_type='{self.item_type}', item_id={self.item_id}, quantity={self.quantity})>"
+
+
+
+class InventorySnapshot(Base):
+    """
+    Stock level of an item at a point in time, derived from the ledger.
+
+    The inventory transactions are an append-only ledger; a snapshot holds
+    each item's quantity including every transaction up to snapshot_date,
+    so the stock at any later time is the snapshot plus the transactions
+    recorded since.
+    """
+
+    __tablename__ = "inventory_snapshots"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    snapshot_date = Column(DateTime, nullable=False)
+    item_type = Column(String(50), nullable=False)
+    item_id = Column(Integer, nullable=False)
+    quantity = Column(Float, nullable=False)
+
+    __table_args__ = (
+        UniqueConstraint(
+            "snapshot_date", "item_type", "item_id", name="uq_inventory_snapshots_item"
+        ),
+        Index("idx_inventory_snapshots_item", "item_type", "item_id", "snapshot_date"),
+    )
+
+    def __repr__(self) -> str:
+        """Return string representation of the InventorySnapshot."""
+        return f"<InventorySnapshot(snapshot_date={self.snapshot_date}, item_type='{self.item_type}', item_id={self.item_id}, quantity={self.quantity})>"
@@ -84,7 +84,9 @@ class Material(AbstractBase, ValidationMixin, CostingMixin, TimestampMixin):
     material_type = Column(String(50), nullable=False)  # Discriminator column
 
     # Inventory information
-    status = Column(Enum(InventoryStatus), default=InventoryStatus.IN_STOCK)
+    # Kept in step with quantity and reorder point by the validators below, so
+    # low-stock materials are an index lookup on status
+    status = Column(Enum(InventoryStatus), default=InventoryStatus.IN_STOCK, index=True)
     quantity = Column(Float, default=0)
     unit = Column(Enum(MeasurementUnit), nullable=False)
     quality = Column(Enum(MaterialQualityGrade), default=MaterialQualityGrade.STANDARD)
@@ -187,6 +189,12 @@ class Material(AbstractBase, ValidationMixin, CostingMixin, TimestampMixin):
             return value
         if value < 0:
             raise ValueError("Reorder point cannot be negative")
+        if self.quantity is not None and self.quantity > 0:
+            self.status = (
+                InventoryStatus.LOW_STOCK
+                if self.quantity <= value
+                else InventoryStatus.IN_STOCK
+            )
         return value
 
     @validates("price")
@@ -31,6 +31,7 @@ class MediaAsset(Base, TimestampMixin):
     content_type = Column(String(100), nullable=False)
     file_size_bytes = Column(Integer, nullable=False)
     storage_location = Column(String(512), nullable=False)  # Path or URI
+    checksum = Column(String(64))  # SHA-256 of the content, used as ETag
 
     # Media attributes
     width = Column(Integer)  # For images and videos
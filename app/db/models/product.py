@@ -93,6 +93,12 @@ class Product(AbstractBase, ValidationMixin, CostingMixin, TimestampMixin):
     cost_breakdown = Column(JSON, nullable=True)
     total_cost = Column(Float, nullable=True)
     selling_price = Column(Float, nullable=True)
+    # Components of total_cost, kept as columns so the catalog can be priced
+    # without decoding cost_breakdown; all None when the cost was never split
+    material_cost = Column(Float, nullable=True)
+    hardware_cost = Column(Float, nullable=True)
+    labor_cost = Column(Float, nullable=True)
+    overhead_cost = Column(Float, nullable=True)
 
     # --- Sales Metrics ---
     last_sold = Column(DateTime, nullable=True)
@@ -10,7 +10,7 @@ order fulfillment, and payment status.
 from typing import List, Optional, Dict, Any, ClassVar, Set
 from datetime import datetime
 
-from sqlalchemy import Column, String, Text, Float, Enum, Integer, ForeignKey, DateTime
+from sqlalchemy import Column, String, Text, Float, Enum, Integer, ForeignKey, DateTime, Index
 from sqlalchemy.orm import relationship, validates
 from sqlalchemy.ext.hybrid import hybrid_property
 
@@ -39,6 +39,8 @@ class Purchase(AbstractBase, ValidationMixin, TimestampMixin):
 
     __tablename__ = "purchases"
     __validated_fields__: ClassVar[Set[str]] = {"supplier_id", "total"}
+    # Day rebuilds of the analytics rollups scan by creation time
+    __table_args__ = (Index("ix_purchases_created_at", "created_at"),)
 
     # Supplier information
     supplier_id = Column(Integer, ForeignKey("suppliers.id"), nullable=False)
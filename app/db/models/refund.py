@@ -42,7 +42,7 @@ class Refund(AbstractBase, ValidationMixin, TimestampMixin):
     sale_id = Column(Integer, ForeignKey("sales.id"), nullable=False)
 
     # Refund information
-    refund_date = Column(DateTime, default=datetime.now)
+    refund_date = Column(DateTime, default=datetime.now, index=True)
     refund_amount = Column(Float, nullable=False)
     reason = Column(String(255), nullable=False)
     status = Column(String(50), default="PENDING")
@@ -21,6 +21,7 @@ from sqlalchemy import (
     DateTime,
     JSON,
     ARRAY,
+    Index,
 )
 from sqlalchemy.orm import relationship, validates
 from sqlalchemy.ext.hybrid import hybrid_property
@@ -75,6 +76,13 @@ class Sale(AbstractBase, ValidationMixin, CostingMixin, TimestampMixin):
         "deposit_amount",
         "customer_id",
     }
+    # Day rebuilds of the analytics rollups scan by creation time; customer
+    # analytics group by customer and check updated_at for changes
+    __table_args__ = (
+        Index("ix_sales_created_at", "created_at"),
+        Index("ix_sales_customer_id_created_at", "customer_id", "created_at"),
+        Index("ix_sales_updated_at", "updated_at"),
+    )
 
     # Customer information
     customer_id = Column(Integer, ForeignKey("customers.id"), nullable=False)
@@ -0,0 +1,52 @@
+# File: app/db/models/supplier_performance.py
+
+from sqlalchemy import Column, DateTime, Float, ForeignKey, Index, Integer
+
+from app.db.models.base import Base
+
+
+class SupplierPerformance(Base):
+    """
+    Running delivery and rating aggregates of one supplier.
+
+    Updated in place when one of the supplier's purchases is received and
+    when the supplier is rated, so on-time rate, lead time statistics and
+    rating are read from one row instead of the supplier's whole purchase
+    and rating history.
+
+    Attributes:
+        supplier_id: ID of the supplier
+        receipt_count: Number of received purchases
+        lead_time_sum: Sum of their lead times (days from order to receipt)
+        lead_time_sum_sq: Sum of the squared lead times
+        due_count: Received purchases that had an expected delivery date
+        on_time_count: Those received by their expected delivery date
+        rating_count: Number of ratings recorded
+        rating_ema: Exponential moving average of the ratings
+        last_received_at: When the last purchase was received
+        last_rated_at: When the supplier was last rated
+    """
+
+    __tablename__ = "supplier_performance"
+
+    supplier_id = Column(Integer, ForeignKey("suppliers.id"), primary_key=True)
+    receipt_count = Column(Integer, nullable=False, default=0)
+    lead_time_sum = Column(Float, nullable=False, default=0.0)
+    lead_time_sum_sq = Column(Float, nullable=False, default=0.0)
+    due_count = Column(Integer, nullable=False, default=0)
+    on_time_count = Column(Integer, nullable=False, default=0)
+    rating_count = Column(Integer, nullable=False, default=0)
+    rating_ema = Column(Float)  # None until the first rating
+    last_received_at = Column(DateTime)
+    last_rated_at = Column(DateTime)
+
+    # Top suppliers are read in rating order
+    __table_args__ = (
+        Index("ix_supplier_performance_rating_ema", "rating_ema", "rating_count"),
+    )
+
+    def __repr__(self):
+        return (
+            f"<SupplierPerformance(supplier_id={self.supplier_id}, "
+            f"receipts={self.receipt_count}, rating_ema={self.rating_ema})>"
+        )
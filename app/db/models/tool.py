@@ -18,6 +18,7 @@ from sqlalchemy import (
     DateTime, # Use standard DateTime
     Date,     # Use standard Date
     Boolean,
+    Index,
     and_,
 )
 from sqlalchemy.orm import relationship, validates, configure_mappers, foreign, Mapped, mapped_column
@@ -262,6 +263,11 @@ class ToolMaintenance(AbstractBase, ValidationMixin, TimestampMixin):
 
     tool: Mapped["Tool"] = relationship("Tool", back_populates="maintenance_history")
 
+    # Readiness checks read the open maintenance of many tools at once
+    __table_args__ = (
+        Index("ix_tool_maintenance_tool_id_status", "tool_id", "status"),
+    )
+
     @validates("cost")
     def validate_cost(self, key: str, cost: Optional[float]) -> float:
         if cost is not None and cost < 0: raise ValueError("Cost cannot be negative")
@@ -298,6 +304,11 @@ class ToolCheckout(AbstractBase, ValidationMixin, TimestampMixin):
     tool: Mapped["Tool"] = relationship("Tool", back_populates="checkouts")
     project: Mapped[Optional["Project"]] = relationship("Project", back_populates="tool_checkouts")
 
+    # Readiness checks read the open checkouts of many tools at once
+    __table_args__ = (
+        Index("ix_tool_checkouts_tool_id_status", "tool_id", "status"),
+    )
+
     # --- Hybrid Properties (No changes needed here) ---
     @hybrid_property
     def is_overdue(self) -> bool:
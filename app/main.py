@@ -14,13 +14,26 @@ import json
 from datetime import datetime
 from enum import Enum
 from typing import Any, Dict
+import asyncio
+import functools
 import os
+import time
 
 from app.api.api import api_router
 from app.core.config import settings
 from app.core.metrics_middleware import MetricsMiddleware
+from app.core.app_container import AppContainer
 from app.core.events import setup_event_handlers
+from app.services.audit_service import AuditService
+from app.services.audit_writer import AuditWriter
+from app.services.event_stream import EventStreamHub
+from app.services.image_derivative_service import ImageDerivativeService
 from scripts.register_material_settings import register_settings
+from scripts.scrub_file_store import scrub_file_stores
+from scripts.check_media_files import check_media_files
+from scripts.snapshot_inventory import snapshot_inventory
+from starlette.concurrency import run_in_threadpool
+import anyio.to_thread
 
 # --- Logging Configuration ---
 LOG_LEVEL_NAME = os.environ.get("LOG_LEVEL", "INFO").upper()
@@ -113,6 +126,28 @@ async def log_requests(request: Request, call_next):
 # Add metrics middleware
 app.add_middleware(MetricsMiddleware)
 
+# Record API access in the audit trail; the write-behind buffer keeps this off the request's commit path
+if settings.AUDIT_API_ACCESS:
+    @app.middleware("http")
+    async def audit_api_access(request: Request, call_next):
+        start_time = time.perf_counter()
+        response = await call_next(request)
+        audit_writer = AuditWriter.get_instance()
+        record = functools.partial(
+            AuditService(None, audit_writer=audit_writer).record_api_access,
+            endpoint=request.url.path,
+            method=request.method,
+            status_code=response.status_code,
+            user_id=getattr(request.state, "user_id", None),
+            duration_ms=(time.perf_counter() - start_time) * 1000,
+        )
+        if audit_writer.overflow_policy == "block":
+            # A full buffer makes the write wait; keep that off the event loop
+            await run_in_threadpool(record)
+        else:
+            record()
+        return response
+
 # Add security headers middleware
 class SecurityHeadersMiddleware(BaseHTTPMiddleware):
     async def dispatch(self, request: Request, call_next):
@@ -130,6 +165,63 @@ app.add_middleware(SecurityHeadersMiddleware)
 # Set up event handlers
 setup_event_handlers(app)
 
+@app.on_event("startup")
+async def initialize_app_container():
+    """Build the cache, event bus and file store shared by all requests."""
+    AppContainer.initialize()
+
+@app.on_event("startup")
+async def start_outbox_dispatcher():
+    """Start delivering events committed to the outbox."""
+    if not settings.OUTBOX_ENABLED:
+        return
+    from app.db.session import SessionLocal
+    from app.services.outbox_dispatcher import OutboxDispatcher
+
+    container = AppContainer.initialize()
+    container.outbox_dispatcher = OutboxDispatcher(
+        SessionLocal,
+        container.event_bus,
+        batch_size=settings.OUTBOX_BATCH_SIZE,
+        workers=settings.OUTBOX_WORKERS,
+        max_attempts=settings.OUTBOX_MAX_ATTEMPTS,
+        base_backoff=settings.OUTBOX_BACKOFF_SECONDS,
+        max_backoff=settings.OUTBOX_MAX_BACKOFF_SECONDS,
+        poll_interval=settings.OUTBOX_POLL_SECONDS,
+    )
+    container.outbox_dispatcher.start()
+
+@app.on_event("startup")
+async def start_audit_writer():
+    """Start the background writer of the audit trail."""
+    container = AppContainer.initialize()
+    container.audit_writer = AuditWriter.get_instance()
+    container.audit_writer.start()
+    if settings.AUDIT_ENTITY_CHANGES:
+        from app.db.session import SessionLocal
+        from app.services.entity_audit import register_entity_audit
+
+        register_entity_audit(SessionLocal, container.audit_writer)
+
+@app.on_event("startup")
+async def start_event_stream_hub():
+    """Buffer pushed events from startup so reconnecting clients can resume."""
+    EventStreamHub.get_instance()
+
+@app.on_event("startup")
+async def subscribe_workflow_readiness_cache():
+    """Drop cached workflow readiness when stock, tools or reservations change."""
+    from app.services.workflow_resource_service import WorkflowResourceService
+
+    WorkflowResourceService.subscribe_to_events(AppContainer.initialize().event_bus)
+
+@app.on_event("startup")
+async def configure_threadpool():
+    """Bound the worker threads that run sync handlers and blocking DB work."""
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    limiter.total_tokens = settings.THREADPOOL_MAX_WORKERS
+    logger.info(f"Threadpool limited to {settings.THREADPOOL_MAX_WORKERS} workers")
+
 # Register settings on startup
 @app.on_event("startup")
 async def register_material_settings_on_startup():
@@ -141,6 +233,45 @@ async def register_material_settings_on_startup():
     except Exception as e:
         logger.error(f"Error registering material settings: {e}")
 
+async def run_periodically(job, interval_seconds: int, name: str):
+    """Run a blocking maintenance job in the background, off the request path."""
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            await run_in_threadpool(job)
+        except Exception as e:
+            logger.error(f"{name} failed: {e}", exc_info=True)
+
+@app.on_event("startup")
+async def schedule_file_maintenance():
+    """Schedule the periodic file integrity scrub and media file check."""
+    if settings.FILE_SCRUB_INTERVAL_HOURS > 0:
+        asyncio.create_task(run_periodically(
+            scrub_file_stores, settings.FILE_SCRUB_INTERVAL_HOURS * 3600, "File integrity scrub"
+        ))
+    if settings.MEDIA_FILE_CHECK_INTERVAL_MINUTES > 0:
+        asyncio.create_task(run_periodically(
+            check_media_files, settings.MEDIA_FILE_CHECK_INTERVAL_MINUTES * 60, "Media file check"
+        ))
+
+@app.on_event("startup")
+async def schedule_inventory_snapshots():
+    """Schedule the periodic stock snapshot of the inventory ledger."""
+    if settings.INVENTORY_SNAPSHOT_INTERVAL_HOURS > 0:
+        asyncio.create_task(run_periodically(
+            snapshot_inventory, settings.INVENTORY_SNAPSHOT_INTERVAL_HOURS * 3600, "Inventory snapshot"
+        ))
+
+@app.on_event("shutdown")
+async def stop_image_derivative_workers():
+    """Stop background image derivative workers."""
+    ImageDerivativeService.shutdown_all()
+
+@app.on_event("shutdown")
+async def shutdown_app_container():
+    """Release the application-lifetime dependencies."""
+    AppContainer.shutdown()
+
 # Include the API router
 app.include_router(api_router, prefix=settings.API_V1_STR)
 
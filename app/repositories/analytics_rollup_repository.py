@@ -0,0 +1,265 @@
+# File: app/repositories/analytics_rollup_repository.py
+
+from typing import List, Any
+from sqlalchemy.orm import Session
+from sqlalchemy import (
+    String,
+    and_,
+    cast,
+    delete,
+    desc,
+    func,
+    insert,
+    literal,
+    or_,
+    select,
+    union,
+    union_all,
+)
+from datetime import date, datetime, time, timedelta
+
+from app.db.models.analytics_rollup import PurchaseDailyRollup, SalesDailyRollup
+from app.db.models.enums import PurchaseStatus, SaleStatus
+from app.db.models.product import Product
+from app.db.models.purchase import Purchase
+from app.db.models.refund import Refund
+from app.db.models.sales import Sale, SaleItem
+from app.repositories.base_repository import BaseRepository
+
+
+class AnalyticsRollupRepository(BaseRepository[SalesDailyRollup]):
+    """
+    Repository for the daily sales and purchase rollups.
+
+    Rebuilds the rollup rows of a range of days from the sales, refunds and
+    purchases of those days, and reads totals back from the rollups.
+    """
+
+    def __init__(self, session: Session, encryption_service=None):
+        """
+        Initialize the AnalyticsRollupRepository.
+
+        Args:
+            session (Session): SQLAlchemy database session
+            encryption_service (Optional): Service for handling field encryption/decryption
+        """
+        super().__init__(session, encryption_service)
+        self.model = SalesDailyRollup
+
+    @staticmethod
+    def _day_bounds(first_day: date, last_day: date):
+        """Start of the first day and of the day after the last one."""
+        return (
+            datetime.combine(first_day, time.min),
+            datetime.combine(last_day + timedelta(days=1), time.min),
+        )
+
+    def rebuild_sales_days(self, first_day: date, last_day: date) -> int:
+        """
+        Replace the sales rollups of a range of days.
+
+        One INSERT ... SELECT: the sales created on those days (cancelled
+        ones left out) and the refunds processed on them, each under the
+        channel and product type of its sale, grouped per day. Does not
+        commit.
+
+        Args:
+            first_day (date): First day to rebuild
+            last_day (date): Last day to rebuild
+
+        Returns:
+            int: Number of rollup rows written
+        """
+        start, end = self._day_bounds(first_day, last_day)
+        self.session.execute(
+            delete(SalesDailyRollup).where(SalesDailyRollup.day.between(first_day, last_day))
+        )
+
+        sales_in_range = and_(
+            Sale.created_at >= start,
+            Sale.created_at < end,
+            or_(Sale.status.is_(None), Sale.status != SaleStatus.CANCELLED),
+        )
+        refunds_in_range = and_(
+            Refund.status == "PROCESSED",
+            Refund.refund_date >= start,
+            Refund.refund_date < end,
+        )
+
+        # Product type of each sale's largest line
+        line_rank = func.row_number().over(
+            partition_by=SaleItem.sale_id,
+            order_by=(
+                desc(func.coalesce(SaleItem.price, 0) * func.coalesce(SaleItem.quantity, 0)),
+                SaleItem.id,
+            ),
+        )
+        lines = (
+            select(
+                SaleItem.sale_id,
+                func.coalesce(cast(Product.product_type, String), SaleItem.type).label("product_type"),
+                line_rank.label("line_rank"),
+            )
+            .outerjoin(Product, Product.id == SaleItem.product_id)
+            .where(
+                SaleItem.sale_id.in_(
+                    union(
+                        select(Sale.id).where(sales_in_range),
+                        select(Refund.sale_id).where(refunds_in_range),
+                    )
+                )
+            )
+            .subquery()
+        )
+        primary = (
+            select(lines.c.sale_id, lines.c.product_type)
+            .where(lines.c.line_rank == 1)
+            .subquery()
+        )
+        channel = func.coalesce(Sale.channel, "")
+        product_type = func.coalesce(primary.c.product_type, "")
+        zero = literal(0.0)
+
+        movements = union_all(
+            select(
+                func.date(Sale.created_at).label("day"),
+                channel.label("channel"),
+                product_type.label("product_type"),
+                literal(1).label("order_count"),
+                func.coalesce(Sale.total_amount, 0.0).label("revenue"),
+                func.coalesce(Sale.net_revenue, 0.0).label("net_revenue"),
+                func.coalesce(Sale.platform_fees, 0.0).label("fees"),
+                func.coalesce(Sale.cost_price, 0.0).label("cogs"),
+                zero.label("refunds"),
+                literal(0).label("refund_count"),
+            )
+            .select_from(Sale)
+            .outerjoin(primary, primary.c.sale_id == Sale.id)
+            .where(sales_in_range),
+            select(
+                func.date(Refund.refund_date),
+                channel,
+                product_type,
+                literal(0),
+                zero,
+                zero,
+                zero,
+                zero,
+                func.coalesce(Refund.refund_amount, 0.0),
+                literal(1),
+            )
+            .select_from(Refund)
+            .join(Sale, Sale.id == Refund.sale_id)
+            .outerjoin(primary, primary.c.sale_id == Sale.id)
+            .where(refunds_in_range),
+        ).subquery()
+
+        totals = ["order_count", "revenue", "net_revenue", "fees", "cogs", "refunds", "refund_count"]
+        result = self.session.execute(
+            insert(SalesDailyRollup.__table__).from_select(
+                ["day", "channel", "product_type"] + totals,
+                select(
+                    movements.c.day,
+                    movements.c.channel,
+                    movements.c.product_type,
+                    *[func.sum(movements.c[column]) for column in totals],
+                ).group_by(movements.c.day, movements.c.channel, movements.c.product_type),
+            )
+        )
+        return result.rowcount
+
+    def rebuild_purchase_days(self, first_day: date, last_day: date) -> int:
+        """
+        Replace the purchase rollups of a range of days.
+
+        Purchases count on the day they were created; cancelled ones are
+        left out. Does not commit.
+
+        Args:
+            first_day (date): First day to rebuild
+            last_day (date): Last day to rebuild
+
+        Returns:
+            int: Number of rollup rows written
+        """
+        start, end = self._day_bounds(first_day, last_day)
+        self.session.execute(
+            delete(PurchaseDailyRollup).where(PurchaseDailyRollup.day.between(first_day, last_day))
+        )
+        day = func.date(Purchase.created_at)
+        supplier_id = func.coalesce(Purchase.supplier_id, 0)
+        result = self.session.execute(
+            insert(PurchaseDailyRollup.__table__).from_select(
+                ["day", "supplier_id", "purchase_count", "spend"],
+                select(
+                    day,
+                    supplier_id,
+                    func.count(Purchase.id),
+                    func.sum(func.coalesce(Purchase.total, 0.0)),
+                )
+                .where(
+                    Purchase.created_at >= start,
+                    Purchase.created_at < end,
+                    or_(Purchase.status.is_(None), Purchase.status != PurchaseStatus.CANCELLED),
+                )
+                .group_by(day, supplier_id),
+            )
+        )
+        return result.rowcount
+
+    def get_sales_totals(
+        self, first_day: date, last_day: date, group_by: str = "day"
+    ) -> List[Any]:
+        """
+        Sum the sales rollups of a range of days.
+
+        Args:
+            first_day (date): First day of the range
+            last_day (date): Last day of the range
+            group_by (str): 'day', 'channel' or 'product_type'
+
+        Returns:
+            List of row mappings with the group_by column (as "key"),
+            order_count, revenue, net_revenue, fees, cogs, refunds and
+            refund_count, in key order
+        """
+        key = getattr(SalesDailyRollup, group_by)
+        query = (
+            self.session.query(
+                key.label("key"),
+                func.sum(SalesDailyRollup.order_count).label("order_count"),
+                func.sum(SalesDailyRollup.revenue).label("revenue"),
+                func.sum(SalesDailyRollup.net_revenue).label("net_revenue"),
+                func.sum(SalesDailyRollup.fees).label("fees"),
+                func.sum(SalesDailyRollup.cogs).label("cogs"),
+                func.sum(SalesDailyRollup.refunds).label("refunds"),
+                func.sum(SalesDailyRollup.refund_count).label("refund_count"),
+            )
+            .filter(SalesDailyRollup.day.between(first_day, last_day))
+            .group_by(key)
+            .order_by(key)
+        )
+        return [row._mapping for row in query.all()]
+
+    def get_purchase_totals(self, first_day: date, last_day: date) -> List[Any]:
+        """
+        Sum the purchase rollups of a range of days per day.
+
+        Args:
+            first_day (date): First day of the range
+            last_day (date): Last day of the range
+
+        Returns:
+            List of row mappings with day, purchase_count and spend, in day order
+        """
+        query = (
+            self.session.query(
+                PurchaseDailyRollup.day,
+                func.sum(PurchaseDailyRollup.purchase_count).label("purchase_count"),
+                func.sum(PurchaseDailyRollup.spend).label("spend"),
+            )
+            .filter(PurchaseDailyRollup.day.between(first_day, last_day))
+            .group_by(PurchaseDailyRollup.day)
+            .order_by(PurchaseDailyRollup.day)
+        )
+        return [row._mapping for row in query.all()]
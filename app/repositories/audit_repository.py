@@ -0,0 +1,111 @@
+# File: app/repositories/audit_repository.py
+
+import json
+from typing import Any, Dict, List
+from sqlalchemy.orm import Session
+from sqlalchemy import asc, desc, or_, select
+
+from app.db.models.audit import AuditRecord
+from app.repositories.base_repository import BaseRepository
+
+
+class AuditRepository(BaseRepository[AuditRecord]):
+    """
+    Repository for the audit trail.
+
+    Records are normally inserted in batches by the audit writer; this
+    repository is the read path of AuditService's history queries.
+    """
+
+    def __init__(self, session: Session, encryption_service=None):
+        """
+        Initialize the AuditRepository.
+
+        Args:
+            session (Session): SQLAlchemy database session
+            encryption_service (Optional): Service for handling field encryption/decryption
+        """
+        super().__init__(session, encryption_service)
+        self.model = AuditRecord
+
+    def create(self, data: Dict[str, Any]) -> AuditRecord:
+        """
+        Create an audit record, committing it immediately.
+
+        Args:
+            data (Dict[str, Any]): Audit record with "changes" and "metadata" as JSON text
+
+        Returns:
+            AuditRecord: The created record
+        """
+        data = dict(data)
+        data["audit_metadata"] = data.pop("metadata", None)
+        record = AuditRecord(**data)
+        self.session.add(record)
+        self.session.commit()
+        return record
+
+    def list(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        sort_by: str = "timestamp",
+        sort_dir: str = "asc",
+        **filters,
+    ) -> List[Dict[str, Any]]:
+        """
+        List audit records as dictionaries.
+
+        Filters are column names, optionally suffixed with "_gte", "_lte" or
+        "_in". Values of an "_in" filter containing "%" match as LIKE
+        patterns, so "GET %" matches every GET request.
+
+        Args:
+            skip (int): Number of records to skip
+            limit (int): Maximum number of records to return
+            sort_by (str): Column to sort by
+            sort_dir (str): Sort direction ('asc' or 'desc')
+            **filters: Column filters
+
+        Returns:
+            List[Dict[str, Any]]: Records with "changes" and "metadata" decoded
+        """
+        stmt = select(AuditRecord)
+        for key, value in filters.items():
+            if key.endswith("_gte"):
+                stmt = stmt.where(getattr(AuditRecord, key[:-4]) >= value)
+            elif key.endswith("_lte"):
+                stmt = stmt.where(getattr(AuditRecord, key[:-4]) <= value)
+            elif key.endswith("_in"):
+                column = getattr(AuditRecord, key[:-3])
+                patterns = [v for v in value if isinstance(v, str) and "%" in v]
+                exact = [v for v in value if v not in patterns]
+                conditions = [column.like(pattern) for pattern in patterns]
+                if exact:
+                    conditions.append(column.in_(exact))
+                stmt = stmt.where(or_(*conditions))
+            else:
+                stmt = stmt.where(getattr(AuditRecord, key) == value)
+
+        order = desc if sort_dir.lower() == "desc" else asc
+        stmt = stmt.order_by(
+            order(getattr(AuditRecord, sort_by)), order(AuditRecord.id)
+        ).offset(skip).limit(limit)
+
+        return [self._to_dict(record) for record in self.session.execute(stmt).scalars()]
+
+    @staticmethod
+    def _to_dict(record: AuditRecord) -> Dict[str, Any]:
+        """Get an audit record as a dictionary with its JSON fields decoded."""
+        return {
+            "id": record.id,
+            "entity_type": record.entity_type,
+            "entity_id": record.entity_id,
+            "entity_name": record.entity_name,
+            "action": record.action,
+            "changes": json.loads(record.changes) if record.changes else None,
+            "user_id": record.user_id,
+            "timestamp": record.timestamp,
+            "ip_address": record.ip_address,
+            "metadata": json.loads(record.audit_metadata) if record.audit_metadata else None,
+        }
@@ -1,12 +1,25 @@
 # File: app/repositories/customer_repository.py
 
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+from datetime import datetime, timedelta
 from sqlalchemy.orm import Session
-from sqlalchemy import or_
+from sqlalchemy import and_, case, desc, func, or_, select
 
 from app.db.models.customer import Customer
+from app.db.models.enums import CustomerStatus, SaleStatus
+from app.db.models.sales import Sale
 from app.repositories.base_repository import BaseRepository
 
+# RFM segments, first match wins; scores are quintiles, 5 being the best
+RFM_SEGMENTS = (
+    ("champions", lambda r, f, m: and_(r >= 4, f >= 4, m >= 4)),
+    ("loyal", lambda r, f, m: f >= 4),
+    ("recent", lambda r, f, m: r >= 4),
+    ("at_risk", lambda r, f, m: and_(r <= 2, f >= 3)),
+    ("hibernating", lambda r, f, m: r <= 2),
+)
+OTHER_SEGMENT = "needs_attention"
+
 
 class CustomerRepository(BaseRepository[Customer]):
     """
@@ -153,3 +166,242 @@ class CustomerRepository(BaseRepository[Customer]):
 
         entities = query.offset(skip).limit(limit).all()
         return [self._decrypt_sensitive_fields(entity) for entity in entities]
+
+    def count_summary(self, created_since: datetime) -> Dict[str, int]:
+        """
+        Count all, active and recently created customers in one query.
+
+        Args:
+            created_since (datetime): Start of the "new customers" window
+
+        Returns:
+            Dict[str, int]: total, active and new counts
+        """
+        row = self.session.execute(
+            select(
+                func.count(self.model.id).label("total"),
+                func.coalesce(
+                    func.sum(case((self.model.status == CustomerStatus.ACTIVE, 1), else_=0)), 0
+                ).label("active"),
+                func.coalesce(
+                    func.sum(case((self.model.created_at >= created_since, 1), else_=0)), 0
+                ).label("new"),
+            )
+        ).one()
+        return dict(row._mapping)
+
+    def get_distribution_by_field(self, field: str) -> Dict[str, int]:
+        """
+        Count customers per value of a classification field.
+
+        Args:
+            field (str): 'status', 'tier' or 'source'
+
+        Returns:
+            Dict[str, int]: Enum member name (or None) to number of customers
+        """
+        column = getattr(self.model, field)
+        rows = self.session.execute(
+            select(column, func.count(self.model.id)).group_by(column)
+        ).all()
+        return {
+            (value.name if hasattr(value, "name") else value): count
+            for value, count in rows
+        }
+
+    def get_analytics_version(self) -> Tuple[Any, ...]:
+        """
+        Get a version of the sales and customer data.
+
+        Row counts and latest updated_at of both tables, read from their
+        indexes; the version changes whenever a sale or customer is added,
+        changed or removed.
+
+        Returns:
+            Tuple[Any, ...]: Comparable data version
+        """
+        row = self.session.execute(
+            select(
+                select(func.count(Sale.id)).scalar_subquery(),
+                select(func.max(Sale.updated_at)).scalar_subquery(),
+                select(func.count(self.model.id)).scalar_subquery(),
+                select(func.max(self.model.updated_at)).scalar_subquery(),
+            )
+        ).one()
+        return tuple(row)
+
+    def _customer_values(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        status=None,
+        tier=None,
+    ):
+        """
+        Per-customer value subquery.
+
+        One row per customer with sales: order count, revenue, first and
+        last order, recency/frequency/monetary quintile scores and the
+        named RFM segment, revenue rank and the average revenue over all
+        those customers. Cancelled sales are left out.
+        """
+        conditions = [or_(Sale.status.is_(None), Sale.status != SaleStatus.CANCELLED)]
+        if start_date:
+            conditions.append(Sale.created_at >= start_date)
+        if end_date:
+            conditions.append(Sale.created_at <= end_date)
+
+        totals = select(
+            Sale.customer_id,
+            func.count(Sale.id).label("order_count"),
+            func.coalesce(func.sum(Sale.total_amount), 0.0).label("revenue"),
+            func.min(Sale.created_at).label("first_order"),
+            func.max(Sale.created_at).label("last_order"),
+        )
+        if status is not None or tier is not None:
+            totals = totals.join(self.model, self.model.id == Sale.customer_id)
+            if status is not None:
+                conditions.append(self.model.status == status)
+            if tier is not None:
+                conditions.append(self.model.tier == tier)
+        totals = totals.where(*conditions).group_by(Sale.customer_id).subquery()
+
+        scored = select(
+            totals,
+            func.ntile(5).over(
+                order_by=(totals.c.last_order, totals.c.customer_id)
+            ).label("recency_score"),
+            func.ntile(5).over(
+                order_by=(totals.c.order_count, totals.c.revenue, totals.c.customer_id)
+            ).label("frequency_score"),
+            func.ntile(5).over(
+                order_by=(totals.c.revenue, totals.c.customer_id)
+            ).label("monetary_score"),
+            func.rank().over(order_by=desc(totals.c.revenue)).label("revenue_rank"),
+            func.avg(totals.c.revenue).over().label("avg_revenue"),
+        ).subquery()
+
+        r, f, m = scored.c.recency_score, scored.c.frequency_score, scored.c.monetary_score
+        segment = case(
+            *((rule(r, f, m), name) for name, rule in RFM_SEGMENTS),
+            else_=OTHER_SEGMENT,
+        )
+        return select(scored, segment.label("rfm_segment")).subquery()
+
+    def get_customer_value_summary(
+        self,
+        as_of: datetime,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        status=None,
+        tier=None,
+    ) -> Dict[str, Any]:
+        """
+        Summarize customer value in one aggregate query.
+
+        Args:
+            as_of (datetime): Reference time for the new and inactive segments
+            start_date (Optional[datetime]): Only count sales from this time
+            end_date (Optional[datetime]): Only count sales up to this time
+            status: Only count customers with this status
+            tier: Only count customers in this tier
+
+        Returns:
+            Dict[str, Any]: customers_with_orders, order_count,
+            total_revenue, average_lifetime_value, the new (first order in
+            the last 30 days), returning (more than one order), inactive (no
+            order in the last 90 days) and high_value (over twice the
+            average revenue) customer counts, and one count per RFM segment
+            (rfm_<segment>)
+        """
+        values = self._customer_values(start_date, end_date, status, tier)
+
+        def count_where(condition):
+            return func.coalesce(func.sum(case((condition, 1), else_=0)), 0)
+
+        columns = [
+            func.count(values.c.customer_id).label("customers_with_orders"),
+            func.coalesce(func.sum(values.c.order_count), 0).label("order_count"),
+            func.coalesce(func.sum(values.c.revenue), 0.0).label("total_revenue"),
+            func.coalesce(func.avg(values.c.revenue), 0.0).label("average_lifetime_value"),
+            count_where(values.c.first_order >= as_of - timedelta(days=30)).label("new_customers"),
+            count_where(values.c.order_count > 1).label("returning_customers"),
+            count_where(values.c.last_order < as_of - timedelta(days=90)).label("inactive_customers"),
+            count_where(values.c.revenue > values.c.avg_revenue * 2).label("high_value_customers"),
+        ]
+        columns += [
+            count_where(values.c.rfm_segment == name).label(f"rfm_{name}")
+            for name in [name for name, _ in RFM_SEGMENTS] + [OTHER_SEGMENT]
+        ]
+        return dict(self.session.execute(select(*columns)).one()._mapping)
+
+    def get_customer_value_rows(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        status=None,
+        tier=None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Get per-customer value, highest revenue first.
+
+        Args:
+            start_date (Optional[datetime]): Only count sales from this time
+            end_date (Optional[datetime]): Only count sales up to this time
+            status: Only include customers with this status
+            tier: Only include customers in this tier
+            limit (Optional[int]): Maximum number of customers to return
+
+        Returns:
+            List[Dict[str, Any]]: customer_id, name, order_count, revenue,
+            first_order, last_order, the RFM scores and segment, and
+            revenue_rank per customer
+        """
+        values = self._customer_values(start_date, end_date, status, tier)
+        query = (
+            select(
+                values.c.customer_id,
+                self.model.name,
+                values.c.order_count,
+                values.c.revenue,
+                values.c.first_order,
+                values.c.last_order,
+                values.c.recency_score,
+                values.c.frequency_score,
+                values.c.monetary_score,
+                values.c.rfm_segment,
+                values.c.revenue_rank,
+            )
+            .join(self.model, self.model.id == values.c.customer_id)
+            .order_by(values.c.revenue_rank, values.c.customer_id)
+        )
+        if limit is not None:
+            query = query.limit(limit)
+        return [dict(row._mapping) for row in self.session.execute(query)]
+
+    def get_top_customers_by_revenue(
+        self, limit: int = 10
+    ) -> List[Tuple[Customer, Dict[str, Any]]]:
+        """
+        Get the customers with the highest revenue and their value rows.
+
+        Args:
+            limit (int): Number of customers to return
+
+        Returns:
+            List[Tuple[Customer, Dict[str, Any]]]: Customer (sensitive
+            fields decrypted) and value row, highest revenue first
+        """
+        rows = self.get_customer_value_rows(limit=limit)
+        customers = {
+            customer.id: self._decrypt_sensitive_fields(customer)
+            for customer in self.session.query(self.model).filter(
+                self.model.id.in_([row["customer_id"] for row in rows])
+            )
+        }
+        return [
+            (customers[row["customer_id"]], row)
+            for row in rows
+            if row["customer_id"] in customers
+        ]
@@ -301,6 +301,8 @@ class DynamicMaterialRepository(BaseRepository[DynamicMaterial]):
     def get_low_stock_materials(self, skip: int = 0, limit: int = 100) -> List[DynamicMaterial]:
         """
         Get materials that are low in stock (below reorder point).
+
+        The filter matches the partial index idx_dynamic_materials_low_stock.
         """
         query = self.session.query(self.model).filter(
             and_(
@@ -16,7 +16,7 @@ from sqlalchemy.exc import SQLAlchemyError, IntegrityError
 from sqlalchemy import func, and_, or_
 
 from app.repositories.base_repository import BaseRepository
-from app.db.models.entity_translation import EntityTranslation
+from app.db.models.entity_translation import EntityTranslation, TranslationCatalogVersion
 from app.core.exceptions import (
     DatabaseException,
     ValidationException,
@@ -74,7 +74,7 @@ class EntityTranslationRepository(BaseRepository[EntityTranslation]):
                 f"locale={locale}, field_name={field_name}"
             )
 
-            translation = self.db_session.query(EntityTranslation).filter(
+            translation = self.session.query(EntityTranslation).filter(
                 and_(
                     EntityTranslation.entity_type == entity_type,
                     EntityTranslation.entity_id == entity_id,
@@ -122,7 +122,7 @@ class EntityTranslationRepository(BaseRepository[EntityTranslation]):
                 f"entity_id={entity_id}, locale={locale}, fields={field_names}"
             )
 
-            query = self.db_session.query(EntityTranslation).filter(
+            query = self.session.query(EntityTranslation).filter(
                 and_(
                     EntityTranslation.entity_type == entity_type,
                     EntityTranslation.entity_id == entity_id
@@ -176,7 +176,7 @@ class EntityTranslationRepository(BaseRepository[EntityTranslation]):
                 f"entity_id={entity_id}, field_name={field_name}, locales={locales}"
             )
 
-            query = self.db_session.query(EntityTranslation).filter(
+            query = self.session.query(EntityTranslation).filter(
                 and_(
                     EntityTranslation.entity_type == entity_type,
                     EntityTranslation.entity_id == entity_id,
@@ -196,6 +196,60 @@ class EntityTranslationRepository(BaseRepository[EntityTranslation]):
             self.logger.error(f"Database error finding field translations: {e}", exc_info=True)
             raise DatabaseException(f"Failed to find field translations: {str(e)}")
 
+    def find_translations_for_entities(
+            self,
+            entity_type: str,
+            entity_ids: List[int],
+            locales: List[str],
+            field_names: Optional[List[str]] = None
+    ) -> List[EntityTranslation]:
+        """
+        Find translations for a batch of entities in a single query.
+
+        Used to hydrate a page of entities at once instead of querying
+        every field of every entity separately.
+
+        Args:
+            entity_type: Type of entity
+            entity_ids: IDs of the entities
+            locales: Locales to load (typically the requested and default locale)
+            field_names: Optional list of field names to filter by
+
+        Returns:
+            List of EntityTranslation objects
+
+        Raises:
+            DatabaseException: If database operation fails
+        """
+        if not entity_ids or not locales:
+            return []
+
+        try:
+            self.logger.debug(
+                f"Finding translations for {len(entity_ids)} {entity_type} entities, "
+                f"locales={locales}, fields={field_names}"
+            )
+
+            query = self.session.query(EntityTranslation).filter(
+                and_(
+                    EntityTranslation.entity_type == entity_type,
+                    EntityTranslation.entity_id.in_(entity_ids),
+                    EntityTranslation.locale.in_(locales)
+                )
+            )
+
+            if field_names:
+                query = query.filter(EntityTranslation.field_name.in_(field_names))
+
+            translations = query.all()
+
+            self.logger.debug(f"Found {len(translations)} translations")
+            return translations
+
+        except SQLAlchemyError as e:
+            self.logger.error(f"Database error finding batch translations: {e}", exc_info=True)
+            raise DatabaseException(f"Failed to find batch translations: {str(e)}")
+
     def find_all_for_entity_type(
             self,
             entity_type: str,
@@ -224,7 +278,7 @@ class EntityTranslationRepository(BaseRepository[EntityTranslation]):
                 f"locale={locale}, limit={limit}, offset={offset}"
             )
 
-            query = self.db_session.query(EntityTranslation).filter(
+            query = self.session.query(EntityTranslation).filter(
                 EntityTranslation.entity_type == entity_type
             )
 
@@ -253,6 +307,93 @@ class EntityTranslationRepository(BaseRepository[EntityTranslation]):
             self.logger.error(f"Database error finding entity type translations: {e}", exc_info=True)
             raise DatabaseException(f"Failed to find entity type translations: {str(e)}")
 
+    def find_catalog_values(
+            self,
+            entity_type: str,
+            locale: str
+    ) -> List[Tuple[int, str, str]]:
+        """
+        Load every translation of an entity type in one locale.
+
+        Used to fill the in-process translation catalog.
+
+        Args:
+            entity_type: Type of entity
+            locale: Locale code
+
+        Returns:
+            List of (entity_id, field_name, translated_value) tuples
+
+        Raises:
+            DatabaseException: If database operation fails
+        """
+        try:
+            return self.session.query(
+                EntityTranslation.entity_id,
+                EntityTranslation.field_name,
+                EntityTranslation.translated_value
+            ).filter(
+                and_(
+                    EntityTranslation.entity_type == entity_type,
+                    EntityTranslation.locale == locale
+                )
+            ).all()
+
+        except SQLAlchemyError as e:
+            self.logger.error(f"Database error loading translation catalog: {e}", exc_info=True)
+            raise DatabaseException(f"Failed to load translation catalog: {str(e)}")
+
+    def get_catalog_versions(self) -> Dict[str, int]:
+        """
+        Get the current version of every translation catalog.
+
+        Returns:
+            Dictionary mapping catalog keys (entity types) to versions
+
+        Raises:
+            DatabaseException: If database operation fails
+        """
+        try:
+            rows = self.session.query(
+                TranslationCatalogVersion.catalog,
+                TranslationCatalogVersion.version
+            ).all()
+            return {catalog: version for catalog, version in rows}
+
+        except SQLAlchemyError as e:
+            self.logger.error(f"Database error reading catalog versions: {e}", exc_info=True)
+            raise DatabaseException(f"Failed to read catalog versions: {str(e)}")
+
+    def bump_catalog_version(self, catalog: str) -> None:
+        """
+        Record a change to a translation catalog.
+
+        Args:
+            catalog: Catalog key (an entity type)
+
+        Raises:
+            DatabaseException: If database operation fails
+        """
+        try:
+            updated = self.session.query(TranslationCatalogVersion).filter(
+                TranslationCatalogVersion.catalog == catalog
+            ).update(
+                {"version": TranslationCatalogVersion.version + 1},
+                synchronize_session=False
+            )
+            if not updated:
+                self.session.add(TranslationCatalogVersion(catalog=catalog, version=1))
+            self.session.commit()
+
+        except IntegrityError:
+            # Another worker created the row first
+            self.session.rollback()
+            self.bump_catalog_version(catalog)
+        except SQLAlchemyError as e:
+            self.logger.error(f"Database error bumping catalog version: {e}", exc_info=True)
+            self.session.rollback()
+            raise DatabaseException(f"Failed to bump catalog version: {str(e)}")
+
     def upsert_translation(
             self,
             entity_type: str,
@@ -260,7 +401,8 @@ class EntityTranslationRepository(BaseRepository[EntityTranslation]):
             locale: str,
             field_name: str,
             translated_value: str,
-            user_id: Optional[int] = None
+            user_id: Optional[int] = None,
+            bump_version: bool = True
     ) -> EntityTranslation:
         """
         Create or update a translation with comprehensive error handling.
@@ -272,6 +414,8 @@ class EntityTranslationRepository(BaseRepository[EntityTranslation]):
             field_name: Name of the field
             translated_value: The translated content
             user_id: Optional user ID for audit logging
+            bump_version: Whether to bump the entity type's catalog version
+                (bulk callers bump once at the end instead)
 
         Returns:
             The created or updated EntityTranslation object
@@ -316,6 +460,8 @@ class EntityTranslationRepository(BaseRepository[EntityTranslation]):
                 }
 
                 updated = self.update(existing.id, updated_data)
+                if bump_version:
+                    self.bump_catalog_version(entity_type)
 
                 self.logger.info(
                     f"Updated translation ID {existing.id}: "
@@ -334,6 +480,8 @@ class EntityTranslationRepository(BaseRepository[EntityTranslation]):
                 }
 
                 created = self.create(new_data)
+                if bump_version:
+                    self.bump_catalog_version(entity_type)
 
                 self.logger.info(
                     f"Created translation ID {created.id} for "
@@ -348,14 +496,17 @@ class EntityTranslationRepository(BaseRepository[EntityTranslation]):
         except IntegrityError as e:
             self.logger.error(f"Integrity error in upsert_translation: {e}", exc_info=True)
             # Handle potential race condition where translation was created between find and create
-            self.db_session.rollback()
+            self.session.rollback()
             existing = self.find_translation(entity_type, entity_id, locale, field_name)
             if existing:
                 # Another process created it, update instead
-                return self.update(existing.id, {
+                updated = self.update(existing.id, {
                     "translated_value": translated_value,
                     "updated_at": datetime.utcnow()
                 })
+                if bump_version:
+                    self.bump_catalog_version(entity_type)
+                return updated
             else:
                 raise DatabaseException(f"Database integrity error: {str(e)}")
         except SQLAlchemyError as e:
@@ -394,7 +545,8 @@ class EntityTranslationRepository(BaseRepository[EntityTranslation]):
                         locale=data.get('locale'),
                         field_name=data.get('field_name'),
                         translated_value=data.get('translated_value'),
-                        user_id=user_id
+                        user_id=user_id,
+                        bump_version=False
                     )
                     successful_translations.append(translation)
 
@@ -404,7 +556,10 @@ class EntityTranslationRepository(BaseRepository[EntityTranslation]):
                     self.logger.warning(error_msg)
 
             # Commit successful operations
-            self.db_session.commit()
+            self.session.commit()
+
+            for entity_type in {t.entity_type for t in successful_translations}:
+                self.bump_catalog_version(entity_type)
 
             self.logger.info(
                 f"Bulk upsert completed: {len(successful_translations)} successful, "
@@ -415,7 +570,7 @@ class EntityTranslationRepository(BaseRepository[EntityTranslation]):
 
         except SQLAlchemyError as e:
             self.logger.error(f"Database error in bulk_upsert_translations: {e}", exc_info=True)
-            self.db_session.rollback()
+            self.session.rollback()
             raise DatabaseException(f"Bulk upsert transaction failed: {str(e)}")
 
     def delete_translations_for_entity(
@@ -444,21 +599,23 @@ class EntityTranslationRepository(BaseRepository[EntityTranslation]):
                 f"(requested by user {user_id})"
             )
 
-            deleted_count = self.db_session.query(EntityTranslation).filter(
+            deleted_count = self.session.query(EntityTranslation).filter(
                 and_(
                     EntityTranslation.entity_type == entity_type,
                     EntityTranslation.entity_id == entity_id
                 )
             ).delete(synchronize_session=False)
 
-            self.db_session.commit()
+            self.session.commit()
+            if deleted_count:
+                self.bump_catalog_version(entity_type)
 
             self.logger.info(f"Deleted {deleted_count} translations for {entity_type}#{entity_id}")
             return deleted_count
 
         except SQLAlchemyError as e:
             self.logger.error(f"Database error deleting entity translations: {e}", exc_info=True)
-            self.db_session.rollback()
+            self.session.rollback()
             raise DatabaseException(f"Failed to delete entity translations: {str(e)}")
 
     def delete_translations_for_entity_type(
@@ -487,18 +644,20 @@ class EntityTranslationRepository(BaseRepository[EntityTranslation]):
                 f"(requested by user {user_id})"
             )
 
-            deleted_count = self.db_session.query(EntityTranslation).filter(
+            deleted_count = self.session.query(EntityTranslation).filter(
                 EntityTranslation.entity_type == entity_type
             ).delete(synchronize_session=False)
 
-            self.db_session.commit()
+            self.session.commit()
+            if deleted_count:
+                self.bump_catalog_version(entity_type)
 
             self.logger.warning(f"Deleted {deleted_count} translations for entity type '{entity_type}'")
             return deleted_count
 
         except SQLAlchemyError as e:
             self.logger.error(f"Database error deleting entity type translations: {e}", exc_info=True)
-            self.db_session.rollback()
+            self.session.rollback()
             raise DatabaseException(f"Failed to delete entity type translations: {str(e)}")
 
     def get_entity_types_with_translations(self) -> List[str]:
@@ -512,7 +671,7 @@ class EntityTranslationRepository(BaseRepository[EntityTranslation]):
             DatabaseException: If database operation fails
         """
         try:
-            result = self.db_session.query(
+            result = self.session.query(
                 EntityTranslation.entity_type
             ).distinct().order_by(EntityTranslation.entity_type).all()
 
@@ -538,7 +697,7 @@ class EntityTranslationRepository(BaseRepository[EntityTranslation]):
             DatabaseException: If database operation fails
         """
         try:
-            result = self.db_session.query(
+            result = self.session.query(
                 EntityTranslation.locale
             ).filter(
                 EntityTranslation.entity_type == entity_type
@@ -566,28 +725,28 @@ class EntityTranslationRepository(BaseRepository[EntityTranslation]):
             self.logger.debug("Generating translation statistics")
 
             # Total count
-            total_translations = self.db_session.query(EntityTranslation).count()
+            total_translations = self.session.query(EntityTranslation).count()
 
             # Count by entity type
-            entity_type_counts = self.db_session.query(
+            entity_type_counts = self.session.query(
                 EntityTranslation.entity_type,
                 func.count(EntityTranslation.id).label('count')
             ).group_by(EntityTranslation.entity_type).all()
 
             # Count by locale
-            locale_counts = self.db_session.query(
+            locale_counts = self.session.query(
                 EntityTranslation.locale,
                 func.count(EntityTranslation.id).label('count')
             ).group_by(EntityTranslation.locale).all()
 
             # Unique entities with translations
-            unique_entities = self.db_session.query(
+            unique_entities = self.session.query(
                 EntityTranslation.entity_type,
                 EntityTranslation.entity_id
             ).distinct().count()
 
             # Most recent update
-            latest_update = self.db_session.query(
+            latest_update = self.session.query(
                 func.max(EntityTranslation.updated_at)
             ).scalar()
 
@@ -639,7 +798,7 @@ class EntityTranslationRepository(BaseRepository[EntityTranslation]):
             )
 
             # Find translations for entity type that don't have valid entity IDs
-            orphaned_query = self.db_session.query(EntityTranslation).filter(
+            orphaned_query = self.session.query(EntityTranslation).filter(
                 and_(
                     EntityTranslation.entity_type == entity_type,
                     ~EntityTranslation.entity_id.in_(valid_entity_ids) if valid_entity_ids else True
@@ -657,12 +816,14 @@ class EntityTranslationRepository(BaseRepository[EntityTranslation]):
                 return count, orphaned_entity_ids
             else:
                 count = orphaned_query.delete(synchronize_session=False)
-                self.db_session.commit()
+                self.session.commit()
+                if count:
+                    self.bump_catalog_version(entity_type)
                 self.logger.info(f"Deleted {count} orphaned translations")
                 return count, orphaned_entity_ids
 
         except SQLAlchemyError as e:
             self.logger.error(f"Database error cleaning up orphaned translations: {e}", exc_info=True)
             if not dry_run:
-                self.db_session.rollback()
+                self.session.rollback()
             raise DatabaseException(f"Failed to cleanup orphaned translations: {str(e)}")
\ No newline at end of file
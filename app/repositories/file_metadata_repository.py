@@ -143,6 +143,65 @@ class FileMetadataRepository(BaseRepository[FileMetadata]):
             .all()
         )
 
+    def get_blob_reference(self, checksum: str) -> Optional[FileMetadata]:
+        """
+        Get the oldest metadata row referencing the blob for a checksum.
+
+        Soft-deleted rows are included because their blob is still on disk.
+
+        Args:
+            checksum: File checksum hash
+
+        Returns:
+            FileMetadata if any row references the checksum, None otherwise
+        """
+        return (
+            self.session.query(FileMetadata)
+            .filter(FileMetadata.checksum == checksum)
+            .order_by(FileMetadata.id)
+            .first()
+        )
+
+    def sync_ref_count(self, checksum: str) -> int:
+        """
+        Recount the rows referencing a checksum and store the result on each of them.
+
+        Counting instead of incrementing keeps the value correct when two
+        uploads of the same content race each other. Soft-deleted rows are
+        counted: their blob stays on disk until they are permanently deleted
+        (see get_blob_reference), so they still hold a reference.
+
+        Args:
+            checksum: File checksum hash
+
+        Returns:
+            Number of metadata rows referencing the checksum
+        """
+        ref_count = (
+            self.session.query(func.count(FileMetadata.id))
+            .filter(FileMetadata.checksum == checksum)
+            .scalar()
+            or 0
+        )
+        if ref_count:
+            self.session.query(FileMetadata).filter(
+                FileMetadata.checksum == checksum
+            ).update({"ref_count": ref_count}, synchronize_session="fetch")
+        self.session.commit()
+        return ref_count
+
+    def list_all_references(self) -> List[FileMetadata]:
+        """
+        List every metadata row, including soft-deleted ones.
+
+        Used by the deduplication tool, which has to see every row that
+        references a file on disk.
+
+        Returns:
+            List of FileMetadata instances ordered by ID
+        """
+        return self.session.query(FileMetadata).order_by(FileMetadata.id).all()
+
     def mark_as_deleted(self, file_id: str) -> Optional[FileMetadata]:
         """
         Mark a file as deleted (soft delete).
@@ -2,11 +2,14 @@
 
 from typing import List, Optional, Dict, Any, Tuple
 from sqlalchemy.orm import Session
-from sqlalchemy import or_, and_, func
+from sqlalchemy import or_, and_, case, func, update
 from datetime import datetime
 
 from app.db.models.inventory import Inventory
 from app.db.models.enums import InventoryStatus
+from app.db.models.material import Material
+from app.db.models.product import Product
+from app.db.models.tool import Tool
 from app.repositories.base_repository import BaseRepository
 import logging
 
@@ -91,54 +94,16 @@ class InventoryRepository(BaseRepository[Inventory]):
 
     def count_needs_reorder(self) -> int:
         """
-        Counts inventory records where quantity is at or below the reorder point
-        of the associated Product or Material. Requires JOINs.
-        """
-        logger.debug("Counting inventory items needing reorder.")
-        # Import models needed for JOINs within the method if not globally imported
-        from app.db.models.product import Product
-        from app.db.models.material import Material
-
-        # Add Tool if tools have reorder points
+        Counts inventory records at or below the reorder point of their item.
 
-        # Query for products needing reorder
-        product_reorder_query = (
-            self.session.query(func.count(self.model.id))
-            .join(
-                Product,
-                and_(
-                    self.model.item_type == "product", self.model.item_id == Product.id
-                ),
-            )
-            .filter(Product.reorder_point > 0)  # Ensure reorder point is set
-            .filter(self.model.quantity <= Product.reorder_point)
-        )
-
-        # Query for materials needing reorder
-        material_reorder_query = (
+        Reads the needs_reorder flag through its partial index.
+        """
+        count = (
             self.session.query(func.count(self.model.id))
-            .join(
-                Material,
-                and_(
-                    self.model.item_type == "material",
-                    self.model.item_id == Material.id,
-                ),
-            )
-            .filter(Material.reorder_point > 0)  # Ensure reorder point is set
-            .filter(self.model.quantity <= Material.reorder_point)
-        )
-
-        # Add query for tools if they have reorder points
-
-        product_count = product_reorder_query.scalar() or 0
-        material_count = material_reorder_query.scalar() or 0
-        # tool_count = ...
-
-        total_needs_reorder = product_count + material_count  # + tool_count
-        logger.debug(
-            f"Found {total_needs_reorder} items needing reorder ({product_count} products, {material_count} materials)."
+            .filter(self.model.needs_reorder == True)  # noqa: E712
+            .scalar()
         )
-        return total_needs_reorder
+        return count or 0
 
     def get_inventory_by_item_and_location(
         self, item_type: str, item_id: int, location: str
@@ -163,145 +128,70 @@ class InventoryRepository(BaseRepository[Inventory]):
         )
         return self._decrypt_sensitive_fields(entity) if entity else None
 
-    def get_low_stock_inventory_detailed(
+    def get_reorder_inventory(
         self,
         threshold_percentage: float = 100.0,
         item_type: Optional[str] = None,
         limit: int = 500,
-    ) -> List[Tuple[Inventory, Dict[str, Any]]]:
+    ) -> List[Any]:
         """
-        Fetches low stock inventory records along with essential item details.
-        Returns tuples of (InventoryObject, ItemDetailsDict).
-        """
-        logger.debug(
-            f"Fetching detailed low stock items: threshold={threshold_percentage}%, type={item_type or 'All'}"
-        )
-        # This is complex because details come from different tables (Product, Material, Tool)
-        # Option 1: Fetch low stock inventory IDs first, then fetch details individually (less efficient)
-        # Option 2: Use UNION or complex JOINs (more efficient but harder to write/maintain)
-
-        # --- Using Option 1 (Simpler to implement) ---
-        low_stock_inventories = (
-            self.get_low_stock_inventory(  # Use the basic low stock method
-                item_type=item_type,
-                threshold_percentage=threshold_percentage,  # Pass threshold
-                limit=limit,
-            )
-        )
+        Get inventory at or below a percentage of its item's reorder point.
 
-        results = []
-        # Requires _get_item_details helper in *this* repository OR access to the service layer
-        # For simplicity, assuming InventoryService._get_item_details can be accessed or duplicated here
-        # Ideally, this logic might live entirely in the service layer calling simpler repo methods.
-        for inv in low_stock_inventories:
-            # *** IMPORTANT: Requires access to _get_item_details logic ***
-            # This is a dependency violation if called directly from service.
-            # Better: Service calls repo.get_low_stock_inventory(), then service loops and calls _get_item_details()
-            # For now, assume logic is available here:
-            item_details = self._get_item_details_for_repo(
-                inv.item_type, inv.item_id
-            )  # Placeholder name
-            if item_details:
-                results.append((inv, item_details))
-        logger.debug(f"Found {len(results)} detailed low stock items.")
-        return results
-
-    # Placeholder for the detail fetching logic needed by get_low_stock_inventory_detailed
-    # This should ideally use injected services or be handled entirely in the service layer.
-    def _get_item_details_for_repo(
-        self, item_type: str, item_id: int
-    ) -> Optional[Dict[str, Any]]:
-        # WARNING: This introduces service dependencies into the repository, which is not ideal.
-        # Consider refactoring this logic into the service layer.
-        from app.db.models.product import Product
-        from app.db.models.material import Material
-
-        # from app.db.models.tool import Tool # If needed
-
-        logger.debug(f"Repo: Getting item details for {item_type} {item_id}")
-        if item_type == "product":
-            item = self.session.query(Product).filter(Product.id == item_id).first()
-            if item:
-                return {
-                    "name": item.name,
-                    "cost": item.total_cost,
-                    "reorder_point": item.reorder_point,
-                    "unit": "piece",
-                    "sku": item.sku,
-                }
-        elif item_type == "material":
-            item = self.session.query(Material).filter(Material.id == item_id).first()
-            if item:
-                return {
-                    "name": item.name,
-                    "cost": item.cost,
-                    "reorder_point": item.reorder_point,
-                    "unit": item.unit.name if item.unit else None,
-                    "supplier_id": item.supplier_id,
-                }
-        # Add Tool logic if needed
-        # elif item_type == 'tool': ...
-        return None
-
-    def get_low_stock_inventory(  # Basic version used by detailed one
-        self,
-        item_type: Optional[str] = None,
-        threshold_percentage: float = 100.0,
-        skip: int = 0,
-        limit: int = 100,
-    ) -> List[Inventory]:
-        """Gets inventory items at or below reorder threshold"""
-        from app.db.models.product import Product
-        from app.db.models.material import Material
+        Up to 100% these are a subset of the records flagged needs_reorder,
+        so only the partial index on the flag is read; higher thresholds
+        compare every product's and material's stock with its reorder point.
 
-        query = self.session.query(self.model)
-        conditions = []
-
-        # Product condition
-        product_cond = and_(
-            self.model.item_type == "product",
-            Product.reorder_point > 0,
-            self.model.quantity
-            <= (Product.reorder_point * (threshold_percentage / 100.0)),
+        Args:
+            threshold_percentage: Percentage of the reorder point
+            item_type: Optional item type ('product' or 'material')
+            limit: Maximum number of rows
+
+        Returns:
+            Row mappings with inventory_id, item_type, item_id, name,
+            quantity, status, reorder_point, storage_location and
+            material_unit, lowest stock relative to reorder point first
+        """
+        item = func.lower(self.model.item_type)
+        reorder_point = func.coalesce(
+            case(
+                (item == "product", Product.reorder_point),
+                (item == "material", Material.reorder_point),
+            ),
+            0.0,
         )
-        query_prod = query.join(Product, self.model.item_id == Product.id).filter(
-            product_cond
+        query = (
+            self.session.query(
+                self.model.id.label("inventory_id"),
+                self.model.item_type,
+                self.model.item_id,
+                case(
+                    (item == "product", Product.name),
+                    (item == "material", Material.name),
+                ).label("name"),
+                self.model.quantity,
+                self.model.status,
+                reorder_point.label("reorder_point"),
+                self.model.storage_location,
+                Material.unit.label("material_unit"),
+            )
+            .select_from(self.model)
+            .outerjoin(Product, and_(item == "product", Product.id == self.model.item_id))
+            .outerjoin(Material, and_(item == "material", Material.id == self.model.item_id))
         )
-
-        # Material condition
-        material_cond = and_(
-            self.model.item_type == "material",
-            Material.reorder_point > 0,
-            self.model.quantity
-            <= (Material.reorder_point * (threshold_percentage / 100.0)),
+        if threshold_percentage <= 100:
+            query = query.filter(self.model.needs_reorder == True)  # noqa: E712
+        if item_type:
+            query = query.filter(item == item_type.lower())
+        query = query.filter(
+            reorder_point > 0,
+            self.model.quantity <= reorder_point * (threshold_percentage / 100.0),
         )
-        query_mat = query.join(Material, self.model.item_id == Material.id).filter(
-            material_cond
+        rows = (
+            query.order_by(self.model.quantity / reorder_point, self.model.id)
+            .limit(limit)
+            .all()
         )
-
-        # Combine queries using UNION if filtering by item_type is not done,
-        # or select the appropriate query if item_type is specified.
-        if item_type == "product":
-            final_query = query_prod
-        elif item_type == "material":
-            final_query = query_mat
-        elif item_type is None:
-            # Combine results - UNION might be complex, fetching separately might be ok for moderate data
-            # This simplified version fetches separately - consider UNION for performance
-            prod_ids = [p.id for p in query_prod.all()]
-            mat_ids = [m.id for m in query_mat.all()]
-            all_ids = list(set(prod_ids + mat_ids))  # Combine unique inventory IDs
-            if not all_ids:
-                return []
-            # Fetch final inventory objects - apply pagination here
-            final_query = self.session.query(self.model).filter(
-                self.model.id.in_(all_ids)
-            )
-        else:  # Invalid item_type or tool not handled
-            return []
-
-        entities = final_query.order_by(self.model.id).offset(skip).limit(limit).all()
-        return [self._decrypt_sensitive_fields(entity) for entity in entities]
+        return [row._mapping for row in rows]
 
     # Add count_with_filters if needed for pagination in _generate_detail_report
     def count_with_filters(
@@ -518,3 +408,187 @@ class InventoryRepository(BaseRepository[Inventory]):
                 (out_of_stock_count / total_count * 100) if total_count > 0 else 0
             ),
         }
+
+    def get_valuation(
+        self, stock_levels: Optional[Any] = None, include_items: bool = True
+    ) -> List[Any]:
+        """
+        Value the inventory in one query, joining each row to its item.
+
+        Unit cost is the product's total cost, the material's cost price or
+        the tool's purchase price. Quantities are the current ones, or those
+        of a stock levels subquery (see
+        InventoryTransactionRepository.stock_levels_as_of) to value the stock
+        at an earlier time; costs and locations are current.
+
+        Args:
+            stock_levels: Optional subquery with item_type, item_id and
+                quantity columns
+            include_items: Return one row per item in stock, sorted by value
+                (descending); otherwise one row per item type with
+                item_count and total_value
+
+        Returns:
+            Row mappings
+        """
+        item_type = func.lower(self.model.item_type)
+        quantity = self.model.quantity
+        if stock_levels is not None:
+            quantity = func.coalesce(stock_levels.c.quantity, 0)
+
+        unit_cost = func.coalesce(
+            case(
+                (item_type == "product", Product.total_cost),
+                (item_type == "material", Material.cost_price),
+                (item_type == "tool", Tool.purchase_price),
+            ),
+            0.0,
+        )
+        value = quantity * unit_cost
+
+        if include_items:
+            query = self.session.query(
+                self.model.id.label("inventory_id"),
+                self.model.item_type,
+                self.model.item_id,
+                case(
+                    (item_type == "product", Product.name),
+                    (item_type == "material", Material.name),
+                    (item_type == "tool", Tool.name),
+                ).label("name"),
+                quantity.label("quantity"),
+                Material.unit.label("material_unit"),
+                unit_cost.label("unit_cost"),
+                value.label("total_value"),
+                self.model.storage_location.label("location"),
+            )
+        else:
+            query = self.session.query(
+                item_type.label("item_type"),
+                func.count(self.model.id).label("item_count"),
+                func.sum(value).label("total_value"),
+            )
+
+        query = (
+            query.select_from(self.model)
+            .outerjoin(Product, and_(item_type == "product", Product.id == self.model.item_id))
+            .outerjoin(Material, and_(item_type == "material", Material.id == self.model.item_id))
+            .outerjoin(Tool, and_(item_type == "tool", Tool.id == self.model.item_id))
+        )
+        if stock_levels is not None:
+            query = query.outerjoin(
+                stock_levels,
+                and_(
+                    stock_levels.c.item_type == self.model.item_type,
+                    stock_levels.c.item_id == self.model.item_id,
+                ),
+            )
+        query = query.filter(quantity > 0)
+
+        if include_items:
+            query = query.order_by(value.desc(), self.model.id)
+        else:
+            query = query.group_by(item_type)
+        return [row._mapping for row in query.all()]
+
+    def apply_quantity_delta(
+        self, item_type: str, item_id: int, delta: float
+    ) -> Optional[Tuple[int, float, Optional[InventoryStatus]]]:
+        """
+        Add a delta to an item's quantity in one guarded UPDATE.
+
+        The guard is evaluated by the database against the row it updates, so
+        concurrent adjustments of the same item can never take its quantity
+        below zero and none of them is lost. The status is left unchanged.
+
+        Args:
+            item_type (str): Type of item ('material', 'product', 'tool')
+            item_id (int): ID of the item
+            delta (float): Quantity to add (negative to remove)
+
+        Returns:
+            Optional[Tuple]: Inventory ID, new quantity and current status, or
+            None if there is no inventory record or too little stock
+        """
+        table = self.model.__table__
+        quantity = func.coalesce(table.c.quantity, 0)
+        statement = (
+            update(table)
+            .where(
+                table.c.item_type == item_type,
+                table.c.item_id == item_id,
+                quantity + delta >= 0,
+            )
+            .values(quantity=quantity + delta)
+            .returning(table.c.id, table.c.quantity, table.c.status)
+        )
+        row = self.session.execute(statement).first()
+        return tuple(row) if row else None
+
+    def update_statuses(self, statuses: Dict[int, InventoryStatus]) -> None:
+        """
+        Set the status of several inventory records without committing.
+
+        Args:
+            statuses (Dict[int, InventoryStatus]): New status by inventory ID
+        """
+        if statuses:
+            self.session.execute(
+                update(self.model),
+                [{"id": inventory_id, "status": status} for inventory_id, status in statuses.items()],
+            )
+
+    def set_needs_reorder(
+        self, inventory_ids: List[int], needs_reorder: bool
+    ) -> List[int]:
+        """
+        Set the needs_reorder flag of several inventory records without committing.
+
+        Only records whose flag differs are updated, and the database decides
+        which ones those are, so of two transactions flipping the same flag
+        only the first sees the change.
+
+        Args:
+            inventory_ids (List[int]): IDs of the inventory records
+            needs_reorder (bool): New value of the flag
+
+        Returns:
+            List[int]: IDs of the records whose flag changed
+        """
+        if not inventory_ids:
+            return []
+        table = self.model.__table__
+        statement = (
+            update(table)
+            .where(table.c.id.in_(inventory_ids), table.c.needs_reorder != needs_reorder)
+            .values(needs_reorder=needs_reorder)
+            .returning(table.c.id)
+        )
+        return [row[0] for row in self.session.execute(statement)]
+
+    def get_reorder_points(
+        self, items: List[Tuple[str, int]]
+    ) -> Dict[Tuple[str, int], float]:
+        """
+        Get the reorder points of several items with one query per item type.
+
+        Args:
+            items (List[Tuple[str, int]]): (item_type, item_id) pairs
+
+        Returns:
+            Dict[Tuple[str, int], float]: Reorder point by item; tools and
+            unknown items have none and are left out
+        """
+        reorder_points = {}
+        for item_type, model in (("product", Product), ("material", Material)):
+            ids = {item_id for type_, item_id in items if type_ == item_type}
+            if not ids:
+                continue
+            rows = (
+                self.session.query(model.id, model.reorder_point)
+                .filter(model.id.in_(ids))
+                .all()
+            )
+            for item_id, reorder_point in rows:
+                reorder_points[(item_type, item_id)] = float(reorder_point or 0.0)
+        return reorder_points
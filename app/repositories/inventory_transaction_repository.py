@@ -2,10 +2,23 @@
 
 from typing import List, Optional, Dict, Any, Union
 from sqlalchemy.orm import Session
-from sqlalchemy import or_, and_, desc, func
+from sqlalchemy import (
+    DateTime,
+    and_,
+    case,
+    delete,
+    desc,
+    func,
+    insert,
+    literal,
+    or_,
+    select,
+    union_all,
+)
+from sqlalchemy.sql import Subquery
 from datetime import datetime, timedelta
 
-from app.db.models.inventory import InventoryTransaction
+from app.db.models.inventory import Inventory, InventorySnapshot, InventoryTransaction
 from app.db.models.enums import TransactionType, InventoryAdjustmentType
 from app.repositories.base_repository import BaseRepository
 
@@ -317,6 +330,269 @@ class InventoryTransactionRepository(BaseRepository[InventoryTransaction]):
 
         return self.create(transaction_data)
 
+    def bulk_create(self, transactions: List[Dict[str, Any]]) -> int:
+        """
+        Insert many inventory transactions in one statement, without committing.
+
+        Args:
+            transactions (List[Dict[str, Any]]): Column values of each
+                transaction; every dict needs the same keys
+
+        Returns:
+            int: Number of transactions inserted
+        """
+        if transactions:
+            self.session.execute(insert(self.model), transactions)
+        return len(transactions)
+
+    def _filtered_query(
+        self,
+        item_id: Optional[int] = None,
+        item_type: Optional[str] = None,
+        transaction_type: Optional[Union[TransactionType, str]] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        location: Optional[str] = None,
+    ):
+        """Build a transaction query from optional filters."""
+        query = self.session.query(self.model)
+        if item_type:
+            query = query.filter(self.model.item_type == item_type.lower())
+        if item_id is not None:
+            query = query.filter(self.model.item_id == item_id)
+        if transaction_type:
+            if isinstance(transaction_type, str):
+                transaction_type = TransactionType[transaction_type.upper()]
+            query = query.filter(self.model.transaction_type == transaction_type)
+        if start_date:
+            query = query.filter(self.model.transaction_date >= start_date)
+        if end_date:
+            query = query.filter(self.model.transaction_date <= end_date)
+        if location:
+            query = query.filter(
+                or_(self.model.from_location == location, self.model.to_location == location)
+            )
+        return query
+
+    def get_filtered_transactions(
+        self, skip: int = 0, limit: int = 100, **filters
+    ) -> List[InventoryTransaction]:
+        """
+        Get transactions matching optional filters, newest first.
+
+        Args:
+            skip (int): Number of records to skip (for pagination)
+            limit (int): Maximum number of records to return
+            **filters: item_id, item_type, transaction_type, start_date,
+                end_date and location (matching either end of a transfer)
+
+        Returns:
+            List[InventoryTransaction]: Matching transactions
+        """
+        entities = (
+            self._filtered_query(**filters)
+            .order_by(desc(self.model.transaction_date))
+            .offset(skip)
+            .limit(limit)
+            .all()
+        )
+        return [self._decrypt_sensitive_fields(entity) for entity in entities]
+
+    def get_filtered_transactions_paginated(
+        self, skip: int = 0, limit: int = 100, **filters
+    ) -> Dict[str, Any]:
+        """
+        Get a page of transactions matching optional filters, with the total.
+
+        Args:
+            skip (int): Number of records to skip (for pagination)
+            limit (int): Maximum number of records to return
+            **filters: As for get_filtered_transactions
+
+        Returns:
+            Dict[str, Any]: Dictionary with the page of items and the total count
+        """
+        return {
+            "items": self.get_filtered_transactions(skip=skip, limit=limit, **filters),
+            "total": self._filtered_query(**filters).order_by(None).count(),
+        }
+
+    def get_movement_totals(self, **filters) -> Dict[str, Any]:
+        """
+        Sum the quantities moved by all transactions matching optional filters.
+
+        Args:
+            **filters: As for get_filtered_transactions
+
+        Returns:
+            Dict[str, Any]: Transaction count, total quantity in and total
+            quantity out (positive)
+        """
+        count, quantity_in, quantity_out = (
+            self._filtered_query(**filters)
+            .with_entities(
+                func.count(self.model.id),
+                func.sum(case((self.model.quantity > 0, self.model.quantity), else_=0)),
+                func.sum(case((self.model.quantity < 0, -self.model.quantity), else_=0)),
+            )
+            .order_by(None)
+            .one()
+        )
+        return {
+            "count": count or 0,
+            "quantity_in": float(quantity_in or 0.0),
+            "quantity_out": float(quantity_out or 0.0),
+        }
+
+    # --- Ledger snapshots ---
+
+    def get_latest_snapshot_date(self, on_or_before: datetime) -> Optional[datetime]:
+        """
+        Get the date of the latest stock snapshot at or before a time.
+
+        Args:
+            on_or_before (datetime): Latest acceptable snapshot date
+
+        Returns:
+            Optional[datetime]: Snapshot date, or None if there is none
+        """
+        return (
+            self.session.query(func.max(InventorySnapshot.snapshot_date))
+            .filter(InventorySnapshot.snapshot_date <= on_or_before)
+            .scalar()
+        )
+
+    def stock_levels_as_of(
+        self,
+        as_of_date: datetime,
+        item_type: Optional[str] = None,
+        item_id: Optional[int] = None,
+    ) -> Subquery:
+        """
+        Build a subquery of stock levels including every transaction up to a time.
+
+        Starts from the latest snapshot at or before as_of_date and adds the
+        transactions recorded after it, so only that window of the ledger is
+        scanned. Without a snapshot, the current stock is replayed backwards
+        by undoing the transactions recorded after as_of_date.
+
+        Args:
+            as_of_date (datetime): Naive local time to get the stock at
+            item_type (Optional[str]): Only this item type
+            item_id (Optional[int]): Only this item ID
+
+        Returns:
+            Subquery: Columns item_type, item_id and quantity
+        """
+        tx = self.model
+        snapshot_date = self.get_latest_snapshot_date(as_of_date)
+        if snapshot_date is not None:
+            base = select(
+                InventorySnapshot.item_type,
+                InventorySnapshot.item_id,
+                InventorySnapshot.quantity.label("quantity"),
+            ).where(InventorySnapshot.snapshot_date == snapshot_date)
+            changes = select(tx.item_type, tx.item_id, tx.quantity).where(
+                tx.transaction_date > snapshot_date, tx.transaction_date <= as_of_date
+            )
+            base_model = InventorySnapshot
+        else:
+            base = select(Inventory.item_type, Inventory.item_id, Inventory.quantity.label("quantity"))
+            changes = select(tx.item_type, tx.item_id, -tx.quantity).where(
+                tx.transaction_date > as_of_date
+            )
+            base_model = Inventory
+
+        if item_type:
+            base = base.where(base_model.item_type == item_type)
+            changes = changes.where(tx.item_type == item_type)
+        if item_id is not None:
+            base = base.where(base_model.item_id == item_id)
+            changes = changes.where(tx.item_id == item_id)
+
+        movements = union_all(base, changes).subquery()
+        return (
+            select(
+                movements.c.item_type,
+                movements.c.item_id,
+                func.sum(movements.c.quantity).label("quantity"),
+            )
+            .group_by(movements.c.item_type, movements.c.item_id)
+            .subquery()
+        )
+
+    def get_stock_as_of(self, item_type: str, item_id: int, as_of_date: datetime) -> float:
+        """
+        Get one item's stock including every transaction up to a time.
+
+        Args:
+            item_type (str): Type of item ('material', 'product', 'tool')
+            item_id (int): ID of the item
+            as_of_date (datetime): Naive local time to get the stock at
+
+        Returns:
+            float: Quantity in stock
+        """
+        levels = self.stock_levels_as_of(as_of_date, item_type=item_type, item_id=item_id)
+        return float(self.session.query(func.sum(levels.c.quantity)).scalar() or 0.0)
+
+    def create_snapshot(self, snapshot_date: datetime) -> int:
+        """
+        Record every item's stock at a time, replacing any snapshot at that time.
+
+        Built from the previous snapshot plus the transactions since, so
+        snapshots taken in date order each scan one interval of the ledger.
+        Does not commit.
+
+        Args:
+            snapshot_date (datetime): Naive local time of the snapshot
+
+        Returns:
+            int: Number of items recorded
+        """
+        self.session.execute(
+            delete(InventorySnapshot).where(InventorySnapshot.snapshot_date == snapshot_date)
+        )
+        levels = self.stock_levels_as_of(snapshot_date)
+        result = self.session.execute(
+            insert(InventorySnapshot.__table__).from_select(
+                ["snapshot_date", "item_type", "item_id", "quantity"],
+                select(
+                    literal(snapshot_date, DateTime()),
+                    levels.c.item_type,
+                    levels.c.item_id,
+                    levels.c.quantity,
+                ),
+            )
+        )
+        return result.rowcount
+
+    def prune_snapshots(self, before: datetime) -> int:
+        """
+        Delete snapshots older than a time, keeping those at the start of a month.
+
+        Does not commit.
+
+        Args:
+            before (datetime): Snapshots before this time are pruned
+
+        Returns:
+            int: Number of snapshot dates pruned
+        """
+        dates = [
+            snapshot_date
+            for (snapshot_date,) in self.session.query(InventorySnapshot.snapshot_date)
+            .filter(InventorySnapshot.snapshot_date < before)
+            .distinct()
+            .all()
+            if snapshot_date != snapshot_date.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+        ]
+        if dates:
+            self.session.execute(
+                delete(InventorySnapshot).where(InventorySnapshot.snapshot_date.in_(dates))
+            )
+        return len(dates)
+
     def get_item_transaction_history(
         self, item_type: str, item_id: int
     ) -> Dict[str, Any]:
@@ -6,7 +6,7 @@ from datetime import datetime
 from enum import Enum # Import Enum base class
 
 # Import modern SQLAlchemy components
-from sqlalchemy import select, func, or_, and_
+from sqlalchemy import select, func, or_
 from sqlalchemy.orm import Session, joinedload
 
 from app.repositories.base_repository import BaseRepository
@@ -169,6 +169,9 @@ class MaterialRepository(BaseRepository[Material]):
         """
         Get materials with quantity below or at reorder point using modern select().
 
+        The model keeps status in step with quantity and reorder point, so
+        this is a lookup on the indexed status column.
+
         Returns:
             List of materials with low stock
         """
@@ -176,12 +179,6 @@ class MaterialRepository(BaseRepository[Material]):
             or_(
                 Material.status == InventoryStatus.LOW_STOCK,
                 Material.status == InventoryStatus.OUT_OF_STOCK,
-                # Ensure reorder_point is not None before comparing
-                and_(
-                    Material.reorder_point != None,
-                    Material.reorder_point > 0,
-                    Material.quantity <= Material.reorder_point,
-                ),
             )
         )
         results = self.session.execute(stmt)
@@ -409,6 +409,52 @@ class ProductRepository(BaseRepository[Product]):
             logger.debug(f"No product found for SKU {sku}")
         return self._decrypt_sensitive_fields(entity) if entity else None
 
+    def get_pricing_columns(
+        self, product_type: Optional[ProjectType] = None
+    ) -> Dict[str, List[Any]]:
+        """
+        Read the pricing inputs of every product as columns, in one query.
+
+        Products whose cost was never split into components are priced
+        from total_cost, counted as material cost.
+
+        Args:
+            product_type: Only products of this type
+
+        Returns:
+            Dictionary of column name (id, sku, name, selling_price, material,
+            hardware, labor, overhead) to a list of values in product ID order;
+            missing prices and costs are 0.0
+        """
+        unsplit = and_(
+            self.model.material_cost.is_(None),
+            self.model.hardware_cost.is_(None),
+            self.model.labor_cost.is_(None),
+            self.model.overhead_cost.is_(None),
+        )
+        query = self.session.query(
+            self.model.id,
+            self.model.sku,
+            self.model.name,
+            func.coalesce(self.model.selling_price, 0.0).label("selling_price"),
+            case(
+                (unsplit, func.coalesce(self.model.total_cost, 0.0)),
+                else_=func.coalesce(self.model.material_cost, 0.0),
+            ).label("material"),
+            func.coalesce(self.model.hardware_cost, 0.0).label("hardware"),
+            func.coalesce(self.model.labor_cost, 0.0).label("labor"),
+            func.coalesce(self.model.overhead_cost, 0.0).label("overhead"),
+        ).order_by(self.model.id)
+        if product_type is not None:
+            query = query.filter(self.model.product_type == product_type)
+
+        names = [column["name"] for column in query.column_descriptions]
+        rows = query.all()
+        logger.debug(f"Read pricing columns for {len(rows)} products")
+        if not rows:
+            return {name: [] for name in names}
+        return {name: list(values) for name, values in zip(names, zip(*rows))}
+
     # --- Overridden Base Methods (If needed for specific Product logic) ---
 
     def create(self, data: Dict[str, Any]) -> Product:
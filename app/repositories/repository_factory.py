@@ -81,6 +81,7 @@ from app.repositories.workflow_step_repository import WorkflowStepRepository
 from app.repositories.workflow_execution_repository import (
     WorkflowExecutionRepository, WorkflowStepExecutionRepository
 )
+from app.repositories.workflow_resource_repository import WorkflowResourceRepository
 
 # Localization System Repository
 from app.repositories.entity_translation_repository import EntityTranslationRepository
@@ -356,6 +357,10 @@ class RepositoryFactory:
         """Create a WorkflowStepExecutionRepository instance."""
         return WorkflowStepExecutionRepository(self.session, self.encryption_service)
 
+    def create_workflow_resource_repository(self) -> WorkflowResourceRepository:
+        """Create a WorkflowResourceRepository instance."""
+        return WorkflowResourceRepository(self.session, self.encryption_service)
+
     # ================================
     # Localization System Repository
     # ================================
@@ -243,6 +243,63 @@ class SaleRepository(BaseRepository[Sale]):
 
         return {"sale": sale, "items": items}
 
+    def get_status_totals(
+        self, start_date: datetime, end_date: datetime
+    ) -> List[Dict[str, Any]]:
+        """
+        Get sale counts and totals for each status and payment status pair.
+
+        One GROUP BY over the sales created in the range.
+
+        Args:
+            start_date (datetime): Start of the date range
+            end_date (datetime): End of the date range
+
+        Returns:
+            List[Dict[str, Any]]: status, payment_status, order_count,
+            total_amount and net_revenue for each pair present
+        """
+        query = (
+            self.session.query(
+                self.model.status,
+                self.model.payment_status,
+                func.count(self.model.id).label("order_count"),
+                func.coalesce(func.sum(self.model.total_amount), 0.0).label("total_amount"),
+                func.coalesce(func.sum(self.model.net_revenue), 0.0).label("net_revenue"),
+            )
+            .filter(
+                self.model.created_at >= start_date, self.model.created_at <= end_date
+            )
+            .group_by(self.model.status, self.model.payment_status)
+        )
+        return [
+            {
+                "status": row.status,
+                "payment_status": row.payment_status,
+                "order_count": row.order_count,
+                "total_amount": float(row.total_amount),
+                "net_revenue": float(row.net_revenue),
+            }
+            for row in query.all()
+        ]
+
+    def _period_start(self, column, period: str):
+        """
+        SQL expression for the start date ('YYYY-MM-DD') of the period holding a timestamp.
+
+        Weeks start on Monday.
+        """
+        if self.session.get_bind().dialect.name == "sqlite":
+            if period == "day":
+                return func.date(column)
+            if period == "week":
+                # Forward to Sunday (unless already one), back to its Monday
+                return func.date(column, "weekday 0", "-6 days")
+            if period == "month":
+                return func.strftime("%Y-%m-01", column)
+            return func.strftime("%Y-01-01", column)
+        return func.to_char(func.date_trunc(period, column), "YYYY-MM-DD")
+
     def get_revenue_by_period(
         self,
         period: str = "month",
@@ -252,47 +309,47 @@ class SaleRepository(BaseRepository[Sale]):
         """
         Get sales revenue aggregated by time period.
 
+        Bucketing and sums are done by the database, so the cost grows with
+        the number of periods rather than the number of sales. Cancelled
+        sales are left out. Periods without sales are not returned.
+
         Args:
             period (str): Aggregation period ('day', 'week', 'month', 'year')
             start_date (Optional[datetime]): Start of the date range
             end_date (Optional[datetime]): End of the date range
 
         Returns:
-            List[Dict[str, Any]]: List of revenue data points by period
+            List[Dict[str, Any]]: Revenue data points in period order, each
+            with the period's start date ('YYYY-MM-DD'), revenue, net_revenue
+            and order_count
         """
         if not start_date:
             start_date = datetime.now() - timedelta(days=365)
         if not end_date:
             end_date = datetime.now()
 
-        if period == "day":
-            date_format = func.date(self.model.createdAt)
-        elif period == "week":
-            date_format = func.date_trunc("week", self.model.createdAt)
-        elif period == "month":
-            date_format = func.date_trunc("month", self.model.createdAt)
-        else:  # year
-            date_format = func.date_trunc("year", self.model.createdAt)
-
+        bucket = self._period_start(self.model.created_at, period).label("period")
         query = (
             self.session.query(
-                date_format.label("period"),
-                func.sum(self.model.total_amount).label("revenue"),
+                bucket,
+                func.coalesce(func.sum(self.model.total_amount), 0.0).label("revenue"),
+                func.coalesce(func.sum(self.model.net_revenue), 0.0).label("net_revenue"),
                 func.count(self.model.id).label("order_count"),
             )
             .filter(
-                and_(
-                    self.model.createdAt >= start_date, self.model.createdAt <= end_date
-                )
+                self.model.created_at >= start_date,
+                self.model.created_at <= end_date,
+                or_(self.model.status.is_(None), self.model.status != SaleStatus.CANCELLED),
             )
-            .group_by("period")
-            .order_by("period")
+            .group_by(bucket)
+            .order_by(bucket)
         )
 
         return [
             {
                 "period": row.period,
-                "revenue": float(row.revenue) if row.revenue else 0.0,
+                "revenue": float(row.revenue),
+                "net_revenue": float(row.net_revenue),
                 "order_count": row.order_count,
             }
             for row in query.all()
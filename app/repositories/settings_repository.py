@@ -1,6 +1,6 @@
 # app/repositories/settings_repository.py
 
-from typing import List, Optional, Dict, Any, Union
+from typing import List, Optional, Dict, Any, Tuple, Union
 from sqlalchemy.orm import Session, joinedload
 from sqlalchemy import or_, and_, func
 
@@ -159,6 +159,39 @@ class SettingsValueRepository:
             self.model.setting_key.in_(keys)
         ).all()
 
+    def get_values_for_scopes(
+            self,
+            scopes: List[Tuple[str, str]]
+    ) -> List[Tuple[str, Optional[str], Optional[str], Optional[str], Optional[str]]]:
+        """
+        Get every setting definition with its values in several scopes.
+
+        Outer-joins the definitions with the values stored in any of the given
+        scopes, so all settings of a scope chain are read in one query.
+
+        Args:
+            scopes: (scope_type, scope_id) pairs
+
+        Returns:
+            Rows of (setting_key, raw default value, scope_type, scope_id,
+            raw value); the scope and value columns are None for settings
+            without a value in any of the scopes
+        """
+        scope_filter = or_(*[
+            and_(self.model.scope_type == scope_type, self.model.scope_id == scope_id)
+            for scope_type, scope_id in scopes
+        ])
+        return self.session.query(
+            SettingsDefinition.key,
+            SettingsDefinition._default_value,
+            self.model.scope_type,
+            self.model.scope_id,
+            self.model._value,
+        ).outerjoin(
+            self.model,
+            and_(self.model.setting_key == SettingsDefinition.key, scope_filter)
+        ).all()
+
     def set_value(
             self,
             scope_type: str,
@@ -0,0 +1,267 @@
+# File: app/repositories/supplier_performance_repository.py
+
+from typing import Any, Dict, List, Optional
+from datetime import datetime
+from sqlalchemy.orm import Session
+from sqlalchemy import case, delete, desc, exists, func, or_, select, update
+from sqlalchemy.exc import IntegrityError
+
+from app.db.models.enums import PurchaseStatus
+from app.db.models.purchase import Purchase, PurchaseItem
+from app.db.models.supplier import Supplier
+from app.db.models.supplier_performance import SupplierPerformance
+from app.repositories.base_repository import BaseRepository
+
+
+class SupplierPerformanceRepository(BaseRepository[SupplierPerformance]):
+    """
+    Repository for the running supplier performance aggregates.
+
+    Adds single receipts and ratings to a supplier's aggregates with
+    relative UPDATEs, so concurrent writers never lose an increment, and
+    reads aggregates back per supplier or summed over all suppliers.
+    """
+
+    def __init__(self, session: Session, encryption_service=None):
+        """
+        Initialize the SupplierPerformanceRepository.
+
+        Args:
+            session (Session): SQLAlchemy database session
+            encryption_service (Optional): Service for handling field encryption/decryption
+        """
+        super().__init__(session, encryption_service)
+        self.model = SupplierPerformance
+
+    def _ensure_row(self, supplier_id: int) -> None:
+        """Create the supplier's aggregate row if it does not exist yet."""
+        if self.session.get(self.model, supplier_id) is not None:
+            return
+        try:
+            with self.session.begin_nested():
+                self.session.add(self.model(
+                    supplier_id=supplier_id,
+                    receipt_count=0,
+                    lead_time_sum=0.0,
+                    lead_time_sum_sq=0.0,
+                    due_count=0,
+                    on_time_count=0,
+                    rating_count=0,
+                ))
+        except IntegrityError:
+            # Another writer created the row first
+            pass
+
+    def add_receipt(
+        self,
+        supplier_id: int,
+        lead_time_days: float,
+        on_time: Optional[bool],
+        received_at: datetime,
+    ) -> None:
+        """
+        Add one received purchase to a supplier's aggregates. Does not commit.
+
+        Args:
+            supplier_id (int): Supplier of the purchase
+            lead_time_days (float): Days from order to receipt
+            on_time (Optional[bool]): Whether it arrived by its expected
+                delivery date; None when it had none
+            received_at (datetime): When it was received
+        """
+        self._ensure_row(supplier_id)
+        self.session.execute(
+            update(self.model)
+            .where(self.model.supplier_id == supplier_id)
+            .values(
+                receipt_count=self.model.receipt_count + 1,
+                lead_time_sum=self.model.lead_time_sum + lead_time_days,
+                lead_time_sum_sq=self.model.lead_time_sum_sq + lead_time_days ** 2,
+                due_count=self.model.due_count + (0 if on_time is None else 1),
+                on_time_count=self.model.on_time_count + (1 if on_time else 0),
+                last_received_at=received_at,
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+    def add_rating(
+        self, supplier_id: int, rating: float, alpha: float, rated_at: datetime
+    ) -> None:
+        """
+        Add one rating to a supplier's rating count and moving average.
+        Does not commit.
+
+        Args:
+            supplier_id (int): Rated supplier
+            rating (float): New rating
+            alpha (float): Weight of the new rating in the moving average
+            rated_at (datetime): When the rating was given
+        """
+        self._ensure_row(supplier_id)
+        self.session.execute(
+            update(self.model)
+            .where(self.model.supplier_id == supplier_id)
+            .values(
+                rating_count=self.model.rating_count + 1,
+                rating_ema=case(
+                    (self.model.rating_ema.is_(None), rating),
+                    else_=self.model.rating_ema + alpha * (rating - self.model.rating_ema),
+                ),
+                last_rated_at=rated_at,
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+    def get_top_rated(
+        self, limit: int = 5, min_ratings: int = 1, category: Optional[str] = None
+    ) -> List[Supplier]:
+        """
+        Get the suppliers with the highest rating average.
+
+        Args:
+            limit (int): Maximum number of suppliers to return
+            min_ratings (int): Minimum number of ratings a supplier needs
+            category (Optional[str]): Only include suppliers of this category
+
+        Returns:
+            List[Supplier]: Suppliers, highest rating first
+        """
+        query = (
+            self.session.query(Supplier)
+            .join(self.model, self.model.supplier_id == Supplier.id)
+            .filter(
+                self.model.rating_ema.isnot(None),
+                self.model.rating_count >= min_ratings,
+            )
+        )
+        if category:
+            query = query.filter(Supplier.category == category)
+        suppliers = (
+            query.order_by(desc(self.model.rating_ema), desc(self.model.rating_count))
+            .limit(limit)
+            .all()
+        )
+        return [self._decrypt_sensitive_fields(supplier) for supplier in suppliers]
+
+    def get_supplier_rows(
+        self, supplier_id: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Get suppliers with their aggregates (zeros when none were recorded).
+
+        Args:
+            supplier_id (Optional[int]): Only this supplier
+
+        Returns:
+            List[Dict[str, Any]]: id, name, category, status and rating of
+            each supplier with its aggregate columns, in id order
+        """
+        aggregates = [
+            func.coalesce(getattr(self.model, column), 0).label(column)
+            for column in (
+                "receipt_count", "lead_time_sum", "lead_time_sum_sq",
+                "due_count", "on_time_count", "rating_count",
+            )
+        ]
+        query = (
+            select(
+                Supplier.id,
+                Supplier.name,
+                Supplier.category,
+                Supplier.status,
+                Supplier.rating,
+                *aggregates,
+                self.model.rating_ema,
+                self.model.last_received_at,
+            )
+            .outerjoin(self.model, self.model.supplier_id == Supplier.id)
+            .order_by(Supplier.id)
+        )
+        if supplier_id is not None:
+            query = query.where(Supplier.id == supplier_id)
+        return [dict(row._mapping) for row in self.session.execute(query)]
+
+    def get_totals(self) -> Dict[str, Any]:
+        """
+        Sum the aggregates of all suppliers.
+
+        Returns:
+            Dict[str, Any]: Summed receipt, lead time, on-time and rating
+            counts, the number of rated suppliers and their average rating
+        """
+        row = self.session.execute(
+            select(
+                func.coalesce(func.sum(self.model.receipt_count), 0).label("receipt_count"),
+                func.coalesce(func.sum(self.model.lead_time_sum), 0.0).label("lead_time_sum"),
+                func.coalesce(func.sum(self.model.lead_time_sum_sq), 0.0).label("lead_time_sum_sq"),
+                func.coalesce(func.sum(self.model.due_count), 0).label("due_count"),
+                func.coalesce(func.sum(self.model.on_time_count), 0).label("on_time_count"),
+                func.coalesce(func.sum(self.model.rating_count), 0).label("rating_count"),
+                func.count(self.model.rating_ema).label("rated_suppliers"),
+                func.avg(self.model.rating_ema).label("average_rating"),
+            )
+        ).one()
+        return dict(row._mapping)
+
+    def get_period_purchase_totals(
+        self,
+        start: datetime,
+        end: datetime,
+        supplier_id: Optional[int] = None,
+        material_type: Optional[str] = None,
+    ) -> Dict[int, Dict[str, Any]]:
+        """
+        Count and sum the purchases created in a period per supplier.
+
+        Args:
+            start (datetime): Start of the period
+            end (datetime): End of the period
+            supplier_id (Optional[int]): Only this supplier
+            material_type (Optional[str]): Only purchases with an item of
+                this material type
+
+        Returns:
+            Dict[int, Dict[str, Any]]: Supplier ID to purchase_count and
+            total_spent; cancelled purchases left out
+        """
+        query = (
+            select(
+                Purchase.supplier_id,
+                func.count(Purchase.id).label("purchase_count"),
+                func.coalesce(func.sum(Purchase.total), 0.0).label("total_spent"),
+            )
+            .where(
+                Purchase.created_at >= start,
+                Purchase.created_at <= end,
+                or_(Purchase.status.is_(None), Purchase.status != PurchaseStatus.CANCELLED),
+            )
+            .group_by(Purchase.supplier_id)
+        )
+        if supplier_id is not None:
+            query = query.where(Purchase.supplier_id == supplier_id)
+        if material_type:
+            query = query.where(
+                exists().where(
+                    PurchaseItem.purchase_id == Purchase.id,
+                    PurchaseItem.material_type == material_type,
+                )
+            )
+        return {
+            row.supplier_id: {
+                "purchase_count": row.purchase_count,
+                "total_spent": row.total_spent,
+            }
+            for row in self.session.execute(query)
+        }
+
+    def clear(self, supplier_id: Optional[int] = None) -> None:
+        """
+        Delete aggregates before they are rebuilt. Does not commit.
+
+        Args:
+            supplier_id (Optional[int]): Only this supplier's aggregates
+        """
+        statement = delete(self.model)
+        if supplier_id is not None:
+            statement = statement.where(self.model.supplier_id == supplier_id)
+        self.session.execute(statement)
@@ -94,7 +94,8 @@ class WorkflowExecutionRepository(BaseRepository):
             raise
 
     def update_execution_status(self, execution_id: int, new_status: str,
-                                completion_data: Optional[Dict[str, Any]] = None) -> bool:
+                                completion_data: Optional[Dict[str, Any]] = None,
+                                commit: bool = True) -> bool:
         """
         Update execution status and completion data.
 
@@ -102,6 +103,8 @@ class WorkflowExecutionRepository(BaseRepository):
             execution_id: Execution ID
             new_status: New status
             completion_data: Optional completion data
+            commit: Commit the update; pass False to leave it in the caller's
+                transaction, e.g. to commit it with an outbox event
 
         Returns:
             True if updated successfully
@@ -126,7 +129,8 @@ class WorkflowExecutionRepository(BaseRepository):
             ).update(update_data)
 
             if updated_rows > 0:
-                self.db_session.commit()
+                if commit:
+                    self.db_session.commit()
                 logger.info(f"Updated execution {execution_id} status to {new_status}")
                 return True
             else:
@@ -138,13 +142,15 @@ class WorkflowExecutionRepository(BaseRepository):
             self.db_session.rollback()
             raise
 
-    def update_current_step(self, execution_id: int, step_id: int) -> bool:
+    def update_current_step(self, execution_id: int, step_id: int, commit: bool = True) -> bool:
         """
         Update the current step for an execution.
 
         Args:
             execution_id: Execution ID
             step_id: New current step ID
+            commit: Commit the update; pass False to leave it in the caller's
+                transaction
 
         Returns:
             True if updated successfully
@@ -158,7 +164,8 @@ class WorkflowExecutionRepository(BaseRepository):
             })
 
             if updated_rows > 0:
-                self.db_session.commit()
+                if commit:
+                    self.db_session.commit()
                 logger.debug(f"Updated current step for execution {execution_id} to step {step_id}")
                 return True
             else:
@@ -227,7 +234,7 @@ class WorkflowExecutionRepository(BaseRepository):
             raise
 
     def update_step_execution(self, execution_id: int, step_id: int,
-                              update_data: Dict[str, Any]) -> bool:
+                              update_data: Dict[str, Any], commit: bool = True) -> bool:
         """
         Update step execution data.
 
@@ -235,6 +242,8 @@ class WorkflowExecutionRepository(BaseRepository):
             execution_id: Execution ID
             step_id: Step ID
             update_data: Update data
+            commit: Commit the update; pass False to leave it in the caller's
+                transaction
 
         Returns:
             True if updated successfully
@@ -246,7 +255,8 @@ class WorkflowExecutionRepository(BaseRepository):
             ).update(update_data)
 
             if updated_rows > 0:
-                self.db_session.commit()
+                if commit:
+                    self.db_session.commit()
                 logger.debug(f"Updated step execution for execution {execution_id}, step {step_id}")
                 return True
             else:
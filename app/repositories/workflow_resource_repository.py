@@ -0,0 +1,191 @@
+# File: app/repositories/workflow_resource_repository.py
+
+from typing import Any, Dict, Iterable, Optional
+from datetime import date
+from sqlalchemy.orm import Session
+from sqlalchemy import and_, case, false, func, or_, select
+
+from app.db.models.dynamic_material import DynamicMaterial
+from app.db.models.tool import Tool, ToolCheckout, ToolMaintenance
+from app.db.models.workflow import WorkflowExecution, WorkflowStepResource
+from app.repositories.base_repository import BaseRepository
+
+# Executions whose reservations still hold stock
+RESERVING_EXECUTION_STATUSES = ("active", "paused")
+
+# Maintenance in these states keeps a tool out of use
+ACTIVE_MAINTENANCE_STATUSES = ("IN_PROGRESS", "WAITING_PARTS")
+
+
+class WorkflowResourceRepository(BaseRepository[WorkflowStepResource]):
+    """
+    Repository for the availability of the materials and tools that
+    workflow steps require.
+
+    Reads the stock, reservations, checkouts and maintenance of any number
+    of resources with a fixed number of queries, so readiness checks cost
+    the same for a workflow of three steps as for one of three hundred.
+    """
+
+    def __init__(self, session: Session, encryption_service=None):
+        """
+        Initialize the WorkflowResourceRepository.
+
+        Args:
+            session (Session): SQLAlchemy database session
+            encryption_service (Optional): Service for handling field encryption/decryption
+        """
+        super().__init__(session, encryption_service)
+        self.model = WorkflowStepResource
+
+    def get_material_stock(self, material_ids: Iterable[int]) -> Dict[int, Dict[str, Any]]:
+        """
+        Get the name, unit, status and quantity on hand of materials.
+
+        Args:
+            material_ids (Iterable[int]): Dynamic material IDs
+
+        Returns:
+            Dict[int, Dict[str, Any]]: Material ID to name, unit, status and
+            quantity; materials that do not exist are left out
+        """
+        material_ids = list(material_ids)
+        if not material_ids:
+            return {}
+        query = select(
+            DynamicMaterial.id,
+            DynamicMaterial.name,
+            DynamicMaterial.unit,
+            DynamicMaterial.status,
+            func.coalesce(DynamicMaterial.quantity, 0.0).label("quantity"),
+        ).where(DynamicMaterial.id.in_(material_ids))
+        return {row.id: dict(row._mapping) for row in self.session.execute(query)}
+
+    def get_reserved_material_quantities(
+        self, material_ids: Iterable[int]
+    ) -> Dict[int, float]:
+        """
+        Sum the quantities of materials reserved by running workflow executions.
+
+        Reservations are kept in the execution data of active and paused
+        executions until they are released.
+
+        Args:
+            material_ids (Iterable[int]): Dynamic material IDs
+
+        Returns:
+            Dict[int, float]: Material ID to reserved quantity, for reserved
+            materials only
+        """
+        wanted = set(material_ids)
+        if not wanted:
+            return {}
+        query = select(WorkflowExecution.execution_data).where(
+            WorkflowExecution.status.in_(RESERVING_EXECUTION_STATUSES),
+            WorkflowExecution.execution_data.isnot(None),
+        )
+        reserved: Dict[int, float] = {}
+        for execution_data in self.session.execute(query).scalars():
+            reservations = (execution_data or {}).get("resource_reservations") or {}
+            if reservations.get("status") != "active":
+                continue
+            for reservation in reservations.get("material_reservations", []):
+                material_id = reservation.get("material_id")
+                if material_id in wanted and reservation.get("status") == "reserved":
+                    reserved[material_id] = (
+                        reserved.get(material_id, 0.0) + (reservation.get("quantity") or 0)
+                    )
+        return reserved
+
+    def get_tool_availability(
+        self,
+        tool_ids: Iterable[int],
+        project_id: Optional[int] = None,
+        on_date: Optional[date] = None,
+    ) -> Dict[int, Dict[str, Any]]:
+        """
+        Get the status, open checkouts and maintenance windows of tools.
+
+        Maintenance is current when it is in progress, waiting for parts, or
+        scheduled on or before the given day and not completed.
+
+        Args:
+            tool_ids (Iterable[int]): Tool IDs
+            project_id (Optional[int]): Project the tools are needed for;
+                checkouts for it are counted separately
+            on_date (Optional[date]): Day to check (defaults to today)
+
+        Returns:
+            Dict[int, Dict[str, Any]]: Tool ID to name, status,
+            open_checkouts, project_checkouts, checked_out_until,
+            active_maintenance and next_maintenance; tools that do not exist
+            are left out
+        """
+        tool_ids = list(tool_ids)
+        if not tool_ids:
+            return {}
+        on_date = on_date or date.today()
+        for_project = (
+            ToolCheckout.project_id == project_id if project_id is not None else false()
+        )
+
+        checkouts = (
+            select(
+                ToolCheckout.tool_id,
+                func.count(ToolCheckout.id).label("open_checkouts"),
+                func.sum(case((for_project, 1), else_=0)).label("project_checkouts"),
+                func.max(ToolCheckout.due_date).label("checked_out_until"),
+            )
+            .where(
+                ToolCheckout.tool_id.in_(tool_ids),
+                ToolCheckout.status == "CHECKED_OUT",
+                ToolCheckout.returned_date.is_(None),
+            )
+            .group_by(ToolCheckout.tool_id)
+            .subquery()
+        )
+        scheduled = ToolMaintenance.status == "SCHEDULED"
+        maintenance = (
+            select(
+                ToolMaintenance.tool_id,
+                func.sum(
+                    case(
+                        (
+                            or_(
+                                ToolMaintenance.status.in_(ACTIVE_MAINTENANCE_STATUSES),
+                                and_(scheduled, ToolMaintenance.date <= on_date),
+                            ),
+                            1,
+                        ),
+                        else_=0,
+                    )
+                ).label("active_maintenance"),
+                func.min(
+                    case(
+                        (and_(scheduled, ToolMaintenance.date > on_date), ToolMaintenance.date)
+                    )
+                ).label("next_maintenance"),
+            )
+            .where(
+                ToolMaintenance.tool_id.in_(tool_ids),
+                ToolMaintenance.status != "COMPLETED",
+            )
+            .group_by(ToolMaintenance.tool_id)
+            .subquery()
+        )
+        query = (
+            select(
+                Tool.id,
+                Tool.name,
+                Tool.status,
+                func.coalesce(checkouts.c.open_checkouts, 0).label("open_checkouts"),
+                func.coalesce(checkouts.c.project_checkouts, 0).label("project_checkouts"),
+                checkouts.c.checked_out_until,
+                func.coalesce(maintenance.c.active_maintenance, 0).label("active_maintenance"),
+                maintenance.c.next_maintenance,
+            )
+            .outerjoin(checkouts, checkouts.c.tool_id == Tool.id)
+            .outerjoin(maintenance, maintenance.c.tool_id == Tool.id)
+            .where(Tool.id.in_(tool_ids))
+        )
+        return {row.id: dict(row._mapping) for row in self.session.execute(query)}
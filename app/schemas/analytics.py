@@ -59,6 +59,51 @@ class PricingCalculatorResults(BaseModel):
     )
 
 
+class BulkPricingInputs(BaseModel):
+    """Catalog-wide pricing assumptions and what-if cost changes."""
+
+    overhead: float = Field(
+        0.0,
+        ge=0,
+        description="Overhead percentage applied to direct costs (e.g., 20 for 20%).",
+    )
+    targetMargin: float = Field(
+        ...,
+        ge=0,
+        lt=100,
+        description="Desired profit margin percentage based on selling price (e.g., 40 for 40%).",
+    )
+    shippingCost: float = Field(0.0, ge=0, description="Shipping cost per unit.")
+    packagingCost: float = Field(0.0, ge=0, description="Packaging cost per unit.")
+    platformFees: float = Field(
+        0.0,
+        ge=0,
+        lt=100,
+        description="Platform fee percentage on selling price (e.g., 5 for 5%).",
+    )
+    marketingCost: float = Field(
+        0.0, ge=0, description="Fixed marketing cost allocated per unit."
+    )
+    costChanges: Dict[str, float] = Field(
+        default_factory=dict,
+        description="What-if percent change per cost component (material, hardware, labor, overhead), e.g. {\"material\": 8}.",
+    )
+    productType: Optional[str] = Field(
+        None, description="Only price products of this type (e.g., WALLET)."
+    )
+    limit: int = Field(
+        100, ge=0, le=1000, description="Products to list, lowest margin first."
+    )
+
+
+class BulkPricingResults(BaseModel):
+    """Catalog pricing before and after the what-if cost changes."""
+
+    costChanges: Dict[str, float]
+    summary: Dict[str, Any]
+    products: List[Dict[str, Any]]
+
+
 class DashboardSummary(BaseModel):
     """Dashboard summary response."""
 
@@ -90,6 +135,33 @@ class RevenueSummary(BaseModel):
     grouped_data: Dict[str, Any]
 
 
+class SalesMetrics(BaseModel):
+    """Sales metrics response."""
+
+    period: Dict[str, Any]
+    metrics: Dict[str, Any]
+    status_counts: Dict[str, int]
+    payment_status_counts: Dict[str, int]
+
+
+class RevenuePoint(BaseModel):
+    """Revenue of one period."""
+
+    period: str = Field(..., description="Start date of the period (YYYY-MM-DD)")
+    revenue: float
+    net_revenue: float
+    order_count: int
+
+
+class RevenueSeries(BaseModel):
+    """Revenue time series response."""
+
+    period: str
+    start_date: str
+    end_date: str
+    data: List[RevenuePoint]
+
+
 class InventoryStockLevels(BaseModel):
     """Inventory stock levels response."""
 
@@ -32,6 +32,8 @@ class TokenPayload(BaseModel):
     sub: str = Field(..., description="Subject identifier (user ID)")
     exp: int = Field(..., description="Token expiration timestamp")
     type: Optional[str] = Field(None, description="Token type (access or refresh)")
+    iat: Optional[int] = Field(None, description="Token issue timestamp")
+    jti: Optional[str] = Field(None, description="Unique token identifier")
 
 
 class TokenRefresh(BaseModel):
@@ -0,0 +1,234 @@
+# File: services/analytics_rollup_service.py
+
+from typing import Any, Dict, Iterable, List, Optional, Union
+from datetime import date, datetime, timedelta
+import logging
+
+from sqlalchemy.orm import Session
+
+from app.core.exceptions import ValidationException
+from app.db.models.analytics_rollup import SalesDailyRollup
+from app.repositories.analytics_rollup_repository import AnalyticsRollupRepository
+from app.services.base_service import BaseService
+
+logger = logging.getLogger(__name__)
+
+PERIODS = ("day", "week", "month", "quarter", "year")
+BREAKDOWNS = ("channel", "product_type")
+
+
+def _as_day(value: Union[date, datetime]) -> date:
+    """Calendar day of a date or datetime."""
+    return value.date() if isinstance(value, datetime) else value
+
+
+def _period_key(day: date, period: str) -> str:
+    """
+    Key of the period a day falls in.
+
+    Args:
+        day: Day to bucket
+        period: 'day', 'week' (ISO week), 'month', 'quarter' or 'year'
+
+    Returns:
+        Sortable period key such as '2024-03-05', '2024-W10', '2024-03',
+        '2024-Q1' or '2024'
+    """
+    if period == "day":
+        return day.strftime("%Y-%m-%d")
+    if period == "week":
+        iso_year, iso_week, _ = day.isocalendar()
+        return f"{iso_year}-W{iso_week:02d}"
+    if period == "quarter":
+        return f"{day.year}-Q{(day.month - 1) // 3 + 1}"
+    if period == "year":
+        return str(day.year)
+    return day.strftime("%Y-%m")
+
+
+class AnalyticsRollupService(BaseService[SalesDailyRollup]):
+    """
+    Service maintaining the daily sales and purchase rollups.
+
+    Sale, refund and purchase services refresh the days their changes
+    touch, inside their own transactions; analytics then read one row per
+    day, channel and product type instead of every order.
+    """
+
+    def __init__(
+        self,
+        session: Session,
+        repository=None,
+        security_context=None,
+        event_bus=None,
+        cache_service=None,
+    ):
+        """
+        Initialize AnalyticsRollupService with dependencies.
+
+        Args:
+            session: Database session for persistence operations
+            repository: Optional repository (defaults to AnalyticsRollupRepository)
+            security_context: Optional security context for authorization
+            event_bus: Optional event bus for publishing domain events
+            cache_service: Optional cache service for data caching
+        """
+        self.session = session
+        self.repository = repository or AnalyticsRollupRepository(session)
+        self.security_context = security_context
+        self.event_bus = event_bus
+        self.cache_service = cache_service
+
+    def refresh_sales_days(self, days: Iterable[Union[date, datetime, None]]) -> None:
+        """
+        Rebuild the sales rollups of the given days.
+
+        Runs in the caller's transaction; pending changes are flushed first
+        so the rebuild sees them.
+
+        Args:
+            days: Days (or timestamps) whose sales or refunds changed
+        """
+        self.session.flush()
+        for day in sorted({_as_day(value) for value in days if value is not None}):
+            self.repository.rebuild_sales_days(day, day)
+
+    def refresh_purchase_days(self, days: Iterable[Union[date, datetime, None]]) -> None:
+        """
+        Rebuild the purchase rollups of the given days.
+
+        Runs in the caller's transaction; pending changes are flushed first
+        so the rebuild sees them.
+
+        Args:
+            days: Days (or timestamps) whose purchases changed
+        """
+        self.session.flush()
+        for day in sorted({_as_day(value) for value in days if value is not None}):
+            self.repository.rebuild_purchase_days(day, day)
+
+    def backfill(
+        self,
+        start_date: Union[date, datetime],
+        end_date: Optional[Union[date, datetime]] = None,
+        chunk_days: int = 31,
+    ) -> Dict[str, int]:
+        """
+        Rebuild the rollups of a range of days from the raw records.
+
+        Each chunk of days is rebuilt and committed on its own, so a long
+        backfill does not hold one large transaction.
+
+        Args:
+            start_date: First day to rebuild
+            end_date: Last day to rebuild (defaults to today)
+            chunk_days: Days rebuilt per transaction
+
+        Returns:
+            Dictionary with the number of sales and purchase rollup rows written
+        """
+        first = _as_day(start_date)
+        last = _as_day(end_date or datetime.now())
+        written = {"sales_rows": 0, "purchase_rows": 0}
+        while first <= last:
+            chunk_end = min(first + timedelta(days=chunk_days - 1), last)
+            with self.transaction():
+                written["sales_rows"] += self.repository.rebuild_sales_days(first, chunk_end)
+                written["purchase_rows"] += self.repository.rebuild_purchase_days(first, chunk_end)
+            first = chunk_end + timedelta(days=1)
+        return written
+
+    def get_period_totals(
+        self,
+        start_date: Union[date, datetime],
+        end_date: Union[date, datetime],
+        period: str = "month",
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Get sales and purchase totals per period from the rollups.
+
+        Args:
+            start_date: First day of the range
+            end_date: Last day of the range
+            period: 'day', 'week', 'month', 'quarter' or 'year' (unknown
+                periods fall back to month)
+
+        Returns:
+            Dictionary of period key to revenue, net_revenue, fees, cogs,
+            refunds, expenses, profit, margin, sales_count and
+            purchase_count, in period order
+        """
+        first, last = _as_day(start_date), _as_day(end_date)
+        period_data: Dict[str, Dict[str, Any]] = {}
+
+        def bucket(day: date) -> Dict[str, Any]:
+            return period_data.setdefault(_period_key(day, period), {
+                "revenue": 0.0,
+                "net_revenue": 0.0,
+                "fees": 0.0,
+                "cogs": 0.0,
+                "refunds": 0.0,
+                "expenses": 0.0,
+                "profit": 0.0,
+                "margin": 0.0,
+                "sales_count": 0,
+                "purchase_count": 0,
+            })
+
+        for row in self.repository.get_sales_totals(first, last, "day"):
+            data = bucket(row["key"])
+            data["revenue"] += row["revenue"]
+            data["net_revenue"] += row["net_revenue"]
+            data["fees"] += row["fees"]
+            data["cogs"] += row["cogs"]
+            data["refunds"] += row["refunds"]
+            data["sales_count"] += row["order_count"]
+        for row in self.repository.get_purchase_totals(first, last):
+            data = bucket(row["day"])
+            data["expenses"] += row["spend"]
+            data["purchase_count"] += row["purchase_count"]
+
+        for data in period_data.values():
+            data["profit"] = data["revenue"] - data["expenses"]
+            data["margin"] = (
+                (data["profit"] / data["revenue"] * 100) if data["revenue"] > 0 else 0
+            )
+        return {key: period_data[key] for key in sorted(period_data)}
+
+    def get_sales_breakdown(
+        self,
+        start_date: Union[date, datetime],
+        end_date: Union[date, datetime],
+        group_by: str,
+    ) -> List[Dict[str, Any]]:
+        """
+        Get sales totals per channel or product type from the rollups.
+
+        Args:
+            start_date: First day of the range
+            end_date: Last day of the range
+            group_by: 'channel' or 'product_type'
+
+        Returns:
+            One dictionary per channel or product type ("" when unknown),
+            largest revenue first
+
+        Raises:
+            ValidationException: If group_by is not supported
+        """
+        if group_by not in BREAKDOWNS:
+            raise ValidationException(
+                f"Unsupported breakdown: {group_by}",
+                {"group_by": [f"Must be one of: {', '.join(BREAKDOWNS)}"]},
+            )
+        rows = self.repository.get_sales_totals(
+            _as_day(start_date), _as_day(end_date), group_by
+        )
+        return sorted(
+            (
+                {group_by: row["key"], **{k: v for k, v in row.items() if k != "key"}}
+                for row in rows
+            ),
+            key=lambda row: row["revenue"],
+            reverse=True,
+        )
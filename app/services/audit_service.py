@@ -8,6 +8,7 @@ import logging
 import ipaddress
 
 from app.db.models.base import Base
+from app.repositories.audit_repository import AuditRepository
 
 logger = logging.getLogger(__name__)
 
@@ -17,21 +18,35 @@ class AuditService:
     Service for audit logging of entity changes and user actions.
 
     Provides comprehensive audit trail functionality for compliance
-    and troubleshooting purposes.
+    and troubleshooting purposes. With an audit writer, records are buffered
+    and written in batches in the background instead of being committed one
+    by one on the caller's request.
     """
 
-    def __init__(self, session: Session, audit_repository=None, security_context=None):
+    def __init__(
+        self,
+        session: Session,
+        audit_repository=None,
+        security_context=None,
+        audit_writer=None,
+    ):
         """
         Initialize audit service with dependencies.
 
         Args:
             session: Database session for persistence operations
-            audit_repository: Repository for audit records
+            audit_repository: Repository for audit records; defaults to one
+                over the session, which the history queries read from
             security_context: Optional security context for authorization
+            audit_writer: Optional write-behind AuditWriter; takes precedence
+                over the repository for recording
         """
         self.session = session
+        if audit_repository is None and session is not None:
+            audit_repository = AuditRepository(session)
         self.repository = audit_repository
         self.security_context = security_context
+        self.audit_writer = audit_writer
 
     def record_entity_change(
         self,
@@ -71,11 +86,11 @@ class AuditService:
             "entity_id": str(entity_id),
             "entity_name": entity_name,
             "action": action,
-            "changes": json.dumps(changes) if isinstance(changes, dict) else changes,
+            "changes": changes,
             "user_id": user_id,
             "timestamp": datetime.now(),
             "ip_address": self._get_client_ip(),
-            "metadata": json.dumps(metadata) if metadata else None,
+            "metadata": metadata or None,
         }
 
         # Log the audit record
@@ -90,11 +105,7 @@ class AuditService:
             },
         )
 
-        # Store in repository if available
-        if self.repository:
-            return self.repository.create(audit_data)
-
-        return audit_data
+        return self._store(audit_data)
 
     def record_create(
         self,
@@ -310,7 +321,7 @@ class AuditService:
             "user_id": user_id,
             "timestamp": datetime.now(),
             "ip_address": ip_address or self._get_client_ip(),
-            "metadata": json.dumps(metadata),
+            "metadata": metadata,
         }
 
         # Log the audit event
@@ -325,11 +336,7 @@ class AuditService:
             },
         )
 
-        # Store in repository if available
-        if self.repository:
-            return self.repository.create(audit_data)
-
-        return audit_data
+        return self._store(audit_data)
 
     def record_api_access(
         self,
@@ -381,7 +388,7 @@ class AuditService:
             "user_id": user_id,
             "timestamp": datetime.now(),
             "ip_address": self._get_client_ip(),
-            "metadata": json.dumps(metadata),
+            "metadata": metadata,
         }
 
         # Log the audit event
@@ -396,12 +403,37 @@ class AuditService:
             },
         )
 
-        # Store in repository if available
+        return self._store(audit_data)
+
+    def _store(self, audit_data: Dict[str, Any]) -> Any:
+        """
+        Persist an audit record through the writer or the repository.
+
+        Args:
+            audit_data: Audit record with "changes" and "metadata" as dicts
+
+        Returns:
+            Created audit record, or the audit data if it was buffered or
+            there is nowhere to store it
+        """
+        if self.audit_writer:
+            self.audit_writer.write(audit_data)
+            return audit_data
+
         if self.repository:
-            return self.repository.create(audit_data)
+            return self.repository.create({
+                **audit_data,
+                "changes": self._to_json(audit_data["changes"]),
+                "metadata": self._to_json(audit_data["metadata"]),
+            })
 
         return audit_data
 
+    @staticmethod
+    def _to_json(value: Any) -> Any:
+        """Serialize dict and list values for storage as text."""
+        return json.dumps(value) if isinstance(value, (dict, list)) else value
+
     def get_entity_history(
         self,
         entity_type: str,
@@ -414,6 +446,9 @@ class AuditService:
         """
         Get the audit history for an entity.
 
+        Records still in the audit writer's buffer are not included yet; they
+        appear within AUDIT_FLUSH_SECONDS.
+
         Args:
             entity_type: Type of entity
             entity_id: ID of the entity
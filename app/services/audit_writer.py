@@ -0,0 +1,302 @@
+# File: app/services/audit_writer.py
+"""
+Write-behind buffer for the audit trail.
+
+Recording an audit entry only appends it to an in-process buffer; a
+background thread writes the buffer to the audit log in multi-row inserts,
+whenever a batch fills up or the flush interval passes, and once more when
+the application shuts down. Serialization to JSON also happens on the
+writer thread. When the database cannot keep up and the buffer is full, the
+overflow policy decides which records are lost (or whether callers wait),
+and every lost record is counted.
+"""
+
+from collections import deque
+from datetime import datetime
+from typing import Any, Callable, Deque, Dict, List, Optional
+import json
+import logging
+import threading
+import time
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from app.core.metrics import counter, gauge, histogram
+from app.db.models.audit import AuditRecord
+
+logger = logging.getLogger(__name__)
+
+# Audit writer metrics
+audit_buffered = counter("audit.records.buffered", "Audit records accepted into the buffer")
+audit_written = counter("audit.records.written", "Audit records written to the audit log")
+audit_dropped = counter("audit.records.dropped", "Audit records lost to buffer overflow")
+audit_flush_failures = counter("audit.flush.failures", "Failed audit log writes")
+audit_buffer_size = gauge("audit.buffer.size", "Audit records waiting to be written")
+audit_batch_rows = histogram(
+    "audit.flush.batch_size",
+    "Rows per audit log insert",
+    buckets=[1, 10, 50, 100, 250, 500, 1000],
+)
+
+# Columns written for each record, and those stored as JSON text
+_COLUMNS = tuple(column.key for column in AuditRecord.__table__.columns if column.key != "id")
+_JSON_FIELDS = ("changes", "metadata")
+
+
+class AuditWriter:
+    """
+    Bounded buffer of audit records drained by a background writer thread.
+    """
+
+    OVERFLOW_POLICIES = ("drop_oldest", "drop_newest", "block")
+
+    _instance: Optional["AuditWriter"] = None
+    _instance_lock = threading.Lock()
+
+    @classmethod
+    def get_instance(cls) -> "AuditWriter":
+        """
+        Get the process-wide audit writer.
+
+        Returns:
+            Shared AuditWriter instance
+        """
+        with cls._instance_lock:
+            if cls._instance is None:
+                from app.core.config import settings
+                from app.db.session import SessionLocal
+
+                cls._instance = cls(
+                    SessionLocal,
+                    batch_size=settings.AUDIT_BATCH_SIZE,
+                    flush_interval=settings.AUDIT_FLUSH_SECONDS,
+                    max_buffer=settings.AUDIT_BUFFER_SIZE,
+                    overflow_policy=settings.AUDIT_OVERFLOW_POLICY,
+                )
+            return cls._instance
+
+    def __init__(
+            self,
+            session_factory: Callable[[], Session],
+            batch_size: int = 500,
+            flush_interval: float = 1.0,
+            max_buffer: int = 50000,
+            overflow_policy: str = "drop_oldest",
+            block_timeout: float = 1.0,
+    ):
+        """
+        Initialize the writer.
+
+        Args:
+            session_factory: Callable returning a new database session
+            batch_size: Maximum rows per insert; a full batch is written
+                without waiting for the flush interval
+            flush_interval: Maximum seconds a record waits in the buffer
+            max_buffer: Records the buffer holds before the overflow policy
+                applies
+            overflow_policy: What to do with a new record when the buffer is
+                full: "drop_oldest" evicts the oldest buffered record,
+                "drop_newest" discards the new one and "block" makes the
+                caller wait up to block_timeout for room, then discards it
+            block_timeout: Seconds a caller waits under the "block" policy
+        """
+        if overflow_policy not in self.OVERFLOW_POLICIES:
+            raise ValueError(
+                f"Unknown audit overflow policy '{overflow_policy}'; "
+                f"expected one of {', '.join(self.OVERFLOW_POLICIES)}"
+            )
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_buffer = max_buffer
+        self.overflow_policy = overflow_policy
+        self.block_timeout = block_timeout
+
+        self._buffer: Deque[Dict[str, Any]] = deque()
+        self._condition = threading.Condition()
+        # Serializes flushes between the writer thread and flush() callers
+        self._flush_lock = threading.Lock()
+        self._stopping = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.stats = {"buffered": 0, "written": 0, "dropped": 0, "flush_failures": 0}
+
+    # --- Recording ---
+
+    def write(self, record: Dict[str, Any]) -> bool:
+        """
+        Buffer an audit record for writing.
+
+        Dict values of "changes" and "metadata" are serialized on the writer
+        thread, so callers must not modify them afterwards.
+
+        Args:
+            record: Column values of the audit log row
+
+        Returns:
+            True if the record was buffered, False if it was dropped
+        """
+        if self._thread is None and not self._stopping.is_set():
+            self.start()
+
+        with self._condition:
+            if len(self._buffer) >= self.max_buffer:
+                if self.overflow_policy == "drop_newest":
+                    self._count_dropped(1)
+                    return False
+                if self.overflow_policy == "block":
+                    deadline = time.monotonic() + self.block_timeout
+                    while len(self._buffer) >= self.max_buffer:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            self._count_dropped(1)
+                            return False
+                        self._condition.notify_all()
+                        self._condition.wait(remaining)
+                else:
+                    self._buffer.popleft()
+                    self._count_dropped(1)
+
+            self._buffer.append(record)
+            self.stats["buffered"] += 1
+            if len(self._buffer) >= self.batch_size:
+                self._condition.notify_all()
+        audit_buffered.increment()
+        return True
+
+    def _count_dropped(self, count: int) -> None:
+        """Record lost audit records."""
+        self.stats["dropped"] += count
+        audit_dropped.increment(count)
+
+    # --- Writing ---
+
+    def start(self) -> None:
+        """Start the writer thread if it is not already running."""
+        with self._condition:
+            if self._thread is not None:
+                return
+            self._stopping.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="audit-writer", daemon=True
+            )
+            self._thread.start()
+        logger.info(
+            f"Started audit writer (batches of {self.batch_size}, "
+            f"every {self.flush_interval}s, {self.overflow_policy} on overflow)"
+        )
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """
+        Stop the writer thread and write everything still buffered.
+
+        Args:
+            timeout: Seconds to wait for the writer thread's current batch
+        """
+        self._stopping.set()
+        with self._condition:
+            self._condition.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+        written = self.flush()
+        logger.info(f"Audit writer stopped ({written} buffered records written on shutdown)")
+
+    def _run(self) -> None:
+        """Write batches until stopped."""
+        while not self._stopping.is_set():
+            with self._condition:
+                self._condition.wait_for(
+                    lambda: len(self._buffer) >= self.batch_size or self._stopping.is_set(),
+                    timeout=self.flush_interval,
+                )
+            if self._stopping.is_set():
+                return
+            if not self._flush_available():
+                # Give the database a moment before retrying
+                self._stopping.wait(self.flush_interval)
+
+    def flush(self) -> int:
+        """
+        Write everything buffered now, on the calling thread.
+
+        Returns:
+            Number of records written
+        """
+        before = self.stats["written"]
+        self._flush_available()
+        return self.stats["written"] - before
+
+    def _flush_available(self) -> bool:
+        """
+        Write the buffered records in batches.
+
+        Returns:
+            False if a write failed; its records are back in the buffer
+        """
+        with self._flush_lock:
+            while True:
+                with self._condition:
+                    count = min(len(self._buffer), self.batch_size)
+                    batch = [self._buffer.popleft() for _ in range(count)]
+                    # Wake callers blocked on a full buffer
+                    self._condition.notify_all()
+                if not batch:
+                    audit_buffer_size.set(0)
+                    return True
+                if not self._insert(batch):
+                    self._requeue(batch)
+                    return False
+                audit_buffer_size.set(len(self._buffer))
+
+    def _insert(self, batch: List[Dict[str, Any]]) -> bool:
+        """Insert a batch of records in one statement and commit."""
+        rows = [self._to_row(record) for record in batch]
+        session = self.session_factory()
+        try:
+            session.execute(insert(AuditRecord.__table__), rows)
+            session.commit()
+        except Exception as e:
+            session.rollback()
+            self.stats["flush_failures"] += 1
+            audit_flush_failures.increment()
+            logger.error(f"Failed to write {len(rows)} audit records: {e}")
+            return False
+        finally:
+            session.close()
+        self.stats["written"] += len(rows)
+        audit_written.increment(len(rows))
+        audit_batch_rows.observe(len(rows))
+        return True
+
+    def _requeue(self, batch: List[Dict[str, Any]]) -> None:
+        """Put a failed batch back at the front of the buffer, as far as it fits."""
+        with self._condition:
+            room = max(0, self.max_buffer - len(self._buffer))
+            if room < len(batch):
+                self._count_dropped(len(batch) - room)
+                batch = batch[len(batch) - room:] if room else []
+            self._buffer.extendleft(reversed(batch))
+
+    @staticmethod
+    def _to_row(record: Dict[str, Any]) -> Dict[str, Any]:
+        """Get the audit log column values of a record."""
+        # Every row needs every key for one multi-row statement
+        row = {key: record.get(key) for key in _COLUMNS}
+        if row["timestamp"] is None:
+            row["timestamp"] = datetime.now()
+        for key in _JSON_FIELDS:
+            if row[key] is not None and not isinstance(row[key], str):
+                row[key] = json.dumps(row[key], default=str)
+        return row
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get writer statistics.
+
+        Returns:
+            Dictionary with buffered, written and dropped record counts,
+            failed writes and the current buffer size
+        """
+        with self._condition:
+            return {**self.stats, "buffer_size": len(self._buffer)}
@@ -12,6 +12,7 @@ from app.core.exceptions import (
     BusinessRuleException,
 )
 from app.repositories.base_repository import BaseRepository
+from app.services.cache_service import attach_cached
 
 T = TypeVar("T")
 logger = logging.getLogger(__name__)
@@ -129,10 +130,12 @@ class BaseService(Generic[T]):
             Entity if found, None otherwise
         """
         if self.cache_service:
-            cache_key = f"{self.repository.model.__name__}:{id}"
+            cache_key = self._entity_cache_key(id)
             cached = self.cache_service.get(cache_key)
             if cached:
-                return cached
+                attached = attach_cached(self.session, cached)
+                if attached is not None:
+                    return attached
 
         entity = self.repository.get_by_id(id)
 
@@ -141,6 +144,34 @@ class BaseService(Generic[T]):
 
         return entity
 
+    def _entity_cache_key(self, id: int) -> str:
+        """
+        Get the cache key that get_by_id stores an entity under.
+
+        Args:
+            id: Entity ID
+
+        Returns:
+            Cache key for the entity
+        """
+        return f"{self.repository.model.__name__}:{id}"
+
+    def _invalidate_entity_cache(self, id: int) -> None:
+        """
+        Drop an entity cached by get_by_id, and its "{Model}:detail:{id}"
+        view.
+
+        Services that change an entity outside update and delete call this
+        so neither get_by_id nor the service's detail view serves the old row.
+
+        Args:
+            id: Entity ID
+        """
+        if self.cache_service:
+            model_name = self.repository.model.__name__
+            self.cache_service.invalidate(self._entity_cache_key(id))
+            self.cache_service.invalidate(f"{model_name}:detail:{id}")
+
     def list(self, skip: int = 0, limit: int = 100, **filters) -> List[T]:
         """
         List entities with pagination and filtering.
@@ -273,10 +304,7 @@ class BaseService(Generic[T]):
             if not entity:
                 return None
 
-            # Invalidate cache if cache service exists
-            if self.cache_service:
-                cache_key = f"{self.repository.model.__name__}:{id}"
-                self.cache_service.invalidate(cache_key)
+            self._invalidate_entity_cache(id)
 
             # Publish update event if event bus exists
             if self.event_bus and original and hasattr(self, "_create_updated_event"):
@@ -322,10 +350,7 @@ class BaseService(Generic[T]):
             if not result:
                 return False
 
-            # Invalidate cache if cache service exists
-            if self.cache_service:
-                cache_key = f"{self.repository.model.__name__}:{id}"
-                self.cache_service.invalidate(cache_key)
+            self._invalidate_entity_cache(id)
 
             # Publish deletion event if event bus exists
             if self.event_bus and entity and hasattr(self, "_create_deleted_event"):
@@ -130,6 +130,8 @@ class MemoryCache(CacheBackend):
         """
         self.cache = {}
         self.max_size = max_size
+        # Shared by every request thread once owned by the application container
+        self._lock = threading.RLock()
         self.stats = {
             "hits": 0,
             "misses": 0,
@@ -149,23 +151,24 @@ class MemoryCache(CacheBackend):
         Returns:
             Cached value or None if not found or expired
         """
-        entry = self.cache.get(key)
+        with self._lock:
+            entry = self.cache.get(key)
 
-        if entry is None:
-            self.stats["misses"] += 1
-            return None
+            if entry is None:
+                self.stats["misses"] += 1
+                return None
 
-        # Check if expired
-        if entry.is_expired:
-            self.stats["expirations"] += 1
-            del self.cache[key]
-            return None
+            # Check if expired
+            if entry.is_expired:
+                self.stats["expirations"] += 1
+                del self.cache[key]
+                return None
 
-        # Update access stats
-        entry.touch()
-        self.stats["hits"] += 1
+            # Update access stats
+            entry.touch()
+            self.stats["hits"] += 1
 
-        return entry.value
+            return entry.value
 
     def set(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
         """
@@ -179,18 +182,19 @@ class MemoryCache(CacheBackend):
         Returns:
             True if set successfully
         """
-        # Check if we need to evict items (LRU policy)
-        if len(self.cache) >= self.max_size and key not in self.cache:
-            self._evict_lru_item()
+        with self._lock:
+            # Check if we need to evict items (LRU policy)
+            if len(self.cache) >= self.max_size and key not in self.cache:
+                self._evict_lru_item()
 
-        # Create cache entry
-        entry = CacheEntry(key, value, ttl)
+            # Create cache entry
+            entry = CacheEntry(key, value, ttl)
 
-        # Store in cache
-        self.cache[key] = entry
-        self.stats["sets"] += 1
+            # Store in cache
+            self.cache[key] = entry
+            self.stats["sets"] += 1
 
-        return True
+            return True
 
     def delete(self, key: str) -> bool:
         """
@@ -202,11 +206,12 @@ class MemoryCache(CacheBackend):
         Returns:
             True if key was in cache and deleted
         """
-        if key in self.cache:
-            del self.cache[key]
-            self.stats["invalidations"] += 1
-            return True
-        return False
+        with self._lock:
+            if key in self.cache:
+                del self.cache[key]
+                self.stats["invalidations"] += 1
+                return True
+            return False
 
     def exists(self, key: str) -> bool:
         """
@@ -218,18 +223,19 @@ class MemoryCache(CacheBackend):
         Returns:
             True if key exists and is not expired
         """
-        entry = self.cache.get(key)
+        with self._lock:
+            entry = self.cache.get(key)
 
-        if entry is None:
-            return False
+            if entry is None:
+                return False
 
-        # Check if expired
-        if entry.is_expired:
-            del self.cache[key]
-            self.stats["expirations"] += 1
-            return False
+            # Check if expired
+            if entry.is_expired:
+                del self.cache[key]
+                self.stats["expirations"] += 1
+                return False
 
-        return True
+            return True
 
     def clear(self) -> bool:
         """
@@ -238,7 +244,8 @@ class MemoryCache(CacheBackend):
         Returns:
             True if cache was cleared
         """
-        self.cache.clear()
+        with self._lock:
+            self.cache.clear()
         return True
 
     def get_stats(self) -> Dict[str, Any]:
@@ -255,9 +262,10 @@ class MemoryCache(CacheBackend):
         # Calculate memory usage (approximate)
         import sys
 
+        with self._lock:
+            entries = list(self.cache.values())
         memory_usage = sum(
-            sys.getsizeof(entry) + sys.getsizeof(entry.value)
-            for entry in self.cache.values()
+            sys.getsizeof(entry) + sys.getsizeof(entry.value) for entry in entries
         )
 
         return {
@@ -298,7 +306,8 @@ class MemoryCache(CacheBackend):
         Returns:
             Number of expired items
         """
-        return sum(1 for entry in self.cache.values() if entry.is_expired)
+        with self._lock:
+            return sum(1 for entry in self.cache.values() if entry.is_expired)
 
     def remove_expired(self) -> int:
         """
@@ -307,19 +316,20 @@ class MemoryCache(CacheBackend):
         Returns:
             Number of items removed
         """
-        keys_to_delete = []
+        with self._lock:
+            keys_to_delete = []
 
-        # Find expired keys
-        for key, entry in self.cache.items():
-            if entry.is_expired:
-                keys_to_delete.append(key)
+            # Find expired keys
+            for key, entry in self.cache.items():
+                if entry.is_expired:
+                    keys_to_delete.append(key)
 
-        # Delete expired keys
-        for key in keys_to_delete:
-            del self.cache[key]
+            # Delete expired keys
+            for key in keys_to_delete:
+                del self.cache[key]
 
-        self.stats["expirations"] += len(keys_to_delete)
-        return len(keys_to_delete)
+            self.stats["expirations"] += len(keys_to_delete)
+            return len(keys_to_delete)
 
 
 class RedisCache(CacheBackend):
@@ -594,10 +604,11 @@ class CacheService:
 
         if self.backend_type == "memory":
             # For memory cache, we can only do prefix matching
+            prefix = namespace_pattern.rstrip("*")
             keys_to_delete = []
 
             for key in list(self.backend.cache.keys()):
-                if key.startswith(namespace_pattern):
+                if key.startswith(prefix):
                     keys_to_delete.append(key)
 
             # Delete keys
@@ -839,3 +850,33 @@ def _generate_cache_key(prefix: str, func_name: str, args: tuple, kwargs: dict)
         key = f"{prefix}:{func_name}:{hashlib.md5((args_str + kwargs_str).encode()).hexdigest()}"
 
     return key
+
+
+def attach_cached(session, value: Any) -> Any:
+    """
+    Attach cached ORM instances to a session.
+
+    The application cache is shared by every request, so a cached entity was
+    usually loaded by another request's session, which may since have been
+    closed or committed. Merging without loading gives the caller a copy that
+    belongs to its own session, without a query, and leaves the cached
+    instance untouched.
+
+    Args:
+        session: Session of the calling request
+        value: Cached ORM instance or list of instances
+
+    Returns:
+        The attached instance(s), or None if they cannot be attached (for
+        example while another request has unflushed changes on them), in
+        which case the caller should load from the database
+    """
+    from sqlalchemy.exc import InvalidRequestError
+
+    try:
+        if isinstance(value, list):
+            return [session.merge(item, load=False) for item in value]
+        return session.merge(value, load=False)
+    except InvalidRequestError as e:
+        logger.debug(f"Could not attach cached instance: {e}")
+        return None
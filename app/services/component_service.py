@@ -684,6 +684,7 @@ class ComponentService(BaseService[Component]):
             # Invalidate component cache
             if self.cache_service:
                 self.cache_service.invalidate(f"Component:detail:{component_id}")
+                self._invalidate_entity_cache(component_id)
 
             return requirement
 
@@ -728,6 +729,7 @@ class ComponentService(BaseService[Component]):
                 self.cache_service.invalidate(
                     f"Component:detail:{updated_requirement.component_id}"
                 )
+                self._invalidate_entity_cache(updated_requirement.component_id)
 
             return updated_requirement
 
@@ -777,6 +779,7 @@ class ComponentService(BaseService[Component]):
             # Invalidate component cache
             if self.cache_service:
                 self.cache_service.invalidate(f"Component:detail:{component_id}")
+                self._invalidate_entity_cache(component_id)
 
             return result
 
@@ -2,11 +2,12 @@
 
 from typing import List, Optional, Dict, Any, Tuple, Union
 
-from typing import List, Dict, Any, Optional, Tuple
+from typing import Callable, List, Dict, Any, Optional, Tuple
 from datetime import datetime, timedelta
 import json
 import csv
 import io
+import threading
 from sqlalchemy.orm import Session
 from datetime import datetime, timedelta
 
@@ -128,6 +129,9 @@ class CustomerCommunicationRecorded(DomainEvent):
         self.user_id = user_id
 
 
+# Analytics cached per set of parameters
+ANALYTICS_CACHE_SIZE = 32
+
 # Validation functions
 validate_customer = validate_entity(Customer)
 validate_customer_communication = validate_entity(CustomerCommunication)
@@ -141,8 +145,16 @@ class CustomerService(BaseService[Customer]):
     - Customer management
     - Communication history
     - Customer segmentation and analysis
+
+    Customer analytics are aggregated in the database and cached for the
+    whole process, keyed by a version of the sales and customer data, so
+    they are recomputed only after a change.
     """
 
+    # cache key -> (data version, analytics)
+    _analytics_cache: Dict[Tuple, Tuple[Tuple, Dict[str, Any]]] = {}
+    _analytics_lock = threading.Lock()
+
     def __init__(
         self,
         session: Session,
@@ -336,6 +348,8 @@ class CustomerService(BaseService[Customer]):
             # Invalidate cache if cache service exists
             if self.cache_service:
                 self.cache_service.invalidate(f"Customer:{customer_id}")
+                # Sale detail views embed the customer
+                self.cache_service.invalidate_pattern("Sale:detail:")
 
             return updated_customer
 
@@ -407,6 +421,8 @@ class CustomerService(BaseService[Customer]):
             # Invalidate cache if cache service exists
             if self.cache_service:
                 self.cache_service.invalidate(f"Customer:{customer_id}")
+                # Sale detail views embed the customer
+                self.cache_service.invalidate_pattern("Sale:detail:")
 
             return updated_customer
 
@@ -633,6 +649,168 @@ class CustomerService(BaseService[Customer]):
         start_date = datetime.now() - timedelta(days=days)
         return self.repository.get_active_customers(start_date, limit=limit)
 
+    def get_customer_analytics(self, top_limit: int = 10) -> Dict[str, Any]:
+        """
+        Get aggregated customer analytics data.
+
+        Computed with aggregate and window queries and cached until a sale
+        or customer changes (or the day ends).
+
+        Args:
+            top_limit: Number of top customers by revenue to include
+
+        Returns:
+            Dictionary with customer counts, distributions, average
+            lifetime value, RFM segments and top customers
+        """
+        return self._get_cached_analytics(
+            ("overview", top_limit), lambda: self._build_customer_analytics(top_limit)
+        )
+
+    def get_customer_value_analysis(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        status: Optional[Union[CustomerStatus, str]] = None,
+        tier: Optional[Union[CustomerTier, str]] = None,
+        limit: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Get customer value over a period: per-customer revenue, order count,
+        first and last order, RFM scores and revenue rank, with a summary.
+
+        Cached until a sale or customer changes.
+
+        Args:
+            start_date: Only count sales from this time
+            end_date: Only count sales up to this time (also the reference
+                time of the new and inactive segments; defaults to now)
+            status: Only include customers with this status
+            tier: Only include customers in this tier
+            limit: Maximum number of customers to list, highest revenue first
+
+        Returns:
+            Dictionary with total_customers (matching status and tier), the
+            value summary and the listed customers
+
+        Raises:
+            ValidationException: If status or tier is unknown
+        """
+        status = self._as_enum(CustomerStatus, status, "status")
+        tier = self._as_enum(CustomerTier, tier, "tier")
+        key = ("value", start_date, end_date, status, tier, limit)
+
+        def build() -> Dict[str, Any]:
+            filters = {
+                name: value
+                for name, value in (("status", status), ("tier", tier))
+                if value is not None
+            }
+            return {
+                "total_customers": self.repository.count(**filters),
+                "summary": self.repository.get_customer_value_summary(
+                    end_date or datetime.now(), start_date, end_date, status, tier
+                ),
+                "customers": self.repository.get_customer_value_rows(
+                    start_date, end_date, status, tier, limit
+                ),
+            }
+
+        return self._get_cached_analytics(key, build)
+
+    def _build_customer_analytics(self, top_limit: int) -> Dict[str, Any]:
+        """Run the customer analytics queries."""
+        now = datetime.now()
+        counts = self.repository.count_summary(now - timedelta(days=30))
+        summary = self.repository.get_customer_value_summary(now)
+
+        distribution = {}
+        for field, enum_class in (
+            ("status", CustomerStatus),
+            ("tier", CustomerTier),
+            ("source", CustomerSource),
+        ):
+            counted = self.repository.get_distribution_by_field(field)
+            distribution[field] = {member.name: counted.get(member.name, 0) for member in enum_class}
+
+        top_customers = []
+        for customer, row in self.repository.get_top_customers_by_revenue(top_limit):
+            top_customers.append(
+                {
+                    "id": customer.id,
+                    "name": customer.name,
+                    "email": customer.email,
+                    "tier": (
+                        customer.tier.name
+                        if hasattr(customer.tier, "name")
+                        else customer.tier
+                    ),
+                    "total_spent": row["revenue"],
+                    "order_count": row["order_count"],
+                    "average_order_value": (
+                        row["revenue"] / row["order_count"] if row["order_count"] else 0
+                    ),
+                    "first_order": row["first_order"].isoformat() if row["first_order"] else None,
+                    "last_order": row["last_order"].isoformat() if row["last_order"] else None,
+                    "rank": row["revenue_rank"],
+                    "recency_score": row["recency_score"],
+                    "frequency_score": row["frequency_score"],
+                    "monetary_score": row["monetary_score"],
+                    "rfm_segment": row["rfm_segment"],
+                }
+            )
+
+        return {
+            "generated_at": now.isoformat(),
+            "total_customers": counts["total"],
+            "active_customers": counts["active"],
+            "new_customers_30d": counts["new"],
+            "customers_with_orders": summary["customers_with_orders"],
+            "customer_distribution": distribution,
+            "average_lifetime_value": summary["average_lifetime_value"],
+            "rfm_segments": {
+                name[len("rfm_"):]: count
+                for name, count in summary.items()
+                if name.startswith("rfm_")
+            },
+            "top_customers": top_customers,
+        }
+
+    def _get_cached_analytics(
+        self, key: Tuple, build: Callable[[], Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """
+        Serve analytics from the process-wide cache while the sales and
+        customer data version (and the day) is unchanged, else build them.
+        """
+        version = (self.repository.get_analytics_version(), datetime.now().date())
+        with self._analytics_lock:
+            cached = self._analytics_cache.get(key)
+        if cached and cached[0] == version:
+            return cached[1]
+
+        result = build()
+        with self._analytics_lock:
+            for stale in [k for k, (v, _) in self._analytics_cache.items() if v != version]:
+                del self._analytics_cache[stale]
+            while len(self._analytics_cache) >= ANALYTICS_CACHE_SIZE:
+                del self._analytics_cache[next(iter(self._analytics_cache))]
+            self._analytics_cache[key] = (version, result)
+        return result
+
+    @staticmethod
+    def _as_enum(enum_class, value, field: str):
+        """Convert an enum member name or value to the member."""
+        if value is None or isinstance(value, enum_class):
+            return value
+        for member in enum_class:
+            if str(value).upper() in (member.name, str(member.value).upper()):
+                return member
+        raise ValidationException(
+            f"Invalid {field}: {value}",
+            {field: [f"Unknown {field}: {value}"]},
+        )
+
     def _calculate_customer_statistics(self, customer_id: int) -> Dict[str, Any]:
         """
         Calculate statistics for a customer.
@@ -884,211 +1062,3 @@ def export_customers(
         output.close()
 
     return content, filename
-
-
-def get_customer_analytics(self) -> Dict[str, Any]:
-    """
-    Get aggregated customer analytics data.
-
-    Returns:
-        Dictionary with various customer analytics metrics
-    """
-    # Get today's date for calculations
-    today = datetime.now().date()
-    thirty_days_ago = today - timedelta(days=30)
-
-    # Get total customer count
-    total_customers = self.repository.count()
-
-    # Get active customers (using CustomerStatus.ACTIVE)
-    active_customers = self.repository.count(status=CustomerStatus.ACTIVE)
-
-    # Get new customers in the last 30 days
-    new_customers = self.repository.count_new_since(thirty_days_ago)
-
-    # Get customer distribution by status, tier, and source
-    status_distribution = self.repository.get_distribution_by_field("status")
-    tier_distribution = self.repository.get_distribution_by_field("tier")
-    source_distribution = self.repository.get_distribution_by_field("source")
-
-    # Get average lifetime value
-    avg_ltv = self.repository.get_average_lifetime_value()
-
-    # Get top customers by sales volume
-    top_customers = self.repository.get_top_customers_by_sales(limit=10)
-
-    return {
-        "total_customers": total_customers,
-        "active_customers": active_customers,
-        "new_customers_30d": new_customers,
-        "customer_distribution": {
-            "status": status_distribution,
-            "tier": tier_distribution,
-            "source": source_distribution,
-        },
-        "average_lifetime_value": avg_ltv,
-        "top_customers": top_customers,
-    }
-
-
-def get_customer_analytics(self) -> Dict[str, Any]:
-    """
-    Get aggregated customer analytics data.
-
-    Returns:
-        Dictionary with various customer analytics metrics
-    """
-    # Get today's date for calculations
-    today = datetime.now().date()
-    thirty_days_ago = today - timedelta(days=30)
-
-    # Get total customer count
-    total_customers = self.repository.count()
-
-    # Get active customers (using CustomerStatus.ACTIVE)
-    active_customers = self.repository.count_by_status(CustomerStatus.ACTIVE)
-
-    # Get new customers in the last 30 days
-    new_customers = self.repository.count_created_since(thirty_days_ago)
-
-    # Get customer distribution by status, tier, and source
-    status_distribution = self._get_customer_distribution_by_status()
-    tier_distribution = self._get_customer_distribution_by_tier()
-    source_distribution = self._get_customer_distribution_by_source()
-
-    # Get average lifetime value
-    avg_ltv = self._calculate_average_lifetime_value()
-
-    # Get top customers by sales volume
-    top_customers = self._get_top_customers_by_sales(limit=10)
-
-    return {
-        "total_customers": total_customers,
-        "active_customers": active_customers,
-        "new_customers_30d": new_customers,
-        "customer_distribution": {
-            "status": status_distribution,
-            "tier": tier_distribution,
-            "source": source_distribution,
-        },
-        "average_lifetime_value": avg_ltv,
-        "top_customers": top_customers,
-    }
-
-
-def _get_customer_distribution_by_status(self) -> Dict[str, int]:
-    """
-    Get distribution of customers by status.
-
-    Returns:
-        Dictionary mapping status values to counts
-    """
-    result = {}
-    for status in CustomerStatus:
-        count = self.repository.count_by_status(status)
-        result[status.name] = count
-    return result
-
-
-def _get_customer_distribution_by_tier(self) -> Dict[str, int]:
-    """
-    Get distribution of customers by tier.
-
-    Returns:
-        Dictionary mapping tier values to counts
-    """
-    result = {}
-    for tier in CustomerTier:
-        count = self.repository.count_by_tier(tier)
-        result[tier.name] = count
-    return result
-
-
-def _get_customer_distribution_by_source(self) -> Dict[str, int]:
-    """
-    Get distribution of customers by source.
-
-    Returns:
-        Dictionary mapping source values to counts
-    """
-    result = {}
-    for source in CustomerSource:
-        count = self.repository.count_by_source(source)
-        result[source.name] = count
-    return result
-
-
-def _calculate_average_lifetime_value(self) -> float:
-    """
-    Calculate average customer lifetime value.
-
-    Returns:
-        Average lifetime value as float
-    """
-    # Implement calculation based on sales data
-    # This is a simplified implementation
-    from sqlalchemy import func
-    from app.db.models.sales import Sale
-
-    query = self.session.query(
-        Sale.customer_id, func.sum(Sale.total_amount).label("total_spent")
-    ).group_by(Sale.customer_id)
-
-    results = query.all()
-
-    if not results:
-        return 0.0
-
-    total_ltv = sum(row.total_spent for row in results)
-    return total_ltv / len(results) if results else 0.0
-
-
-def _get_top_customers_by_sales(self, limit: int = 10) -> List[Dict[str, Any]]:
-    """
-    Get top customers by total sales amount.
-
-    Args:
-        limit: Number of customers to return
-
-    Returns:
-        List of top customers with details
-    """
-    from sqlalchemy import func, desc
-    from app.db.models.sales import Sale
-
-    query = (
-        self.session.query(
-            Sale.customer_id,
-            func.sum(Sale.total_amount).label("total_spent"),
-            func.count(Sale.id).label("order_count"),
-        )
-        .group_by(Sale.customer_id)
-        .order_by(desc("total_spent"))
-        .limit(limit)
-    )
-
-    results = query.all()
-
-    top_customers = []
-    for row in results:
-        customer = self.repository.get_by_id(row.customer_id)
-        if customer:
-            top_customers.append(
-                {
-                    "id": customer.id,
-                    "name": customer.name,
-                    "email": customer.email,
-                    "tier": (
-                        customer.tier.name
-                        if hasattr(customer.tier, "name")
-                        else customer.tier
-                    ),
-                    "total_spent": row.total_spent,
-                    "order_count": row.order_count,
-                    "average_order_value": (
-                        row.total_spent / row.order_count if row.order_count else 0
-                    ),
-                }
-            )
-
-    return top_customers
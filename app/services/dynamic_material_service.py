@@ -2,7 +2,6 @@
 
 from typing import List, Optional, Dict, Any, Tuple
 from sqlalchemy.orm import Session
-from datetime import datetime
 import uuid
 import re
 
@@ -11,6 +10,7 @@ from app.db.models.dynamic_material import (
     DynamicMaterial, MaterialPropertyValue, PropertyDefinition, MaterialType
 )
 from app.repositories.dynamic_material_repository import DynamicMaterialRepository
+from app.core.events import MaterialStockChanged
 from app.core.exceptions import EntityNotFoundException, InsufficientInventoryException, ValidationException
 from app.services.settings_service import SettingsService
 
@@ -314,6 +314,7 @@ class DynamicMaterialService(BaseService[DynamicMaterial]):
             # Invalidate cache if needed
             if self.cache_service:
                 self.cache_service.invalidate(f"materials:{id}")
+                self._invalidate_entity_cache(id)
                 self.cache_service.invalidate_pattern("materials:*")
                 self.cache_service.invalidate_pattern(f"materials:type:{material.material_type_id}:*")
 
@@ -344,6 +345,7 @@ class DynamicMaterialService(BaseService[DynamicMaterial]):
             # Invalidate cache if needed
             if self.cache_service and result:
                 self.cache_service.invalidate(f"materials:{id}")
+                self._invalidate_entity_cache(id)
                 self.cache_service.invalidate_pattern("materials:*")
                 self.cache_service.invalidate_pattern(f"materials:type:{material_type_id}:*")
 
@@ -396,26 +398,25 @@ class DynamicMaterialService(BaseService[DynamicMaterial]):
             # Adjust stock
             material = self.repository.adjust_stock(material_id, quantity_change)
 
-            # Emit event if event bus is available
-            if self.event_bus:
-                self.event_bus.publish({
-                    "type": "material.stock_changed",
-                    "material_id": material_id,
-                    "previous_quantity": previous_quantity,
-                    "new_quantity": new_quantity,
-                    "change": quantity_change,
-                    "reason": notes or "Manual inventory adjustment",
-                    "user_id": user_id,
-                    "timestamp": datetime.now().isoformat()
-                })
-
             # Invalidate cache if needed
             if self.cache_service:
                 self.cache_service.invalidate(f"materials:{material_id}")
+                self._invalidate_entity_cache(material_id)
                 self.cache_service.invalidate_pattern("materials:*")
                 self.cache_service.invalidate_pattern(f"materials:type:{material.material_type_id}:*")
 
-            return material
+        # Emit event once committed, so handlers see the new quantity
+        if self.event_bus:
+            self.event_bus.publish(MaterialStockChanged(
+                material_id=material_id,
+                previous_quantity=previous_quantity,
+                new_quantity=new_quantity,
+                change=quantity_change,
+                reason=notes or "Manual inventory adjustment",
+                user_id=user_id
+            ))
+
+        return material
 
     def get_low_stock_materials(self, skip: int = 0, limit: int = 100) -> List[DynamicMaterial]:
         """
@@ -472,12 +473,8 @@ class DynamicMaterialService(BaseService[DynamicMaterial]):
             return materials
 
         try:
-            # Get UI settings
-            material_ui = self.settings_service.get_setting(
-                key="material_ui",
-                scope_type="user",
-                scope_id=str(user_id)
-            )
+            # Get UI settings (user -> organization -> system, resolved once per request)
+            material_ui = self.settings_service.get_resolved_settings(user_id=user_id).get("material_ui")
 
             # If no settings found, return materials as is
             if not material_ui:
@@ -656,6 +653,7 @@ class DynamicMaterialService(BaseService[DynamicMaterial]):
                 # Invalidate cache if needed
                 if self.cache_service:
                     self.cache_service.invalidate(f"materials:{material_id}")
+                    self._invalidate_entity_cache(material_id)
 
                 return association
 
@@ -700,6 +698,7 @@ class DynamicMaterialService(BaseService[DynamicMaterial]):
             # Invalidate cache if needed
             if self.cache_service and added_tags:
                 self.cache_service.invalidate(f"materials:{material_id}")
+                self._invalidate_entity_cache(material_id)
 
             return added_tags
 
@@ -737,6 +736,7 @@ class DynamicMaterialService(BaseService[DynamicMaterial]):
                 # Invalidate cache if needed
                 if self.cache_service:
                     self.cache_service.invalidate(f"materials:{material_id}")
+                    self._invalidate_entity_cache(material_id)
 
                 return True
 
@@ -0,0 +1,139 @@
+# File: app/services/entity_audit.py
+"""
+Audit of entity changes at the session level.
+
+Services change entities through many paths - BaseService, their own
+repository calls, bulk helpers - so instead of each of them calling
+AuditService, the sessions of a session factory report every flushed
+insert, update and delete. The changes are collected at flush and handed to
+the audit writer only when the transaction commits, so rolled-back work
+leaves no audit records.
+"""
+
+import logging
+from typing import Any, Dict
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+from app.services.audit_service import AuditService
+from app.services.audit_writer import AuditWriter
+
+logger = logging.getLogger(__name__)
+
+# Derived and infrastructure rows, not entities users change
+UNAUDITED_MODELS = frozenset({
+    "AuditRecord",
+    "OutboxEvent",
+    "SalesDailyRollup",
+    "PurchaseDailyRollup",
+    "InventorySnapshot",
+    "SupplierPerformance",
+})
+
+# Session.info keys
+_PENDING_KEY = "audit_pending"
+USER_ID_KEY = "audit_user_id"
+
+
+def register_entity_audit(session_factory: Any, audit_writer: AuditWriter) -> None:
+    """
+    Record the entity changes of every session the factory creates.
+
+    The user of a change is read from session.info[USER_ID_KEY], which
+    get_current_user sets for the request's session.
+
+    Args:
+        session_factory: sessionmaker (or Session class) to listen on
+        audit_writer: Writer the audit records are buffered in
+    """
+    audit = AuditService(None, audit_writer=audit_writer)
+
+    @event.listens_for(session_factory, "after_flush")
+    def collect_changes(session: Session, flush_context) -> None:
+        """Collect the changes of a flush while their history is still available."""
+        pending = session.info.setdefault(_PENDING_KEY, [])
+        for action, entities in (
+                ("create", session.new),
+                ("update", session.dirty),
+                ("delete", session.deleted),
+        ):
+            for entity in entities:
+                if entity.__class__.__name__ in UNAUDITED_MODELS:
+                    continue
+                changes = _changes(audit, entity, action)
+                if changes:
+                    state = inspect(entity)
+                    key = state.mapper.primary_key_from_instance(entity)
+                    pending.append((
+                        entity.__class__.__name__,
+                        key[0] if len(key) == 1 else key,
+                        state.dict.get("name"),
+                        action,
+                        changes,
+                    ))
+
+    @event.listens_for(session_factory, "after_commit")
+    def write_changes(session: Session) -> None:
+        """Buffer the committed changes in the audit writer."""
+        pending = session.info.pop(_PENDING_KEY, None)
+        if not pending:
+            return
+        user_id = session.info.get(USER_ID_KEY)
+        for entity_type, entity_id, entity_name, action, changes in pending:
+            try:
+                audit.record_entity_change(
+                    entity_type=entity_type,
+                    entity_id=entity_id,
+                    action=action,
+                    changes=changes,
+                    entity_name=entity_name,
+                    user_id=user_id,
+                )
+            except Exception as e:
+                logger.error(f"Failed to audit {action} of {entity_type} {entity_id}: {e}")
+
+    @event.listens_for(session_factory, "after_transaction_end")
+    def discard_changes(session: Session, transaction) -> None:
+        """Forget the changes of a transaction that ended without committing."""
+        if transaction.parent is None:
+            session.info.pop(_PENDING_KEY, None)
+
+
+def _changes(audit: AuditService, entity: Any, action: str) -> Dict[str, Dict[str, Any]]:
+    """
+    Get the changed column values of a flushed entity.
+
+    Only values already loaded are read, so collecting never queries.
+
+    Args:
+        audit: Service whose sensitive-field rules apply
+        entity: Entity in the flush
+        action: "create", "update" or "delete"
+
+    Returns:
+        Changed fields with their old and new values
+    """
+    state = inspect(entity)
+    changes = {}
+    for attr in state.mapper.column_attrs:
+        key = attr.key
+        if key in ("id", "created_at", "updated_at"):
+            continue
+        if action == "update":
+            history = state.attrs[key].history
+            if not history.has_changes():
+                continue
+            old = history.deleted[0] if history.deleted else None
+            new = history.added[0] if history.added else None
+        elif key not in state.dict:
+            continue
+        elif action == "create":
+            old, new = None, state.dict[key]
+        else:
+            old, new = state.dict[key], None
+        if audit._is_sensitive_field(key):
+            changes[key] = {"changed": True}
+        else:
+            changes[key] = {"old": old, "new": new}
+    return changes
@@ -1,23 +1,39 @@
 # app/services/enum_service.py
 import re
+import json
+import hashlib
 import logging
-from typing import Dict, List, Optional, Any
+import threading
+from typing import Dict, List, Optional, Any, Tuple
 from sqlalchemy.orm import Session, joinedload
 from sqlalchemy import text, insert, update, delete, select
 from sqlalchemy.exc import SQLAlchemyError, IntegrityError
 
 from app.db.models.dynamic_enum import EnumType, EnumTranslation
+from app.db.models.entity_translation import TranslationCatalogVersion
 from app.schemas.enum import EnumValueRead # Import schema for return type hint if possible
 
 # --- Logger Setup ---
 logger = logging.getLogger(__name__)
 # --- End Logger Setup ---
 
+# Key of the enum catalog in translation_catalog_versions
+ENUM_CATALOG_KEY = "enums"
+
 class EnumService:
     """
     Service for managing dynamic enumerations and their translations.
     Handles interactions with EnumType, EnumTranslation, and dynamic enum_value_* tables.
+
+    The full catalog returned by get_all_enums is cached per locale for the
+    whole process, together with an ETag. Every enum value or translation
+    write bumps the catalog's version, so cached catalogs are rebuilt only
+    after a change, also when that change happened in another worker.
     """
+
+    # locale -> (catalog version, etag, catalog)
+    _catalog_cache: Dict[str, Tuple[int, str, Dict[str, List[Dict]]]] = {}
+    _catalog_lock = threading.Lock()
     def __init__(self, db: Session):
         """
         Initializes the EnumService.
@@ -40,18 +56,21 @@ class EnumService:
 
     def get_enum_types(self) -> List[Dict]:
         """Get all registered enum types"""
-        logger.info("Executing get_enum_types()")
+        logger.debug("Executing get_enum_types()")
         try:
             enum_types_orm = self.db.query(EnumType).order_by(EnumType.name).all()
             count = len(enum_types_orm)
-            logger.info(f"Raw ORM query for EnumType returned {count} objects.")
+            logger.debug(f"Raw ORM query for EnumType returned {count} objects.")
 
             if not enum_types_orm:
                 logger.warning("No EnumType records found in 'enum_types'.")
                 return []
 
-            result = [{"id": et.id, "name": et.name, "system_name": et.system_name} for et in enum_types_orm]
-            logger.info(f"Returning {len(result)} enum types.")
+            result = [
+                {"id": et.id, "name": et.name, "system_name": et.system_name, "table_name": et.table_name}
+                for et in enum_types_orm
+            ]
+            logger.debug(f"Returning {len(result)} enum types.")
             return result
         except SQLAlchemyError as e:
              logger.exception("SQLAlchemyError occurred while fetching enum types.")
@@ -62,7 +81,7 @@ class EnumService:
 
     def get_enum_values(self, enum_system_name: str, locale: str = "en") -> List[Dict]:
         """Get active values for a specific enum type by system_name with translations"""
-        logger.info(f"Executing get_enum_values(enum_system_name='{enum_system_name}', locale='{locale}')")
+        logger.debug(f"Executing get_enum_values(enum_system_name='{enum_system_name}', locale='{locale}')")
         try:
             enum_type_record = self._get_enum_type_record(enum_system_name, raise_not_found=True) # Raises ValueError if not found
             if not enum_type_record: return [] # Should not be reached if raise_not_found=True
@@ -90,7 +109,7 @@ class EnumService:
 
             result_proxy = self.db.execute(sql, {"enum_type_name": enum_type_record.name, "locale": locale})
             values = [dict(row._mapping) for row in result_proxy] # Use ._mapping for SQLAlchemy 2+
-            logger.info(f"Found {len(values)} active values for enum '{enum_system_name}' with locale '{locale}'.")
+            logger.debug(f"Found {len(values)} active values for enum '{enum_system_name}' with locale '{locale}'.")
             return values
 
         except ValueError as e: # Catch specific errors raised internally
@@ -105,20 +124,132 @@ class EnumService:
 
     def get_all_enums(self, locale: str = "en") -> Dict[str, List[Dict]]:
         """Get all enums with their active values for a specific locale"""
-        logger.info(f"Executing get_all_enums(locale='{locale}')")
-        enum_types = self.get_enum_types()
-        result = {}
-        for enum_type_info in enum_types:
-            system_name = enum_type_info["system_name"]
+        catalog, _ = self.get_enum_catalog(locale)
+        return catalog
+
+    def get_enum_catalog(self, locale: str = "en") -> Tuple[Dict[str, List[Dict]], str]:
+        """
+        Get the full enum catalog for a locale together with its ETag.
+
+        Served from the process-wide cache while the catalog version is
+        unchanged, which costs a single primary-key lookup.
+
+        Args:
+            locale: Locale code for translations
+
+        Returns:
+            Tuple of (catalog keyed by enum system_name, ETag)
+        """
+        version = self._get_catalog_version()
+        if version is not None:
+            with self._catalog_lock:
+                cached = self._catalog_cache.get(locale)
+            if cached and cached[0] == version:
+                return cached[2], cached[1]
+
+        catalog = self._build_catalog(locale)
+        etag = hashlib.sha1(
+            json.dumps(catalog, sort_keys=True, default=str).encode("utf-8")
+        ).hexdigest()
+
+        if version is not None:
+            with self._catalog_lock:
+                self._catalog_cache[locale] = (version, etag, catalog)
+        logger.info(f"Built enum catalog for {len(catalog)} types for locale '{locale}'.")
+        return catalog, etag
+
+    def _build_catalog(self, locale: str) -> Dict[str, List[Dict]]:
+        """
+        Load every enum type's active values with one UNION ALL query.
+
+        Falls back to querying each type separately if the combined query
+        fails, e.g. because one dynamic table is missing.
+        """
+        all_types = self.get_enum_types()
+        result = {et["system_name"]: [] for et in all_types}
+        enum_types = [
+            et for et in all_types
+            if et["table_name"] and re.match(r"^[a-zA-Z0-9_]+$", et["table_name"])
+        ]
+        if not enum_types:
+            return result
+
+        selects = []
+        params = {"locale": locale}
+        for index, et in enumerate(enum_types):
+            selects.append(f"""
+            SELECT :system_name_{index} AS enum_system_name,
+                   ev.id, ev.code, ev.display_order, ev.is_system, ev.parent_id, ev.is_active,
+                   COALESCE(et.display_text, ev.code) as display_text,
+                   et.description
+            FROM "{et['table_name']}" ev
+            LEFT JOIN enum_translations et ON
+                et.enum_type = :enum_type_name_{index} AND
+                et.enum_value = ev.code AND
+                et.locale = :locale
+            WHERE ev.is_active = 1""")
+            params[f"system_name_{index}"] = et["system_name"]
+            params[f"enum_type_name_{index}"] = et["name"]
+
+        sql = text(
+            " UNION ALL ".join(selects)
+            + " ORDER BY enum_system_name, display_order, code"
+        )
+
+        try:
+            for row in self.db.execute(sql, params):
+                value = dict(row._mapping)
+                result[value.pop("enum_system_name")].append(value)
+            return result
+        except SQLAlchemyError as e:
+            self.db.rollback()
+            logger.error(f"Combined enum catalog query failed, loading types one by one: {e}")
+
+        for et in enum_types:
+            system_name = et["system_name"]
             try:
                 result[system_name] = self.get_enum_values(system_name, locale)
             except Exception as e:
                 # Log error but continue fetching other types
                 logger.error(f"Failed to get values for enum type '{system_name}' in get_all_enums: {e}", exc_info=False) # Keep log concise
                 result[system_name] = [] # Include empty list for this type on error
-        logger.info(f"Returning all enum values for {len(result)} types for locale '{locale}'.")
         return result
 
+    def _get_catalog_version(self) -> Optional[int]:
+        """Get the enum catalog version, or None if it cannot be read (nothing is cached then)."""
+        try:
+            version = self.db.query(TranslationCatalogVersion.version).filter(
+                TranslationCatalogVersion.catalog == ENUM_CATALOG_KEY
+            ).scalar()
+            return version or 0
+        except SQLAlchemyError as e:
+            self.db.rollback()
+            logger.warning(f"Could not read enum catalog version: {e}")
+            return None
+
+    def _bump_catalog_version(self) -> None:
+        """
+        Record a change to the enum catalog in the current transaction.
+
+        Called right before the write is committed, so the new version and
+        the change become visible together.
+        """
+        try:
+            with self.db.begin_nested():
+                updated = self.db.query(TranslationCatalogVersion).filter(
+                    TranslationCatalogVersion.catalog == ENUM_CATALOG_KEY
+                ).update(
+                    {"version": TranslationCatalogVersion.version + 1},
+                    synchronize_session=False
+                )
+                if not updated:
+                    self.db.add(TranslationCatalogVersion(catalog=ENUM_CATALOG_KEY, version=1))
+        except SQLAlchemyError as e:
+            # Never fail the write itself; cached catalogs refresh on the next bump
+            logger.warning(f"Could not bump enum catalog version: {e}")
+        with self._catalog_lock:
+            self._catalog_cache.clear()
+
     # --- Write Operations ---
 
     def create_enum_value(self, enum_system_name: str, data: dict) -> Dict:
@@ -162,6 +293,7 @@ class EnumService:
             logger.debug(f"Executing SQL: {sql} with data: {insert_data}")
             result = self.db.execute(sql, insert_data)
             new_id = result.scalar_one() # Get the ID of the newly inserted row
+            self._bump_catalog_version()
             self.db.commit()
             logger.info(f"Successfully created enum value ID {new_id} for '{enum_system_name}'.")
 
@@ -277,6 +409,7 @@ class EnumService:
                      # Potentially raise ValueError("Failed to update translation, main update rolled back") if transactional integrity needed
 
 
+            self._bump_catalog_version()
             self.db.commit()
             logger.info(f"Successfully updated enum value ID {value_id} for '{enum_system_name}'.")
 
@@ -337,6 +470,7 @@ class EnumService:
             logger.debug(f"Executing SQL: {delete_trans_sql} with enum_type_name='{enum_type_record.name}', value_code='{value_code}'")
             self.db.execute(delete_trans_sql, {"enum_type_name": enum_type_record.name, "value_code": value_code})
 
+            self._bump_catalog_version()
             self.db.commit()
             logger.info(f"Successfully deleted enum value ID {value_id} ('{value_code}') and its translations for '{enum_system_name}'.")
 
@@ -399,6 +533,7 @@ class EnumService:
                 self.db.flush() # Flush to get ID and potential errors
                 translation_id = new_translation.id
 
+            self._bump_catalog_version()
             self.db.commit()
             # Fetch the committed record to return consistent data
             final_translation = self.db.query(EnumTranslation).get(translation_id)
@@ -456,6 +591,7 @@ class EnumService:
                     "locale": translation.locale, "display_text": translation.display_text, "description": translation.description
                  }
 
+            self._bump_catalog_version()
             self.db.commit()
             self.db.refresh(translation) # Refresh to get latest state
             logger.info(f"Successfully updated translation ID {translation_id}.")
@@ -487,6 +623,7 @@ class EnumService:
 
             logger.debug(f"Deleting translation: Type='{translation.enum_type}', Value='{translation.enum_value}', Locale='{translation.locale}'")
             self.db.delete(translation)
+            self._bump_catalog_version()
             self.db.commit()
             logger.info(f"Successfully deleted translation ID {translation_id}.")
 
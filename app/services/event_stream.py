@@ -0,0 +1,355 @@
+# File: app/services/event_stream.py
+"""
+Push channel for workflow progress and notifications.
+
+The event stream hub subscribes to the event bus and fans the events clients
+care about out to connected Server-Sent Events streams, so clients no longer
+poll execution progress and notifications. Each event is encoded once and
+handed to every matching client through a bounded queue; a client that
+falls too far behind is disconnected and resumes from its Last-Event-ID,
+replayed from a ring buffer of recent events. Idle streams receive
+heartbeat comments so proxies keep them open.
+
+Event IDs are only meaningful to the process that issued them; a client
+resuming against another worker (or after a restart) receives a ``reset``
+event and should refetch its state once.
+"""
+
+from collections import defaultdict, deque
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Deque, Dict, Iterable, List, Optional, Set, Tuple, Type
+import asyncio
+import itertools
+import json
+import logging
+import threading
+import time
+import uuid
+
+from app.core.events import (
+    DomainEvent,
+    EventBus,
+    WorkflowCancelledEvent,
+    WorkflowCompletedEvent,
+    WorkflowPausedEvent,
+    WorkflowProgressUpdateEvent,
+    WorkflowResumedEvent,
+    WorkflowStartedEvent,
+    WorkflowStepCompletedEvent,
+    WorkflowStepStartedEvent,
+)
+from app.core.metrics import counter, gauge
+
+logger = logging.getLogger(__name__)
+
+# Stream metrics
+stream_clients = gauge("events.stream.clients", "Connected event stream clients")
+stream_events = counter("events.stream.events", "Events published to event streams")
+stream_deliveries = counter("events.stream.deliveries", "Events queued for stream clients")
+stream_overflows = counter("events.stream.overflows", "Stream clients disconnected for falling behind")
+
+# Sent as the whole message when a client overflowed, ending its stream
+_OVERFLOW = b"event: overflow\ndata: {}\n\n"
+
+
+def _streamed_event_types() -> Tuple[Type[DomainEvent], ...]:
+    """Event classes pushed to clients."""
+    from app.services.notification_service import NotificationCreated
+
+    return (
+        WorkflowStartedEvent,
+        WorkflowStepStartedEvent,
+        WorkflowStepCompletedEvent,
+        WorkflowProgressUpdateEvent,
+        WorkflowPausedEvent,
+        WorkflowResumedEvent,
+        WorkflowCompletedEvent,
+        WorkflowCancelledEvent,
+        NotificationCreated,
+    )
+
+
+@dataclass(eq=False)
+class StreamClient:
+    """One connected stream and the events it is interested in."""
+
+    user_id: int
+    execution_ids: Set[int] = field(default_factory=set)
+    queue: "asyncio.Queue[bytes]" = field(default_factory=lambda: asyncio.Queue(maxsize=256))
+    overflowed: bool = False
+    # Sequence of the newest event queued, so replayed events are not repeated
+    last_sequence: int = 0
+
+    def matches(self, user_id: Optional[int], execution_id: Optional[int]) -> bool:
+        """Whether an event with these routing fields is for this client."""
+        return user_id == self.user_id or (
+            execution_id is not None and execution_id in self.execution_ids
+        )
+
+
+@dataclass
+class _StreamEvent:
+    """An encoded event and the fields it is routed by."""
+
+    sequence: int
+    user_id: Optional[int]
+    execution_id: Optional[int]
+    message: bytes
+
+
+class EventStreamHub:
+    """
+    Fans event bus events out to connected stream clients.
+
+    Bus handlers may run on any thread; each event crosses into the event
+    loop once and is fanned out there, using indexes by user and execution
+    so only the matching clients are visited.
+    """
+
+    _instance: Optional["EventStreamHub"] = None
+    _instance_lock = threading.Lock()
+
+    @classmethod
+    def get_instance(cls) -> "EventStreamHub":
+        """
+        Get the process-wide hub, subscribed to the global event bus.
+
+        Returns:
+            Shared EventStreamHub instance
+        """
+        with cls._instance_lock:
+            if cls._instance is None:
+                from app.core.config import settings
+                from app.core.events import global_event_bus
+
+                cls._instance = cls(
+                    global_event_bus,
+                    replay_size=settings.EVENT_STREAM_REPLAY_SIZE,
+                    client_queue_size=settings.EVENT_STREAM_CLIENT_QUEUE_SIZE,
+                    heartbeat_seconds=settings.EVENT_STREAM_HEARTBEAT_SECONDS,
+                )
+            return cls._instance
+
+    def __init__(
+            self,
+            event_bus: EventBus,
+            replay_size: int = 10000,
+            client_queue_size: int = 256,
+            heartbeat_seconds: float = 15.0,
+            event_types: Optional[Iterable[Type[DomainEvent]]] = None,
+    ):
+        """
+        Initialize the hub and subscribe it to the event bus.
+
+        Args:
+            event_bus: Event bus to take events from
+            replay_size: Recent events kept for clients resuming a stream
+            client_queue_size: Events a client may fall behind by before it
+                is disconnected
+            heartbeat_seconds: Idle seconds after which a heartbeat is sent
+            event_types: Event classes to stream (defaults to workflow
+                execution and notification events)
+        """
+        self.replay_size = replay_size
+        self.client_queue_size = client_queue_size
+        self.heartbeat_seconds = heartbeat_seconds
+        # Distinguishes this process's event IDs from any other's
+        self.epoch = uuid.uuid4().hex[:8]
+
+        self._sequence = itertools.count(1)
+        self._replay: Deque[_StreamEvent] = deque(maxlen=replay_size)
+        self._by_user: Dict[int, Set[StreamClient]] = defaultdict(set)
+        self._by_execution: Dict[int, Set[StreamClient]] = defaultdict(set)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._pending: List[_StreamEvent] = []
+        self._lock = threading.Lock()
+
+        for event_type in (event_types or _streamed_event_types()):
+            event_bus.subscribe(event_type, self._on_events, batch=True)
+
+    # --- Publishing (any thread) ---
+
+    def _on_events(self, events: List[DomainEvent]) -> None:
+        """Encode bus events and hand them to the event loop for fan-out."""
+        encoded = []
+        with self._lock:
+            for event in events:
+                sequence = next(self._sequence)
+                data = event.to_dict()
+                message = (
+                    f"id: {self.epoch}:{sequence}\n"
+                    f"event: {data['event_type']}\n"
+                    f"data: {json.dumps(data, default=str)}\n\n"
+                ).encode()
+                stream_event = _StreamEvent(
+                    sequence=sequence,
+                    user_id=getattr(event, "user_id", None),
+                    execution_id=getattr(event, "execution_id", None),
+                    message=message,
+                )
+                self._replay.append(stream_event)
+                encoded.append(stream_event)
+
+            # Queued under the lock so events reach the loop in sequence order;
+            # one wake-up drains everything published before it runs
+            loop = self._loop
+            if loop is not None and not loop.is_closed():
+                schedule = not self._pending
+                self._pending.extend(encoded)
+                if schedule:
+                    loop.call_soon_threadsafe(self._drain_pending)
+        stream_events.increment(len(encoded))
+
+    # --- Fan-out (event loop) ---
+
+    def _drain_pending(self) -> None:
+        """Fan out the events published since the last drain."""
+        with self._lock:
+            pending, self._pending = self._pending, []
+        self._fan_out(pending)
+
+    def _fan_out(self, stream_events: List[_StreamEvent]) -> None:
+        """Queue events for the clients they are routed to."""
+        delivered = 0
+        for stream_event in stream_events:
+            clients = set(self._by_user.get(stream_event.user_id, ()))
+            if stream_event.execution_id is not None:
+                clients.update(self._by_execution.get(stream_event.execution_id, ()))
+            for client in clients:
+                self._offer(client, stream_event)
+            delivered += len(clients)
+        stream_deliveries.increment(delivered)
+
+    def _offer(self, client: StreamClient, stream_event: _StreamEvent) -> None:
+        """Queue an event, or cut off a client that stopped keeping up."""
+        if client.overflowed or stream_event.sequence <= client.last_sequence:
+            return
+        try:
+            client.queue.put_nowait(stream_event.message)
+            client.last_sequence = stream_event.sequence
+        except asyncio.QueueFull:
+            client.overflowed = True
+            stream_overflows.increment()
+            # Make room for the marker that ends the stream
+            while not client.queue.empty():
+                client.queue.get_nowait()
+            client.queue.put_nowait(_OVERFLOW)
+            logger.info(f"Event stream of user {client.user_id} fell behind and was closed")
+
+    # --- Client lifecycle (event loop) ---
+
+    def connect(
+            self,
+            user_id: int,
+            execution_ids: Iterable[int] = (),
+            last_event_id: Optional[str] = None
+    ) -> StreamClient:
+        """
+        Register a client and queue the events it missed.
+
+        Must be called on the event loop that serves the stream.
+
+        Args:
+            user_id: ID of the authenticated user
+            execution_ids: Executions whose events the client follows, in
+                addition to the user's own events and notifications
+            last_event_id: ID of the last event the client received, to
+                resume a dropped stream
+
+        Returns:
+            The registered client
+        """
+        client = StreamClient(
+            user_id=user_id,
+            execution_ids=set(execution_ids),
+            queue=asyncio.Queue(maxsize=self.client_queue_size),
+        )
+        with self._lock:
+            self._loop = asyncio.get_running_loop()
+            if last_event_id:
+                self._replay_to(client, last_event_id)
+            # Registered under the lock so no event is both replayed and fanned out
+            self._by_user[user_id].add(client)
+            for execution_id in client.execution_ids:
+                self._by_execution[execution_id].add(client)
+        stream_clients.increment()
+        return client
+
+    def _replay_to(self, client: StreamClient, last_event_id: str) -> None:
+        """Queue the buffered events after last_event_id for a resuming client."""
+        epoch, _, sequence = last_event_id.partition(":")
+        oldest = self._replay[0].sequence if self._replay else None
+        if epoch != self.epoch or not sequence.isdigit() or (
+                oldest is not None and int(sequence) < oldest - 1
+        ):
+            client.queue.put_nowait(b"event: reset\ndata: {}\n\n")
+            return
+        for stream_event in self._replay:
+            if stream_event.sequence > int(sequence) and client.matches(
+                    stream_event.user_id, stream_event.execution_id
+            ):
+                self._offer(client, stream_event)
+
+    def disconnect(self, client: StreamClient) -> None:
+        """
+        Unregister a client.
+
+        Args:
+            client: Client returned by connect()
+        """
+        with self._lock:
+            self._discard(self._by_user, client.user_id, client)
+            for execution_id in client.execution_ids:
+                self._discard(self._by_execution, execution_id, client)
+        stream_clients.decrement()
+
+    @staticmethod
+    def _discard(index: Dict[int, Set[StreamClient]], key: int, client: StreamClient) -> None:
+        """Remove a client from an index, dropping empty entries."""
+        clients = index.get(key)
+        if clients is not None:
+            clients.discard(client)
+            if not clients:
+                del index[key]
+
+    async def stream(self, client: StreamClient) -> AsyncIterator[bytes]:
+        """
+        Yield the Server-Sent Events messages of a client until it overflows.
+
+        Messages already queued are yielded together as one chunk, so a busy
+        client costs one write per wake-up rather than one per event. Sends a
+        heartbeat comment whenever no event arrived for heartbeat_seconds.
+        Unregisters the client when the stream ends or is cancelled by a
+        disconnect.
+
+        Args:
+            client: Client returned by connect()
+        """
+        try:
+            yield f"retry: 3000\n: connected {int(time.time())}\n\n".encode()
+            queue = client.queue
+            while True:
+                messages = []
+                if queue.empty():
+                    try:
+                        messages.append(await asyncio.wait_for(queue.get(), self.heartbeat_seconds))
+                    except asyncio.TimeoutError:
+                        yield b": heartbeat\n\n"
+                        continue
+                messages.extend(queue.get_nowait() for _ in range(queue.qsize()))
+                yield b"".join(messages)
+                if messages[-1] is _OVERFLOW:
+                    return
+        finally:
+            self.disconnect(client)
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get hub statistics.
+
+        Returns:
+            Dictionary with connected clients and buffered events
+        """
+        with self._lock:
+            clients = set().union(*self._by_user.values()) if self._by_user else set()
+            return {"clients": len(clients), "buffered_events": len(self._replay)}
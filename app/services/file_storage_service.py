@@ -6,15 +6,18 @@ import uuid
 import os
 import mimetypes
 import hashlib
-import io
 import logging
 from pathlib import Path
 from datetime import datetime
 import shutil
-from PIL import Image
 
 from app.core.exceptions import StorageException, InvalidPathException
 from app.repositories.file_metadata_repository import FileMetadataRepository
+from app.services.image_derivative_service import (
+    ImageDerivativeService,
+    DEFAULT_THUMBNAIL_SIZE,
+    is_renderable_image,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -25,7 +28,7 @@ class FileStorageService:
 
     Handles file uploads, downloads, and metadata management, including:
     - Secure file storage with proper organization
-    - Thumbnail generation for supported file types
+    - Background thumbnail and image derivative generation
     - File integrity verification
     - Association with system entities
     """
@@ -36,7 +39,7 @@ class FileStorageService:
         metadata_repository=None,
         security_context=None,
         generate_thumbnails: bool = True,
-        max_thumbnail_size: Tuple[int, int] = (300, 300),
+        derivative_service: Optional[ImageDerivativeService] = None,
     ):
         """
         Initialize file storage service with dependencies.
@@ -45,18 +48,18 @@ class FileStorageService:
             base_path: Base directory for file storage
             metadata_repository: Repository for file metadata
             security_context: Optional security context for authorization
-            generate_thumbnails: Whether to generate thumbnails for images
-            max_thumbnail_size: Maximum dimensions for thumbnails (width, height)
+            generate_thumbnails: Whether to queue image derivatives on upload
+            derivative_service: Service rendering image derivatives
+                (defaults to the shared worker pool for base_path)
         """
         self.base_path = Path(base_path)
         self.metadata_repository = metadata_repository
         self.security_context = security_context
         self.generate_thumbnails = generate_thumbnails
-        self.max_thumbnail_size = max_thumbnail_size
+        self.derivative_service = derivative_service
 
         # Create basic directory structure
         os.makedirs(self.base_path, exist_ok=True)
-        os.makedirs(self.base_path / "thumbnails", exist_ok=True)
 
     def store_file(
         self,
@@ -104,10 +107,9 @@ class FileStorageService:
                 if not content_type:
                     content_type = "application/octet-stream"
 
-            # Calculate file hash for integrity verification
+            # The SHA-256 doubles as the content address of the stored blob
             file_hash = hashlib.sha256(file_data).hexdigest()
 
-            # Generate storage paths
             extension = Path(filename).suffix
             if not extension:
                 # Try to get extension from content type
@@ -117,8 +119,6 @@ class FileStorageService:
                 else:
                     extension = ".bin"
 
-            storage_path = self._get_storage_path(file_id, extension)
-
             # Get user_id from security context if not provided
             if (
                 user_id is None
@@ -127,24 +127,36 @@ class FileStorageService:
             ):
                 user_id = self.security_context.user_id
 
-            # Ensure directory exists
-            os.makedirs(storage_path.parent, exist_ok=True)
-
-            # Write the file
-            with open(storage_path, "wb") as f:
-                f.write(file_data)
-
-            # Generate thumbnail if applicable
-            thumbnail_path = None
-            if self.generate_thumbnails and self._is_image(content_type):
-                try:
-                    thumbnail_path = self._generate_thumbnail(
-                        file_data, file_id, extension
-                    )
-                except Exception as e:
-                    logger.warning(
-                        f"Failed to generate thumbnail for {file_id}: {str(e)}"
+            # Reuse the blob (and its thumbnail) if these bytes are already stored
+            existing = (
+                self.metadata_repository.get_blob_reference(file_hash)
+                if self.metadata_repository
+                else None
+            )
+            if existing and (self.base_path / existing.storage_path).exists():
+                storage_path = self.base_path / existing.storage_path
+                thumbnail_path = (
+                    self.base_path / existing.thumbnail_path
+                    if existing.thumbnail_path
+                    else None
+                )
+                logger.debug(
+                    f"Deduplicated upload {file_id} against blob {file_hash}"
+                )
+            else:
+                storage_path = self._get_blob_path(file_hash)
+                if not storage_path.exists():
+                    self._write_blob(storage_path, file_data)
+
+                # Derivatives are rendered off the request thread; the
+                # thumbnail path is known up front and filled in lazily
+                thumbnail_path = None
+                if self.generate_thumbnails and is_renderable_image(content_type):
+                    derivatives = self._get_derivative_service()
+                    thumbnail_path = derivatives.get_derivative_path(
+                        file_hash, DEFAULT_THUMBNAIL_SIZE
                     )
+                    derivatives.enqueue(file_hash, storage_path)
 
             # Record file metadata
             file_metadata_data = {
@@ -154,6 +166,7 @@ class FileStorageService:
                 "content_type": content_type,
                 "size": len(file_data),
                 "checksum": file_hash,
+                "ref_count": 1,
                 "storage_path": str(storage_path.relative_to(self.base_path)),
                 "thumbnail_path": (
                     str(thumbnail_path.relative_to(self.base_path))
@@ -173,6 +186,14 @@ class FileStorageService:
                 stored_metadata = self.metadata_repository.create_file_metadata(
                     file_metadata_data
                 )
+                self.metadata_repository.sync_ref_count(file_hash)
+                # A permanent delete of the blob's last other reference may
+                # have released it since get_blob_reference. Our row is
+                # committed now, so a delete that starts later counts it and
+                # keeps the blob; restore anything released before that.
+                if not storage_path.exists():
+                    logger.info(f"Restoring blob {file_hash} released by a concurrent delete")
+                    self._write_blob(storage_path, file_data)
                 return stored_metadata.to_dict()
 
             return file_metadata_data
@@ -195,46 +216,28 @@ class FileStorageService:
             StorageException: If file retrieval fails
         """
         try:
-            # Get metadata
-            if self.metadata_repository:
-                metadata = self.metadata_repository.get_by_file_id(file_id)
-                if not metadata:
-                    raise StorageException(f"File metadata not found: {file_id}")
-
-                metadata_dict = metadata.to_dict()
-                storage_path = self.base_path / metadata.storage_path
-            else:
-                # Try to find the file without metadata
-                storage_pattern = f"**/{file_id}.*"
-                matching_files = list(self.base_path.glob(storage_pattern))
-
-                if not matching_files:
-                    raise StorageException(f"File not found: {file_id}")
-
-                storage_path = matching_files[0]
-
-                # Create basic metadata
-                metadata_dict = {
-                    "file_id": file_id,
-                    "filename": storage_path.name,
-                    "original_filename": storage_path.name,
-                    "storage_path": str(storage_path.relative_to(self.base_path)),
-                }
+            # Blobs are stored by checksum, so only the metadata row can
+            # locate a file
+            metadata = (
+                self.metadata_repository.get_by_file_id(file_id)
+                if self.metadata_repository
+                else None
+            )
+            if not metadata:
+                raise StorageException(f"File metadata not found: {file_id}")
+
+            metadata_dict = metadata.to_dict()
+            storage_path = self.base_path / metadata.storage_path
 
             # Check if file exists
             if not storage_path.exists():
                 raise StorageException(f"File not found at {storage_path}")
 
-            # Read file data
+            # Read file data; integrity is verified by the periodic scrub
+            # (verify_integrity), not on every read
             with open(storage_path, "rb") as f:
                 file_data = f.read()
 
-            # Verify file integrity if hash is available
-            if "checksum" in metadata_dict:
-                current_hash = hashlib.sha256(file_data).hexdigest()
-                if current_hash != metadata_dict["checksum"]:
-                    logger.warning(f"File integrity check failed for {file_id}")
-
             return file_data, metadata_dict
 
         except StorageException:
@@ -247,6 +250,9 @@ class FileStorageService:
         """
         Delete a file and its metadata.
 
+        A permanent delete removes the metadata row and unlinks the stored
+        blob only when no other row references the same content.
+
         Args:
             file_id: File ID
             permanent: Whether to permanently delete or use soft delete
@@ -258,44 +264,40 @@ class FileStorageService:
             StorageException: If file deletion fails
         """
         try:
-            # Get metadata
-            metadata = None
-            if self.metadata_repository:
-                metadata = self.metadata_repository.get_by_file_id(file_id)
-
-            # Find file path
-            if metadata and hasattr(metadata, "storage_path"):
-                storage_path = self.base_path / metadata.storage_path
-                thumbnail_path = (
-                    self.base_path / metadata.thumbnail_path
-                    if metadata.thumbnail_path
-                    else None
-                )
-            else:
-                # Try to find the file without metadata
-                storage_pattern = f"**/{file_id}.*"
-                matching_files = list(self.base_path.glob(storage_pattern))
-
-                if not matching_files:
-                    return False
-
-                storage_path = matching_files[0]
-                thumbnail_path = self.base_path / "thumbnails" / storage_path.name
-
-            # Delete the physical file if permanent deletion
-            if permanent:
-                if storage_path.exists():
-                    os.remove(storage_path)
-
-                if thumbnail_path and thumbnail_path.exists():
-                    os.remove(thumbnail_path)
-
-            # Update or delete metadata
-            if self.metadata_repository and metadata:
-                if permanent:
-                    self.metadata_repository.permanently_delete(file_id)
-                else:
-                    self.metadata_repository.mark_as_deleted(file_id)
+            # Blobs are stored by checksum, so only the metadata row can
+            # locate a file and count its references
+            metadata = (
+                self.metadata_repository.get_by_file_id(file_id)
+                if self.metadata_repository
+                else None
+            )
+            if not metadata:
+                return False
+
+            storage_path = self.base_path / metadata.storage_path
+            thumbnail_path = (
+                self.base_path / metadata.thumbnail_path
+                if metadata.thumbnail_path
+                else None
+            )
+
+            if not permanent:
+                self.metadata_repository.mark_as_deleted(file_id)
+                return True
+
+            # Other uploads of the same bytes may still reference the blob;
+            # only unlink it once the last reference is gone
+            checksum = metadata.checksum
+            self.metadata_repository.permanently_delete(file_id)
+            remaining = (
+                self.metadata_repository.sync_ref_count(checksum) if checksum else 0
+            )
+            if remaining == 0 and self._release_blob(storage_path, checksum):
+                # Derivatives are regenerated on demand if an upload of the
+                # same bytes arrives later
+                self._unlink_quietly(thumbnail_path)
+                if checksum:
+                    self._get_derivative_service().remove_derivatives(checksum)
 
             return True
 
@@ -319,6 +321,101 @@ class FileStorageService:
         metadata = self.metadata_repository.get_by_file_id(file_id)
         return metadata.to_dict() if metadata else None
 
+    def get_file_path(self, file_id: str) -> Tuple[Path, Dict[str, Any]]:
+        """
+        Resolve a file's location without reading it.
+
+        Lets HTTP handlers stream the file (including range requests)
+        instead of loading it into memory.
+
+        Args:
+            file_id: File ID
+
+        Returns:
+            Tuple of (absolute path, metadata)
+
+        Raises:
+            StorageException: If the metadata or the file is missing
+        """
+        metadata = (
+            self.metadata_repository.get_by_file_id(file_id)
+            if self.metadata_repository
+            else None
+        )
+        if not metadata:
+            raise StorageException(f"File metadata not found: {file_id}")
+
+        storage_path = self.base_path / metadata.storage_path
+        if not storage_path.exists():
+            raise StorageException(f"File not found at {storage_path}")
+        return storage_path, metadata.to_dict()
+
+    def verify_integrity(self) -> Dict[str, Any]:
+        """
+        Re-hash every stored blob and compare it to its recorded checksum.
+
+        Intended to run periodically in the background. Each blob is hashed
+        once no matter how many metadata rows share it.
+
+        Returns:
+            Dictionary with counts of checked and missing blobs and the
+            checksums whose content no longer matches
+
+        Raises:
+            StorageException: If no metadata repository is configured
+        """
+        if not self.metadata_repository:
+            raise StorageException("Metadata repository not available")
+
+        report = {"checked": 0, "missing": 0, "corrupted": []}
+        seen = set()
+        for row in self.metadata_repository.list_all_references():
+            if not row.checksum or row.storage_path in seen:
+                continue
+            seen.add(row.storage_path)
+
+            path = self.base_path / row.storage_path
+            if not path.exists():
+                report["missing"] += 1
+                logger.warning(f"Stored file missing for {row.file_id}: {path}")
+                continue
+
+            report["checked"] += 1
+            if self._hash_file(path) != row.checksum:
+                logger.error(f"File integrity check failed for blob {row.checksum}")
+                report["corrupted"].append(row.checksum)
+
+        return report
+
+    def get_image_derivative(self, file_id: str, size: str) -> Tuple[Path, Dict[str, Any]]:
+        """
+        Get a resized WebP rendition of an image, generating it if missing.
+
+        Args:
+            file_id: File ID
+            size: Derivative size name (e.g. 'thumb', 'medium')
+
+        Returns:
+            Tuple of (derivative path, file metadata)
+
+        Raises:
+            StorageException: If the file is unknown, not an image, or cannot be rendered
+        """
+        metadata = (
+            self.metadata_repository.get_by_file_id(file_id)
+            if self.metadata_repository
+            else None
+        )
+        if not metadata:
+            raise StorageException(f"File metadata not found: {file_id}")
+        if not is_renderable_image(metadata.content_type):
+            raise StorageException(f"File {file_id} is not an image")
+
+        path = self._get_derivative_service().ensure_derivative(
+            metadata.checksum, self.base_path / metadata.storage_path, size
+        )
+        return path, metadata.to_dict()
+
     def update_file_metadata(
         self, file_id: str, updates: Dict[str, Any]
     ) -> Optional[Dict[str, Any]]:
@@ -436,6 +533,8 @@ class FileStorageService:
         """
         Delete orphaned files (not associated with any entity and older than threshold).
 
+        Shared blobs stay on disk while non-orphaned uploads still reference them.
+
         Args:
             days_threshold: Number of days to consider a file orphaned
 
@@ -481,70 +580,215 @@ class FileStorageService:
 
         return self.metadata_repository.get_storage_stats()
 
-    def _get_storage_path(self, file_id: str, extension: str) -> Path:
+    def deduplicate_store(self, dry_run: bool = False) -> Dict[str, int]:
         """
-        Generate storage path for a file.
+        Collapse the existing store so identical contents share one blob.
+
+        Files written before content addressing live under per-upload UUID
+        paths. This copies one of each set of identical files to its checksum
+        path, repoints every metadata row at it, recounts references and then
+        removes the superseded copies. Rows without a checksum are hashed
+        from disk first.
 
         Args:
-            file_id: File ID
-            extension: File extension
+            dry_run: Report what would change without touching disk or database
 
         Returns:
-            Path object for the file
+            Dictionary with counts of blobs, relinked rows, removed files,
+            reclaimed bytes and rows whose file is missing
+
+        Raises:
+            StorageException: If no metadata repository is configured
         """
-        # Create a directory structure based on the first characters of the ID
-        # This helps to avoid having too many files in a single directory
-        if not extension.startswith("."):
-            extension = f".{extension}"
+        if not self.metadata_repository:
+            raise StorageException("Metadata repository not available")
+
+        stats = {
+            "blobs": 0,
+            "rows_relinked": 0,
+            "files_removed": 0,
+            "bytes_reclaimed": 0,
+            "missing": 0,
+        }
+
+        # Group every row (soft-deleted included) by content
+        groups: Dict[str, List[Any]] = {}
+        for row in self.metadata_repository.list_all_references():
+            checksum = row.checksum
+            if not checksum:
+                path = self.base_path / row.storage_path
+                if not path.exists():
+                    stats["missing"] += 1
+                    continue
+                checksum = self._hash_file(path)
+                if not dry_run:
+                    row.checksum = checksum
+            groups.setdefault(checksum, []).append(row)
+
+        for checksum, rows in groups.items():
+            blob_path = self._get_blob_path(checksum)
+            blob_relative = str(blob_path.relative_to(self.base_path))
+
+            sources = [
+                self.base_path / p
+                for p in dict.fromkeys(row.storage_path for row in rows)
+                if p != blob_relative and (self.base_path / p).exists()
+            ]
+            thumbnails = [
+                self.base_path / p
+                for p in dict.fromkeys(row.thumbnail_path for row in rows)
+                if p and (self.base_path / p).exists()
+            ]
+            kept_thumbnail = thumbnails[0] if thumbnails else None
+
+            if not blob_path.exists() and not sources:
+                stats["missing"] += len(rows)
+                continue
+
+            stats["blobs"] += 1
+            stats["rows_relinked"] += sum(
+                1 for row in rows if row.storage_path != blob_relative
+            )
+            stats["files_removed"] += len(sources) + max(len(thumbnails) - 1, 0)
+            stats["bytes_reclaimed"] += sum(p.stat().st_size for p in sources)
+            if not blob_path.exists():
+                # The first copy becomes the blob, so it is not reclaimed
+                stats["bytes_reclaimed"] -= sources[0].stat().st_size
+
+            if dry_run:
+                continue
+
+            # Copy rather than move so a failed commit leaves rows readable
+            if not blob_path.exists():
+                os.makedirs(blob_path.parent, exist_ok=True)
+                temp_path = blob_path.with_name(f".{blob_path.name}.tmp")
+                shutil.copy2(sources[0], temp_path)
+                os.replace(temp_path, blob_path)
+
+            for row in rows:
+                row.storage_path = blob_relative
+                row.filename = blob_path.name
+                row.thumbnail_path = (
+                    str(kept_thumbnail.relative_to(self.base_path))
+                    if kept_thumbnail
+                    else None
+                )
+                row.ref_count = len(rows)
+            self.metadata_repository.session.commit()
+
+            for path in sources + thumbnails[1:]:
+                self._unlink_quietly(path)
 
-        dir1, dir2 = file_id[:2], file_id[2:4]
-        return self.base_path / dir1 / dir2 / f"{file_id}{extension}"
+        return stats
 
-    def _generate_thumbnail(
-        self, image_data: bytes, file_id: str, extension: str
-    ) -> Path:
+    def _get_blob_path(self, checksum: str) -> Path:
         """
-        Generate thumbnail for an image.
+        Generate the content-addressed storage path for a blob.
 
         Args:
-            image_data: Image file data
-            file_id: File ID
-            extension: File extension
+            checksum: SHA-256 hex digest of the content
 
         Returns:
-            Path to the thumbnail
+            Path object for the blob
+        """
+        # Fan out on the first characters of the hash to avoid having
+        # too many files in a single directory
+        dir1, dir2 = checksum[:2], checksum[2:4]
+        return self.base_path / dir1 / dir2 / checksum
 
-        Raises:
-            Exception: If thumbnail generation fails
+    def _write_blob(self, path: Path, data: bytes) -> None:
         """
+        Atomically write blob content to its content-addressed path.
+
+        Writing to a temporary file first guarantees that a blob path never
+        holds partial content, even if two identical uploads race.
+
+        Args:
+            path: Destination path
+            data: Content to write
+        """
+        os.makedirs(path.parent, exist_ok=True)
+        temp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
         try:
-            # Create thumbnail directory if it doesn't exist
-            thumbnail_dir = self.base_path / "thumbnails"
-            os.makedirs(thumbnail_dir, exist_ok=True)
+            with open(temp_path, "wb") as f:
+                f.write(data)
+            os.replace(temp_path, path)
+        finally:
+            if temp_path.exists():
+                os.remove(temp_path)
+
+    def _hash_file(self, path: Path, chunk_size: int = 1024 * 1024) -> str:
+        """
+        Compute the SHA-256 of a file without loading it into memory.
 
-            # Generate thumbnail path
-            thumbnail_path = thumbnail_dir / f"{file_id}_thumb{extension}"
+        Args:
+            path: File to hash
+            chunk_size: Number of bytes to read at a time
 
-            # Generate thumbnail
-            with io.BytesIO(image_data) as img_file:
-                with Image.open(img_file) as img:
-                    img.thumbnail(self.max_thumbnail_size)
-                    img.save(thumbnail_path)
+        Returns:
+            Hex digest of the file content
+        """
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(chunk_size), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
 
-            return thumbnail_path
+    def _release_blob(self, path: Path, checksum: Optional[str]) -> bool:
+        """
+        Remove a blob whose last reference was deleted, unless an upload has
+        referenced it again in the meantime.
 
-        except Exception as e:
-            logger.warning(f"Thumbnail generation failed: {str(e)}")
-            raise
+        The blob is first moved aside and the references recounted. An
+        upload that reused the blob committed its row before checking that
+        the blob exists, so either the recount sees that row and the blob is
+        put back, or the upload finds the blob missing and rewrites it.
 
-    def _is_image(self, content_type: str) -> bool:
+        Args:
+            path: Blob path
+            checksum: Content address of the blob (None for legacy rows,
+                which never share their file)
+
+        Returns:
+            True if the blob was removed, False if it is referenced again
         """
-        Check if a content type is an image.
+        if not checksum:
+            self._unlink_quietly(path)
+            return True
+
+        released_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}.released")
+        try:
+            os.replace(path, released_path)
+        except FileNotFoundError:
+            return True
+
+        if self.metadata_repository.sync_ref_count(checksum):
+            os.replace(released_path, path)
+            logger.debug(f"Kept blob {checksum}, referenced again during delete")
+            return False
+
+        os.remove(released_path)
+        return True
+
+    def _unlink_quietly(self, path: Optional[Path]) -> None:
+        """
+        Remove a file if it exists.
 
         Args:
-            content_type: MIME type to check
+            path: File to remove, or None
+        """
+        if path and path.exists():
+            os.remove(path)
+
+    def _get_derivative_service(self) -> ImageDerivativeService:
+        """
+        Get the derivative service, falling back to the process-wide instance.
 
         Returns:
-            True if content type is an image, False otherwise
+            ImageDerivativeService instance
         """
-        return content_type.startswith("image/")
+        if self.derivative_service is None:
+            self.derivative_service = ImageDerivativeService.get_instance(
+                str(self.base_path)
+            )
+        return self.derivative_service
@@ -0,0 +1,310 @@
+# File: app/services/image_derivative_service.py
+"""
+Background image derivative generation for HideSync.
+
+Uploads only enqueue work here; resized WebP renditions are produced by a
+small pool of worker threads so that request threads never decode images.
+Any size that has not been rendered yet can also be generated on demand,
+after which it is served from the on-disk cache.
+"""
+
+from typing import Dict, Optional, Set, Tuple
+from pathlib import Path
+import os
+import queue
+import threading
+import uuid
+import logging
+
+from PIL import Image, ImageOps
+
+from app.core.exceptions import StorageException
+
+logger = logging.getLogger(__name__)
+
+# Named renditions and the length of their longest edge in pixels
+DERIVATIVE_SIZES: Dict[str, int] = {
+    "thumb": 150,
+    "small": 320,
+    "medium": 800,
+    "large": 1600,
+}
+
+DEFAULT_THUMBNAIL_SIZE = "thumb"
+
+
+class ImageDerivativeService:
+    """
+    Service for generating and caching resized image renditions.
+
+    Derivatives are keyed by an opaque source key (the content checksum for
+    files in the file store, the asset ID for legacy media assets) and stored
+    as ``derivatives/<size>/<key[:2]>/<key>.webp`` under the base path.
+    Generation normalizes EXIF orientation, downsizes to fit the requested
+    edge length and never upscales.
+    """
+
+    _instances: Dict[str, "ImageDerivativeService"] = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def get_instance(cls, base_path: Optional[str] = None) -> "ImageDerivativeService":
+        """
+        Get the process-wide derivative service for a storage root.
+
+        Args:
+            base_path: Storage root (defaults to MEDIA_ASSETS_BASE_PATH)
+
+        Returns:
+            Shared ImageDerivativeService for that root
+        """
+        if base_path is None:
+            from app.core.config import settings
+
+            base_path = settings.MEDIA_ASSETS_BASE_PATH
+        key = str(Path(base_path).resolve())
+        with cls._lock:
+            if key not in cls._instances:
+                cls._instances[key] = cls(base_path)
+            return cls._instances[key]
+
+    @classmethod
+    def shutdown_all(cls) -> None:
+        """Stop the workers of every process-wide instance."""
+        with cls._lock:
+            instances = list(cls._instances.values())
+        for instance in instances:
+            instance.stop()
+
+    def __init__(
+        self,
+        base_path: str,
+        sizes: Optional[Dict[str, int]] = None,
+        worker_count: int = 2,
+        max_queue_size: int = 1000,
+        quality: int = 82,
+    ):
+        """
+        Initialize the derivative service.
+
+        Args:
+            base_path: Base directory under which derivatives are cached
+            sizes: Mapping of size name to longest edge in pixels
+            worker_count: Number of background worker threads
+            max_queue_size: Maximum number of pending jobs before new ones are dropped
+            quality: WebP encoder quality (0-100)
+        """
+        self.base_path = Path(base_path)
+        self.sizes = dict(sizes or DERIVATIVE_SIZES)
+        self.worker_count = worker_count
+        self.quality = quality
+
+        self._queue: "queue.Queue[Optional[Tuple[str, Path, Tuple[str, ...]]]]" = (
+            queue.Queue(maxsize=max_queue_size)
+        )
+        self._pending: Set[str] = set()
+        self._pending_lock = threading.Lock()
+        self._workers = []
+
+    # --- Worker lifecycle ---
+
+    def start(self) -> None:
+        """Start the background workers if they are not already running."""
+        if self._workers:
+            return
+        for index in range(self.worker_count):
+            worker = threading.Thread(
+                target=self._worker_loop,
+                name=f"image-derivatives-{index}",
+                daemon=True,
+            )
+            worker.start()
+            self._workers.append(worker)
+        logger.info(f"Started {self.worker_count} image derivative workers")
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """
+        Stop the background workers.
+
+        Jobs still queued are abandoned; their sizes are generated lazily
+        the next time they are requested.
+
+        Args:
+            timeout: Seconds to wait for each worker to finish its current job
+        """
+        for _ in self._workers:
+            try:
+                self._queue.put_nowait(None)
+            except queue.Full:
+                break
+        for worker in self._workers:
+            worker.join(timeout=timeout)
+        self._workers = []
+
+    def enqueue(
+        self, key: str, source_path: Path, sizes: Optional[Tuple[str, ...]] = None
+    ) -> bool:
+        """
+        Queue derivative generation for a source image.
+
+        Starts the workers on first use. Never blocks: if the queue is full the
+        job is dropped and the sizes will be rendered on demand instead.
+
+        Args:
+            key: Source key the derivatives are cached under
+            source_path: Path to the original image
+            sizes: Size names to render (defaults to all configured sizes)
+
+        Returns:
+            True if the job was queued, False if it was already pending or dropped
+        """
+        with self._pending_lock:
+            if key in self._pending:
+                return False
+            self._pending.add(key)
+
+        self.start()
+        try:
+            self._queue.put_nowait((key, Path(source_path), sizes or tuple(self.sizes)))
+            return True
+        except queue.Full:
+            with self._pending_lock:
+                self._pending.discard(key)
+            logger.warning(f"Derivative queue full, deferring {key} to on-demand generation")
+            return False
+
+    # --- Derivative access ---
+
+    def get_derivative_path(self, key: str, size: str) -> Path:
+        """
+        Get the cache path for a derivative.
+
+        Args:
+            key: Source key
+            size: Size name
+
+        Returns:
+            Path where the derivative is (or will be) stored
+
+        Raises:
+            StorageException: If the size name is unknown
+        """
+        if size not in self.sizes:
+            raise StorageException(
+                f"Unknown image size '{size}'",
+                {"size": size, "available_sizes": list(self.sizes)},
+            )
+        return self.base_path / "derivatives" / size / key[:2] / f"{key}.webp"
+
+    def ensure_derivative(self, key: str, source_path: Path, size: str) -> Path:
+        """
+        Get a derivative, generating and caching it first if it is missing.
+
+        Args:
+            key: Source key
+            source_path: Path to the original image
+            size: Size name
+
+        Returns:
+            Path to the cached derivative
+
+        Raises:
+            StorageException: If the size is unknown or the source cannot be rendered
+        """
+        target_path = self.get_derivative_path(key, size)
+        if target_path.exists():
+            return target_path
+
+        try:
+            self._render(Path(source_path), target_path, self.sizes[size])
+        except Exception as e:
+            logger.error(f"Failed to render {size} derivative for {key}: {str(e)}")
+            raise StorageException(f"Failed to generate image derivative: {str(e)}")
+        return target_path
+
+    def remove_derivatives(self, key: str) -> int:
+        """
+        Delete every cached derivative for a source key.
+
+        Args:
+            key: Source key
+
+        Returns:
+            Number of files removed
+        """
+        removed = 0
+        for size in self.sizes:
+            path = self.get_derivative_path(key, size)
+            if path.exists():
+                os.remove(path)
+                removed += 1
+        return removed
+
+    # --- Internal helpers ---
+
+    def _worker_loop(self) -> None:
+        """Process queued jobs until a stop sentinel is received."""
+        while True:
+            job = self._queue.get()
+            if job is None:
+                self._queue.task_done()
+                return
+
+            key, source_path, sizes = job
+            try:
+                for size in sizes:
+                    target_path = self.get_derivative_path(key, size)
+                    if not target_path.exists():
+                        self._render(source_path, target_path, self.sizes[size])
+            except Exception as e:
+                logger.warning(f"Background derivative generation failed for {key}: {str(e)}")
+            finally:
+                with self._pending_lock:
+                    self._pending.discard(key)
+                self._queue.task_done()
+
+    def _render(self, source_path: Path, target_path: Path, max_edge: int) -> None:
+        """
+        Render one WebP derivative.
+
+        The image is decoded once, rotated according to its EXIF orientation,
+        shrunk to fit ``max_edge`` and written atomically so concurrent readers
+        never see a partial file.
+
+        Args:
+            source_path: Original image
+            target_path: Destination of the derivative
+            max_edge: Longest edge of the derivative in pixels
+        """
+        os.makedirs(target_path.parent, exist_ok=True)
+        temp_path = target_path.with_name(f".{target_path.name}.{uuid.uuid4().hex}.tmp")
+
+        try:
+            with Image.open(source_path) as img:
+                # Let the decoder skip work for large JPEGs
+                img.draft("RGB", (max_edge, max_edge))
+                img = ImageOps.exif_transpose(img)
+                img.thumbnail((max_edge, max_edge), Image.LANCZOS)
+                if img.mode not in ("RGB", "RGBA"):
+                    has_alpha = img.mode in ("LA", "PA") or (
+                        img.mode == "P" and "transparency" in img.info
+                    )
+                    img = img.convert("RGBA" if has_alpha else "RGB")
+                img.save(temp_path, format="WEBP", quality=self.quality, method=4)
+            os.replace(temp_path, target_path)
+        finally:
+            if temp_path.exists():
+                os.remove(temp_path)
+
+
+def is_renderable_image(content_type: Optional[str]) -> bool:
+    """
+    Check whether a content type can be rendered into raster derivatives.
+
+    Args:
+        content_type: MIME type to check
+
+    Returns:
+        True for raster image types, False otherwise (including SVG)
+    """
+    return bool(content_type) and content_type.startswith("image/") and content_type != "image/svg+xml"
@@ -1,6 +1,7 @@
 # File: services/inventory_service.py
 
 import logging
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional, Union
 
@@ -74,21 +75,42 @@ class InventoryAdjusted(DomainEvent):
         self.user_id = user_id
 
 
-class LowStockAlert(DomainEvent):
+class InventoryBulkAdjusted(DomainEvent):
     def __init__(
         self,
-        inventory_id: int,
-        item_id: int,
-        item_type: str,
-        current_quantity: float,
-        reorder_point: float,
+        adjustments: List[Dict[str, Any]],
+        adjustment_type: InventoryAdjustmentType,
+        reason: str,
+        reference_id: Optional[str] = None,
+        reference_type: Optional[str] = None,
+        user_id: Optional[int] = None,
     ):
         super().__init__()
-        self.inventory_id = inventory_id
-        self.item_id = item_id
-        self.item_type = item_type
-        self.current_quantity = current_quantity
-        self.reorder_point = reorder_point
+        self.adjustments = adjustments
+        self.adjustment_type = adjustment_type.name
+        self.reason = reason
+        self.reference_id = reference_id
+        self.reference_type = reference_type
+        self.user_id = user_id
+
+
+# Dataclasses so the outbox can store and rebuild them
+@dataclass(eq=False)
+class LowStock(DomainEvent):
+    inventory_id: int = 0
+    item_id: int = 0
+    item_type: str = ""
+    current_quantity: float = 0.0
+    reorder_point: float = 0.0
+
+
+@dataclass(eq=False)
+class BackInStock(DomainEvent):
+    inventory_id: int = 0
+    item_id: int = 0
+    item_type: str = ""
+    current_quantity: float = 0.0
+    reorder_point: float = 0.0
 
 
 class InventoryTransferred(DomainEvent):
@@ -202,22 +224,26 @@ class InventoryService(BaseService[Inventory]):
                 )
                 return None
 
-            # 2. Get related item details (especially reorder point)
-            item_details = self._get_item_details(item_type, item_id)
-            # Use 0 if details or reorder_point are missing
-            reorder_point = (
-                item_details.get("reorder_point", 0.0) if item_details else 0.0
-            )
-            if not isinstance(
-                reorder_point, (int, float)
-            ):  # Handle non-numeric reorder points
-                logger.warning(
-                    f"Invalid reorder point type ({type(reorder_point)}) found for {item_type} {item_id}. Using 0."
-                )
-                reorder_point = 0.0
+            # 2. Get the related item's reorder point (0 if it has none)
+            reorder_point = self.repository.get_reorder_points(
+                [(item_type, item_id)]
+            ).get((item_type, item_id), 0.0)
 
             # 3. Determine the correct status based on current quantity
             current_quantity = inventory.quantity
+            # The reorder flag can change even when the status does not
+            transitions = self._update_reorder_flags(
+                [
+                    {
+                        "inventory_id": inventory.id,
+                        "item_type": item_type,
+                        "item_id": item_id,
+                        "quantity": current_quantity,
+                        "reorder_point": reorder_point,
+                    }
+                ]
+            )
+            self._enqueue_stock_transitions(transitions)
             correct_status = self._determine_inventory_status(
                 current_quantity, reorder_point
             )
@@ -252,13 +278,14 @@ class InventoryService(BaseService[Inventory]):
                     general_key = self._get_cache_key(item_type, item_id)
                     self.cache_service.invalidate(general_key)
 
-                self.session.refresh(updated_inventory)  # Refresh to get latest state
-                return updated_inventory
+                inventory = updated_inventory
             else:
                 logger.debug(
                     f"Inventory status for {item_type} {item_id} remains {inventory.status}. No update needed."
                 )
-                return inventory  # Return original object if no change
+
+        self.session.refresh(inventory)  # Refresh to get latest state
+        return inventory
 
     @property
     def product_service(self) -> "ProductService":
@@ -641,9 +668,19 @@ class InventoryService(BaseService[Inventory]):
                     )
                 )
 
-            # 8. Check for Low Stock Alert
-            # Pass reorder_point to avoid fetching details again
-            self._check_low_stock(updated_inventory, reorder_point)
+            # 8. Flag or unflag the item for reorder
+            transitions = self._update_reorder_flags(
+                [
+                    {
+                        "inventory_id": updated_inventory.id,
+                        "item_type": item_type,
+                        "item_id": item_id,
+                        "quantity": new_quantity,
+                        "reorder_point": reorder_point,
+                    }
+                ]
+            )
+            self._enqueue_stock_transitions(transitions)
 
             # 9. Invalidate Cache
             if self.cache_service:
@@ -653,8 +690,195 @@ class InventoryService(BaseService[Inventory]):
                     f"{cache_key}:status"
                 )  # Invalidate status cache too
 
-            self.session.refresh(updated_inventory)  # Refresh state
-            return updated_inventory
+        self.session.refresh(updated_inventory)  # Refresh state
+        return updated_inventory
+
+    def bulk_adjust(
+        self,
+        adjustments: List[Dict[str, Any]],
+        adjustment_type: InventoryAdjustmentType,
+        reason: str,
+        transaction_type: TransactionType = TransactionType.ADJUSTMENT,
+        reference_id: Optional[int] = None,
+        reference_type: Optional[str] = None,
+        user_id: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Applies many quantity changes in one transaction, all or nothing.
+
+        Each item's quantity is changed with a single guarded UPDATE, so
+        concurrent adjustments of the same item never lose an update or take
+        its stock below zero. Lines for the same item are combined, and items
+        are updated in a fixed order so that concurrent batches lock rows in
+        the same order. Transactions are logged with one multi-row insert,
+        one per line, and a single InventoryBulkAdjusted event is published
+        once the batch is committed. LowStock or BackInStock events for items
+        that crossed their reorder point go to the outbox in the same
+        transaction.
+
+        Args:
+            adjustments: Dicts with item_type, item_id and quantity_change
+                (+ for increase, - for decrease), and optionally notes.
+            adjustment_type: The type of adjustment (Enum member).
+            reason: A required reason for the adjustments.
+            transaction_type: Type of the logged transactions.
+            reference_id: Optional ID related to the adjustments (e.g. a sale).
+            reference_type: Optional type of the reference ID.
+            user_id: Optional ID of the user performing the action.
+
+        Returns:
+            For each adjusted item: inventory_id, item_type, item_id,
+            previous_quantity, new_quantity and status.
+
+        Raises:
+            ValidationException: For invalid inputs.
+            InsufficientInventoryException: If any item lacks the stock to
+                decrease; nothing is adjusted.
+        """
+        user_id = user_id or self._get_current_user_id()
+        if not reason:
+            raise ValidationException(
+                "Reason is required for inventory adjustment.",
+                {"reason": "Cannot be empty."},
+            )
+        if not isinstance(adjustment_type, InventoryAdjustmentType):
+            raise ValidationException(
+                "Invalid adjustment_type provided.",
+                {"adjustment_type": "Must be InventoryAdjustmentType enum member."},
+            )
+
+        deltas: Dict[tuple, float] = {}
+        lines = []
+        for adjustment in adjustments:
+            item_type = str(adjustment.get("item_type", "")).lower()
+            item_id = adjustment.get("item_id")
+            quantity_change = adjustment.get("quantity_change") or 0
+            if item_type not in ["product", "material", "tool"]:
+                raise ValidationException(
+                    f"Invalid item_type: {item_type}",
+                    {"item_type": "Must be 'product', 'material', or 'tool'."},
+                )
+            if item_id is None or quantity_change == 0:
+                raise ValidationException(
+                    "Each adjustment needs an item_id and a non-zero quantity_change.",
+                    {"adjustments": f"Invalid adjustment for {item_type} {item_id}"},
+                )
+            key = (item_type, item_id)
+            deltas[key] = deltas.get(key, 0.0) + quantity_change
+            lines.append((key, quantity_change, adjustment.get("notes")))
+        if not lines:
+            return []
+        logger.info(
+            f"Bulk adjusting inventory: {len(lines)} lines for {len(deltas)} items, "
+            f"type={adjustment_type.name}, reason='{reason}'"
+        )
+
+        results = []
+        with self.transaction():
+            updated = {}
+            for key in sorted(deltas):
+                delta = deltas[key]
+                if delta == 0:
+                    continue
+                row = self.repository.apply_quantity_delta(key[0], key[1], delta)
+                if row is None:
+                    inventory = self.repository.get_inventory_by_item_id(*key)
+                    if inventory or delta < 0:
+                        available = inventory.quantity if inventory else 0.0
+                        logger.warning(
+                            f"Insufficient inventory for {key[0]} {key[1]}. Available: {available}, Requested change: {delta}"
+                        )
+                        raise InsufficientInventoryException(key[1], -delta, available)
+                    logger.warning(
+                        f"Inventory record not found for {key[0]} ID {key[1]}. Creating one due to positive adjustment."
+                    )
+                    inventory = Inventory(
+                        item_type=key[0], item_id=key[1], quantity=delta
+                    )
+                    self.session.add(inventory)
+                    self.session.flush()
+                    row = (inventory.id, delta, None)
+                updated[key] = row
+
+            # Re-evaluate the status of every adjusted item at once
+            reorder_points = self.repository.get_reorder_points(list(updated))
+            statuses = {}
+            for key, (inventory_id, new_quantity, status) in updated.items():
+                reorder_point = reorder_points.get(key, 0.0)
+                new_status = self._determine_inventory_status(new_quantity, reorder_point)
+                if new_status != status:
+                    statuses[inventory_id] = new_status
+                results.append(
+                    {
+                        "inventory_id": inventory_id,
+                        "item_type": key[0],
+                        "item_id": key[1],
+                        "previous_quantity": new_quantity - deltas[key],
+                        "new_quantity": new_quantity,
+                        "status": new_status.name,
+                        "reorder_point": reorder_point,
+                    }
+                )
+            self.repository.update_statuses(statuses)
+            transitions = self._update_reorder_flags(
+                [
+                    {
+                        "inventory_id": result["inventory_id"],
+                        "item_type": result["item_type"],
+                        "item_id": result["item_id"],
+                        "quantity": result["new_quantity"],
+                        "reorder_point": result["reorder_point"],
+                    }
+                    for result in results
+                ]
+            )
+            self._enqueue_stock_transitions(transitions)
+
+            reference_column = {
+                "project": "project_id",
+                "sale": "sale_id",
+                "purchase": "purchase_id",
+            }.get((reference_type or "").lower())
+            now = datetime.now()
+            self.transaction_repository.bulk_create(
+                [
+                    {
+                        "item_type": key[0],
+                        "item_id": key[1],
+                        "quantity": quantity_change,
+                        "transaction_type": transaction_type,
+                        "adjustment_type": adjustment_type,
+                        "project_id": reference_id if reference_column == "project_id" else None,
+                        "sale_id": reference_id if reference_column == "sale_id" else None,
+                        "purchase_id": reference_id if reference_column == "purchase_id" else None,
+                        "notes": f"{reason}{f' | {notes}' if notes else ''}",
+                        "performed_by": str(user_id) if user_id else None,
+                        "transaction_date": now,
+                    }
+                    for key, quantity_change, notes in lines
+                ]
+            )
+
+        # Published only once the batch is committed
+        if self.event_bus:
+            self.event_bus.publish(
+                InventoryBulkAdjusted(
+                    adjustments=results,
+                    adjustment_type=adjustment_type,
+                    reason=reason,
+                    reference_id=reference_id,
+                    reference_type=reference_type,
+                    user_id=user_id,
+                )
+            )
+
+        if self.cache_service:
+            for key in updated:
+                cache_key = self._get_cache_key(*key)
+                self.cache_service.invalidate(cache_key)
+                self.cache_service.invalidate(f"{cache_key}:status")
+
+        return results
 
     def transfer_inventory(
         self,
@@ -900,9 +1124,7 @@ class InventoryService(BaseService[Inventory]):
             # 3. Calculate total value (can be complex, use simplified approach for now)
             #    This might require fetching all inventory items and their costs.
             #    Using the existing calculate_inventory_value method is a good start.
-            value_data = (
-                self.calculate_inventory_value()
-            )  # Assuming this returns {'total_value': ...}
+            value_data = self.calculate_inventory_value(include_items=False)
             total_value = value_data.get("total_value", 0.0)
 
             # 4. Get total number of distinct products tracked
@@ -1071,76 +1293,87 @@ class InventoryService(BaseService[Inventory]):
     ) -> List[Dict[str, Any]]:
         """
         Gets items low in stock (at or below reorder point * threshold %).
+
+        Up to the reorder point itself this reads only the items flagged as
+        needing reorder.
         """
         logger.info(
             f"Fetching low stock items: threshold={threshold_percentage}%, type={item_type or 'All'}"
         )
-        # Repository method should handle the core query joining Inventory and Product/Material/Tool
-        # to compare Inventory.quantity with Item.reorder_point
-        low_stock_inventories = self.repository.get_low_stock_inventory_detailed(
+        rows = self.repository.get_reorder_inventory(
             threshold_percentage=threshold_percentage,
-            item_type=item_type.lower() if item_type else None,
+            item_type=item_type,
             limit=500,  # Add a reasonable limit
-        )  # Assuming repo has this method
+        )
 
         results = []
-        for (
-            inventory,
-            item_details,
-        ) in low_stock_inventories:  # Assuming repo returns tuples
-            if not item_details:  # Should ideally not happen if query is correct
-                logger.warning(
-                    f"Missing item details for low stock inventory ID {inventory.id} ({inventory.item_type} {inventory.item_id})"
-                )
-                continue
-
-            reorder_point = item_details.get("reorder_point", 0.0)
-            quantity = inventory.quantity
-
-            # Format output
+        for row in rows:
+            reorder_point = row["reorder_point"]
+            quantity = row["quantity"] or 0.0
+            if row["material_unit"] is not None:
+                unit = row["material_unit"].name
+            else:
+                unit = "piece" if row["item_type"] == "product" else "unit"
             results.append(
                 {
-                    "inventory_id": inventory.id,
-                    "item_type": inventory.item_type,
-                    "item_id": inventory.item_id,
-                    "item_name": item_details.get(
-                        "name", f"Unknown {inventory.item_type}"
-                    ),
+                    "inventory_id": row["inventory_id"],
+                    "item_type": row["item_type"],
+                    "item_id": row["item_id"],
+                    "item_name": row["name"] or f"Unknown {row['item_type']}",
                     "quantity": quantity,
-                    "status": inventory.status.name if inventory.status else None,
+                    "status": row["status"].name if row["status"] else None,
                     "reorder_point": reorder_point,
-                    "storage_location": inventory.storage_location,
-                    "percent_of_reorder": round(
-                        (quantity / reorder_point * 100) if reorder_point > 0 else 0, 1
-                    ),
+                    "storage_location": row["storage_location"],
+                    "percent_of_reorder": round(quantity / reorder_point * 100, 1),
                     "units_below_reorder": max(0, reorder_point - quantity),
-                    "unit": item_details.get("unit", "unit"),
-                    # Add other useful details like supplier?
+                    "unit": unit,
                 }
             )
 
         logger.info(f"Found {len(results)} low stock items.")
-        # Sort results (e.g., by severity - lowest percentage first)
-        return sorted(results, key=lambda x: x["percent_of_reorder"])
+        # Lowest percentage first, as ordered by the query
+        return results
 
     # --- Reporting & Calculation Methods ---
     # (Keep calculate_inventory_value, generate_inventory_report, reconcile_inventory, perform_inventory_audit
     #  as defined previously, ensuring they use _get_item_details correctly)
 
     def calculate_inventory_value(
-        self, as_of_date: Optional[datetime] = None
+        self, as_of_date: Optional[datetime] = None, include_items: bool = True
     ) -> Dict[str, Any]:
-        logger.info(f"Calculating inventory value as of {as_of_date or 'now'}")
-        if not as_of_date:
-            as_of_date = datetime.now(timezone.utc)  # Use timezone aware now
+        """
+        Calculate the value of the inventory.
+
+        The valuation runs as one query joining each inventory row to its
+        product, material or tool. With as_of_date, quantities are those on
+        that date, from the latest stock snapshot before it plus the
+        inventory transactions recorded in between; unit costs and locations
+        are current.
 
-        # Fetch all inventory items (consider filtering if performance is an issue)
-        # Ensure the repository list method doesn't cause issues
+        Args:
+            as_of_date: Optional date to value the inventory at (default now)
+            include_items: Whether to list every item in stock; without it
+                only the totals are computed, in the database
+
+        Returns:
+            Dictionary with the total value, item count, totals by item type
+            and the items sorted by value (descending)
+        """
+        logger.info(f"Calculating inventory value as of {as_of_date or 'now'}")
         try:
-            inventories = self.repository.list(limit=10000)  # Fetch a large batch
+            stock_levels = None
+            if as_of_date:
+                stock_levels = self.transaction_repository.stock_levels_as_of(
+                    self._to_ledger_time(as_of_date)
+                )
+            else:
+                as_of_date = datetime.now()
+            rows = self.repository.get_valuation(
+                stock_levels=stock_levels, include_items=include_items
+            )
         except Exception as e:
             logger.error(
-                f"Failed to list inventory items for value calculation: {e}",
+                f"Failed to value inventory: {e}",
                 exc_info=True,
             )
             return {  # Return default on error fetching inventory
@@ -1158,72 +1391,40 @@ class InventoryService(BaseService[Inventory]):
             "tool": {"count": 0, "value": 0.0},
         }
         items_detail = []
-        item_count = 0  # Use a separate counter
-
-        for inventory in inventories:
-            # Skip if quantity is zero or less
-            if not inventory.quantity or inventory.quantity <= 0:
-                continue
-
-            item_count += 1  # Count items with positive quantity
-
-            # Get details, which might return None
-            item_details = self._get_item_details(
-                inventory.item_type, inventory.item_id
-            )
-
-            # --- SAFELY GET UNIT COST ---
-            # Default to 0.0 if details are missing or cost is None/invalid
-            unit_cost = 0.0
-            if item_details:
-                cost_value = item_details.get("cost")  # Get cost value
-                if isinstance(cost_value, (int, float)):  # Check if it's a number
-                    unit_cost = float(cost_value)
+        item_count = 0
+
+        for row in rows:
+            type_key = (row["item_type"] or "").lower()
+            if type_key not in by_type:
+                type_key = "other"
+                by_type.setdefault("other", {"count": 0, "value": 0.0})
+            count = row["item_count"] if not include_items else 1
+            item_value = float(row["total_value"] or 0.0)
+            item_count += count
+            total_value += item_value
+            by_type[type_key]["count"] += count
+            by_type[type_key]["value"] += item_value
+
+            if include_items:
+                if row["material_unit"] is not None:
+                    unit = getattr(row["material_unit"], "name", row["material_unit"])
+                elif type_key in ("product", "tool"):
+                    unit = "piece"
                 else:
-                    logger.warning(
-                        f"Invalid or missing cost for {inventory.item_type} ID {inventory.item_id}. Using 0.0 for value calculation."
-                    )
-            else:
-                logger.warning(
-                    f"Could not get item details for {inventory.item_type} ID {inventory.item_id}. Using 0.0 cost."
+                    unit = "unit"
+                items_detail.append(
+                    {
+                        "inventory_id": row["inventory_id"],
+                        "item_type": row["item_type"],
+                        "item_id": row["item_id"],
+                        "name": row["name"] or f"Unknown {row['item_type']}",
+                        "quantity": row["quantity"],
+                        "unit": unit,
+                        "unit_cost": float(row["unit_cost"] or 0.0),
+                        "total_value": item_value,
+                        "location": row["location"],
+                    }
                 )
-            # --- END SAFELY GET UNIT COST ---
-
-            # Calculate item value (unit_cost is now guaranteed to be a float)
-            item_value = inventory.quantity * unit_cost
-            total_value += item_value
-
-            # Aggregate by type
-            type_key = inventory.item_type.lower()  # Use lowercase for consistency
-            if type_key in by_type:
-                by_type[type_key]["count"] += 1  # Count distinct items being valued
-                by_type[type_key]["value"] += item_value
-            else:
-                # Handle unexpected item types if necessary
-                if "other" not in by_type:
-                    by_type["other"] = {"count": 0, "value": 0.0}
-                by_type["other"]["count"] += 1
-                by_type["other"]["value"] += item_value
-
-            items_detail.append(
-                {
-                    "inventory_id": inventory.id,
-                    "item_type": inventory.item_type,
-                    "item_id": inventory.item_id,
-                    "name": (
-                        item_details.get("name", f"Unknown {inventory.item_type}")
-                        if item_details
-                        else f"Unknown {inventory.item_type}"
-                    ),
-                    "quantity": inventory.quantity,
-                    "unit": (
-                        item_details.get("unit", "unit") if item_details else "unit"
-                    ),
-                    "unit_cost": unit_cost,
-                    "total_value": item_value,
-                    "location": inventory.storage_location,
-                }
-            )
 
         logger.info(
             f"Calculated total inventory value: {total_value:.2f} for {item_count} items."
@@ -1233,9 +1434,98 @@ class InventoryService(BaseService[Inventory]):
             "total_value": round(total_value, 2),
             "item_count": item_count,  # Return count of items included in value calc
             "by_type": by_type,
-            "items": sorted(items_detail, key=lambda x: x["total_value"], reverse=True),
+            "items": items_detail,  # Already sorted by value in the query
         }
 
+    def get_stock_as_of(
+        self, item_type: str, item_id: int, as_of_date: datetime
+    ) -> float:
+        """
+        Gets an item's stock at a point in time.
+
+        Computed from the latest stock snapshot before as_of_date plus the
+        item's inventory transactions recorded in between.
+
+        Args:
+            item_type: 'product', 'material', or 'tool'.
+            item_id: The ID of the item.
+            as_of_date: Time to get the stock at.
+
+        Returns:
+            Quantity in stock at that time.
+        """
+        return self.transaction_repository.get_stock_as_of(
+            item_type.lower(), item_id, self._to_ledger_time(as_of_date)
+        )
+
+    def take_stock_snapshot(self, snapshot_date: Optional[datetime] = None) -> int:
+        """
+        Records every item's stock at a point in time.
+
+        Args:
+            snapshot_date: Time of the snapshot (default: the start of today).
+
+        Returns:
+            Number of items recorded.
+        """
+        if snapshot_date is None:
+            snapshot_date = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        snapshot_date = self._to_ledger_time(snapshot_date)
+        with self.transaction():
+            count = self.transaction_repository.create_snapshot(snapshot_date)
+        logger.info(f"Stock snapshot at {snapshot_date.isoformat()}: {count} items")
+        return count
+
+    def backfill_stock_snapshots(
+        self, start_date: datetime, daily_days: int = 90
+    ) -> int:
+        """
+        Takes the snapshots the ledger should have since a date.
+
+        One at the start of every month since start_date, and one at the
+        start of each of the last daily_days days. Snapshots are taken
+        oldest first, each built from the one before.
+
+        Args:
+            start_date: Earliest month to snapshot.
+            daily_days: Number of recent days with daily snapshots.
+
+        Returns:
+            Number of snapshots taken.
+        """
+        today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        dates = {today - timedelta(days=days) for days in range(daily_days + 1)}
+        month = self._to_ledger_time(start_date).replace(
+            day=1, hour=0, minute=0, second=0, microsecond=0
+        )
+        while month <= today:
+            dates.add(month)
+            month = (month + timedelta(days=32)).replace(day=1)
+        for snapshot_date in sorted(dates):
+            self.take_stock_snapshot(snapshot_date)
+        return len(dates)
+
+    def prune_stock_snapshots(self, daily_days: int = 90) -> int:
+        """
+        Deletes daily snapshots older than daily_days, keeping monthly ones.
+
+        Args:
+            daily_days: Number of recent days whose daily snapshots are kept.
+
+        Returns:
+            Number of snapshot dates pruned.
+        """
+        today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        with self.transaction():
+            return self.transaction_repository.prune_snapshots(
+                today - timedelta(days=daily_days)
+            )
+
+    @staticmethod
+    def _to_ledger_time(value: datetime) -> datetime:
+        """Converts a datetime to the naive local time the ledger is stored in."""
+        return value.astimezone().replace(tzinfo=None) if value.tzinfo else value
+
     def generate_inventory_report(
         self, report_type: str, filters: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
@@ -1440,39 +1730,62 @@ class InventoryService(BaseService[Inventory]):
         else:
             return InventoryStatus.IN_STOCK
 
-    def _check_low_stock(
-        self, inventory: Inventory, reorder_point: Optional[float] = None
-    ) -> None:
-        """Checks if inventory is low stock and emits an event if needed."""
-        if not self.event_bus:
-            return
+    def _update_reorder_flags(self, levels: List[Dict[str, Any]]) -> List[DomainEvent]:
+        """
+        Bring the needs_reorder flag of changed items up to date.
 
-        # Get reorder point if not provided
-        if reorder_point is None:
-            item_details = self._get_item_details(
-                inventory.item_type, inventory.item_id
-            )
-            reorder_point = (
-                item_details.get("reorder_point", 0.0) if item_details else 0.0
-            )
+        An item needs reorder while its quantity is at or below a non-zero
+        reorder point. The flag is flipped by a guarded UPDATE, so each
+        crossing of the reorder point is seen by exactly one transaction.
+
+        Args:
+            levels: Dicts with inventory_id, item_type, item_id, quantity
+                and reorder_point of each changed item
 
-        # Check status directly or compare quantity
-        if reorder_point > 0 and inventory.quantity <= reorder_point:
-            # Check if status *actually changed* to LOW_STOCK or OUT_OF_STOCK to avoid redundant alerts?
-            # Or just alert whenever it's low. Alerting whenever low is simpler.
+        Returns:
+            A LowStock or BackInStock event for each item whose flag this call
+            changed, to enqueue in the same transaction
+        """
+        by_flag: Dict[bool, Dict[int, Dict[str, Any]]] = {True: {}, False: {}}
+        for level in levels:
+            reorder_point = level["reorder_point"] or 0.0
+            needs_reorder = reorder_point > 0 and level["quantity"] <= reorder_point
+            by_flag[needs_reorder][level["inventory_id"]] = level
+
+        transitions = []
+        for needs_reorder, flagged in by_flag.items():
+            event_class = LowStock if needs_reorder else BackInStock
+            for inventory_id in self.repository.set_needs_reorder(sorted(flagged), needs_reorder):
+                level = flagged[inventory_id]
+                transitions.append(
+                    event_class(
+                        inventory_id=inventory_id,
+                        item_id=level["item_id"],
+                        item_type=level["item_type"],
+                        current_quantity=level["quantity"],
+                        reorder_point=level["reorder_point"] or 0.0,
+                    )
+                )
+        return transitions
+
+    def _enqueue_stock_transitions(self, transitions: List[DomainEvent]) -> None:
+        """
+        Adds LowStock and BackInStock events from _update_reorder_flags to the
+        outbox in the caller's transaction.
+
+        The crossing and its event commit together, so a crash after the
+        commit cannot lose the event. Events of the same inventory record are
+        delivered in order.
+        """
+        for event in transitions:
             logger.info(
-                f"Low stock detected for {inventory.item_type} ID {inventory.item_id}. Qty: {inventory.quantity}, Reorder: {reorder_point}"
+                f"{type(event).__name__}: {event.item_type} ID {event.item_id}. "
+                f"Qty: {event.current_quantity}, Reorder: {event.reorder_point}"
             )
-            self.event_bus.publish(
-                LowStockAlert(
-                    inventory_id=inventory.id,
-                    item_id=inventory.item_id,
-                    item_type=inventory.item_type,
-                    current_quantity=inventory.quantity,
-                    reorder_point=reorder_point,
+            if self.event_bus:
+                self.event_bus.enqueue(
+                    self.session, event, ordering_key=f"Inventory:{event.inventory_id}"
                 )
-            )
-        # else: No alert needed
 
         # Add these methods inside the InventoryService class
         # File: services/inventory_service.py (Continued)
@@ -1755,19 +2068,21 @@ class InventoryService(BaseService[Inventory]):
         limit = filters.get("limit", 100)
 
         # --- Fetch Transactions ---
-        # Assuming transaction repo method handles these filters
+        transaction_filters = {
+            "item_id": item_id_filter,
+            "item_type": item_type_filter,
+            "transaction_type": transaction_type_filter,
+            "start_date": start_date,
+            "end_date": end_date,
+            "location": location_filter,
+        }
         paginated_transactions = self.transaction_repository.get_filtered_transactions_paginated(
-            skip=skip,
-            limit=limit,
-            item_id=item_id_filter,
-            item_type=item_type_filter,
-            transaction_type=transaction_type_filter,
-            start_date=start_date,
-            end_date=end_date,
-            location=location_filter,  # Repo needs to implement OR filter on from/to location
+            skip=skip, limit=limit, **transaction_filters
         )
         transactions = paginated_transactions.get("items", [])
         total_count = paginated_transactions.get("total", 0)
+        # Totals cover the whole period, not just this page
+        totals = self.transaction_repository.get_movement_totals(**transaction_filters)
 
         # Initialize report structure
         report = {
@@ -1790,8 +2105,8 @@ class InventoryService(BaseService[Inventory]):
             },
             "summary": {  # Add a summary section
                 "total_transactions": total_count,
-                "total_quantity_in": 0.0,
-                "total_quantity_out": 0.0,
+                "total_quantity_in": totals["quantity_in"],
+                "total_quantity_out": totals["quantity_out"],
                 "net_quantity_change": 0.0,
             },
             "transactions": [],
@@ -1800,13 +2115,7 @@ class InventoryService(BaseService[Inventory]):
         # Process transactions
         for tx in transactions:
             item_details = self._get_item_details(tx.item_type, tx.item_id)
-            quantity_change = tx.quantity_change or 0.0  # Use the correct field name
-
-            # Update summary totals
-            if quantity_change > 0:
-                report["summary"]["total_quantity_in"] += quantity_change
-            else:
-                report["summary"]["total_quantity_out"] += abs(quantity_change)
+            quantity_change = tx.quantity or 0.0
 
             report["transactions"].append(
                 {
@@ -1845,6 +2154,20 @@ class InventoryService(BaseService[Inventory]):
             - report["summary"]["total_quantity_out"]
         )
 
+        # For a single item without other filters, add its stock at both ends
+        # of the period (snapshot plus the ledger since)
+        if (
+            item_type_filter
+            and item_id_filter is not None
+            and not transaction_type_filter
+            and not location_filter
+        ):
+            closing = self.get_stock_as_of(item_type_filter, item_id_filter, end_date)
+            report["summary"]["opening_quantity"] = round(
+                closing - report["summary"]["net_quantity_change"], 4
+            )
+            report["summary"]["closing_quantity"] = round(closing, 4)
+
         # Round summary values
         report["summary"]["total_quantity_in"] = round(
             report["summary"]["total_quantity_in"], 4
@@ -15,8 +15,9 @@ from datetime import datetime
 
 from app.repositories.repository_factory import RepositoryFactory
 from app.repositories.entity_translation_repository import EntityTranslationRepository
+from app.services.translation_catalog import TranslationCatalog, get_fallback_chain
 from app.core.config import settings
-from app.core.exceptions import EntityNotFoundException, ValidationException
+from app.core.exceptions import DatabaseException, EntityNotFoundException, ValidationException
 
 logger = logging.getLogger(__name__)
 
@@ -79,13 +80,20 @@ class LocalizationService:
         # Add additional entities as needed
     }
 
-    def __init__(self, session: Session, repository_factory: Optional[RepositoryFactory] = None):
+    def __init__(
+            self,
+            session: Session,
+            repository_factory: Optional[RepositoryFactory] = None,
+            catalog: Optional[TranslationCatalog] = None
+    ):
         """
         Initialize the LocalizationService.
 
         Args:
             session: SQLAlchemy database session
             repository_factory: Optional repository factory instance
+            catalog: Optional translation catalog (defaults to the process-wide
+                catalog when TRANSLATION_CATALOG_ENABLED is set)
         """
         self.session = session
         self.repo_factory = repository_factory or RepositoryFactory(session)
@@ -96,6 +104,11 @@ class LocalizationService:
             self.repo_factory.create_entity_translation_repository()
         )
 
+        # In-process catalog serving reads; None reads from the database
+        if catalog is None and getattr(settings, 'TRANSLATION_CATALOG_ENABLED', True):
+            catalog = TranslationCatalog.get_instance()
+        self.catalog = catalog
+
         # Cache for main entity repositories
         self._main_repo_cache = {}
         self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
@@ -150,6 +163,9 @@ class LocalizationService:
 
         if entity_type not in self._main_repo_cache:
             config = self.ENTITY_REGISTRY[entity_type]
+            if "main_repo_method" not in config:
+                # Registered by model only (tools); existence is not checked
+                return None
             repo_method = getattr(self.repo_factory, config["main_repo_method"], None)
             if repo_method:
                 self._main_repo_cache[entity_type] = repo_method()
@@ -205,7 +221,7 @@ class LocalizationService:
 
         Fallback order:
         1. Requested locale translation
-        2. Default locale translation (if different from requested)
+        2. Translations along the locale's fallback chain (e.g. de-AT -> de -> en)
         3. Original entity field value
 
         Args:
@@ -232,18 +248,23 @@ class LocalizationService:
                 f"Supported fields: {translatable_fields}"
             )
 
-        # Try requested locale
-        translation_obj = self.translation_repo.find_translation(entity_type, entity_id, locale, field_name)
-        if translation_obj:
-            return translation_obj.translated_value
+        locales = get_fallback_chain(locale, self.default_locale)
+        if not use_fallback:
+            locales = locales[:1]
 
-        # Fallback to default locale if different
-        if use_fallback and locale != self.default_locale:
-            fallback_translation = self.translation_repo.find_translation(
-                entity_type, entity_id, self.default_locale, field_name
+        if self.catalog is not None:
+            translated_value = self.catalog.lookup(
+                self.translation_repo, entity_type, entity_id, field_name, locales
             )
-            if fallback_translation:
-                return fallback_translation.translated_value
+            if translated_value is not None:
+                return translated_value
+        else:
+            for candidate_locale in locales:
+                translation_obj = self.translation_repo.find_translation(
+                    entity_type, entity_id, candidate_locale, field_name
+                )
+                if translation_obj:
+                    return translation_obj.translated_value
 
         # Final fallback to original field value
         if use_fallback:
@@ -356,6 +377,7 @@ class LocalizationService:
             translation_obj = self.translation_repo.upsert_translation(
                 entity_type, entity_id, locale, field_name, translated_value, user_id
             )
+            self._invalidate_catalog(entity_type)
             self.logger.info(
                 f"Translation upserted: {entity_type}#{entity_id}.{field_name} "
                 f"[{locale}] by user {user_id}"
@@ -392,6 +414,8 @@ class LocalizationService:
         try:
             result = self.translation_repo.delete(translation_id)
             if result:
+                self.translation_repo.bump_catalog_version(translation.entity_type)
+                self._invalidate_catalog(translation.entity_type)
                 self.logger.info(f"Translation deleted: ID {translation_id} by user {user_id}")
             return result
         except Exception as e:
@@ -423,26 +447,7 @@ class LocalizationService:
         if not entity or not hasattr(entity, 'id'):
             return entity
 
-        if entity_type not in self.ENTITY_REGISTRY:
-            self.logger.warning(f"Cannot hydrate unsupported entity type: {entity_type}")
-            return entity
-
-        # Use provided fields or default translatable fields
-        if fields_to_translate is None:
-            fields_to_translate = self.get_translatable_fields(entity_type)
-
-        for field_name in fields_to_translate:
-            if hasattr(entity, field_name):
-                try:
-                    translated_value = self.get_translation(
-                        entity_type, entity.id, field_name, locale, use_fallback=True
-                    )
-                    if translated_value is not None:
-                        setattr(entity, field_name, translated_value)
-                except Exception as e:
-                    self.logger.warning(f"Failed to translate {entity_type}.{field_name}: {e}")
-                    # Continue with original value
-
+        self.bulk_hydrate_entities([entity], entity_type, locale, fields_to_translate)
         return entity
 
     def bulk_hydrate_entities(
@@ -455,6 +460,12 @@ class LocalizationService:
         """
         Efficiently hydrate multiple entities with translations.
 
+        Translations come from the in-process catalog, so a warm catalog
+        answers without any queries. Without a catalog, the translations along
+        the locale's fallback chain are loaded for all entities in one query.
+        Either way the fallback order of get_translation is applied in memory
+        and fields without any translation keep their original value.
+
         Args:
             entities: List of entity objects to hydrate
             entity_type: Type of entities
@@ -467,11 +478,69 @@ class LocalizationService:
         if not entities:
             return entities
 
+        if entity_type not in self.ENTITY_REGISTRY:
+            self.logger.warning(f"Cannot hydrate unsupported entity type: {entity_type}")
+            return entities
+
+        # Use provided fields or default translatable fields
+        if fields_to_translate is None:
+            fields_to_translate = self.get_translatable_fields(entity_type)
+
+        entity_ids = list({
+            entity.id for entity in entities
+            if entity is not None and getattr(entity, 'id', None) is not None
+        })
+        if not entity_ids or not fields_to_translate:
+            return entities
+
+        locales = get_fallback_chain(locale, self.default_locale)
+
+        # One {(entity_id, field_name): value} mapping per locale, in fallback order
+        try:
+            if self.catalog is not None:
+                values_by_locale = [
+                    self.catalog.get_locale_values(self.translation_repo, entity_type, candidate_locale)
+                    for candidate_locale in locales
+                ]
+            else:
+                values_by_locale = [{} for _ in locales]
+                for t in self.translation_repo.find_translations_for_entities(
+                        entity_type, entity_ids, locales, fields_to_translate
+                ):
+                    values_by_locale[locales.index(t.locale)][(t.entity_id, t.field_name)] = (
+                        t.translated_value
+                    )
+        except DatabaseException as e:
+            self.logger.warning(f"Failed to load translations for {entity_type}: {e}")
+            # Continue with original values
+            return entities
+
         for entity in entities:
-            self.hydrate_entity_with_translations(entity, entity_type, locale, fields_to_translate)
+            if entity is None or getattr(entity, 'id', None) is None:
+                continue
+            for field_name in fields_to_translate:
+                if not hasattr(entity, field_name):
+                    continue
+                for values in values_by_locale:
+                    translated_value = values.get((entity.id, field_name))
+                    if translated_value is not None:
+                        setattr(entity, field_name, translated_value)
+                        break
 
         return entities
 
+    def _invalidate_catalog(self, entity_type: str) -> None:
+        """
+        Make a local translation write visible to this process immediately.
+
+        Other workers pick the change up from the bumped catalog version.
+
+        Args:
+            entity_type: Type of entity whose translations changed
+        """
+        if self.catalog is not None:
+            self.catalog.invalidate(entity_type.strip().lower())
+
     # Utility and administrative methods
     def get_translation_statistics(self) -> Dict[str, Any]:
         """
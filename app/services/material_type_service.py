@@ -167,6 +167,7 @@ class MaterialTypeService(BaseService[MaterialType]):
             # Invalidate cache if needed
             if self.cache_service:
                 self.cache_service.invalidate(f"material_types:{id}")
+                self._invalidate_entity_cache(id)
                 self.cache_service.invalidate_pattern("material_types:*")
 
             return updated_type
@@ -201,6 +202,7 @@ class MaterialTypeService(BaseService[MaterialType]):
             # Invalidate cache if needed
             if self.cache_service and result:
                 self.cache_service.invalidate(f"material_types:{id}")
+                self._invalidate_entity_cache(id)
                 self.cache_service.invalidate_pattern("material_types:*")
 
             return result
@@ -261,6 +263,7 @@ class MaterialTypeService(BaseService[MaterialType]):
                 if existing:
                     # Update existing material type
                     updated = self.repository.update_with_properties(existing.id, create_data)
+                    self._invalidate_entity_cache(existing.id)
                     if updated:
                         imported_types.append(updated)
                 else:
@@ -10,6 +10,7 @@ from typing import Dict, List, Optional, Any, BinaryIO, Tuple, Union
 from datetime import datetime
 import uuid
 import os
+import hashlib
 import mimetypes
 from sqlalchemy.orm import Session
 import logging
@@ -24,6 +25,11 @@ from app.repositories.media_asset_repository import MediaAssetRepository
 from app.repositories.tag_repository import TagRepository
 from app.repositories.media_asset_tag_repository import MediaAssetTagRepository
 from app.services.file_storage_service import FileStorageService
+from app.services.image_derivative_service import (
+    ImageDerivativeService,
+    is_renderable_image,
+)
+from app.services.media_path_index import MediaPathIndex, canonical_storage_path
 from app.db.models.media_asset import MediaAsset
 
 logger = logging.getLogger(__name__)
@@ -41,6 +47,8 @@ class MediaAssetService(BaseService[MediaAsset]):
         self,
         session: Session,
         file_storage_service: Optional[FileStorageService] = None,
+        derivative_service: Optional[ImageDerivativeService] = None,
+        path_index: Optional[MediaPathIndex] = None,
     ):
         """
         Initialize the service with dependencies.
@@ -48,11 +56,15 @@ class MediaAssetService(BaseService[MediaAsset]):
         Args:
             session: Database session for persistence operations
             file_storage_service: Service for file storage operations
+            derivative_service: Service rendering resized image derivatives
+            path_index: Cache of resolved asset file paths
         """
         super().__init__(session, MediaAssetRepository)
         self.tag_repository = TagRepository(session)
         self.asset_tag_repository = MediaAssetTagRepository(session)
         self.file_storage_service = file_storage_service
+        self.derivative_service = derivative_service or ImageDerivativeService.get_instance()
+        self.path_index = path_index or MediaPathIndex.get_instance()
 
     def get_media_asset(self, asset_id: str) -> Optional[MediaAsset]:
         """
@@ -66,39 +78,48 @@ class MediaAssetService(BaseService[MediaAsset]):
         """
         return self.repository.get_by_id_with_tags(asset_id)
 
-    def find_file_path(self, asset_id: str) -> Optional[str]:
-        """Finds the actual file path on the server for an asset."""
-        asset = self.repository.get_by_id(asset_id)
+    def find_file_path(
+        self, asset_id: str, asset: Optional[MediaAsset] = None
+    ) -> Optional[str]:
+        """
+        Get the absolute path of an asset's file.
+
+        Resolved paths are served from the path index as long as they were
+        resolved for the asset's current checksum; a miss costs one stat.
+        Loads the asset unless the caller passes the one it already loaded.
+        Missing files are reported by check_file_consistency rather than
+        searched for here.
+
+        Args:
+            asset_id: The UUID of the media asset
+            asset: The asset, if the caller has already loaded it
+
+        Returns:
+            Absolute file path, or None if the file does not exist
+
+        Raises:
+            EntityNotFoundException: If the asset or its storage location is not found
+        """
+        if asset is None:
+            asset = self.repository.get_by_id(asset_id)
         if not asset or not asset.storage_location:
             raise EntityNotFoundException(
                 f"Media asset {asset_id} or its storage location not found."
             )
 
-        # Try the stored path directly
-        if os.path.exists(asset.storage_location):
-            return asset.storage_location
-
-        # Try relative paths common in the project structure
-        base_dir = "media_assets"
-        candidates = [
-            os.path.join(base_dir, f"{asset_id}_{asset.file_name}"),
-            os.path.join(base_dir, asset.file_name),
-            os.path.join(os.getcwd(), "media_assets", f"{asset_id}_{asset.file_name}"),
-            os.path.join(os.getcwd(), asset.storage_location),
-            # Add more potential paths if necessary
-        ]
-
-        for path in candidates:
-            if os.path.exists(path):
-                logger.info(f"Found asset {asset_id} file at alternative path: {path}")
-                # Optionally update storage_location if found elsewhere? Be careful with this.
-                # self.repository.update(asset_id, {"storage_location": path})
-                return path
-
-        logger.error(
-            f"Could not find file for asset {asset_id} at any expected location based on storage: {asset.storage_location}"
-        )
-        return None  # Or raise FileNotFoundError
+        # Keyed on the checksum, so a file another worker replaced is not
+        # served from this process's entry for the old one
+        path = self.path_index.get(asset_id, asset.checksum)
+        if path:
+            return path
+
+        path = canonical_storage_path(asset.storage_location)
+        if not os.path.isfile(path):
+            logger.error(f"File for asset {asset_id} not found at {path}")
+            return None
+
+        self.path_index.put(asset_id, path, asset.checksum)
+        return path
 
     def list_media_assets(
         self,
@@ -218,7 +239,7 @@ class MediaAssetService(BaseService[MediaAsset]):
 
             # Generate storage path
             filename = asset.file_name
-            storage_path = f"{storage_dir}/{asset_id}_{filename}"
+            storage_path = canonical_storage_path(f"{storage_dir}/{asset_id}_{filename}")
 
             # Write the file
             with open(storage_path, "wb") as f:
@@ -230,6 +251,7 @@ class MediaAssetService(BaseService[MediaAsset]):
             update_data = {
                 "storage_location": storage_path,
                 "file_size_bytes": file_size,
+                "checksum": hashlib.sha256(content_bytes).hexdigest(),
             }
 
             # Update content type if provided
@@ -237,7 +259,10 @@ class MediaAssetService(BaseService[MediaAsset]):
                 update_data["content_type"] = update_content_type
 
             # Update the asset
-            return self.repository.update(asset_id, update_data)
+            asset = self.repository.update(asset_id, update_data)
+            self.path_index.invalidate(asset_id)
+            self._queue_derivatives(asset, replaced=True)
+            return asset
 
         # Regular path with file_storage_service
         try:
@@ -251,6 +276,7 @@ class MediaAssetService(BaseService[MediaAsset]):
                 )
                 storage_location = uploaded_file.storage_location
                 file_size = uploaded_file.size
+                checksum = getattr(uploaded_file, "checksum", None)
             elif hasattr(self.file_storage_service, "store_file"):
                 # Alternative implementation
                 file_data = file_content.read()
@@ -260,7 +286,13 @@ class MediaAssetService(BaseService[MediaAsset]):
                     content_type=asset.content_type,
                 )
                 storage_location = result.get("storage_path", storage_path)
+                base_path = getattr(self.file_storage_service, "base_path", None)
+                if base_path is not None:
+                    storage_location = os.path.join(base_path, storage_location)
                 file_size = result.get("size", len(file_data))
+                checksum = result.get("checksum") or hashlib.sha256(
+                    file_data
+                ).hexdigest()
             else:
                 raise BusinessRuleException(
                     "Incompatible FileStorageService implementation"
@@ -268,8 +300,9 @@ class MediaAssetService(BaseService[MediaAsset]):
 
             # Update the asset with storage information
             update_data = {
-                "storage_location": storage_location,
+                "storage_location": canonical_storage_path(storage_location),
                 "file_size_bytes": file_size,
+                "checksum": checksum,
             }
 
             # Update content type if provided
@@ -277,7 +310,10 @@ class MediaAssetService(BaseService[MediaAsset]):
                 update_data["content_type"] = update_content_type
 
             # Update the asset
-            return self.repository.update(asset_id, update_data)
+            asset = self.repository.update(asset_id, update_data)
+            self.path_index.invalidate(asset_id)
+            self._queue_derivatives(asset, replaced=True)
+            return asset
 
         except Exception as e:
             logger.error(f"Failed to upload file for asset {asset_id}: {str(e)}")
@@ -305,7 +341,7 @@ class MediaAssetService(BaseService[MediaAsset]):
         os.makedirs(storage_dir, exist_ok=True)
 
         # Define file path with asset ID to ensure uniqueness
-        file_path = f"{storage_dir}/{asset_id}_{file_name}"
+        file_path = canonical_storage_path(f"{storage_dir}/{asset_id}_{file_name}")
 
         # Save file to disk
         content_bytes = file_content.read()
@@ -322,8 +358,9 @@ class MediaAssetService(BaseService[MediaAsset]):
             "file_name": file_name,
             "file_type": file_type,
             "content_type": content_type,
-            "storage_location": file_path,  # Store the exact path
+            "storage_location": file_path,  # Store the canonical absolute path
             "file_size_bytes": file_size,
+            "checksum": hashlib.sha256(content_bytes).hexdigest(),
             "uploaded_by": uploaded_by,
         }
 
@@ -343,7 +380,8 @@ class MediaAssetService(BaseService[MediaAsset]):
                             }
                         )
 
-            return self.repository.get_by_id_with_tags(asset.id)
+        self._queue_derivatives(asset)
+        return self.repository.get_by_id_with_tags(asset.id)
 
     def update_media_asset(
         self,
@@ -380,6 +418,7 @@ class MediaAssetService(BaseService[MediaAsset]):
             # Update the asset fields
             if update_data:
                 asset = self.repository.update(asset_id, update_data)
+                self.path_index.invalidate(asset_id)
 
             # Update tags if provided
             if "tag_ids" in data and data["tag_ids"] is not None:
@@ -409,6 +448,9 @@ class MediaAssetService(BaseService[MediaAsset]):
                 logger.error(f"Failed to delete file for asset {asset_id}: {str(e)}")
                 # Continue with database deletion even if file deletion fails
 
+        self.derivative_service.remove_derivatives(asset_id)
+        self.path_index.invalidate(asset_id)
+
         # Delete all tag associations and the asset itself in a transaction
         with self.transaction():
             # Delete tag associations
@@ -420,6 +462,17 @@ class MediaAssetService(BaseService[MediaAsset]):
     def get_file_content(self, asset_id: str) -> BinaryIO:
         """
         Get the file content for a media asset.
+
+        Args:
+            asset_id: The UUID of the media asset
+
+        Returns:
+            Open binary file handle
+
+        Raises:
+            EntityNotFoundException: If the asset is not found
+            BusinessRuleException: If the asset has no file
+            FileStorageException: If the file is missing or cannot be read
         """
         asset = self.repository.get_by_id(asset_id)
         if not asset:
@@ -428,45 +481,160 @@ class MediaAssetService(BaseService[MediaAsset]):
         if not asset.storage_location:
             raise BusinessRuleException(f"No file content for asset {asset_id}")
 
-        # Direct file access fallback if file_storage_service is not available
-        if self.file_storage_service is None:
-            logger.warning(
-                f"FileStorageService not configured, using direct file access for {asset_id}"
-            )
-            try:
-                # Check if the path exists directly
-                if os.path.exists(asset.storage_location):
-                    return open(asset.storage_location, "rb")
+        path = self.find_file_path(asset_id, asset)
+        if not path:
+            raise FileStorageException(f"File not found at {asset.storage_location}")
 
-                # Check relative path from working directory
-                base_dir = "media_assets"
-                if os.path.exists(f"{base_dir}/{asset.storage_location}"):
-                    return open(f"{base_dir}/{asset.storage_location}", "rb")
+        try:
+            return open(path, "rb")
+        except OSError as e:
+            logger.error(f"Failed to read file for asset {asset_id}: {str(e)}")
+            raise FileStorageException(f"Failed to read file: {str(e)}")
 
-                # Check if it might be just a filename
-                if os.path.exists(f"{base_dir}/{asset_id}_{asset.file_name}"):
-                    return open(f"{base_dir}/{asset_id}_{asset.file_name}", "rb")
+    def get_image_derivative(self, asset_id: str, size: str) -> str:
+        """
+        Get the path of a resized WebP rendition, rendering it if missing.
 
-                raise FileStorageException(
-                    f"File not found at {asset.storage_location}"
-                )
-            except Exception as e:
-                logger.error(f"Failed to read file for asset {asset_id}: {str(e)}")
-                raise FileStorageException(f"Failed to read file: {str(e)}")
+        Args:
+            asset_id: The UUID of the media asset
+            size: Derivative size name (e.g. 'thumb', 'medium')
+
+        Returns:
+            Path to the cached derivative
 
+        Raises:
+            EntityNotFoundException: If the asset or its file is not found
+            BusinessRuleException: If the asset is not a raster image
+        """
+        asset = self.repository.get_by_id(asset_id)
+        if not asset:
+            raise EntityNotFoundException(f"Media asset with ID {asset_id} not found")
+        if not is_renderable_image(asset.content_type):
+            raise BusinessRuleException(f"Media asset {asset_id} is not an image")
+
+        source_path = self.find_file_path(asset_id, asset)
+        if not source_path:
+            raise EntityNotFoundException(f"File for media asset {asset_id} not found")
+
+        return str(
+            self.derivative_service.ensure_derivative(asset_id, source_path, size)
+        )
+
+    def scrub_integrity(self, batch_size: int = 200) -> Dict[str, Any]:
+        """
+        Verify stored media files against their checksums.
+
+        Runs as a periodic background job so that previews and downloads never
+        re-hash content. Assets uploaded before checksums were recorded get
+        their checksum backfilled from the file on disk.
+
+        Args:
+            batch_size: Number of assets loaded per query
+
+        Returns:
+            Dictionary with counts of checked, backfilled and missing assets
+            and the IDs of assets whose content no longer matches
+        """
+        report = {"checked": 0, "backfilled": 0, "missing": 0, "corrupted": []}
+
+        offset = 0
+        while True:
+            assets = self.repository.list(skip=offset, limit=batch_size)
+            if not assets:
+                break
+            offset += len(assets)
+
+            for asset in assets:
+                if not asset.storage_location:
+                    continue
+                path = self.find_file_path(asset.id, asset)
+                if not path:
+                    report["missing"] += 1
+                    continue
+
+                digest = hashlib.sha256()
+                with open(path, "rb") as f:
+                    for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                        digest.update(chunk)
+                current = digest.hexdigest()
+                report["checked"] += 1
+
+                if not asset.checksum:
+                    asset.checksum = current
+                    report["backfilled"] += 1
+                elif asset.checksum != current:
+                    logger.error(
+                        f"Integrity check failed for media asset {asset.id} at {path}"
+                    )
+                    report["corrupted"].append(asset.id)
+
+            self.session.commit()
+
+        return report
+
+    def check_file_consistency(self, batch_size: int = 500) -> Dict[str, Any]:
+        """
+        Check that every media asset's file exists at its canonical path.
+
+        Runs periodically in the background; only stats files, so it is far
+        cheaper than scrub_integrity. Missing files are evicted from the
+        path index and reported.
+
+        Args:
+            batch_size: Number of assets loaded per query
+
+        Returns:
+            Dictionary with the number of assets checked, the number whose
+            storage location is not canonical yet, and the IDs of assets
+            whose file is missing
+        """
+        report = {"checked": 0, "non_canonical": 0, "missing": []}
+
+        offset = 0
+        while True:
+            assets = self.repository.list(skip=offset, limit=batch_size)
+            if not assets:
+                break
+            offset += len(assets)
+
+            for asset in assets:
+                if not asset.storage_location:
+                    continue
+                report["checked"] += 1
+                path = canonical_storage_path(asset.storage_location)
+                if path != asset.storage_location:
+                    report["non_canonical"] += 1
+                if not os.path.isfile(path):
+                    self.path_index.invalidate(asset.id)
+                    report["missing"].append(asset.id)
+
+        if report["missing"]:
+            logger.warning(
+                f"{len(report['missing'])} media asset files are missing: "
+                f"{', '.join(report['missing'][:20])}"
+            )
+        return report
+
+    def _queue_derivatives(self, asset: Optional[MediaAsset], replaced: bool = False) -> None:
+        """
+        Queue background rendering of an image asset's derivatives.
+
+        Args:
+            asset: The media asset whose file was just written
+            replaced: Whether the file replaced earlier content, making cached
+                derivatives stale
+        """
+        if not asset or not is_renderable_image(asset.content_type):
+            return
         try:
-            # Try different methods depending on file_storage_service implementation
-            if hasattr(self.file_storage_service, "get_file"):
-                return self.file_storage_service.get_file(asset.storage_location)
-            elif hasattr(self.file_storage_service, "retrieve_file"):
-                return self.file_storage_service.retrieve_file(asset.storage_location)
-            else:
-                raise BusinessRuleException(
-                    "Incompatible FileStorageService implementation"
-                )
+            if replaced:
+                self.derivative_service.remove_derivatives(asset.id)
+            source_path = self.find_file_path(asset.id, asset)
+            if source_path:
+                self.derivative_service.enqueue(asset.id, source_path)
         except Exception as e:
-            logger.error(f"Failed to retrieve file for asset {asset_id}: {str(e)}")
-            raise FileStorageException(f"Failed to retrieve file: {str(e)}")
+            # Derivatives are rendered on demand if queueing fails
+            logger.warning(f"Could not queue derivatives for asset {asset.id}: {str(e)}")
 
     def add_tags_to_asset(self, asset_id: str, tag_ids: List[str]) -> MediaAsset:
         """
@@ -0,0 +1,180 @@
+# File: app/services/media_path_index.py
+"""
+Resolved file-path index for media assets.
+
+Keeps an in-memory LRU of media asset ID to absolute file path so that
+previews and downloads do not probe the filesystem on every request. Each
+entry records the checksum of the file it was resolved for and is only
+served for that checksum, so a file replaced by another worker (whose
+invalidation this process never sees) is resolved again. Entries are also
+invalidated whenever this process changes an asset's file or deletes the
+asset; files that disappear behind the index's back are reported by the
+periodic consistency check rather than on the request path.
+"""
+
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional, Tuple
+import os
+import threading
+
+# Directory legacy media assets were written to, relative to the working directory
+LEGACY_MEDIA_DIR = "media_assets"
+
+
+class MediaPathIndex:
+    """
+    Thread-safe LRU mapping media asset IDs to absolute file paths.
+    """
+
+    _instance: Optional["MediaPathIndex"] = None
+    _instance_lock = threading.Lock()
+
+    @classmethod
+    def get_instance(cls) -> "MediaPathIndex":
+        """
+        Get the process-wide index.
+
+        Returns:
+            Shared MediaPathIndex instance
+        """
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
+
+    def __init__(self, max_size: int = 10000):
+        """
+        Initialize the index.
+
+        Args:
+            max_size: Maximum number of paths kept before the least recently
+                used entry is evicted
+        """
+        self.max_size = max_size
+        # Asset ID to (path, checksum of the file the path was resolved for)
+        self._paths: "OrderedDict[str, Tuple[str, Optional[str]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0, "invalidations": 0}
+
+    def get(self, asset_id: str, checksum: Optional[str]) -> Optional[str]:
+        """
+        Look up the path of an asset's current file.
+
+        Args:
+            asset_id: The UUID of the media asset
+            checksum: The asset's current checksum
+
+        Returns:
+            Absolute file path, or None if the asset is not indexed or was
+            indexed for another checksum
+        """
+        with self._lock:
+            entry = self._paths.get(asset_id)
+            if entry is None or entry[1] != checksum:
+                if entry is not None:
+                    del self._paths[asset_id]
+                    self.stats["invalidations"] += 1
+                self.stats["misses"] += 1
+                return None
+            self._paths.move_to_end(asset_id)
+            self.stats["hits"] += 1
+            return entry[0]
+
+    def put(self, asset_id: str, path: str, checksum: Optional[str]) -> None:
+        """
+        Record the resolved path of an asset.
+
+        Args:
+            asset_id: The UUID of the media asset
+            path: Absolute file path
+            checksum: Checksum of the file the path was resolved for
+        """
+        with self._lock:
+            self._paths[asset_id] = (path, checksum)
+            self._paths.move_to_end(asset_id)
+            while len(self._paths) > self.max_size:
+                self._paths.popitem(last=False)
+                self.stats["evictions"] += 1
+
+    def invalidate(self, asset_id: str) -> None:
+        """
+        Drop an asset from the index.
+
+        Args:
+            asset_id: The UUID of the media asset
+        """
+        with self._lock:
+            if self._paths.pop(asset_id, None) is not None:
+                self.stats["invalidations"] += 1
+
+    def invalidate_many(self, asset_ids: Iterable[str]) -> None:
+        """
+        Drop several assets from the index.
+
+        Args:
+            asset_ids: UUIDs of the media assets
+        """
+        for asset_id in asset_ids:
+            self.invalidate(asset_id)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._paths.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get index statistics.
+
+        Returns:
+            Dictionary with size, hits, misses, evictions and invalidations
+        """
+        with self._lock:
+            return {"size": len(self._paths), "max_size": self.max_size, **self.stats}
+
+
+def canonical_storage_path(storage_location: str) -> str:
+    """
+    Get the canonical (absolute, normalized) form of a storage location.
+
+    Relative locations are resolved against the working directory, which is
+    where legacy uploads were written.
+
+    Args:
+        storage_location: Stored file location
+
+    Returns:
+        Absolute file path
+    """
+    return os.path.abspath(storage_location)
+
+
+def locate_legacy_file(
+    asset_id: str, file_name: Optional[str], storage_location: Optional[str]
+) -> Optional[str]:
+    """
+    Find the file of an asset whose storage location predates canonical paths.
+
+    Probes the locations earlier releases wrote files to. This is only meant
+    for one-off canonicalization, never for request handling.
+
+    Args:
+        asset_id: The UUID of the media asset
+        file_name: The asset's file name
+        storage_location: The stored (possibly relative) location
+
+    Returns:
+        Absolute path of the first existing candidate, or None
+    """
+    candidates = []
+    if storage_location:
+        candidates.append(storage_location)
+        candidates.append(os.path.join(LEGACY_MEDIA_DIR, storage_location))
+    if file_name:
+        candidates.append(os.path.join(LEGACY_MEDIA_DIR, f"{asset_id}_{file_name}"))
+        candidates.append(os.path.join(LEGACY_MEDIA_DIR, file_name))
+
+    for candidate in candidates:
+        if os.path.isfile(candidate):
+            return canonical_storage_path(candidate)
+    return None
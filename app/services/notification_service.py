@@ -28,6 +28,7 @@ the data access layer through repository interfaces, and integrates with other
 services like communications service and user preference service.
 """
 
+from dataclasses import dataclass
 from typing import List, Optional, Dict, Any, Union
 from datetime import datetime, timedelta
 import logging
@@ -48,30 +49,25 @@ from app.services.base_service import BaseService
 logger = logging.getLogger(__name__)
 
 
+@dataclass(eq=False)
 class NotificationCreated(DomainEvent):
-    """Event emitted when a notification is created."""
+    """
+    Event emitted when a notification is created.
 
-    def __init__(
-        self,
-        notification_id: str,
-        notification_type: str,
-        user_id: Optional[str] = None,
-        priority: str = "NORMAL",
-    ):
-        """
-        Initialize notification created event.
+    A dataclass, like the core events, so to_dict() carries its fields to
+    event stream clients and the outbox.
 
-        Args:
-            notification_id: ID of the created notification
-            notification_type: Type of notification
-            user_id: Optional ID of the target user
-            priority: Priority level of the notification
-        """
-        super().__init__()
-        self.notification_id = notification_id
-        self.notification_type = notification_type
-        self.user_id = user_id
-        self.priority = priority
+    Attributes:
+        notification_id: ID of the created notification
+        notification_type: Type of notification
+        user_id: Optional ID of the target user
+        priority: Priority level of the notification
+    """
+
+    notification_id: str = ""
+    notification_type: str = ""
+    user_id: Optional[str] = None
+    priority: str = "NORMAL"
 
 
 class NotificationSent(DomainEvent):
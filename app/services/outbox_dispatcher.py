@@ -0,0 +1,400 @@
+# File: app/services/outbox_dispatcher.py
+"""
+Delivery of outbox events to event bus handlers.
+
+Events enqueued with EventBus.enqueue are committed together with the change
+that raised them. The dispatcher polls the outbox, claims due events in
+batches and runs their handlers on a small worker pool. Delivery is at least
+once: a handler that raises is retried with exponential backoff, handlers
+that already succeeded are not run again, and an event whose claim expires
+(e.g. because its process died) is picked up again. Events sharing an
+ordering key are delivered one after another in the order they were
+enqueued; a failing event holds back the later events of its key until it
+is delivered or given up on.
+"""
+
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Any, Callable, List, Optional, Set
+import asyncio
+import inspect
+import itertools
+import json
+import logging
+import random
+import threading
+import uuid
+
+from sqlalchemy import and_, exists, func, or_, select, update
+from sqlalchemy.orm import Session, aliased
+
+from app.core.events import EventBus, get_event_class
+from app.core.metrics import counter, gauge, histogram
+from app.db.models.event_outbox import OutboxEvent
+
+logger = logging.getLogger(__name__)
+
+# Outbox metrics
+outbox_delivered = counter("events.outbox.delivered", "Outbox events delivered to all handlers")
+outbox_retried = counter("events.outbox.retried", "Outbox event deliveries scheduled for retry")
+outbox_dead = counter("events.outbox.dead", "Outbox events given up after max attempts")
+outbox_pending = gauge("events.outbox.pending", "Outbox events waiting for delivery")
+outbox_lag = histogram(
+    "events.outbox.lag_seconds",
+    "Seconds from enqueueing an event to delivering it to all handlers",
+    buckets=[0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 300],
+)
+handler_lag = {}  # Per-handler lag histograms
+
+
+def handler_name(handler: Callable) -> str:
+    """Get the stable name a handler is recorded under in delivered_handlers."""
+    module = getattr(handler, "__module__", None) or ""
+    name = getattr(handler, "__qualname__", None) or repr(handler)
+    return f"{module}.{name}" if module else name
+
+
+def _observe_handler_lag(name: str, seconds: float) -> None:
+    """Record how long after enqueueing a handler saw an event."""
+    if name not in handler_lag:
+        handler_lag[name] = histogram(
+            "events.handler.lag_seconds",
+            "Seconds from enqueueing an event to a handler processing it",
+            tags={"handler": name},
+        )
+    handler_lag[name].observe(seconds)
+
+
+class OutboxDispatcher:
+    """
+    Drains the event outbox into event bus handlers.
+    """
+
+    def __init__(
+            self,
+            session_factory: Callable[[], Session],
+            event_bus: EventBus,
+            batch_size: int = 100,
+            workers: int = 4,
+            max_attempts: int = 10,
+            base_backoff: float = 1.0,
+            max_backoff: float = 300.0,
+            poll_interval: float = 1.0,
+            lease_seconds: float = 60.0,
+    ):
+        """
+        Initialize the dispatcher.
+
+        Args:
+            session_factory: Callable returning a new database session
+            event_bus: Event bus whose handlers receive the events
+            batch_size: Maximum number of events claimed per poll
+            workers: Threads delivering events in parallel
+            max_attempts: Failed deliveries after which an event is marked dead
+            base_backoff: Seconds before the first retry; doubles per attempt
+            max_backoff: Upper bound of the retry delay in seconds
+            poll_interval: Seconds to wait when the outbox has no due events
+            lease_seconds: Seconds a claim lasts before another dispatcher
+                may take the event over
+        """
+        self.session_factory = session_factory
+        self.event_bus = event_bus
+        self.batch_size = batch_size
+        self.workers = workers
+        self.max_attempts = max_attempts
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self.poll_interval = poll_interval
+        self.lease_seconds = lease_seconds
+        self.worker_id = uuid.uuid4().hex
+        self._claims = itertools.count(1)
+
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._poller: Optional[threading.Thread] = None
+        self._stopping = threading.Event()
+
+    # --- Lifecycle ---
+
+    def start(self) -> None:
+        """Start polling the outbox in a background thread."""
+        if self._poller is not None:
+            return
+        self._stopping.clear()
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.workers, thread_name_prefix="outbox-dispatch"
+        )
+        self._poller = threading.Thread(
+            target=self._poll_loop, name="outbox-poller", daemon=True
+        )
+        self._poller.start()
+        logger.info(f"Started outbox dispatcher with {self.workers} workers")
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """
+        Stop polling and wait for in-flight deliveries.
+
+        Events claimed but not yet delivered are released when their lease
+        expires.
+
+        Args:
+            timeout: Seconds to wait for the poller to finish its batch
+        """
+        self._stopping.set()
+        if self._poller is not None:
+            self._poller.join(timeout=timeout)
+            self._poller = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def _poll_loop(self) -> None:
+        """Claim and deliver batches until stopped."""
+        while not self._stopping.is_set():
+            try:
+                delivered = self.dispatch_once()
+                self._update_pending_gauge()
+            except Exception as e:
+                logger.error(f"Outbox dispatch failed: {e}", exc_info=True)
+                delivered = 0
+            if delivered < self.batch_size:
+                self._stopping.wait(self.poll_interval)
+
+    def _update_pending_gauge(self) -> None:
+        """Refresh the pending-events gauge."""
+        session = self.session_factory()
+        try:
+            outbox_pending.set(
+                session.query(func.count(OutboxEvent.id))
+                .filter(OutboxEvent.status == "pending")
+                .scalar() or 0
+            )
+        finally:
+            session.close()
+
+    # --- Dispatching ---
+
+    def dispatch_once(self) -> int:
+        """
+        Claim one batch of due events and deliver it.
+
+        Returns:
+            Number of events claimed
+        """
+        claimed = self._claim_batch()
+        if not claimed:
+            return 0
+
+        # Keyed events form one sequential group per key; the rest are independent
+        groups: "OrderedDict[Any, List[int]]" = OrderedDict()
+        for event_id, ordering_key in claimed:
+            group_key = ordering_key if ordering_key is not None else ("", event_id)
+            groups.setdefault(group_key, []).append(event_id)
+
+        if self._executor is None or len(groups) == 1:
+            for event_ids in groups.values():
+                self._deliver_group(event_ids)
+        else:
+            futures = [
+                self._executor.submit(self._deliver_group, event_ids)
+                for event_ids in groups.values()
+            ]
+            for future in futures:
+                future.result()
+        return len(claimed)
+
+    def _claim_batch(self) -> List[tuple]:
+        """
+        Lock the next batch of due events to this dispatcher.
+
+        An event is due when it is pending, its retry time has come and no
+        other dispatcher holds an unexpired claim on it. A keyed event is only
+        claimed when every earlier pending event of its key is claimable too,
+        so a batch always holds the oldest events of each key. Claiming is a
+        single UPDATE, so concurrent dispatchers never claim the same events.
+
+        Returns:
+            (id, ordering_key) of the claimed events, in enqueue order
+        """
+        now = datetime.now()
+        claim = f"{self.worker_id}:{next(self._claims)}"
+        earlier = aliased(OutboxEvent)
+
+        claimable = and_(
+            OutboxEvent.status == "pending",
+            OutboxEvent.next_attempt_at <= now,
+            or_(OutboxEvent.locked_until.is_(None), OutboxEvent.locked_until < now),
+        )
+        blocked = exists().where(
+            earlier.ordering_key == OutboxEvent.ordering_key,
+            earlier.status == "pending",
+            earlier.id < OutboxEvent.id,
+            or_(
+                earlier.next_attempt_at > now,
+                and_(earlier.locked_until.isnot(None), earlier.locked_until >= now),
+            ),
+        )
+        batch = (
+            select(OutboxEvent.id)
+            .where(claimable, ~blocked)
+            .order_by(OutboxEvent.id)
+            .limit(self.batch_size)
+            .scalar_subquery()
+        )
+
+        session = self.session_factory()
+        try:
+            session.execute(
+                update(OutboxEvent)
+                .where(OutboxEvent.id.in_(batch), claimable)
+                .values(
+                    locked_by=claim,
+                    locked_until=now + timedelta(seconds=self.lease_seconds),
+                )
+                .execution_options(synchronize_session=False)
+            )
+            session.commit()
+            return [
+                tuple(row) for row in session.query(OutboxEvent.id, OutboxEvent.ordering_key)
+                .filter(OutboxEvent.locked_by == claim)
+                .order_by(OutboxEvent.id)
+                .all()
+            ]
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+    def _deliver_group(self, event_ids: List[int]) -> None:
+        """
+        Deliver events of one ordering group in order.
+
+        Stops at the first event that is not delivered and releases the
+        claims on the rest, which wait for it on the next polls.
+
+        Args:
+            event_ids: IDs of claimed events, in enqueue order
+        """
+        session = self.session_factory()
+        try:
+            for index, event_id in enumerate(event_ids):
+                if not self._deliver(session, event_id):
+                    self._release(session, event_ids[index + 1:])
+                    break
+        finally:
+            session.close()
+
+    def _release(self, session: Session, event_ids: List[int]) -> None:
+        """Drop this dispatcher's claim on events it will not deliver now."""
+        if not event_ids:
+            return
+        session.query(OutboxEvent).filter(OutboxEvent.id.in_(event_ids)).update(
+            {OutboxEvent.locked_by: None, OutboxEvent.locked_until: None},
+            synchronize_session=False,
+        )
+        session.commit()
+
+    def _deliver(self, session: Session, event_id: int) -> bool:
+        """
+        Run the handlers of one event and record the outcome.
+
+        Args:
+            session: Session of the delivering worker
+            event_id: ID of the claimed outbox row
+
+        Returns:
+            True if every handler has now processed the event
+        """
+        row = session.get(OutboxEvent, event_id)
+        event_class = get_event_class(row.event_type)
+        if event_class is None:
+            return self._record_failure(
+                session, row, f"Unknown event type {row.event_type}", give_up=True
+            )
+
+        try:
+            event = event_class.from_dict(json.loads(row.payload))
+        except Exception as e:
+            return self._record_failure(
+                session, row, f"Cannot decode event: {e}", give_up=True
+            )
+
+        done: Set[str] = set(json.loads(row.delivered_handlers or "[]"))
+        error = None
+        plan = self.event_bus.get_plan(event_class)
+        calls = [(handler, event) for handler in plan.sync_handlers + plan.async_handlers]
+        calls += [
+            (handler, [event]) for handler in plan.sync_batch_handlers + plan.async_batch_handlers
+        ]
+        for handler, argument in calls:
+            name = handler_name(handler)
+            if name in done:
+                continue
+            try:
+                result = handler(argument)
+                if inspect.isawaitable(result):
+                    asyncio.run(result)
+            except Exception as e:
+                logger.error(
+                    f"Error in outbox handler {name} for event {row.event_type} ID {row.event_id}: {e}",
+                    exc_info=True,
+                )
+                error = f"{name}: {e}"
+                break
+            done.add(name)
+            _observe_handler_lag(name, (datetime.now() - row.created_at).total_seconds())
+
+        row.delivered_handlers = json.dumps(sorted(done))
+        if error is not None:
+            return self._record_failure(session, row, error)
+
+        row.status = "delivered"
+        row.delivered_at = datetime.now()
+        row.locked_by = None
+        row.locked_until = None
+        session.commit()
+        outbox_delivered.increment()
+        outbox_lag.observe((row.delivered_at - row.created_at).total_seconds())
+        return True
+
+    def _record_failure(
+            self,
+            session: Session,
+            row: OutboxEvent,
+            error: str,
+            give_up: bool = False
+    ) -> bool:
+        """
+        Schedule a retry of a failed event, or mark it dead.
+
+        Args:
+            session: Session of the delivering worker
+            row: The outbox row
+            error: Description of the failure
+            give_up: Mark the event dead regardless of its attempts
+
+        Returns:
+            False, as the event was not delivered
+        """
+        row.attempts = (row.attempts or 0) + 1
+        row.last_error = error[:2000]
+        row.locked_by = None
+        row.locked_until = None
+        if give_up or row.attempts >= self.max_attempts:
+            row.status = "dead"
+            outbox_dead.increment()
+            logger.error(
+                f"Giving up on outbox event {row.event_type} ID {row.event_id} "
+                f"after {row.attempts} attempts: {error}"
+            )
+        else:
+            row.next_attempt_at = datetime.now() + timedelta(seconds=self._backoff(row.attempts))
+            outbox_retried.increment()
+        session.commit()
+        return False
+
+    def _backoff(self, attempts: int) -> float:
+        """Get the retry delay after a number of failed attempts, with jitter."""
+        delay = min(self.max_backoff, self.base_backoff * (2 ** (attempts - 1)))
+        return delay * random.uniform(0.5, 1.0)
@@ -597,13 +597,8 @@ class PatternService(BaseService[Pattern]):
         Raises:
             EntityNotFoundException: If pattern not found
         """
-        # Check cache first
-        if self.cache_service:
-            cache_key = f"Pattern:detail:{pattern_id}"
-            cached = self.cache_service.get(cache_key)
-            if cached:
-                return cached
-
+        # Not cached: components, templates and usage stats change through
+        # other services, which do not invalidate a cached detail view
         # Get pattern
         pattern = self.get_by_id(pattern_id)
         if not pattern:
@@ -652,10 +647,6 @@ class PatternService(BaseService[Pattern]):
         # Get usage statistics
         result["usage_stats"] = self._get_pattern_usage_stats(pattern_id)
 
-        # Store in cache if cache service exists
-        if self.cache_service:
-            self.cache_service.set(cache_key, result, ttl=3600)  # 1 hour TTL
-
         return result
 
     def upload_pattern_file(
@@ -1141,13 +1132,8 @@ class PatternService(BaseService[Pattern]):
         Raises:
             EntityNotFoundException: If template not found
         """
-        # Check cache first
-        if self.cache_service:
-            cache_key = f"ProjectTemplate:detail:{template_id}"
-            cached = self.cache_service.get(cache_key)
-            if cached:
-                return cached
-
+        # Not cached: the pattern summary and components change through
+        # other services, which do not invalidate a cached detail view
         # Get template
         template = self.template_repository.get_by_id(template_id)
         if not template:
@@ -1201,10 +1187,6 @@ class PatternService(BaseService[Pattern]):
         components = self.template_repository.get_template_components(template_id)
         result["components"] = [component.to_dict() for component in components]
 
-        # Store in cache if cache service exists
-        if self.cache_service:
-            self.cache_service.set(cache_key, result, ttl=3600)  # 1 hour TTL
-
         return result
 
     def find_templates_by_pattern(self, pattern_id: int) -> List[ProjectTemplate]:
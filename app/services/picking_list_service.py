@@ -703,6 +703,7 @@ class PickingListService(BaseService[PickingList]):
             # Invalidate cache if cache service exists
             if self.cache_service:
                 self.cache_service.invalidate(f"PickingList:detail:{picking_list_id}")
+                self._invalidate_entity_cache(picking_list_id)
 
             return item
 
@@ -802,6 +803,7 @@ class PickingListService(BaseService[PickingList]):
             # Invalidate cache if cache service exists
             if self.cache_service:
                 self.cache_service.invalidate(f"PickingList:detail:{picking_list_id}")
+                self._invalidate_entity_cache(picking_list_id)
 
             return updated_item
 
@@ -919,6 +921,7 @@ class PickingListService(BaseService[PickingList]):
             # Invalidate cache if cache service exists
             if self.cache_service:
                 self.cache_service.invalidate(f"PickingList:detail:{picking_list_id}")
+                self._invalidate_entity_cache(picking_list_id)
 
             return result
 
@@ -195,6 +195,7 @@ class PresetService(BaseService[MaterialPreset]):
             # Invalidate cache if needed
             if self.cache_service and preset:
                 self.cache_service.invalidate(f"presets:{preset_id}")
+                self._invalidate_entity_cache(preset_id)
                 self.cache_service.invalidate_pattern("presets:*")
 
             return preset
@@ -216,6 +217,7 @@ class PresetService(BaseService[MaterialPreset]):
             # Invalidate cache if needed
             if self.cache_service and result:
                 self.cache_service.invalidate(f"presets:{preset_id}")
+                self._invalidate_entity_cache(preset_id)
                 self.cache_service.invalidate_pattern("presets:*")
 
             return result
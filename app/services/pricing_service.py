@@ -0,0 +1,285 @@
+# File: services/pricing_service.py
+
+from typing import Any, Dict, List, Optional, Sequence, Union
+import logging
+import math
+
+from sqlalchemy.orm import Session
+
+from app.core.exceptions import ValidationException
+from app.db.models.enums import ProjectType
+from app.db.models.product import Product
+from app.repositories.product_repository import ProductRepository
+from app.services.base_service import BaseService
+
+try:
+    import numpy as np
+except ImportError:  # Optional; pricing falls back to plain Python lists
+    np = None
+
+logger = logging.getLogger(__name__)
+
+COST_COMPONENTS = ("material", "hardware", "labor", "overhead")
+
+DEFAULT_PARAMETERS = {
+    "overhead": 0.0,
+    "target_margin": 0.0,
+    "shipping_cost": 0.0,
+    "packaging_cost": 0.0,
+    "platform_fees": 0.0,
+    "marketing_cost": 0.0,
+}
+
+
+def _base_cost(material, hardware, labor, overhead, parameters, factors):
+    """
+    Unit cost before shipping and platform fees, as the pricing calculator
+    computes it; works on floats and on NumPy arrays alike.
+    """
+    direct = (
+        material * factors["material"]
+        + hardware * factors["hardware"]
+        + labor * factors["labor"]
+    )
+    return (
+        direct * (1 + parameters["overhead"] / 100.0)
+        + overhead * factors["overhead"]
+        + parameters["packaging_cost"]
+        + parameters["marketing_cost"]
+    )
+
+
+def price_catalog(
+    columns: Dict[str, Sequence[float]],
+    parameters: Dict[str, float],
+    cost_changes: Optional[Dict[str, float]] = None,
+) -> Dict[str, Any]:
+    """
+    Price every product of a catalog at once.
+
+    Uses NumPy array math when NumPy is installed and plain Python lists
+    otherwise; both give the same numbers.
+
+    Args:
+        columns: Cost component columns (material, hardware, labor,
+            overhead) and selling_price, one value per product
+        parameters: Pricing assumptions (see DEFAULT_PARAMETERS); overhead,
+            target_margin and platform_fees are percentages
+        cost_changes: Optional percent change per cost component, e.g.
+            {"material": 8} for material costs 8% higher
+
+    Returns:
+        Dictionary of total_cost, break_even_price, suggested_price and
+        margin (percent at the current selling price, NaN when the product
+        has no price) columns
+    """
+    factors = {
+        component: 1 + (cost_changes or {}).get(component, 0.0) / 100.0
+        for component in COST_COMPONENTS
+    }
+    kept = 1 - parameters["platform_fees"] / 100.0
+    kept_after_margin = kept - parameters["target_margin"] / 100.0
+    shipping = parameters["shipping_cost"]
+
+    if np is not None:
+        material, hardware, labor, overhead, price = (
+            np.asarray(columns[name], dtype=float)
+            for name in COST_COMPONENTS + ("selling_price",)
+        )
+        base = _base_cost(material, hardware, labor, overhead, parameters, factors)
+        landed = base + shipping
+        margin = np.full(price.shape, np.nan)
+        np.divide((price * kept - landed) * 100.0, price, out=margin, where=price > 0)
+        return {
+            "total_cost": base,
+            "break_even_price": landed / kept,
+            "suggested_price": landed / kept_after_margin,
+            "margin": margin,
+        }
+
+    base = [
+        _base_cost(m, h, l, o, parameters, factors)
+        for m, h, l, o in zip(*(columns[name] for name in COST_COMPONENTS))
+    ]
+    landed = [cost + shipping for cost in base]
+    return {
+        "total_cost": base,
+        "break_even_price": [cost / kept for cost in landed],
+        "suggested_price": [cost / kept_after_margin for cost in landed],
+        "margin": [
+            (price * kept - cost) * 100.0 / price if price > 0 else math.nan
+            for price, cost in zip(columns["selling_price"], landed)
+        ],
+    }
+
+
+def _margin_stats(margin) -> Dict[str, Any]:
+    """Average margin and number of products priced below break-even."""
+    if np is not None:
+        priced = margin[~np.isnan(margin)]
+        average = float(priced.mean()) if priced.size else None
+        return {
+            "priced_products": int(priced.size),
+            "avg_margin": average,
+            "below_break_even": int((priced < 0).sum()),
+        }
+    priced = [value for value in margin if not math.isnan(value)]
+    return {
+        "priced_products": len(priced),
+        "avg_margin": sum(priced) / len(priced) if priced else None,
+        "below_break_even": sum(1 for value in priced if value < 0),
+    }
+
+
+def _lowest_margins(margin, limit: int) -> List[int]:
+    """Positions of the limit lowest margins, unpriced products last."""
+    if np is not None:
+        return np.argsort(margin, kind="stable")[:limit].tolist()
+    return sorted(
+        range(len(margin)), key=lambda i: (math.isnan(margin[i]), margin[i])
+    )[:limit]
+
+
+def _round(value: float) -> Optional[float]:
+    return None if math.isnan(value) else round(value, 2)
+
+
+class PricingService(BaseService[Product]):
+    """
+    Service for pricing the whole product catalog at once.
+
+    Reads every product's cost components as columns and computes
+    break-even price, suggested price and margin for all of them, today
+    and under what-if cost changes, with the pricing calculator's formulas.
+    """
+
+    def __init__(
+        self,
+        session: Session,
+        repository=None,
+        security_context=None,
+        event_bus=None,
+        cache_service=None,
+    ):
+        """
+        Initialize PricingService with dependencies.
+
+        Args:
+            session: Database session for persistence operations
+            repository: Optional repository (defaults to ProductRepository)
+            security_context: Optional security context for authorization
+            event_bus: Optional event bus for publishing domain events
+            cache_service: Optional cache service for data caching
+        """
+        self.session = session
+        self.repository = repository or ProductRepository(session)
+        self.security_context = security_context
+        self.event_bus = event_bus
+        self.cache_service = cache_service
+
+    def reprice_catalog(
+        self,
+        parameters: Optional[Dict[str, float]] = None,
+        cost_changes: Optional[Dict[str, float]] = None,
+        product_type: Optional[Union[ProjectType, str]] = None,
+        limit: int = 100,
+    ) -> Dict[str, Any]:
+        """
+        Price the catalog today and under what-if cost changes.
+
+        Args:
+            parameters: Pricing assumptions overriding DEFAULT_PARAMETERS
+            cost_changes: Percent change per cost component (material,
+                hardware, labor, overhead), e.g. {"material": 8}
+            product_type: Only price products of this type
+            limit: Number of products to list, lowest margin after the
+                changes first
+
+        Returns:
+            Dictionary with the parameters, the cost changes, a catalog
+            summary before and after the changes, and the listed products
+
+        Raises:
+            ValidationException: If the parameters or cost changes are invalid
+        """
+        parameters = {**DEFAULT_PARAMETERS, **(parameters or {})}
+        cost_changes = dict(cost_changes or {})
+        self._validate(parameters, cost_changes)
+        if isinstance(product_type, str):
+            try:
+                product_type = ProjectType[product_type.upper()]
+            except KeyError:
+                raise ValidationException(
+                    f"Invalid product type: {product_type}",
+                    {"product_type": [f"Unknown product type: {product_type}"]},
+                )
+
+        columns = self.repository.get_pricing_columns(product_type)
+        before = price_catalog(columns, parameters)
+        after = price_catalog(columns, parameters, cost_changes)
+
+        products = []
+        for i in _lowest_margins(after["margin"], limit):
+            products.append({
+                "product_id": columns["id"][i],
+                "sku": columns["sku"][i],
+                "name": columns["name"][i],
+                "selling_price": round(float(columns["selling_price"][i]), 2),
+                "total_cost": _round(float(after["total_cost"][i])),
+                "break_even_price": _round(float(after["break_even_price"][i])),
+                "suggested_price": _round(float(after["suggested_price"][i])),
+                "suggested_price_change": _round(
+                    float(after["suggested_price"][i] - before["suggested_price"][i])
+                ),
+                "margin_before": _round(float(before["margin"][i])),
+                "margin_after": _round(float(after["margin"][i])),
+            })
+
+        stats_before = _margin_stats(before["margin"])
+        stats_after = _margin_stats(after["margin"])
+        return {
+            "parameters": parameters,
+            "cost_changes": cost_changes,
+            "summary": {
+                "products": len(columns["id"]),
+                "priced_products": stats_before["priced_products"],
+                "avg_margin_before": (
+                    round(stats_before["avg_margin"], 2)
+                    if stats_before["avg_margin"] is not None
+                    else None
+                ),
+                "avg_margin_after": (
+                    round(stats_after["avg_margin"], 2)
+                    if stats_after["avg_margin"] is not None
+                    else None
+                ),
+                "below_break_even_before": stats_before["below_break_even"],
+                "below_break_even_after": stats_after["below_break_even"],
+            },
+            "products": products,
+        }
+
+    def _validate(
+        self, parameters: Dict[str, float], cost_changes: Dict[str, float]
+    ) -> None:
+        """
+        Check the pricing assumptions and cost changes.
+
+        Raises:
+            ValidationException: If a price could not be computed from them
+        """
+        errors = {}
+        if parameters["platform_fees"] + parameters["target_margin"] >= 100:
+            errors["target_margin"] = [
+                "Target margin and platform fees must add up to less than 100%"
+            ]
+        unknown = sorted(set(cost_changes) - set(COST_COMPONENTS))
+        if unknown:
+            errors["cost_changes"] = [
+                f"Unknown cost components: {', '.join(unknown)}; "
+                f"must be among: {', '.join(COST_COMPONENTS)}"
+            ]
+        elif any(change <= -100 for change in cost_changes.values()):
+            errors["cost_changes"] = ["Cost changes must be above -100%"]
+        if errors:
+            raise ValidationException("Invalid pricing parameters", errors)
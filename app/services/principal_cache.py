@@ -0,0 +1,217 @@
+# File: app/services/principal_cache.py
+"""
+Authenticated-user cache.
+
+Every authenticated request resolves its bearer token to a User with roles
+and permissions. The principal cache keeps that result for a short time,
+keyed by user ID and token, so hot clients authenticate without a database
+round-trip. Entries hold plain column values rather than ORM instances and
+are rebuilt into instances attached to the calling request's session.
+User and role writes invalidate the affected entries; the short TTL bounds
+staleness across worker processes.
+"""
+
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+import threading
+import time
+
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.orm import Session, make_transient_to_detached
+from sqlalchemy.orm.attributes import set_committed_value
+
+from app.core.config import settings
+from app.db.models.role import Permission, Role
+from app.db.models.user import User
+
+
+class PrincipalCache:
+    """
+    Thread-safe, TTL-bounded LRU of authenticated-user snapshots.
+    """
+
+    _instance: Optional["PrincipalCache"] = None
+    _instance_lock = threading.Lock()
+
+    @classmethod
+    def get_instance(cls) -> "PrincipalCache":
+        """
+        Get the process-wide principal cache.
+
+        Returns:
+            Shared PrincipalCache instance
+        """
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls(ttl=settings.PRINCIPAL_CACHE_TTL_SECONDS)
+            return cls._instance
+
+    def __init__(self, ttl: float = 30.0, max_size: int = 10000):
+        """
+        Initialize the cache.
+
+        Args:
+            ttl: Seconds an entry is served for; 0 disables the cache
+            max_size: Maximum number of entries kept before the least
+                recently used one is evicted
+        """
+        self.ttl = ttl
+        self.max_size = max_size
+        self._entries: "OrderedDict[Tuple[int, Hashable], Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        # Bumped on every invalidation so in-flight loads can detect them
+        self.generation = 0
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "invalidations": 0}
+
+    @property
+    def enabled(self) -> bool:
+        """Whether entries are cached at all."""
+        return self.ttl > 0
+
+    def get(self, user_id: int, token_id: Hashable) -> Optional[Dict[str, Any]]:
+        """
+        Look up the snapshot of an authenticated user.
+
+        Args:
+            user_id: ID of the user
+            token_id: Identifier of the token the user authenticated with
+
+        Returns:
+            Snapshot from snapshot_principal, or None
+        """
+        key = (user_id, token_id)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self.stats["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats["hits"] += 1
+            return entry[1]
+
+    def put(
+            self,
+            user_id: int,
+            token_id: Hashable,
+            snapshot: Dict[str, Any],
+            generation: int
+    ) -> None:
+        """
+        Cache the snapshot of an authenticated user.
+
+        Args:
+            user_id: ID of the user
+            token_id: Identifier of the token the user authenticated with
+            snapshot: Snapshot from snapshot_principal
+            generation: Value of ``generation`` read before the user was
+                loaded; the snapshot is dropped if anything was invalidated
+                since
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            if generation != self.generation:
+                return
+            key = (user_id, token_id)
+            self._entries[key] = (time.monotonic() + self.ttl, snapshot)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate_user(self, user_id: int) -> None:
+        """
+        Drop every cached token of a user.
+
+        Args:
+            user_id: ID of the user
+        """
+        with self._lock:
+            self.generation += 1
+            keys = [key for key in self._entries if key[0] == user_id]
+            for key in keys:
+                del self._entries[key]
+            self.stats["invalidations"] += len(keys)
+
+    def clear(self) -> None:
+        """Drop every entry, e.g. after a role's permissions change."""
+        with self._lock:
+            self.generation += 1
+            self.stats["invalidations"] += len(self._entries)
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with size, hits, misses and invalidations
+        """
+        with self._lock:
+            return {"size": len(self._entries), "ttl": self.ttl, **self.stats}
+
+
+def _column_values(instance: Any, exclude: Tuple[str, ...] = ()) -> Dict[str, Any]:
+    """Get the loaded column attribute values of an ORM instance."""
+    state = sa_inspect(instance)
+    return {
+        attr.key: state.dict[attr.key]
+        for attr in state.mapper.column_attrs
+        if attr.key in state.dict and attr.key not in exclude
+    }
+
+
+def snapshot_principal(user: User) -> Dict[str, Any]:
+    """
+    Capture a user with its roles and their permissions as plain values.
+
+    Sensitive fields are left out; they load on access from restored users.
+
+    Args:
+        user: Loaded user
+
+    Returns:
+        Snapshot for PrincipalCache.put
+    """
+    return {
+        "user": _column_values(user, exclude=tuple(User.SENSITIVE_FIELDS)),
+        "roles": [
+            {
+                "role": _column_values(role),
+                "permissions": [_column_values(permission) for permission in role.permissions],
+            }
+            for role in user.roles
+        ],
+    }
+
+
+def _detached(model: type, values: Dict[str, Any]) -> Any:
+    """Build a detached instance whose values count as loaded from the database."""
+    instance = model(**values)
+    make_transient_to_detached(instance)
+    return instance
+
+
+def restore_principal(session: Session, snapshot: Dict[str, Any]) -> User:
+    """
+    Rebuild a snapshot into a user attached to a session, without a query.
+
+    Args:
+        session: Session of the calling request
+        snapshot: Snapshot from snapshot_principal
+
+    Returns:
+        User belonging to the session, with roles and permissions loaded
+    """
+    roles = []
+    for entry in snapshot["roles"]:
+        role = _detached(Role, entry["role"])
+        set_committed_value(
+            role, "permissions", [_detached(Permission, values) for values in entry["permissions"]]
+        )
+        roles.append(role)
+
+    user = _detached(User, snapshot["user"])
+    set_committed_value(user, "roles", roles)
+    return session.merge(user, load=False)
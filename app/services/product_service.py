@@ -4,7 +4,7 @@ import logging
 import json
 import uuid
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 
 from sqlalchemy.orm import Session
 
@@ -30,7 +30,6 @@ from app.db.models import Product
 
 from app.services.inventory_service import InventoryService
 from app.services.pattern_service import PatternService
-from app.services.material_service import MaterialService
 from app.repositories.product_repository import ProductRepository
 from app.services.base_service import BaseService
 
@@ -40,6 +39,10 @@ from app.services.inventory_service import InventoryService
 # from app.services.pattern_service import PatternService
 # from app.services.sale_service import SaleService
 # from app.services.material_service import MaterialService # Only if calculating costs here
+
+if TYPE_CHECKING:
+    # Injected for cost calculation only; the module is not part of this tree
+    from app.services.material_service import MaterialService
 from app.schemas.product import (
     ProductCreate,
     ProductUpdate,
@@ -134,7 +137,7 @@ class ProductService(BaseService[Product]):
     inventory_service: InventoryService
     pattern_service: Optional[PatternService]
     # sale_service: Optional[SaleService]
-    material_service: Optional[MaterialService]
+    material_service: Optional["MaterialService"]
 
     def __init__(
         self,
@@ -143,7 +146,7 @@ class ProductService(BaseService[Product]):
         # --- ACCEPT INJECTED SERVICES ---
         inventory_service: Optional[InventoryService] = None,
         pattern_service: Optional[PatternService] = None,
-        material_service: Optional[MaterialService] = None,
+        material_service: Optional["MaterialService"] = None,
         # --- END ACCEPT ---
         security_context=None,
         event_bus=None,
@@ -533,12 +536,8 @@ class ProductService(BaseService[Product]):
         Uses the Product model's to_dict method which accesses inventory.
         """
         logger.debug(f"Service: Getting detailed view for product ID: {product_id}")
-        cache_key = f"Product:detail:{product_id}"
-        if self.cache_service:
-            cached = self.cache_service.get(cache_key)
-            if cached:
-                return cached
-
+        # Not cached: stock levels change through InventoryService, which does
+        # not invalidate a cached detail view
         product = self.repository.get_by_id(product_id, load_inventory=True)
         if not product:
             raise EntityNotFoundException("Product", product_id)
@@ -548,9 +547,6 @@ class ProductService(BaseService[Product]):
         # Add other related details here if needed
         # if product.pattern_id and self.pattern_service: ...
 
-        if self.cache_service:
-            self.cache_service.set(cache_key, result, ttl=1800)
-
         return result
 
     # --- Inventory Specific Method (Delegation) ---
@@ -680,16 +676,20 @@ class ProductService(BaseService[Product]):
 
     def get_all_product_margins(self) -> List[Optional[float]]:
         """
-        Retrieves the profit margin for all products.
-        Optimized to fetch only necessary fields if possible.
+        Retrieves the profit margin for all products, in product ID order.
+        Reads only selling_price and total_cost, without loading products.
         """
         logger.debug("Service: Getting margins for all products.")
-        # This could be optimized in the repository to only select id, selling_price, total_cost
-        all_products = self.repository.list(
-            limit=100000
-        )  # Fetch all (potentially optimize)
-        margins = [p.profit_margin for p in all_products]  # Uses hybrid property
-        return margins
+        rows = (
+            self.session.query(Product.selling_price, Product.total_cost)
+            .order_by(Product.id)
+            .all()
+        )
+        # Same rule as the Product.profit_margin hybrid property
+        return [
+            round((price - cost) / price * 100, 2) if price and cost else None
+            for price, cost in rows
+        ]
 
     # --- Helper Methods ---
     def _invalidate_product_cache(self, product_id: int):
@@ -698,7 +698,7 @@ class ProductService(BaseService[Product]):
             logger.debug(f"Invalidating cache for product ID: {product_id}")
             self.cache_service.invalidate(f"Product:{product_id}")
             self.cache_service.invalidate(f"Product:detail:{product_id}")
-            self.cache_service.invalidate_by_pattern("Product:list:")
+            self.cache_service.invalidate_pattern("Product:list:")
 
     def _has_active_sales(self, product_id: int) -> bool:
         """Placeholder: Check if product is in active sales orders."""
@@ -806,11 +806,11 @@ class ProductService(BaseService[Product]):
             breakdown = {
                 "material_costs": 0.0,
                 "labor_costs": getattr(
-                    product, "labor_cost", 0.0
-                ),  # Get from product or default
+                    product, "labor_cost", None
+                ) or 0.0,  # Get from product or default
                 "overhead_costs": getattr(
-                    product, "overhead_cost", 0.0
-                ),  # Get from product or default
+                    product, "overhead_cost", None
+                ) or 0.0,  # Get from product or default
                 "total_calculated_cost": 0.0,  # Will sum at the end
                 "materials_detail": [],
                 "calculation_timestamp": datetime.now().isoformat(),
@@ -1043,10 +1043,20 @@ class ProductService(BaseService[Product]):
                 with self.transaction():  # Use the service's transaction context manager
                     # Prepare data for update, ensuring JSON serialization
                     # Store the detailed breakdown as JSON string
+                    hardware_costs = sum(
+                        detail["total_cost"]
+                        for detail in breakdown["materials_detail"]
+                        if detail["type"] == "HARDWARE"
+                    )
                     cost_update_data = {
                         "cost_breakdown": json.dumps(breakdown, default=str),
                         # Use default=str for non-serializable types like datetime
                         "total_cost": breakdown["total_calculated_cost"],
+                        # Components as columns, for bulk pricing
+                        "material_cost": breakdown["material_costs"] - hardware_costs,
+                        "hardware_cost": hardware_costs,
+                        "labor_cost": breakdown["labor_costs"],
+                        "overhead_cost": breakdown["overhead_costs"],
                     }
                     # Use the repository's update method
                     updated_product = self.repository.update(
@@ -177,6 +177,7 @@ class PropertyDefinitionService(BaseService[PropertyDefinition]):
             # Invalidate cache if needed
             if self.cache_service:
                 self.cache_service.invalidate(f"property_definitions:{id}")
+                self._invalidate_entity_cache(id)
                 self.cache_service.invalidate_pattern("property_definitions:*")
 
             return updated_property
@@ -211,6 +212,7 @@ class PropertyDefinitionService(BaseService[PropertyDefinition]):
             # Invalidate cache if needed
             if self.cache_service and result:
                 self.cache_service.invalidate(f"property_definitions:{id}")
+                self._invalidate_entity_cache(id)
                 self.cache_service.invalidate_pattern("property_definitions:*")
 
             return result
@@ -252,6 +254,7 @@ class PropertyDefinitionService(BaseService[PropertyDefinition]):
             # Invalidate cache if needed
             if self.cache_service and enum_option:
                 self.cache_service.invalidate(f"property_definitions:{property_id}")
+                self._invalidate_entity_cache(property_id)
                 self.cache_service.invalidate_pattern("property_definitions:*")
 
             return enum_option
@@ -293,6 +296,7 @@ class PropertyDefinitionService(BaseService[PropertyDefinition]):
             # Invalidate cache if needed
             if self.cache_service:
                 self.cache_service.invalidate(f"property_definitions:{property_id}")
+                self._invalidate_entity_cache(property_id)
                 self.cache_service.invalidate_pattern("property_definitions:*")
 
             return True
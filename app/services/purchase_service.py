@@ -5,9 +5,20 @@ from sqlalchemy.orm import Session
 from datetime import datetime, timedelta
 import logging
 
+from app.services.analytics_rollup_service import AnalyticsRollupService
 from app.services.base_service import BaseService
+from app.services.supplier_performance_service import (
+    RECEIPT_STATUSES,
+    RECEIVED_STATUSES,
+    SupplierPerformanceService,
+)
 from app.db.models.purchase import Purchase, PurchaseItem
-from app.db.models.enums import PurchaseStatus, PaymentStatus
+from app.db.models.enums import (
+    InventoryAdjustmentType,
+    PaymentStatus,
+    PurchaseStatus,
+    TransactionType,
+)
 from app.repositories.purchase_repository import PurchaseRepository
 from app.core.exceptions import (
     ValidationException,
@@ -157,6 +168,8 @@ class PurchaseService(BaseService[Purchase]):
         supplier_service=None,
         material_service=None,
         inventory_service=None,
+        analytics_rollup_service=None,
+        supplier_performance_service=None,
     ):
         """
         Initialize PurchaseService with dependencies.
@@ -170,6 +183,11 @@ class PurchaseService(BaseService[Purchase]):
             supplier_service: Optional supplier service for supplier validation
             material_service: Optional material service for material validation
             inventory_service: Optional inventory service for inventory updates
+            analytics_rollup_service: Optional service maintaining the daily
+                rollups (defaults to one on the same session)
+            supplier_performance_service: Optional service maintaining the
+                supplier performance aggregates (defaults to one on the same
+                session)
         """
         self.session = session
         self.repository = repository or PurchaseRepository(session)
@@ -179,6 +197,12 @@ class PurchaseService(BaseService[Purchase]):
         self.supplier_service = supplier_service
         self.material_service = material_service
         self.inventory_service = inventory_service
+        self.analytics_rollup_service = (
+            analytics_rollup_service or AnalyticsRollupService(session)
+        )
+        self.supplier_performance_service = (
+            supplier_performance_service or SupplierPerformanceService(session)
+        )
 
     @validate_input(validate_purchase)
     def create_purchase(self, data: Dict[str, Any]) -> Purchase:
@@ -227,6 +251,9 @@ class PurchaseService(BaseService[Purchase]):
                 # Refresh purchase to get updated total
                 purchase = self.repository.get_by_id(purchase.id)
 
+            # Bring the day's rollups up to date
+            self.analytics_rollup_service.refresh_purchase_days([purchase.created_at])
+
             # Publish event if event bus exists
             if self.event_bus:
                 user_id = (
@@ -284,6 +311,11 @@ class PurchaseService(BaseService[Purchase]):
             updated_purchase = self.repository.update(purchase_id, data)
             if not updated_purchase:
                 return None
+            self.analytics_rollup_service.refresh_purchase_days(
+                [original_purchase.created_at, updated_purchase.created_at]
+            )
+            if status_changed:
+                self._record_receipt(updated_purchase, previous_status)
 
             # Publish events if event bus exists
             if self.event_bus and status_changed:
@@ -341,7 +373,10 @@ class PurchaseService(BaseService[Purchase]):
                 self.delete_purchase_item(item.id)
 
             # Delete purchase
+            created_at = purchase.created_at
             result = self.repository.delete(purchase_id)
+            if result:
+                self.analytics_rollup_service.refresh_purchase_days([created_at])
 
             # Invalidate cache if cache service exists
             if result and self.cache_service:
@@ -577,6 +612,12 @@ class PurchaseService(BaseService[Purchase]):
                 purchase_id, {"status": new_status}
             )
 
+            # Cancelling drops the purchase from its day's rollups
+            self.analytics_rollup_service.refresh_purchase_days(
+                [updated_purchase.created_at]
+            )
+            self._record_receipt(updated_purchase, previous_status)
+
             # Publish event if event bus exists
             if self.event_bus:
                 user_id = (
@@ -648,6 +689,7 @@ class PurchaseService(BaseService[Purchase]):
             total_expected = 0
             total_received = 0
             processed_items = []
+            inventory_adjustments = []
 
             # Get all purchase items
             purchase_items = self.get_purchase_items(purchase_id)
@@ -720,28 +762,37 @@ class PurchaseService(BaseService[Purchase]):
                     }
                 )
 
-                # Update inventory if material_id is present
-                if (
-                    hasattr(purchase_item, "material_id")
-                    and purchase_item.material_id
-                    and self.inventory_service
-                ):
-                    try:
-                        self.inventory_service.adjust_inventory(
-                            item_id=purchase_item.material_id,
-                            quantity_change=quantity_received,
-                            reason=f"Purchase #{purchase_id}",
-                        )
-                    except Exception as e:
-                        logger.warning(
-                            f"Failed to update inventory for material {purchase_item.material_id}: {str(e)}",
-                            exc_info=True,
-                        )
+                # Collect inventory changes for materials
+                if getattr(purchase_item, "material_id", None) and quantity_received:
+                    inventory_adjustments.append(
+                        {
+                            "item_type": "material",
+                            "item_id": purchase_item.material_id,
+                            "quantity_change": quantity_received,
+                        }
+                    )
 
                 # Track totals for status update
                 total_expected += purchase_item.quantity
                 total_received += new_received
 
+            # Update inventory for all received materials at once
+            if inventory_adjustments and self.inventory_service:
+                try:
+                    self.inventory_service.bulk_adjust(
+                        inventory_adjustments,
+                        adjustment_type=InventoryAdjustmentType.RESTOCK,
+                        reason=f"Purchase #{purchase_id}",
+                        transaction_type=TransactionType.PURCHASE,
+                        reference_id=purchase_id,
+                        reference_type="purchase",
+                    )
+                except Exception as e:
+                    logger.warning(
+                        f"Failed to update inventory for purchase {purchase_id}: {str(e)}",
+                        exc_info=True,
+                    )
+
             # Determine new status based on received quantities
             new_status = purchase.status
             if total_received >= total_expected:
@@ -992,7 +1043,25 @@ class PurchaseService(BaseService[Purchase]):
         total = sum(item.total for item in items if hasattr(item, "total"))
 
         # Update purchase
-        self.repository.update(purchase_id, {"total": total})
+        purchase = self.repository.update(purchase_id, {"total": total})
+        if purchase:
+            self.analytics_rollup_service.refresh_purchase_days([purchase.created_at])
+
+    def _record_receipt(self, purchase: Purchase, previous_status) -> None:
+        """
+        Add the purchase to its supplier's performance aggregates if this
+        status change is the one that marks it received.
+
+        Args:
+            purchase: Purchase after the status change
+            previous_status: Status before the change
+        """
+        received = {status.value for status in RECEIVED_STATUSES}
+        already_received = {status.value for status in RECEIPT_STATUSES}
+        new_status = getattr(purchase.status, "value", purchase.status)
+        previous_status = getattr(previous_status, "value", previous_status)
+        if new_status in received and previous_status not in already_received:
+            self.supplier_performance_service.record_receipt(purchase)
 
     def _is_valid_status_transition(self, current_status: str, new_status: str) -> bool:
         """
@@ -20,6 +20,7 @@ from app.core.events import DomainEvent
 from app.db.models.refund import Refund
 from app.db.models.enums import PaymentStatus, SaleStatus
 from app.repositories.refund_repository import RefundRepository
+from app.services.analytics_rollup_service import AnalyticsRollupService
 from app.services.base_service import BaseService
 
 
@@ -101,6 +102,7 @@ class RefundService(BaseService[Refund]):
         cache_service=None,
         sale_service=None,
         payment_service=None,
+        analytics_rollup_service=None,
     ):
         """
         Initialize RefundService with dependencies.
@@ -113,6 +115,8 @@ class RefundService(BaseService[Refund]):
             cache_service: Optional cache service for data caching
             sale_service: Optional sale service for sale operations
             payment_service: Optional payment service for payment processing
+            analytics_rollup_service: Optional service maintaining the daily
+                rollups (defaults to one on the same session)
         """
         self.session = session
         self.repository = repository or RefundRepository(session)
@@ -121,6 +125,9 @@ class RefundService(BaseService[Refund]):
         self.cache_service = cache_service
         self.sale_service = sale_service
         self.payment_service = payment_service
+        self.analytics_rollup_service = (
+            analytics_rollup_service or AnalyticsRollupService(session)
+        )
 
     def create_refund(self, data: Dict[str, Any]) -> Refund:
         """
@@ -285,6 +292,9 @@ class RefundService(BaseService[Refund]):
                             payment_method=payment_method,
                         )
 
+            # Processed refunds count on the refund day's rollups
+            self.analytics_rollup_service.refresh_sales_days([refund.refund_date])
+
             # Publish event if event bus exists
             if self.event_bus:
                 user_id = (
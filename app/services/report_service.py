@@ -48,6 +48,11 @@ from app.core.exceptions import (
     EntityNotFoundException,
     BusinessRuleException,
 )
+from app.services.analytics_rollup_service import (
+    BREAKDOWNS,
+    PERIODS,
+    AnalyticsRollupService,
+)
 from app.services.base_service import BaseService
 
 logger = logging.getLogger(__name__)
@@ -157,6 +162,7 @@ class ReportService(BaseService):
         supplier_service=None,
         purchase_service=None,
         file_service=None,
+        analytics_rollup_service=None,
     ):
         """
         Initialize ReportService with dependencies.
@@ -175,6 +181,8 @@ class ReportService(BaseService):
             supplier_service: Optional service for supplier operations
             purchase_service: Optional service for purchase operations
             file_service: Optional service for file storage
+            analytics_rollup_service: Optional service for the daily sales and
+                purchase rollups (defaults to one on the same session)
         """
         self.session = session
         self.repository = repository
@@ -189,6 +197,9 @@ class ReportService(BaseService):
         self.supplier_service = supplier_service
         self.purchase_service = purchase_service
         self.file_service = file_service
+        self.analytics_rollup_service = (
+            analytics_rollup_service or AnalyticsRollupService(session)
+        )
 
         # Register report generators
         self.report_generators = {
@@ -1304,7 +1315,7 @@ class ReportService(BaseService):
         self, parameters: Dict[str, Any]
     ) -> Dict[str, Any]:
         """
-        Generate sales analysis report.
+        Generate sales analysis report from the daily sales rollups.
 
         Args:
             parameters: Report parameters
@@ -1312,10 +1323,6 @@ class ReportService(BaseService):
         Returns:
             Dictionary with report data
         """
-        # Check if sale service is available
-        if not self.sale_service:
-            raise BusinessRuleException("Sale service not available", "REPORT_102")
-
         # Extract parameters
         start_date = parameters.get("start_date")
         end_date = parameters.get("end_date")
@@ -1335,28 +1342,63 @@ class ReportService(BaseService):
         if not end_date:
             end_date = datetime.now()
 
-        # Get sales data
-        sales = self.sale_service.list_sales(
-            created_at_gte=start_date, created_at_lte=end_date
-        )
+        if group_by not in PERIODS and group_by not in BREAKDOWNS:
+            raise ValidationException(
+                f"Unsupported grouping: {group_by}",
+                {"group_by": [f"Must be one of: {', '.join(PERIODS + BREAKDOWNS)}"]},
+            )
 
-        # Convert to dictionaries
-        sales_data = [
-            sale.to_dict() if hasattr(sale, "to_dict") else dict(sale) for sale in sales
-        ]
+        rollups = self.analytics_rollup_service
+        by_product_type = rollups.get_sales_breakdown(start_date, end_date, "product_type")
+
+        # Group data
+        if group_by in BREAKDOWNS:
+            groups = (
+                by_product_type
+                if group_by == "product_type"
+                else rollups.get_sales_breakdown(start_date, end_date, group_by)
+            )
+            grouped_data = {
+                (row[group_by] or "unknown"): {
+                    "revenue": row["revenue"],
+                    "net_revenue": row["net_revenue"],
+                    "refunds": row["refunds"],
+                    "sales_count": row["order_count"],
+                }
+                for row in groups
+            }
+        else:
+            grouped_data = {
+                key: {
+                    "revenue": totals["revenue"],
+                    "net_revenue": totals["net_revenue"],
+                    "refunds": totals["refunds"],
+                    "sales_count": totals["sales_count"],
+                }
+                for key, totals in rollups.get_period_totals(
+                    start_date, end_date, group_by
+                ).items()
+                if totals["sales_count"] or totals["refunds"]
+            }
+        for data in grouped_data.values():
+            data["avg_order_value"] = (
+                data["revenue"] / data["sales_count"] if data["sales_count"] > 0 else 0
+            )
 
         # Calculate summary statistics
-        total_sales = len(sales_data)
-        total_revenue = sum(
-            sale.get("total_amount", 0) for sale in sales_data if isinstance(sale, dict)
-        )
+        total_sales = sum(data["sales_count"] for data in grouped_data.values())
+        total_revenue = sum(data["revenue"] for data in grouped_data.values())
         avg_order_value = total_revenue / total_sales if total_sales > 0 else 0
 
-        # Group data
-        grouped_data = self._group_sales_data(sales_data, group_by)
-
-        # Calculate top products
-        top_products = self._calculate_top_products(sales_data)
+        # Top product types by revenue
+        top_product_types = [
+            {
+                "product_type": row["product_type"] or "unknown",
+                "revenue": row["revenue"],
+                "sales_count": row["order_count"],
+            }
+            for row in by_product_type[:5]
+        ]
 
         # Generate report data
         report_data = {
@@ -1369,12 +1411,14 @@ class ReportService(BaseService):
             "summary": {
                 "total_sales": total_sales,
                 "total_revenue": total_revenue,
+                "net_revenue": sum(data["net_revenue"] for data in grouped_data.values()),
+                "refunds": sum(data["refunds"] for data in grouped_data.values()),
                 "avg_order_value": avg_order_value,
-                "top_products": top_products[:5],  # Top 5 products
+                "top_product_types": top_product_types,
             },
             "grouped_data": grouped_data,
             "parameters": parameters,
-            "data": sales_data,
+            "data": [{group_by: key, **data} for key, data in grouped_data.items()],
         }
 
         return report_data
@@ -1795,7 +1839,7 @@ class ReportService(BaseService):
         self, parameters: Dict[str, Any]
     ) -> Dict[str, Any]:
         """
-        Generate financial summary report.
+        Generate financial summary report from the daily sales and purchase rollups.
 
         Args:
             parameters: Report parameters
@@ -1803,12 +1847,6 @@ class ReportService(BaseService):
         Returns:
             Dictionary with report data
         """
-        # Check if sale and purchase services are available
-        if not self.sale_service and not self.purchase_service:
-            raise BusinessRuleException(
-                "Sale or purchase service not available", "REPORT_105"
-            )
-
         # Extract parameters
         start_date = parameters.get("start_date")
         end_date = parameters.get("end_date")
@@ -1828,136 +1866,11 @@ class ReportService(BaseService):
         if not end_date:
             end_date = datetime.now()
 
-        # Get sales data
-        sales_data = []
-        if self.sale_service:
-            sales = self.sale_service.list_sales(
-                created_at_gte=start_date, created_at_lte=end_date
-            )
-
-            sales_data = [
-                sale.to_dict() if hasattr(sale, "to_dict") else dict(sale)
-                for sale in sales
-            ]
-
-        # Get purchase data
-        purchases_data = []
-        if self.purchase_service:
-            purchases = self.purchase_service.list_purchases(
-                created_at_gte=start_date, created_at_lte=end_date
-            )
-
-            purchases_data = [
-                purchase.to_dict() if hasattr(purchase, "to_dict") else dict(purchase)
-                for purchase in purchases
-            ]
-
-        # Group data by period
-        period_data = {}
-
-        # Group sales
-        for sale in sales_data:
-            if not isinstance(sale, dict):
-                continue
-
-            sale_date = sale.get("created_at")
-            if not sale_date:
-                continue
-
-            # Parse date if it's a string
-            if isinstance(sale_date, str):
-                sale_date = datetime.fromisoformat(sale_date.replace("Z", "+00:00"))
-
-            # Calculate period key
-            if period == "day":
-                period_key = sale_date.strftime("%Y-%m-%d")
-            elif period == "week":
-                # ISO week number
-                period_key = f"{sale_date.strftime('%Y')}-W{sale_date.strftime('%V')}"
-            elif period == "month":
-                period_key = sale_date.strftime("%Y-%m")
-            elif period == "quarter":
-                quarter = (sale_date.month - 1) // 3 + 1
-                period_key = f"{sale_date.strftime('%Y')}-Q{quarter}"
-            elif period == "year":
-                period_key = sale_date.strftime("%Y")
-            else:
-                # Default to month
-                period_key = sale_date.strftime("%Y-%m")
-
-            # Initialize period if needed
-            if period_key not in period_data:
-                period_data[period_key] = {
-                    "revenue": 0,
-                    "expenses": 0,
-                    "profit": 0,
-                    "margin": 0,
-                    "sales_count": 0,
-                    "purchase_count": 0,
-                }
-
-            # Add sale data
-            period_data[period_key]["revenue"] += sale.get("total_amount", 0)
-            period_data[period_key]["sales_count"] += 1
-
-        # Group purchases
-        for purchase in purchases_data:
-            if not isinstance(purchase, dict):
-                continue
-
-            purchase_date = purchase.get("created_at")
-            if not purchase_date:
-                continue
-
-            # Parse date if it's a string
-            if isinstance(purchase_date, str):
-                purchase_date = datetime.fromisoformat(
-                    purchase_date.replace("Z", "+00:00")
-                )
-
-            # Calculate period key
-            if period == "day":
-                period_key = purchase_date.strftime("%Y-%m-%d")
-            elif period == "week":
-                # ISO week number
-                period_key = (
-                    f"{purchase_date.strftime('%Y')}-W{purchase_date.strftime('%V')}"
-                )
-            elif period == "month":
-                period_key = purchase_date.strftime("%Y-%m")
-            elif period == "quarter":
-                quarter = (purchase_date.month - 1) // 3 + 1
-                period_key = f"{purchase_date.strftime('%Y')}-Q{quarter}"
-            elif period == "year":
-                period_key = purchase_date.strftime("%Y")
-            else:
-                # Default to month
-                period_key = purchase_date.strftime("%Y-%m")
-
-            # Initialize period if needed
-            if period_key not in period_data:
-                period_data[period_key] = {
-                    "revenue": 0,
-                    "expenses": 0,
-                    "profit": 0,
-                    "margin": 0,
-                    "sales_count": 0,
-                    "purchase_count": 0,
-                }
-
-            # Add purchase data
-            period_data[period_key]["expenses"] += purchase.get("total", 0)
-            period_data[period_key]["purchase_count"] += 1
-
-        # Calculate profit and margin for each period
-        for period_key, data in period_data.items():
-            data["profit"] = data["revenue"] - data["expenses"]
-            data["margin"] = (
-                (data["profit"] / data["revenue"] * 100) if data["revenue"] > 0 else 0
-            )
-
-        # Sort periods chronologically
-        sorted_periods = sorted(period_data.keys())
+        # Totals per period, in period order
+        period_data = self.analytics_rollup_service.get_period_totals(
+            start_date, end_date, period
+        )
+        sorted_periods = list(period_data)
 
         # Calculate overall summary
         total_revenue = sum(data["revenue"] for data in period_data.values())
@@ -1984,13 +1897,19 @@ class ReportService(BaseService):
             },
             "summary": {
                 "total_revenue": total_revenue,
+                "total_net_revenue": sum(data["net_revenue"] for data in period_data.values()),
+                "total_fees": sum(data["fees"] for data in period_data.values()),
+                "total_cogs": sum(data["cogs"] for data in period_data.values()),
+                "total_refunds": sum(data["refunds"] for data in period_data.values()),
                 "total_expenses": total_expenses,
                 "total_profit": total_profit,
                 "overall_margin": overall_margin,
-                "total_sales": len(sales_data),
-                "total_purchases": len(purchases_data),
+                "total_sales": sum(data["sales_count"] for data in period_data.values()),
+                "total_purchases": sum(
+                    data["purchase_count"] for data in period_data.values()
+                ),
             },
-            "period_data": {period: period_data[period] for period in sorted_periods},
+            "period_data": period_data,
             "trends": {
                 "periods": sorted_periods,
                 "revenue": revenue_trend,
@@ -2015,10 +1934,10 @@ class ReportService(BaseService):
         Returns:
             Dictionary with report data
         """
-        # Check if customer and sale services are available
-        if not self.customer_service or not self.sale_service:
+        # Check if customer service is available
+        if not self.customer_service:
             raise BusinessRuleException(
-                "Customer or sale service not available", "REPORT_106"
+                "Customer service not available", "REPORT_106"
             )
 
         # Extract parameters
@@ -2041,171 +1960,27 @@ class ReportService(BaseService):
         if not end_date:
             end_date = datetime.now()
 
-        # Get customer data
-        filters = {}
-
-        if customer_type:
-            filters["type"] = customer_type
-
-        if not include_inactive:
-            filters["status"] = "ACTIVE"
-
-        customers = self.customer_service.list_customers(**filters)
-
-        # Convert to dictionaries
-        customer_data = [
-            customer.to_dict() if hasattr(customer, "to_dict") else dict(customer)
-            for customer in customers
-        ]
-
-        # Get sales data
-        sales = self.sale_service.list_sales(
-            created_at_gte=start_date, created_at_lte=end_date
+        # Per-customer revenue, orders, RFM scores and rank, aggregated in
+        # the database
+        analysis = self.customer_service.get_customer_value_analysis(
+            start_date=start_date,
+            end_date=end_date,
+            status=None if include_inactive else "ACTIVE",
+            tier=customer_type,
         )
+        summary = analysis["summary"]
 
-        # Convert to dictionaries
-        sales_data = [
-            sale.to_dict() if hasattr(sale, "to_dict") else dict(sale) for sale in sales
-        ]
-
-        # Group sales by customer
-        customer_sales = {}
-
-        for sale in sales_data:
-            if not isinstance(sale, dict):
-                continue
-
-            customer_id = sale.get("customer_id")
-            if not customer_id:
-                continue
-
-            if customer_id not in customer_sales:
-                customer_sales[customer_id] = {
-                    "sales_count": 0,
-                    "total_revenue": 0,
-                    "avg_order_value": 0,
-                    "first_purchase": None,
-                    "last_purchase": None,
-                    "purchases": [],
-                }
-
-            # Add sale data
-            customer_sales[customer_id]["sales_count"] += 1
-            customer_sales[customer_id]["total_revenue"] += sale.get("total_amount", 0)
-            customer_sales[customer_id]["purchases"].append(sale)
-
-        # Calculate additional metrics
-        for customer_id, data in customer_sales.items():
-            # Sort purchases by date
-            purchases = sorted(
-                data["purchases"],
-                key=lambda s: (
-                    s.get("created_at")
-                    if isinstance(s.get("created_at"), datetime)
-                    else (
-                        datetime.fromisoformat(
-                            s.get("created_at").replace("Z", "+00:00")
-                        )
-                        if isinstance(s.get("created_at"), str)
-                        else datetime.min
-                    )
+        customer_data = [
+            {
+                **row,
+                "first_order": row["first_order"].isoformat() if row["first_order"] else None,
+                "last_order": row["last_order"].isoformat() if row["last_order"] else None,
+                "avg_order_value": (
+                    row["revenue"] / row["order_count"] if row["order_count"] else 0
                 ),
-            )
-
-            # First and last purchase
-            if purchases:
-                data["first_purchase"] = purchases[0].get("created_at")
-                data["last_purchase"] = purchases[-1].get("created_at")
-
-                # Parse dates if they're strings
-                if isinstance(data["first_purchase"], str):
-                    data["first_purchase"] = datetime.fromisoformat(
-                        data["first_purchase"].replace("Z", "+00:00")
-                    )
-
-                if isinstance(data["last_purchase"], str):
-                    data["last_purchase"] = datetime.fromisoformat(
-                        data["last_purchase"].replace("Z", "+00:00")
-                    )
-
-            # Average order value
-            data["avg_order_value"] = (
-                data["total_revenue"] / data["sales_count"]
-                if data["sales_count"] > 0
-                else 0
-            )
-
-            # Remove purchases list to reduce size
-            del data["purchases"]
-
-        # Add sales data to customer data
-        for customer in customer_data:
-            if not isinstance(customer, dict):
-                continue
-
-            customer_id = customer.get("id")
-            if not customer_id or customer_id not in customer_sales:
-                customer["sales_data"] = {
-                    "sales_count": 0,
-                    "total_revenue": 0,
-                    "avg_order_value": 0,
-                    "first_purchase": None,
-                    "last_purchase": None,
-                }
-            else:
-                customer["sales_data"] = customer_sales[customer_id]
-
-        # Calculate customer segments
-        segments = {"new": 0, "returning": 0, "inactive": 0, "high_value": 0}
-
-        for customer in customer_data:
-            if not isinstance(customer, dict):
-                continue
-
-            sales_data = customer.get("sales_data", {})
-            sales_count = sales_data.get("sales_count", 0)
-            last_purchase = sales_data.get("last_purchase")
-            total_revenue = sales_data.get("total_revenue", 0)
-
-            # Skip customers with no purchases
-            if sales_count == 0:
-                continue
-
-            # New customers (first purchase within last 30 days)
-            first_purchase = sales_data.get("first_purchase")
-            if first_purchase and (end_date - first_purchase).days <= 30:
-                segments["new"] += 1
-
-            # Returning customers (multiple purchases)
-            if sales_count > 1:
-                segments["returning"] += 1
-
-            # Inactive customers (no purchase in last 90 days)
-            if last_purchase and (end_date - last_purchase).days > 90:
-                segments["inactive"] += 1
-
-            # High-value customers (revenue above threshold)
-            avg_revenue = (
-                sum(
-                    sale.get("total_amount", 0)
-                    for sale in sales_data
-                    if isinstance(sale, dict)
-                )
-                / len(sales_data)
-                if sales_data
-                else 0
-            )
-            if total_revenue > avg_revenue * 2:  # Threshold: 2x average
-                segments["high_value"] += 1
-
-        # Calculate top customers by revenue
-        top_customers = sorted(
-            [c for c in customer_data if isinstance(c, dict)],
-            key=lambda c: c.get("sales_data", {}).get("total_revenue", 0),
-            reverse=True,
-        )[
-            :10
-        ]  # Top 10
+            }
+            for row in analysis["customers"]
+        ]
 
         # Generate report data
         report_data = {
@@ -2216,29 +1991,28 @@ class ReportService(BaseService):
                 "end_date": end_date.isoformat(),
             },
             "summary": {
-                "total_customers": len(customer_data),
-                "active_customers": len(
-                    [
-                        c
-                        for c in customer_data
-                        if isinstance(c, dict)
-                        and c.get("sales_data", {}).get("sales_count", 0) > 0
-                    ]
-                ),
-                "segments": segments,
+                "total_customers": analysis["total_customers"],
+                "active_customers": summary["customers_with_orders"],
+                "total_revenue": summary["total_revenue"],
+                "average_lifetime_value": summary["average_lifetime_value"],
+                "segments": {
+                    segment: summary[f"{segment}_customers"]
+                    for segment in ("new", "returning", "inactive", "high_value")
+                },
+                "rfm_segments": {
+                    name[len("rfm_"):]: count
+                    for name, count in summary.items()
+                    if name.startswith("rfm_")
+                },
                 "top_customers": [
                     {
-                        "id": c.get("id"),
-                        "name": c.get("name", f"Customer {c.get('id')}"),
-                        "total_revenue": c.get("sales_data", {}).get(
-                            "total_revenue", 0
-                        ),
-                        "sales_count": c.get("sales_data", {}).get("sales_count", 0),
-                        "avg_order_value": c.get("sales_data", {}).get(
-                            "avg_order_value", 0
-                        ),
+                        "id": c["customer_id"],
+                        "name": c["name"] or f"Customer {c['customer_id']}",
+                        "total_revenue": c["revenue"],
+                        "sales_count": c["order_count"],
+                        "avg_order_value": c["avg_order_value"],
                     }
-                    for c in top_customers
+                    for c in customer_data[:10]
                 ],
             },
             "parameters": parameters,
@@ -2470,10 +2244,10 @@ class ReportService(BaseService):
         Returns:
             Dictionary with report data
         """
-        # Check if supplier and purchase services are available
-        if not self.supplier_service or not self.purchase_service:
+        # Check if supplier service is available
+        if not self.supplier_service:
             raise BusinessRuleException(
-                "Supplier or purchase service not available", "REPORT_108"
+                "Supplier service not available", "REPORT_108"
             )
 
         # Extract parameters
@@ -2496,189 +2270,26 @@ class ReportService(BaseService):
         if not end_date:
             end_date = datetime.now()
 
-        # Get supplier data
-        supplier_filters = {}
-
-        if supplier_id:
-            supplier_filters["id"] = supplier_id
-
-        suppliers = self.supplier_service.list_suppliers(**supplier_filters)
-
-        # Convert to dictionaries
-        supplier_data = [
-            supplier.to_dict() if hasattr(supplier, "to_dict") else dict(supplier)
-            for supplier in suppliers
-        ]
-
-        # Get purchase data
-        purchase_filters = {"created_at_gte": start_date, "created_at_lte": end_date}
-
-        if supplier_id:
-            purchase_filters["supplier_id"] = supplier_id
-
-        purchases = self.purchase_service.list_purchases(**purchase_filters)
-
-        # Convert to dictionaries
-        purchase_data = [
-            purchase.to_dict() if hasattr(purchase, "to_dict") else dict(purchase)
-            for purchase in purchases
-        ]
-
-        # Filter for material type if specified
-        if material_type:
-            # Filter purchases by material type
-            # This requires looking at purchase items
-            filtered_purchases = []
-
-            for purchase in purchase_data:
-                if not isinstance(purchase, dict):
-                    continue
-
-                # Check if purchase has items
-                items = purchase.get("items", [])
-
-                # Check if any item matches the material type
-                has_matching_item = False
-
-                for item in items:
-                    if not isinstance(item, dict):
-                        continue
-
-                    if item.get("materialType") == material_type:
-                        has_matching_item = True
-                        break
-
-                if has_matching_item:
-                    filtered_purchases.append(purchase)
-
-            purchase_data = filtered_purchases
-
-        # Group purchases by supplier
-        supplier_purchases = {}
-
-        for purchase in purchase_data:
-            if not isinstance(purchase, dict):
-                continue
-
-            supplier_id = purchase.get("supplier_id")
-            if not supplier_id:
-                continue
-
-            if supplier_id not in supplier_purchases:
-                supplier_purchases[supplier_id] = {
-                    "purchase_count": 0,
-                    "total_spent": 0,
-                    "purchases": [],
-                }
-
-            # Add purchase data
-            supplier_purchases[supplier_id]["purchase_count"] += 1
-            supplier_purchases[supplier_id]["total_spent"] += purchase.get("total", 0)
-            supplier_purchases[supplier_id]["purchases"].append(purchase)
-
-        # Calculate supplier performance metrics
-        for supplier_id, data in supplier_purchases.items():
-            # Sort purchases by date
-            purchases = sorted(
-                data["purchases"],
-                key=lambda p: (
-                    p.get("created_at")
-                    if isinstance(p.get("created_at"), datetime)
-                    else (
-                        datetime.fromisoformat(
-                            p.get("created_at").replace("Z", "+00:00")
-                        )
-                        if isinstance(p.get("created_at"), str)
-                        else datetime.min
-                    )
-                ),
-            )
-
-            # Calculate delivery metrics
-            on_time_deliveries = 0
-            late_deliveries = 0
-            delivery_times = []
-
-            for purchase in purchases:
-                # Check if purchase has delivery dates
-                order_date = purchase.get("created_at")
-                delivery_date = purchase.get("deliveryDate")
-                expected_delivery_date = purchase.get("expectedDeliveryDate")
-
-                if not order_date or not delivery_date:
-                    continue
-
-                # Parse dates if they're strings
-                if isinstance(order_date, str):
-                    order_date = datetime.fromisoformat(
-                        order_date.replace("Z", "+00:00")
-                    )
-
-                if isinstance(delivery_date, str):
-                    delivery_date = datetime.fromisoformat(
-                        delivery_date.replace("Z", "+00:00")
-                    )
-
-                # Calculate delivery time
-                delivery_time = (delivery_date - order_date).days
-                delivery_times.append(delivery_time)
-
-                # Check if delivered on time
-                if expected_delivery_date:
-                    if isinstance(expected_delivery_date, str):
-                        expected_delivery_date = datetime.fromisoformat(
-                            expected_delivery_date.replace("Z", "+00:00")
-                        )
-
-                    if delivery_date <= expected_delivery_date:
-                        on_time_deliveries += 1
-                    else:
-                        late_deliveries += 1
-
-            # Calculate metrics
-            data["avg_delivery_time"] = (
-                sum(delivery_times) / len(delivery_times) if delivery_times else 0
-            )
-            data["on_time_delivery_rate"] = (
-                (on_time_deliveries / (on_time_deliveries + late_deliveries) * 100)
-                if (on_time_deliveries + late_deliveries) > 0
-                else 0
-            )
-
-            # Calculate quality metrics if available
-            quality_ratings = []
-            for purchase in purchases:
-                if "qualityRating" in purchase:
-                    quality_ratings.append(purchase["qualityRating"])
-
-            data["avg_quality_rating"] = (
-                sum(quality_ratings) / len(quality_ratings) if quality_ratings else 0
-            )
-
-            # Remove purchases list to reduce size
-            del data["purchases"]
+        # Delivery and rating metrics from the running per-supplier
+        # aggregates (over each supplier's whole history), with the
+        # purchases of the period counted and summed per supplier
+        supplier_data = self.supplier_service.get_supplier_performance(
+            supplier_id, start_date, end_date, material_type
+        )
 
-        # Add purchase data to supplier data
         for supplier in supplier_data:
-            if not isinstance(supplier, dict):
-                continue
-
-            supplier_id = supplier.get("id")
-            if not supplier_id or supplier_id not in supplier_purchases:
-                supplier["purchase_data"] = {
-                    "purchase_count": 0,
-                    "total_spent": 0,
-                    "avg_delivery_time": 0,
-                    "on_time_delivery_rate": 0,
-                    "avg_quality_rating": 0,
-                }
-            else:
-                supplier["purchase_data"] = supplier_purchases[supplier_id]
+            supplier["purchase_data"] = {
+                "purchase_count": supplier["purchase_count"],
+                "total_spent": supplier["total_spent"],
+                "avg_delivery_time": supplier["avg_lead_time"] or 0,
+                "on_time_delivery_rate": supplier["on_time_delivery_rate"] or 0,
+                "avg_quality_rating": supplier["rating"] or 0,
+            }
 
         # Calculate top suppliers by spending
         top_suppliers = sorted(
-            [s for s in supplier_data if isinstance(s, dict)],
-            key=lambda s: s.get("purchase_data", {}).get("total_spent", 0),
+            supplier_data,
+            key=lambda s: s["purchase_data"]["total_spent"],
             reverse=True,
         )[
             :10
@@ -2695,30 +2306,23 @@ class ReportService(BaseService):
             "summary": {
                 "total_suppliers": len(supplier_data),
                 "active_suppliers": len(
-                    [
-                        s
-                        for s in supplier_data
-                        if isinstance(s, dict)
-                        and s.get("purchase_data", {}).get("purchase_count", 0) > 0
-                    ]
+                    [s for s in supplier_data if s["purchase_data"]["purchase_count"] > 0]
+                ),
+                "total_purchases": sum(
+                    s["purchase_data"]["purchase_count"] for s in supplier_data
                 ),
-                "total_purchases": len(purchase_data),
                 "total_spent": sum(
-                    s.get("purchase_data", {}).get("total_spent", 0)
-                    for s in supplier_data
-                    if isinstance(s, dict)
+                    s["purchase_data"]["total_spent"] for s in supplier_data
                 ),
                 "top_suppliers": [
                     {
-                        "id": s.get("id"),
-                        "name": s.get("name", f"Supplier {s.get('id')}"),
-                        "total_spent": s.get("purchase_data", {}).get("total_spent", 0),
-                        "purchase_count": s.get("purchase_data", {}).get(
-                            "purchase_count", 0
-                        ),
-                        "on_time_delivery_rate": s.get("purchase_data", {}).get(
-                            "on_time_delivery_rate", 0
-                        ),
+                        "id": s["id"],
+                        "name": s["name"] or f"Supplier {s['id']}",
+                        "total_spent": s["purchase_data"]["total_spent"],
+                        "purchase_count": s["purchase_data"]["purchase_count"],
+                        "on_time_delivery_rate": s["purchase_data"][
+                            "on_time_delivery_rate"
+                        ],
                     }
                     for s in top_suppliers
                 ],
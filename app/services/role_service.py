@@ -10,6 +10,8 @@ from typing import List, Dict, Any, Optional
 from sqlalchemy.orm import Session
 
 from app.services.base_service import BaseService
+from app.services.cache_service import attach_cached
+from app.services.principal_cache import PrincipalCache
 from app.db.models.role import Role, Permission
 from app.repositories.role_repository import RoleRepository, PermissionRepository
 from app.core.exceptions import EntityNotFoundException, BusinessRuleException
@@ -143,6 +145,9 @@ class RoleService(BaseService[Role]):
             if self.cache_service:
                 self.cache_service.invalidate(f"Role:{role_id}")
                 self.cache_service.invalidate("Roles:list")
+                # Any user holding the role may see different roles or permissions
+                self.cache_service.invalidate_pattern("User:")
+            PrincipalCache.get_instance().clear()
 
             return updated_role
 
@@ -177,6 +182,9 @@ class RoleService(BaseService[Role]):
             if self.cache_service:
                 self.cache_service.invalidate(f"Role:{role_id}")
                 self.cache_service.invalidate("Roles:list")
+                # Any user holding the role may see different roles or permissions
+                self.cache_service.invalidate_pattern("User:")
+            PrincipalCache.get_instance().clear()
 
             return result
 
@@ -249,6 +257,8 @@ class RoleService(BaseService[Role]):
             # Invalidate cache if needed
             if self.cache_service:
                 self.cache_service.invalidate(f"User:{user_id}:roles")
+                self.cache_service.invalidate(f"User:{user_id}:permissions")
+            PrincipalCache.get_instance().invalidate_user(user_id)
 
             return result
 
@@ -269,6 +279,8 @@ class RoleService(BaseService[Role]):
             # Invalidate cache if needed
             if self.cache_service:
                 self.cache_service.invalidate(f"User:{user_id}:roles")
+                self.cache_service.invalidate(f"User:{user_id}:permissions")
+            PrincipalCache.get_instance().invalidate_user(user_id)
 
             return result
 
@@ -287,7 +299,9 @@ class RoleService(BaseService[Role]):
             cache_key = f"User:{user_id}:roles"
             cached = self.cache_service.get(cache_key)
             if cached:
-                return cached
+                attached = attach_cached(self.session, cached)
+                if attached is not None:
+                    return attached
 
         # Get roles from repository
         roles = self.repository.get_user_roles(user_id)
@@ -308,6 +322,13 @@ class RoleService(BaseService[Role]):
         Returns:
             List of unique permission codes
         """
+        # Check cache first
+        if self.cache_service:
+            cache_key = f"User:{user_id}:permissions"
+            cached = self.cache_service.get(cache_key)
+            if cached is not None:
+                return list(cached)
+
         # Get user roles
         roles = self.get_user_roles(user_id)
 
@@ -318,6 +339,10 @@ class RoleService(BaseService[Role]):
             for perm in permissions:
                 all_permissions.add(perm.code)
 
+        # Cache result if needed
+        if self.cache_service:
+            self.cache_service.set(cache_key, list(all_permissions), ttl=3600)
+
         return list(all_permissions)
 
     def has_permission(self, user_id: int, permission_code: str) -> bool:
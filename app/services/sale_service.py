@@ -17,6 +17,7 @@ from app.core.validation import validate_input, validate_entity
 from app.db.models.enums import SaleStatus, PaymentStatus, FulfillmentStatus
 from app.db.models.sales import Sale, SaleItem
 from app.repositories.sale_repository import SaleRepository
+from app.services.analytics_rollup_service import AnalyticsRollupService
 from app.services.base_service import BaseService
 
 logger = logging.getLogger(__name__)
@@ -186,6 +187,7 @@ class SaleService(BaseService[Sale]):
         project_service=None,
         customer_service=None,
         shipment_service=None,
+        analytics_rollup_service=None,
     ):
         """
         Initialize SaleService with dependencies.
@@ -200,6 +202,8 @@ class SaleService(BaseService[Sale]):
             project_service: Optional project service for project creation
             customer_service: Optional customer service for customer operations
             shipment_service: Optional shipment service for fulfillment operations
+            analytics_rollup_service: Optional service maintaining the daily
+                rollups (defaults to one on the same session)
         """
         self.session = session
         self.repository = repository or SaleRepository(session)
@@ -210,6 +214,9 @@ class SaleService(BaseService[Sale]):
         self.project_service = project_service
         self.customer_service = customer_service
         self.shipment_service = shipment_service
+        self.analytics_rollup_service = (
+            analytics_rollup_service or AnalyticsRollupService(session)
+        )
 
     @validate_input(validate_sale)
     def create_sale(self, data: Dict[str, Any]) -> Sale:
@@ -265,6 +272,9 @@ class SaleService(BaseService[Sale]):
                 item_data["sale_id"] = sale.id
                 self.add_sale_item(sale.id, item_data)
 
+            # Bring the day's rollups up to date
+            self.analytics_rollup_service.refresh_sales_days([sale.created_at])
+
             # Publish event if event bus exists
             if self.event_bus:
                 user_id = (
@@ -416,7 +426,7 @@ class SaleService(BaseService[Sale]):
 
             # Invalidate cache if cache service exists
             if self.cache_service:
-                self.cache_service.invalidate(f"Sale:{sale_id}")
+                self._invalidate_entity_cache(sale_id)
 
             return sale_item
 
@@ -487,6 +497,9 @@ class SaleService(BaseService[Sale]):
                 comments=comments,
             )
 
+            # Cancelling drops the sale from its day's rollups
+            self.analytics_rollup_service.refresh_sales_days([sale.created_at])
+
             # Publish event if event bus exists
             if self.event_bus:
                 user_id = (
@@ -505,7 +518,7 @@ class SaleService(BaseService[Sale]):
 
             # Invalidate cache if cache service exists
             if self.cache_service:
-                self.cache_service.invalidate(f"Sale:{sale_id}")
+                self._invalidate_entity_cache(sale_id)
 
             return updated_sale
 
@@ -629,7 +642,7 @@ class SaleService(BaseService[Sale]):
 
             # Invalidate cache if cache service exists
             if self.cache_service:
-                self.cache_service.invalidate(f"Sale:{sale_id}")
+                self._invalidate_entity_cache(sale_id)
 
             return updated_sale
 
@@ -735,7 +748,7 @@ class SaleService(BaseService[Sale]):
 
             # Invalidate cache if cache service exists
             if self.cache_service:
-                self.cache_service.invalidate(f"Sale:{sale_id}")
+                self._invalidate_entity_cache(sale_id)
 
             return updated_sale
 
@@ -913,39 +926,26 @@ class SaleService(BaseService[Sale]):
         if not start_date:
             start_date = end_date - timedelta(days=30)
 
-        # Get sales for the period
-        sales = self.get_sales_by_date_range(start_date, end_date)
+        # One GROUP BY over (status, payment_status) for the period
+        totals = self.repository.get_status_totals(start_date, end_date)
 
         # Calculate metrics
-        total_revenue = sum(
-            sale.total_amount
-            for sale in sales
-            if sale.status != SaleStatus.CANCELLED.value
-        )
-        net_revenue = sum(
-            sale.net_revenue
-            for sale in sales
-            if sale.status != SaleStatus.CANCELLED.value
-        )
-        total_orders = len(
-            [sale for sale in sales if sale.status != SaleStatus.CANCELLED.value]
-        )
+        status_counts = {status.value: 0 for status in SaleStatus}
+        payment_status_counts = {status.value: 0 for status in PaymentStatus}
+        total_revenue = 0.0
+        net_revenue = 0.0
+        total_orders = 0
+        for row in totals:
+            if row["status"] is not None:
+                status_counts[row["status"].value] += row["order_count"]
+            if row["payment_status"] is not None:
+                payment_status_counts[row["payment_status"].value] += row["order_count"]
+            if row["status"] != SaleStatus.CANCELLED:
+                total_revenue += row["total_amount"]
+                net_revenue += row["net_revenue"]
+                total_orders += row["order_count"]
         avg_order_value = total_revenue / total_orders if total_orders > 0 else 0
 
-        # Count sales by status
-        status_counts = {}
-        for status in SaleStatus:
-            status_counts[status.value] = len(
-                [s for s in sales if s.status == status.value]
-            )
-
-        # Count sales by payment status
-        payment_status_counts = {}
-        for status in PaymentStatus:
-            payment_status_counts[status.value] = len(
-                [s for s in sales if s.payment_status == status.value]
-            )
-
         return {
             "period": {
                 "start_date": start_date.isoformat(),
@@ -967,6 +967,33 @@ class SaleService(BaseService[Sale]):
             "payment_status_counts": payment_status_counts,
         }
 
+    def get_revenue_by_period(
+        self,
+        period: str = "month",
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Get revenue bucketed by day, week or month, computed in the database.
+
+        Args:
+            period: Aggregation period ('day', 'week', 'month' or 'year')
+            start_date: Optional start date (defaults to a year ago)
+            end_date: Optional end date (defaults to now)
+
+        Returns:
+            Revenue data points in period order
+
+        Raises:
+            ValidationException: If the period is not supported
+        """
+        if period not in ("day", "week", "month", "year"):
+            raise ValidationException(
+                f"Unsupported revenue period: {period}",
+                {"period": ["Must be one of: day, week, month, year"]},
+            )
+        return self.repository.get_revenue_by_period(period, start_date, end_date)
+
     def _update_sale_totals(self, sale_id: int) -> None:
         """
         Update the total amounts for a sale based on its current items.
@@ -1006,6 +1033,8 @@ class SaleService(BaseService[Sale]):
 
         # Update sale
         self.repository.update(sale_id, update_data)
+        self._invalidate_entity_cache(sale_id)
+        self.analytics_rollup_service.refresh_sales_days([sale.created_at])
 
     def _validate_status_transition(self, current_status: str, new_status: str) -> None:
         """
@@ -12,6 +12,7 @@ from sqlalchemy.orm import Session
 # Removed unused imports to clean up
 # from app.repositories import communication_repository
 from app.services.base_service import BaseService
+from app.core.app_container import AppContainer
 from app.core.events import EventBus
 from app.core.key_manager import KeyManager as KeyService  # Assuming KeyManager is the correct name
 
@@ -49,8 +50,13 @@ class ServiceFactory:
         """
         self.session = session
         self.security_context = security_context
-        self.event_bus = event_bus or EventBus()
-        self.cache_service = cache_service
+
+        # Share the application's cache and event bus instead of building
+        # per-request ones; outside the running app, fall back as before
+        container = AppContainer.current()
+        self.event_bus = event_bus or (container.event_bus if container else EventBus())
+        self.cache_service = cache_service or (container.cache_service if container else None)
+        self.file_store_path = container.file_store_path if container else None
         self.key_service = key_service or KeyService()
         self.file_storage_service = file_storage_service
 
@@ -361,7 +367,7 @@ class ServiceFactory:
         from app.repositories.file_metadata_repository import FileMetadataRepository
         from app.core.config import settings  # Get default path from settings if needed
 
-        effective_base_path = base_path or settings.MEDIA_ASSETS_BASE_PATH  # Example: Use settings
+        effective_base_path = base_path or self.file_store_path or settings.MEDIA_ASSETS_BASE_PATH
         metadata_repository = FileMetadataRepository(self.session)
         return FileStorageService(
             base_path=effective_base_path,
@@ -374,9 +380,11 @@ class ServiceFactory:
         from app.services.dashboard_service import DashboardService
         if "dashboard_service" in self._service_instances:
             return self._service_instances["dashboard_service"]
+        # No cache: the dashboard aggregates every service's data and nothing
+        # invalidates it when that data changes
         service = DashboardService(
             session=self.session, service_factory=self,
-            cache_service=self.cache_service,
+            cache_service=None,
             metrics_service=None  # Assuming lazy init
         )
         self._service_instances["dashboard_service"] = service
@@ -1,10 +1,12 @@
 # app/services/settings_service.py
 
-from typing import List, Optional, Dict, Any, Union
+from typing import List, Optional, Dict, Any, Tuple, Union
 from sqlalchemy.orm import Session
 from datetime import datetime
+import json
 
 from app.services.base_service import BaseService
+from app.services.cache_service import attach_cached
 from app.db.models.settings import (
     SettingsDefinition, SettingsValue, SettingsTemplate, SettingsTemplateItem
 )
@@ -13,6 +15,9 @@ from app.repositories.settings_repository import (
 )
 from app.core.exceptions import EntityNotFoundException, ValidationException
 
+# Scope ID of the single system-wide settings scope
+SYSTEM_SCOPE_ID = "1"
+
 
 class SettingsService:
     """
@@ -21,6 +26,7 @@ class SettingsService:
     Provides functionality for:
     - Managing settings definitions
     - Retrieving setting values at different scopes
+    - Resolving effective settings across the user -> organization -> system chain
     - Setting values at different scopes
     - Working with settings templates
     """
@@ -49,6 +55,9 @@ class SettingsService:
         self.template_repository = template_repository or SettingsTemplateRepository(session)
         self.cache_service = cache_service
 
+        # Resolved snapshots already read by this service (one per request)
+        self._resolved: Dict[Tuple[Optional[str], Optional[str]], Dict[str, Any]] = {}
+
     def get_definition(self, key: str) -> Optional[SettingsDefinition]:
         """
         Get a settings definition by key.
@@ -64,7 +73,9 @@ class SettingsService:
             cache_key = f"settings_definition:{key}"
             cached_definition = self.cache_service.get(cache_key)
             if cached_definition:
-                return cached_definition
+                attached = attach_cached(self.session, cached_definition)
+                if attached is not None:
+                    return attached
 
         # Get from database
         definition = self.definition_repository.get_by_key(key)
@@ -135,6 +146,7 @@ class SettingsService:
             if self.cache_service:
                 self.cache_service.invalidate_pattern("settings_definition:*")
                 self.cache_service.invalidate_pattern("settings_definitions:*")
+            self._invalidate_resolved()
 
             return definition
 
@@ -194,6 +206,7 @@ class SettingsService:
             if self.cache_service:
                 self.cache_service.invalidate(f"settings_definition:{key}")
                 self.cache_service.invalidate_pattern("settings_definitions:*")
+            self._invalidate_resolved()
 
             return definition
 
@@ -230,6 +243,7 @@ class SettingsService:
             if self.cache_service:
                 self.cache_service.invalidate(f"settings_definition:{key}")
                 self.cache_service.invalidate_pattern("settings_definitions:*")
+            self._invalidate_resolved()
 
             return True
 
@@ -331,6 +345,104 @@ class SettingsService:
 
         return result
 
+    def get_resolved_settings(
+            self,
+            user_id: Optional[Union[int, str]] = None,
+            organization_id: Optional[Union[int, str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Get the effective value of every setting for a scope chain.
+
+        Each setting resolves to the value of the most specific scope that
+        sets it (user, then organization, then system), or to its default.
+        All settings are read in one query; the result is kept for the rest
+        of the request and cached per scope chain until a setting, template
+        or definition write invalidates it.
+
+        Args:
+            user_id: ID of the user scope, if any
+            organization_id: ID of the organization scope, if any
+
+        Returns:
+            Dictionary of setting keys and effective values; treat it as
+            read-only, it is shared with other requests
+        """
+        user_id = str(user_id) if user_id is not None else None
+        organization_id = str(organization_id) if organization_id is not None else None
+        memo_key = (user_id, organization_id)
+
+        resolved = self._resolved.get(memo_key)
+        if resolved is not None:
+            return resolved
+
+        cache_key = f"settings_resolved:{user_id or '-'}:{organization_id or '-'}"
+        if self.cache_service:
+            resolved = self.cache_service.get(cache_key)
+
+        if resolved is None:
+            chain = []
+            if user_id is not None:
+                chain.append(("user", user_id))
+            if organization_id is not None:
+                chain.append(("organization", organization_id))
+            chain.append(("system", SYSTEM_SCOPE_ID))
+            resolved = self._resolve_scope_chain(chain)
+
+            if self.cache_service:
+                self.cache_service.set(cache_key, resolved, ttl=3600)
+
+        self._resolved[memo_key] = resolved
+        return resolved
+
+    def _resolve_scope_chain(self, chain: List[Tuple[str, str]]) -> Dict[str, Any]:
+        """
+        Resolve every setting for a scope chain, most specific scope first.
+
+        Args:
+            chain: (scope_type, scope_id) pairs in precedence order
+
+        Returns:
+            Dictionary of setting keys and effective values
+        """
+        precedence = {scope: rank for rank, scope in enumerate(chain)}
+        resolved: Dict[str, Any] = {}
+        resolved_rank: Dict[str, int] = {}
+
+        rows = self.value_repository.get_values_for_scopes(chain)
+        for key, raw_default, scope_type, scope_id, raw_value in rows:
+            if key not in resolved:
+                resolved[key] = _decode_setting(raw_default)
+                resolved_rank[key] = len(chain)
+            if scope_type is None:
+                continue
+            rank = precedence[(scope_type, scope_id)]
+            if rank < resolved_rank[key]:
+                resolved[key] = _decode_setting(raw_value)
+                resolved_rank[key] = rank
+
+        return resolved
+
+    def _invalidate_resolved(
+            self,
+            scope_type: Optional[str] = None,
+            scope_id: Optional[str] = None
+    ) -> None:
+        """
+        Drop resolved snapshots affected by a write.
+
+        Args:
+            scope_type: Scope written to, or None if definitions changed
+            scope_id: ID of the scope written to
+        """
+        self._resolved.clear()
+        if not self.cache_service:
+            return
+        if scope_type == "user":
+            self.cache_service.invalidate_pattern(f"settings_resolved:{scope_id}:*")
+        else:
+            # Organization and system values are inherited by many chains
+            self.cache_service.invalidate_pattern("settings_resolved:*")
+
     def set_setting(
             self,
             key: str,
@@ -374,6 +486,7 @@ class SettingsService:
             if self.cache_service:
                 self.cache_service.invalidate(f"setting:{scope_type}:{scope_id}:{key}")
                 self.cache_service.invalidate_pattern(f"settings:{scope_type}:{scope_id}:*")
+            self._invalidate_resolved(scope_type, scope_id)
 
         except Exception as e:
             # Ensure transaction is rolled back
@@ -499,6 +612,7 @@ class SettingsService:
                 for key in result:
                     self.cache_service.invalidate(f"setting:{scope_type}:{scope_id}:{key}")
                 self.cache_service.invalidate_pattern(f"settings:{scope_type}:{scope_id}:*")
+            self._invalidate_resolved(scope_type, scope_id)
 
             return result
 
@@ -549,10 +663,22 @@ class SettingsService:
             if self.cache_service and result:
                 self.cache_service.invalidate_pattern("settings_definition:*")
                 self.cache_service.invalidate_pattern("settings_definitions:*")
+            if result:
+                self._invalidate_resolved()
 
             return result
 
         except Exception as e:
             # Ensure transaction is rolled back
             self.session.rollback()
-            raise
\ No newline at end of file
+            raise
+
+
+def _decode_setting(raw_value: Optional[str]) -> Any:
+    """Decode a stored JSON setting value the way the models' properties do."""
+    if not raw_value:
+        return None
+    try:
+        return json.loads(raw_value)
+    except ValueError:
+        return None
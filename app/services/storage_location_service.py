@@ -342,12 +342,8 @@ class StorageLocationService(BaseService[StorageLocation]):
             return locations
 
         try:
-            # Get UI settings for storage
-            storage_ui = self.settings_service.get_setting(
-                key="storage_ui",
-                scope_type="user",
-                scope_id=str(user_id)
-            )
+            # Get UI settings for storage (user -> organization -> system, resolved once per request)
+            storage_ui = self.settings_service.get_resolved_settings(user_id=user_id).get("storage_ui")
 
             # If no settings found, return locations as is
             if not storage_ui:
@@ -705,6 +701,7 @@ class StorageLocationService(BaseService[StorageLocation]):
             # Invalidate cache if needed
             if self.cache_service:
                 self.cache_service.invalidate(f"storage_locations:{id}")
+                self._invalidate_entity_cache(id)
                 self.cache_service.invalidate_pattern("storage_locations:*")
                 self.cache_service.invalidate_pattern(f"storage_locations:type:{location.storage_location_type_id}:*")
 
@@ -757,6 +754,7 @@ class StorageLocationService(BaseService[StorageLocation]):
             # Invalidate cache if needed
             if self.cache_service and result:
                 self.cache_service.invalidate(f"storage_locations:{id}")
+                self._invalidate_entity_cache(id)
                 self.cache_service.invalidate_pattern("storage_locations:*")
                 self.cache_service.invalidate_pattern(f"storage_locations:type:{storage_location_type_id}:*")
 
@@ -1125,6 +1123,7 @@ class StorageLocationService(BaseService[StorageLocation]):
                 self.repository.update(
                     storage_id, {"utilized": current_utilized + 1}  # Count as 1 item regardless of quantity
                 )
+                self._invalidate_entity_cache(storage_id)
 
             # Publish event if event bus exists
             if self.event_bus:
@@ -1261,6 +1260,7 @@ class StorageLocationService(BaseService[StorageLocation]):
                     current_utilized = location.utilized or 0
                     new_utilized = max(0, current_utilized - 1)
                     self.repository.update(location_id, {"utilized": new_utilized})
+                    self._invalidate_entity_cache(location_id)
 
             # Invalidate cache if needed
             if self.cache_service and result:
@@ -1518,6 +1518,7 @@ class StorageLocationService(BaseService[StorageLocation]):
 
                         # Update the count
                         self.repository.update(loc_id, {"utilized": count})
+                        self._invalidate_entity_cache(loc_id)
 
                         updated_count += 1
                         updated_locations.append({
@@ -258,6 +258,7 @@ class StorageLocationTypeService(BaseService[StorageLocationType]):
             # Invalidate cache if needed
             if self.cache_service:
                 self.cache_service.invalidate(f"storage_location_types:{id}")
+                self._invalidate_entity_cache(id)
                 self.cache_service.invalidate_pattern("storage_location_types:*")
 
             return updated_type
@@ -302,6 +303,7 @@ class StorageLocationTypeService(BaseService[StorageLocationType]):
             # Invalidate cache if needed
             if self.cache_service and result:
                 self.cache_service.invalidate(f"storage_location_types:{id}")
+                self._invalidate_entity_cache(id)
                 self.cache_service.invalidate_pattern("storage_location_types:*")
 
             return result
@@ -644,6 +646,7 @@ class StorageLocationTypeService(BaseService[StorageLocationType]):
         # Invalidate cache if needed
         if self.cache_service:
             self.cache_service.invalidate(f"storage_location_types:{type_id}")
+            self._invalidate_entity_cache(type_id)
             self.cache_service.invalidate_pattern("storage_location_types:*")
 
         return True
@@ -671,6 +674,7 @@ class StorageLocationTypeService(BaseService[StorageLocationType]):
             # Invalidate cache if needed
             if self.cache_service:
                 self.cache_service.invalidate(f"storage_location_types:{type_id}")
+                self._invalidate_entity_cache(type_id)
                 self.cache_service.invalidate_pattern("storage_location_types:*")
 
             return True
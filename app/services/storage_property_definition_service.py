@@ -249,6 +249,7 @@ class StoragePropertyDefinitionService(BaseService[StoragePropertyDefinition]):
             # Invalidate cache if needed
             if self.cache_service:
                 self.cache_service.invalidate(f"storage_property_definitions:{id}")
+                self._invalidate_entity_cache(id)
                 self.cache_service.invalidate_pattern("storage_property_definitions:*")
 
             return updated_property
@@ -298,6 +299,7 @@ class StoragePropertyDefinitionService(BaseService[StoragePropertyDefinition]):
             # Invalidate cache if needed
             if self.cache_service and result:
                 self.cache_service.invalidate(f"storage_property_definitions:{id}")
+                self._invalidate_entity_cache(id)
                 self.cache_service.invalidate_pattern("storage_property_definitions:*")
 
             return result
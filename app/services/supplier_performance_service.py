@@ -0,0 +1,326 @@
+# File: services/supplier_performance_service.py
+
+from typing import Any, Dict, List, Optional, Tuple
+from datetime import datetime
+import logging
+import math
+
+from sqlalchemy.orm import Session
+
+from app.db.models.enums import PurchaseStatus
+from app.db.models.purchase import Purchase
+from app.db.models.supplier import Supplier
+from app.db.models.supplier_performance import SupplierPerformance
+from app.db.models.supplier_rating import SupplierRating
+from app.repositories.supplier_performance_repository import SupplierPerformanceRepository
+from app.services.base_service import BaseService
+
+logger = logging.getLogger(__name__)
+
+# Weight of a new rating in a supplier's rating moving average
+RATING_EMA_ALPHA = 0.3
+
+# Purchases in these statuses have been received; a purchase counts as a
+# receipt when it first enters one of the first two
+RECEIVED_STATUSES = (PurchaseStatus.RECEIVED, PurchaseStatus.DELIVERED)
+RECEIPT_STATUSES = RECEIVED_STATUSES + (
+    PurchaseStatus.QUALITY_INSPECTION,
+    PurchaseStatus.COMPLETE,
+)
+
+
+def _naive(value: Optional[datetime]) -> Optional[datetime]:
+    """Drop the timezone of a timestamp, as SQLite returns them."""
+    return value.replace(tzinfo=None) if value and value.tzinfo else value
+
+
+def _receipt(
+    ordered_at: Optional[datetime],
+    expected_at: Optional[datetime],
+    received_at: datetime,
+) -> Tuple[float, Optional[bool]]:
+    """
+    Lead time in days and on-time flag of one received purchase.
+
+    Returns:
+        Tuple of lead time (0 when the order time is unknown) and whether
+        it arrived by its expected delivery day (None without one)
+    """
+    ordered_at, expected_at, received_at = (
+        _naive(ordered_at), _naive(expected_at), _naive(received_at)
+    )
+    lead_time = (
+        max((received_at - ordered_at).total_seconds() / 86400.0, 0.0)
+        if ordered_at
+        else 0.0
+    )
+    on_time = None if expected_at is None else received_at.date() <= expected_at.date()
+    return lead_time, on_time
+
+
+def delivery_metrics(aggregates: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Derive delivery and rating metrics from running aggregates.
+
+    Args:
+        aggregates: receipt_count, lead_time_sum, lead_time_sum_sq,
+            due_count, on_time_count, rating_count and rating (average)
+
+    Returns:
+        Dictionary with receipts, avg_lead_time and lead_time_stddev (days),
+        on_time_delivery_rate (percent), rating and rating_count; None
+        where there is nothing to average
+    """
+    receipts = aggregates["receipt_count"] or 0
+    due = aggregates["due_count"] or 0
+    mean = aggregates["lead_time_sum"] / receipts if receipts else None
+    stddev = (
+        math.sqrt(max(aggregates["lead_time_sum_sq"] / receipts - mean * mean, 0.0))
+        if receipts
+        else None
+    )
+    rating = aggregates.get("rating")
+    return {
+        "receipts": receipts,
+        "avg_lead_time": round(mean, 1) if mean is not None else None,
+        "lead_time_stddev": round(stddev, 1) if stddev is not None else None,
+        "on_time_delivery_rate": (
+            round(aggregates["on_time_count"] / due * 100, 1) if due else None
+        ),
+        "rating": round(rating, 2) if rating is not None else None,
+        "rating_count": aggregates["rating_count"] or 0,
+    }
+
+
+class SupplierPerformanceService(BaseService[SupplierPerformance]):
+    """
+    Service maintaining running performance aggregates per supplier.
+
+    The purchase service records each purchase as it is received and the
+    supplier service records each rating, inside their own transactions;
+    supplier rankings, statistics and the performance report then read one
+    aggregate row per supplier instead of every purchase and rating.
+    """
+
+    def __init__(
+        self,
+        session: Session,
+        repository=None,
+        security_context=None,
+        event_bus=None,
+        cache_service=None,
+    ):
+        """
+        Initialize SupplierPerformanceService with dependencies.
+
+        Args:
+            session: Database session for persistence operations
+            repository: Optional repository (defaults to SupplierPerformanceRepository)
+            security_context: Optional security context for authorization
+            event_bus: Optional event bus for publishing domain events
+            cache_service: Optional cache service for data caching
+        """
+        self.session = session
+        self.repository = repository or SupplierPerformanceRepository(session)
+        self.security_context = security_context
+        self.event_bus = event_bus
+        self.cache_service = cache_service
+
+    def record_receipt(
+        self, purchase: Purchase, received_at: Optional[datetime] = None
+    ) -> None:
+        """
+        Add a received purchase to its supplier's aggregates.
+
+        Runs in the caller's transaction. Lead time is counted from the
+        purchase's order date (or creation time); it is on time when
+        received by its expected delivery day.
+
+        Args:
+            purchase: The received purchase
+            received_at: When it was received (defaults to now)
+        """
+        if not purchase.supplier_id:
+            return
+        received_at = received_at or datetime.now()
+        lead_time, on_time = _receipt(
+            purchase.date or purchase.created_at, purchase.delivery_date, received_at
+        )
+        self.repository.add_receipt(purchase.supplier_id, lead_time, on_time, received_at)
+
+    def record_rating(
+        self, supplier_id: int, rating: float, rated_at: Optional[datetime] = None
+    ) -> None:
+        """
+        Add a rating to the supplier's rating count and moving average.
+
+        Runs in the caller's transaction.
+
+        Args:
+            supplier_id: Rated supplier
+            rating: New rating
+            rated_at: When the rating was given (defaults to now)
+        """
+        self.repository.add_rating(
+            supplier_id, rating, RATING_EMA_ALPHA, rated_at or datetime.now()
+        )
+
+    def get_top_suppliers(
+        self, limit: int = 5, min_ratings: int = 1, category: Optional[str] = None
+    ) -> List[Supplier]:
+        """
+        Get the suppliers with the highest rating moving average.
+
+        Args:
+            limit: Maximum number of suppliers to return
+            min_ratings: Minimum number of ratings a supplier needs
+            category: Only include suppliers of this category
+
+        Returns:
+            Suppliers, highest rating first
+        """
+        return self.repository.get_top_rated(limit, min_ratings, category)
+
+    def get_supplier_performance(
+        self,
+        supplier_id: Optional[int] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        material_type: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Get every supplier (or one) with its delivery and rating metrics.
+
+        Args:
+            supplier_id: Only this supplier
+            start_date: With end_date, also count and sum each supplier's
+                purchases created in this period
+            end_date: End of that period
+            material_type: Only count purchases with an item of this
+                material type
+
+        Returns:
+            One dictionary per supplier with id, name, category, status and
+            the metrics of delivery_metrics (plus purchase_count and
+            total_spent when a period is given), in id order
+        """
+        period_totals = (
+            self.repository.get_period_purchase_totals(
+                start_date, end_date, supplier_id, material_type
+            )
+            if start_date and end_date
+            else None
+        )
+        suppliers = []
+        for row in self.repository.get_supplier_rows(supplier_id):
+            supplier = {
+                "id": row["id"],
+                "name": row["name"],
+                "category": row["category"],
+                "status": getattr(row["status"], "value", row["status"]),
+                **delivery_metrics({**row, "rating": row["rating_ema"]}),
+                "last_received_at": (
+                    row["last_received_at"].isoformat() if row["last_received_at"] else None
+                ),
+            }
+            if period_totals is not None:
+                supplier.update(
+                    period_totals.get(row["id"], {"purchase_count": 0, "total_spent": 0.0})
+                )
+            suppliers.append(supplier)
+        return suppliers
+
+    def get_overall_performance(self) -> Dict[str, Any]:
+        """
+        Get delivery and rating metrics over all suppliers.
+
+        Returns:
+            The metrics of delivery_metrics over all receipts and ratings,
+            with rating the average of the suppliers' rating averages, and
+            the number of rated suppliers
+        """
+        totals = self.repository.get_totals()
+        return {
+            **delivery_metrics({**totals, "rating": totals["average_rating"]}),
+            "rated_suppliers": totals["rated_suppliers"],
+        }
+
+    def rebuild(self, supplier_id: Optional[int] = None) -> int:
+        """
+        Recompute the aggregates from the purchase and rating history.
+
+        Purchases record no receipt time, so a purchase in a received status
+        counts as received at its last update. Ratings are replayed in date
+        order. Commits.
+
+        Args:
+            supplier_id: Only rebuild this supplier's aggregates
+
+        Returns:
+            Number of suppliers with aggregates written
+        """
+        rows: Dict[int, Dict[str, Any]] = {}
+
+        def row_of(sid: int) -> Dict[str, Any]:
+            return rows.setdefault(sid, {
+                "supplier_id": sid,
+                "receipt_count": 0,
+                "lead_time_sum": 0.0,
+                "lead_time_sum_sq": 0.0,
+                "due_count": 0,
+                "on_time_count": 0,
+                "rating_count": 0,
+                "rating_ema": None,
+                "last_received_at": None,
+                "last_rated_at": None,
+            })
+
+        purchases = self.session.query(
+            Purchase.supplier_id,
+            Purchase.date,
+            Purchase.created_at,
+            Purchase.updated_at,
+            Purchase.delivery_date,
+        ).filter(
+            Purchase.status.in_(RECEIPT_STATUSES),
+            Purchase.supplier_id.isnot(None),
+        )
+        ratings = self.session.query(
+            SupplierRating.supplier_id,
+            SupplierRating.new_rating,
+            SupplierRating.rating_date,
+        ).order_by(SupplierRating.supplier_id, SupplierRating.rating_date, SupplierRating.id)
+        if supplier_id is not None:
+            purchases = purchases.filter(Purchase.supplier_id == supplier_id)
+            ratings = ratings.filter(SupplierRating.supplier_id == supplier_id)
+
+        for sid, ordered, created, updated, expected in purchases.yield_per(1000):
+            received_at = _naive(updated or created)
+            if received_at is None:
+                continue
+            lead_time, on_time = _receipt(ordered or created, expected, received_at)
+            row = row_of(sid)
+            row["receipt_count"] += 1
+            row["lead_time_sum"] += lead_time
+            row["lead_time_sum_sq"] += lead_time * lead_time
+            row["due_count"] += 0 if on_time is None else 1
+            row["on_time_count"] += 1 if on_time else 0
+            if not row["last_received_at"] or received_at > row["last_received_at"]:
+                row["last_received_at"] = received_at
+
+        for sid, rating, rated_at in ratings.yield_per(1000):
+            row = row_of(sid)
+            row["rating_count"] += 1
+            row["rating_ema"] = (
+                float(rating)
+                if row["rating_ema"] is None
+                else row["rating_ema"] + RATING_EMA_ALPHA * (rating - row["rating_ema"])
+            )
+            row["last_rated_at"] = rated_at
+
+        with self.transaction():
+            self.repository.clear(supplier_id)
+            if rows:
+                self.session.bulk_insert_mappings(SupplierPerformance, list(rows.values()))
+        logger.info(f"Rebuilt performance aggregates of {len(rows)} suppliers")
+        return len(rows)
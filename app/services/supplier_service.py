@@ -23,6 +23,7 @@ from app.repositories.supplier_repository import SupplierRepository
 from app.repositories.supplier_history_repository import SupplierHistoryRepository
 from app.repositories.supplier_rating_repository import SupplierRatingRepository
 from app.services.base_service import BaseService
+from app.services.supplier_performance_service import SupplierPerformanceService
 
 logger = logging.getLogger(__name__)
 
@@ -180,6 +181,7 @@ class SupplierService(BaseService[Supplier]):
         material_service=None,
         supplier_history_repository=None,
         supplier_rating_repository=None,
+        supplier_performance_service=None,
     ):
         """
         Initialize SupplierService with dependencies.
@@ -194,6 +196,9 @@ class SupplierService(BaseService[Supplier]):
             material_service: Optional material service for related materials
             supplier_history_repository: Optional repository for supplier history (status changes)
             supplier_rating_repository: Optional repository for supplier ratings
+            supplier_performance_service: Optional service maintaining the
+                supplier performance aggregates (defaults to one on the same
+                session)
         """
         # Initialize the base service first
         super().__init__(
@@ -212,6 +217,9 @@ class SupplierService(BaseService[Supplier]):
         self.material_service = material_service
         self.supplier_history_repository = supplier_history_repository
         self.supplier_rating_repository = supplier_rating_repository
+        self.supplier_performance_service = (
+            supplier_performance_service or SupplierPerformanceService(session)
+        )
 
     @validate_input(validate_supplier)
     def create_supplier(
@@ -557,6 +565,7 @@ class SupplierService(BaseService[Supplier]):
                 new_rating=rating,
                 comments=comments,
             )
+            self.supplier_performance_service.record_rating(supplier_id, rating)
 
             # Publish event if event bus exists
             if self.event_bus:
@@ -595,13 +604,8 @@ class SupplierService(BaseService[Supplier]):
         Raises:
             SupplierNotFoundException: If supplier not found
         """
-        # Check cache first
-        if self.cache_service:
-            cache_key = f"Supplier:detail:{supplier_id}"
-            cached = self.cache_service.get(cache_key)
-            if cached:
-                return cached
-
+        # Not cached: purchases, materials and ratings change through other
+        # services, which do not invalidate a cached detail view
         # Get supplier
         supplier = self.get_by_id(supplier_id)
         if not supplier:
@@ -631,10 +635,6 @@ class SupplierService(BaseService[Supplier]):
         result["rating_history"] = self._get_rating_history(supplier_id)
         result["rating_metrics"] = self._get_supplier_rating_metrics(supplier_id)
 
-        # Store in cache if cache service exists
-        if self.cache_service:
-            self.cache_service.set(cache_key, result, ttl=3600)  # 1 hour TTL
-
         return result
 
     def _get_supplier_rating_metrics(self, supplier_id: int) -> Dict[str, Any]:
@@ -918,65 +918,46 @@ class SupplierService(BaseService[Supplier]):
         """
         Get top-rated suppliers, optionally filtered by category.
 
+        Ranked by each supplier's rating moving average, read from the
+        performance aggregates in one indexed query.
+
         Args:
             category: Optional category to filter by
             limit: Maximum number of suppliers to return
-            min_ratings: Minimum number of ratings required (if using rating repository)
+            min_ratings: Minimum number of ratings required
 
         Returns:
             List of top-rated suppliers
         """
-        # If we have the supplier rating repository, use its advanced functionality
-        if self.supplier_rating_repository:
-            # Get top rated supplier IDs with their average ratings
-            top_rated = self.supplier_rating_repository.get_top_rated_suppliers(
-                min_ratings=min_ratings, limit=limit
-            )
-
-            if not top_rated:
-                return []
-
-            # Extract IDs and fetch suppliers
-            supplier_ids = [supplier_id for supplier_id, _ in top_rated]
-
-            # Apply category filter if needed
-            suppliers = []
-            for supplier_id in supplier_ids:
-                if category:
-                    supplier = self.repository.get_by_id(supplier_id)
-                    if supplier and supplier.category == category:
-                        suppliers.append(supplier)
-                else:
-                    supplier = self.repository.get_by_id(supplier_id)
-                    if supplier:
-                        suppliers.append(supplier)
-
-                # Honor the limit
-                if len(suppliers) >= limit:
-                    break
-
+        suppliers = self.supplier_performance_service.get_top_suppliers(
+            limit=limit, min_ratings=min_ratings, category=category
+        )
+        if suppliers or self.supplier_performance_service.get_overall_performance()["rating_count"]:
             return suppliers
-        else:
-            # Fall back to simple ordering by the rating field
-            filters = {"order_by": "rating", "order_dir": "desc", "limit": limit}
 
-            if category:
-                filters["category"] = category
+        # No ratings recorded yet: fall back to the suppliers' rating field
+        filters = {"order_by": "rating", "order_dir": "desc", "limit": limit}
+
+        if category:
+            filters["category"] = category
 
-            return self.repository.list(**filters)
+        return self.repository.list(**filters)
 
     def get_supplier_statistics(self) -> Dict[str, Any]:
         """
         Get statistical information about suppliers.
 
+        Distributions are grouped in the database; delivery performance and
+        the average rating come from the supplier performance aggregates.
+
         Returns:
             Dictionary with supplier statistics
         """
         # Count suppliers by status
-        status_counts = {}
-        for status in SupplierStatus:
-            count = len(self.get_suppliers_by_status(status))
-            status_counts[status.value] = count
+        counted = self._count_suppliers_by(Supplier.status)
+        status_counts = {
+            status.value: counted.get(status, 0) for status in SupplierStatus
+        }
 
         # Get category distribution
         category_counts = self._get_category_distribution()
@@ -994,6 +975,8 @@ class SupplierService(BaseService[Supplier]):
             self._get_rating_trends() if self.supplier_rating_repository else {}
         )
 
+        performance = self.supplier_performance_service.get_overall_performance()
+
         return {
             "total_suppliers": sum(status_counts.values()),
             "status_distribution": status_counts,
@@ -1001,11 +984,51 @@ class SupplierService(BaseService[Supplier]):
             "rating_distribution": rating_counts,
             "active_suppliers": status_counts.get(SupplierStatus.ACTIVE.value, 0),
             "inactive_suppliers": status_counts.get(SupplierStatus.INACTIVE.value, 0),
-            "average_rating": self._calculate_average_rating(),
+            "average_rating": (
+                round(performance["rating"], 1)
+                if performance["rating"] is not None
+                else self._calculate_average_rating()
+            ),
+            "delivery_performance": performance,
             "status_trends": status_trends,
             "rating_trends": rating_trends,
         }
 
+    def get_supplier_performance(
+        self,
+        supplier_id: Optional[int] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        material_type: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Get delivery and rating metrics per supplier.
+
+        Args:
+            supplier_id: Only this supplier
+            start_date: With end_date, also include each supplier's purchase
+                count and spend in this period
+            end_date: End of that period
+            material_type: Only count purchases with an item of this
+                material type
+
+        Returns:
+            One dictionary per supplier with receipts, lead time average and
+            standard deviation, on-time delivery rate and rating average
+        """
+        return self.supplier_performance_service.get_supplier_performance(
+            supplier_id, start_date, end_date, material_type
+        )
+
+    def _count_suppliers_by(self, column) -> Dict[Any, int]:
+        """Count suppliers per value of a column in one GROUP BY query."""
+        rows = (
+            self.session.query(column, func.count(Supplier.id))
+            .group_by(column)
+            .all()
+        )
+        return {value: count for value, count in rows}
+
     def _supplier_exists_by_name(self, name: str) -> bool:
         """
         Check if a supplier with the given name already exists.
@@ -1472,18 +1495,10 @@ class SupplierService(BaseService[Supplier]):
         Returns:
             Dictionary with category counts
         """
-        # Get all suppliers
-        suppliers = self.repository.list()
-
-        # Count by category
         category_counts = {}
-        for supplier in suppliers:
-            category = supplier.category or "UNCATEGORIZED"
-            if category in category_counts:
-                category_counts[category] += 1
-            else:
-                category_counts[category] = 1
-
+        for category, count in self._count_suppliers_by(Supplier.category).items():
+            category = category or "UNCATEGORIZED"
+            category_counts[category] = category_counts.get(category, 0) + count
         return category_counts
 
     def _get_rating_distribution(self) -> Dict[str, int]:
@@ -1493,35 +1508,24 @@ class SupplierService(BaseService[Supplier]):
         Returns:
             Dictionary with rating counts
         """
-        # If rating repository is available, get more accurate distribution
-        if self.supplier_rating_repository:
-            suppliers = self.repository.list(fields=["id"])
-
-            # Aggregate results across all suppliers
-            result = {1: 0, 2: 0, 3: 0, 4: 0, 5: 0}
+        rating_counts = {1: 0, 2: 0, 3: 0, 4: 0, 5: 0}
 
-            for supplier in suppliers:
-                # Get distribution for this supplier
-                dist = self.supplier_rating_repository.get_rating_distribution(
-                    supplier.id
-                )
-
-                # Add to overall counts
-                for rating, count in dist.items():
-                    result[rating] += count
-
-            return result
+        # If rating repository is available, count every recorded rating
+        if self.supplier_rating_repository:
+            rows = (
+                self.session.query(SupplierRating.new_rating, func.count(SupplierRating.id))
+                .group_by(SupplierRating.new_rating)
+                .all()
+            )
         else:
             # Fall back to using suppliers' current rating
-            suppliers = self.repository.list()
+            rows = self._count_suppliers_by(Supplier.rating).items()
 
-            # Count by rating
-            rating_counts = {1: 0, 2: 0, 3: 0, 4: 0, 5: 0}
-            for supplier in suppliers:
-                if supplier.rating and 1 <= supplier.rating <= 5:
-                    rating_counts[supplier.rating] += 1
+        for rating, count in rows:
+            if rating and 1 <= rating <= 5:
+                rating_counts[rating] += count
 
-            return rating_counts
+        return rating_counts
 
     def _get_status_change_trends(self) -> Dict[str, Any]:
         """
@@ -1627,33 +1631,11 @@ class SupplierService(BaseService[Supplier]):
         Returns:
             Average rating
         """
-        # If we have the rating repository with aggregation capabilities, use it
+        # If we have the rating repository, average every recorded rating
         if self.supplier_rating_repository:
-            # Get supplier IDs
-            suppliers = self.repository.list(fields=["id"])
-            supplier_ids = [s.id for s in suppliers]
-
-            if not supplier_ids:
-                return 0.0
-
-            # Calculate average rating across all ratings
-            ratings = (
-                self.session.query(func.avg(SupplierRating.new_rating))
-                .filter(SupplierRating.supplier_id.in_(supplier_ids))
-                .scalar()
-            )
-
-            return round(float(ratings) if ratings is not None else 0.0, 1)
+            average = self.session.query(func.avg(SupplierRating.new_rating)).scalar()
         else:
             # Use the supplier.rating field if no rating repository
-            suppliers = self.repository.list()
-
-            # Calculate average rating
-            rated_suppliers = [s for s in suppliers if s.rating is not None]
-            if not rated_suppliers:
-                return 0.0
-
-            total_rating = sum(s.rating for s in rated_suppliers)
-            average_rating = total_rating / len(rated_suppliers)
+            average = self.session.query(func.avg(Supplier.rating)).scalar()
 
-            return round(average_rating, 1)
+        return round(float(average) if average is not None else 0.0, 1)
@@ -1335,6 +1335,7 @@ class ToolService(BaseService[Tool]):
          """ Update tool record using repository. """
          try:
               updated_tool = self.repository.update(tool_id, data)
+              self._invalidate_entity_cache(tool_id)
               if not updated_tool:
                   logger.error(f"Repository update tool returned None for ID {tool_id}.")
                   # Don't necessarily raise here, might just mean no change, but log it.
@@ -1540,7 +1541,9 @@ class ToolService(BaseService[Tool]):
     def _invalidate_tool_caches(self, tool_id: int, list_too: bool = False, detail_too: bool = True):
         """ Invalidate tool cache entries. """
         if not self.cache_service: return
-        keys_invalidated = []
+        # The tool row itself changed; drop the copy get_by_id/get_tool serve
+        self._invalidate_entity_cache(tool_id)
+        keys_invalidated = [self._entity_cache_key(tool_id)]
         if detail_too:
             key = f"Tool:detail:{tool_id}"
             self.cache_service.invalidate(key)
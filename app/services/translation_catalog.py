@@ -0,0 +1,223 @@
+# File: app/services/translation_catalog.py
+
+"""
+In-process Translation Catalog
+
+Keeps entity translations in memory, per entity type and locale, so that
+localized reads do not query entity_translations. Each entity type has a
+version counter in translation_catalog_versions that is bumped by every
+translation write; workers poll the counters and drop only the entity types
+that changed, reloading them lazily on next use.
+"""
+
+import logging
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from app.core.config import settings
+from app.repositories.entity_translation_repository import EntityTranslationRepository
+
+logger = logging.getLogger(__name__)
+
+
+def get_fallback_chain(locale: str, default_locale: Optional[str] = None) -> List[str]:
+    """
+    Get the locales to try, in order, when looking up a translation.
+
+    Uses TRANSLATION_FALLBACK_CHAINS when the locale has an entry there;
+    otherwise walks up the locale's parents and ends with the default locale,
+    e.g. ``de-AT -> de -> en``. Locales are lower-cased to match how
+    translations are stored.
+
+    Args:
+        locale: Requested locale code
+        default_locale: Final fallback locale (defaults to DEFAULT_LOCALE)
+
+    Returns:
+        Ordered list of distinct locale codes
+    """
+    locale = locale.strip().lower()
+    default_locale = (default_locale or settings.DEFAULT_LOCALE).lower()
+
+    configured = {
+        key.lower(): value for key, value in settings.TRANSLATION_FALLBACK_CHAINS.items()
+    }
+    if locale in configured:
+        candidates = [locale] + [code.lower() for code in configured[locale]]
+    else:
+        parts = locale.replace("_", "-").split("-")
+        candidates = ["-".join(parts[:i]) for i in range(len(parts), 0, -1)]
+    candidates.append(default_locale)
+
+    chain = []
+    for code in candidates:
+        if code and code not in chain:
+            chain.append(code)
+    return chain
+
+
+class TranslationCatalog:
+    """
+    Process-wide, versioned cache of entity translations.
+
+    Values are stored as ``{(entity_type, locale): {(entity_id, field_name): value}}``
+    and loaded with one query per entity type and locale the first time they
+    are needed.
+    """
+
+    _instance: Optional["TranslationCatalog"] = None
+    _instance_lock = threading.Lock()
+
+    @classmethod
+    def get_instance(cls) -> "TranslationCatalog":
+        """
+        Get the process-wide catalog.
+
+        Returns:
+            Shared TranslationCatalog instance
+        """
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls(poll_interval=settings.TRANSLATION_CATALOG_POLL_SECONDS)
+            return cls._instance
+
+    def __init__(self, poll_interval: float = 5.0):
+        """
+        Initialize the catalog.
+
+        Args:
+            poll_interval: Minimum seconds between version checks; 0 checks on
+                every access
+        """
+        self.poll_interval = poll_interval
+        self._values: Dict[Tuple[str, str], Dict[Tuple[int, str], str]] = {}
+        self._versions: Dict[str, int] = {}
+        # Bumped on every local invalidation so in-flight loads can detect them
+        self._generations: Dict[str, int] = {}
+        self._last_poll: Optional[float] = None
+        self._lock = threading.Lock()
+        self.stats = {"loads": 0, "polls": 0, "invalidations": 0}
+
+    def lookup(
+            self,
+            repository: EntityTranslationRepository,
+            entity_type: str,
+            entity_id: int,
+            field_name: str,
+            locales: List[str]
+    ) -> Optional[str]:
+        """
+        Look up a translation, trying each locale in turn.
+
+        Args:
+            repository: Translation repository used to poll and load
+            entity_type: Type of entity
+            entity_id: ID of the entity
+            field_name: Name of the field
+            locales: Locales to try, in fallback order
+
+        Returns:
+            The first translation found, or None
+        """
+        for locale in locales:
+            value = self.get_locale_values(repository, entity_type, locale).get(
+                (entity_id, field_name)
+            )
+            if value is not None:
+                return value
+        return None
+
+    def get_locale_values(
+            self,
+            repository: EntityTranslationRepository,
+            entity_type: str,
+            locale: str
+    ) -> Dict[Tuple[int, str], str]:
+        """
+        Get every translation of an entity type in one locale.
+
+        Args:
+            repository: Translation repository used to poll and load
+            entity_type: Type of entity
+            locale: Locale code
+
+        Returns:
+            Dictionary mapping (entity_id, field_name) to translated value;
+            treat it as read-only
+        """
+        self.refresh(repository)
+
+        key = (entity_type, locale)
+        with self._lock:
+            values = self._values.get(key)
+            generation = self._generations.get(entity_type, 0)
+        if values is not None:
+            return values
+
+        values = {
+            (entity_id, field_name): value
+            for entity_id, field_name, value in repository.find_catalog_values(entity_type, locale)
+        }
+        with self._lock:
+            # Only keep the load if nothing was invalidated while it ran
+            if self._generations.get(entity_type, 0) == generation:
+                self._values[key] = values
+                self.stats["loads"] += 1
+        return values
+
+    def refresh(self, repository: EntityTranslationRepository, force: bool = False) -> None:
+        """
+        Drop entity types whose version changed since the last check.
+
+        Checks at most once per poll interval unless forced.
+
+        Args:
+            repository: Translation repository used to read the versions
+            force: Check even if the poll interval has not elapsed
+        """
+        now = time.monotonic()
+        with self._lock:
+            if (
+                not force
+                and self._last_poll is not None
+                and now - self._last_poll < self.poll_interval
+            ):
+                return
+            self._last_poll = now
+
+        try:
+            versions = repository.get_catalog_versions()
+        except Exception as e:
+            logger.warning(f"Could not poll translation catalog versions: {e}")
+            return
+
+        with self._lock:
+            self.stats["polls"] += 1
+            for entity_type, version in versions.items():
+                if self._versions.get(entity_type) != version:
+                    self._drop(entity_type)
+                    self._versions[entity_type] = version
+
+    def invalidate(self, entity_type: Optional[str] = None) -> None:
+        """
+        Drop cached translations after a local write.
+
+        Args:
+            entity_type: Entity type to drop, or None to drop everything
+        """
+        with self._lock:
+            if entity_type is None:
+                for cached_type in {key[0] for key in self._values}:
+                    self._drop(cached_type)
+            else:
+                self._drop(entity_type)
+
+    def _drop(self, entity_type: str) -> None:
+        """Drop one entity type's values; the caller holds the lock."""
+        keys = [key for key in self._values if key[0] == entity_type]
+        for key in keys:
+            del self._values[key]
+        self._generations[entity_type] = self._generations.get(entity_type, 0) + 1
+        if keys:
+            self.stats["invalidations"] += 1
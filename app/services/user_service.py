@@ -20,6 +20,7 @@ from app.services.base_service import BaseService
 from app.db.models.user import User
 from app.db.models.password_reset import PasswordResetToken
 from app.repositories.user_repository import UserRepository
+from app.services.principal_cache import PrincipalCache
 from app.repositories.password_reset_repository import PasswordResetRepository
 from app.core.exceptions import (
     EntityNotFoundException,
@@ -210,6 +211,7 @@ class UserService(BaseService[User]):
 
             if updated_user:
                 logger.info(f"Successfully updated user ID: {user_id}")
+                PrincipalCache.get_instance().invalidate_user(user_id)
                 # Optionally publish event
                 # if self.event_bus:
                 #     self.event_bus.publish("user_updated", user_id=user_id, changes=list(update_data.keys()))
@@ -266,6 +268,7 @@ class UserService(BaseService[User]):
 
             if deleted_user:
                 logger.info(f"Successfully deleted user ID: {user_id}")
+                PrincipalCache.get_instance().invalidate_user(user_id)
                 # Optionally publish event
                 # if self.event_bus:
                 #     self.event_bus.publish("user_deleted", user_id=user_id)
@@ -541,6 +544,7 @@ class UserService(BaseService[User]):
 
                 # Mark token as used
                 self.password_reset_repository.mark_used(token.id)
+                PrincipalCache.get_instance().invalidate_user(user.id)
                 logger.info(f"Password successfully reset for user {user.id}")
 
                 # Refresh user object to reflect changes before returning
@@ -621,6 +625,7 @@ class UserService(BaseService[User]):
                     )
                     raise RuntimeError(f"Failed to change password for user {user_id}")
 
+                PrincipalCache.get_instance().invalidate_user(user_id)
                 logger.info(f"Password successfully changed for user {user_id}")
                 return True
         except (
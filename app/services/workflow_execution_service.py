@@ -16,7 +16,12 @@ from app.db.models.workflow import (
 from app.core.exceptions import (
     EntityNotFoundException, ValidationException, BusinessRuleException
 )
-from app.core.events import global_event_bus, EntityCreatedEvent, EntityUpdatedEvent
+from app.core.events import (
+    global_event_bus, DomainEvent, EntityCreatedEvent, EntityUpdatedEvent,
+    WorkflowCancelledEvent, WorkflowCompletedEvent, WorkflowPausedEvent,
+    WorkflowProgressUpdateEvent, WorkflowResumedEvent, WorkflowStepCompletedEvent,
+    WorkflowStepStartedEvent
+)
 from app.services.workflow_service import WorkflowService
 
 logger = logging.getLogger(__name__)
@@ -101,8 +106,10 @@ class WorkflowExecutionService(BaseService):
             if execution.status != 'active':
                 raise BusinessRuleException(f"Cannot pause execution with status '{execution.status}'")
 
-            # Update execution status
-            success = self.execution_repo.update_execution_status(execution_id, 'paused')
+            # Update execution status, committed below with its event
+            success = self.execution_repo.update_execution_status(
+                execution_id, 'paused', commit=False
+            )
 
             if success:
                 # Record navigation action
@@ -112,12 +119,20 @@ class WorkflowExecutionService(BaseService):
                     )
 
                 # Emit event
+                # Commit the event with the status change and navigation record
                 event = EntityUpdatedEvent(
                     entity_id=execution_id,
                     entity_type="WorkflowExecution",
                     user_id=user_id
                 )
-                global_event_bus.publish(event)
+                self._enqueue_event(execution_id, event)
+                self._enqueue_event(execution_id, WorkflowPausedEvent(
+                    workflow_id=execution.workflow_id,
+                    execution_id=execution_id,
+                    workflow_name=execution.workflow.name,
+                    user_id=user_id
+                ))
+                self.db_session.commit()
 
                 logger.info(f"Paused execution {execution_id} by user {user_id}")
 
@@ -130,6 +145,7 @@ class WorkflowExecutionService(BaseService):
             raise
         except Exception as e:
             logger.error(f"Error pausing execution {execution_id}: {str(e)}")
+            self.db_session.rollback()
             raise
 
     def resume_execution(self, execution_id: int, user_id: int) -> WorkflowExecution:
@@ -149,8 +165,10 @@ class WorkflowExecutionService(BaseService):
             if execution.status != 'paused':
                 raise BusinessRuleException(f"Cannot resume execution with status '{execution.status}'")
 
-            # Update execution status
-            success = self.execution_repo.update_execution_status(execution_id, 'active')
+            # Update execution status, committed below with its event
+            success = self.execution_repo.update_execution_status(
+                execution_id, 'active', commit=False
+            )
 
             if success:
                 # Record navigation action
@@ -159,6 +177,14 @@ class WorkflowExecutionService(BaseService):
                         execution_id, execution.current_step_id, 'resumed'
                     )
 
+                self._enqueue_event(execution_id, WorkflowResumedEvent(
+                    workflow_id=execution.workflow_id,
+                    execution_id=execution_id,
+                    workflow_name=execution.workflow.name,
+                    user_id=user_id
+                ))
+                self.db_session.commit()
+
                 logger.info(f"Resumed execution {execution_id} by user {user_id}")
                 return self.get_execution(execution_id, user_id)
             else:
@@ -168,6 +194,7 @@ class WorkflowExecutionService(BaseService):
             raise
         except Exception as e:
             logger.error(f"Error resuming execution {execution_id}: {str(e)}")
+            self.db_session.rollback()
             raise
 
     def cancel_execution(self, execution_id: int, user_id: int, reason: Optional[str] = None) -> WorkflowExecution:
@@ -198,9 +225,9 @@ class WorkflowExecutionService(BaseService):
                 execution_data['cancellation_reason'] = reason
                 completion_data['execution_data'] = execution_data
 
-            # Update execution status
+            # Update execution status, committed below with its event
             success = self.execution_repo.update_execution_status(
-                execution_id, 'cancelled', completion_data
+                execution_id, 'cancelled', completion_data, commit=False
             )
 
             if success:
@@ -211,6 +238,15 @@ class WorkflowExecutionService(BaseService):
                         {'reason': reason} if reason else None
                     )
 
+                self._enqueue_event(execution_id, WorkflowCancelledEvent(
+                    workflow_id=execution.workflow_id,
+                    execution_id=execution_id,
+                    workflow_name=execution.workflow.name,
+                    reason=reason or "",
+                    user_id=user_id
+                ))
+                self.db_session.commit()
+
                 logger.info(f"Cancelled execution {execution_id} by user {user_id}")
                 return self.get_execution(execution_id, user_id)
             else:
@@ -220,6 +256,7 @@ class WorkflowExecutionService(BaseService):
             raise
         except Exception as e:
             logger.error(f"Error cancelling execution {execution_id}: {str(e)}")
+            self.db_session.rollback()
             raise
 
     # ==================== Step Navigation ====================
@@ -255,8 +292,10 @@ class WorkflowExecutionService(BaseService):
             if not self._can_navigate_to_step(execution, target_step):
                 raise BusinessRuleException("Navigation to this step is not allowed")
 
-            # Update current step
-            success = self.execution_repo.update_current_step(execution_id, target_step_id)
+            # Update current step, committed below with its events
+            success = self.execution_repo.update_current_step(
+                execution_id, target_step_id, commit=False
+            )
 
             if success:
                 # Record navigation
@@ -266,13 +305,28 @@ class WorkflowExecutionService(BaseService):
 
                 # Create or update step execution if needed
                 step_execution = self.execution_repo.get_step_execution(execution_id, target_step_id)
+                started = True
                 if not step_execution:
                     self.execution_repo.create_step_execution(execution_id, target_step_id, 'active')
                 elif step_execution.status == 'ready':
                     self.execution_repo.update_step_execution(
                         execution_id, target_step_id,
-                        {'status': 'active', 'started_at': datetime.utcnow()}
+                        {'status': 'active', 'started_at': datetime.utcnow()},
+                        commit=False
                     )
+                else:
+                    started = False
+
+                if started:
+                    self._enqueue_event(execution_id, WorkflowStepStartedEvent(
+                        workflow_id=execution.workflow_id,
+                        execution_id=execution_id,
+                        step_id=target_step_id,
+                        step_name=target_step.name,
+                        step_type=target_step.step_type,
+                        user_id=user_id
+                    ))
+                self.db_session.commit()
 
                 logger.info(f"Navigated execution {execution_id} to step {target_step_id}")
                 return self.get_execution(execution_id, user_id)
@@ -283,6 +337,7 @@ class WorkflowExecutionService(BaseService):
             raise
         except Exception as e:
             logger.error(f"Error navigating to step: {str(e)}")
+            self.db_session.rollback()
             raise
 
     def complete_step(self, execution_id: int, step_id: int, user_id: int,
@@ -327,7 +382,10 @@ class WorkflowExecutionService(BaseService):
                 'step_data': completion_data.get('step_data') if completion_data else None
             }
 
-            self.execution_repo.update_step_execution(execution_id, step_id, update_data)
+            # Committed below with the step's events
+            self.execution_repo.update_step_execution(
+                execution_id, step_id, update_data, commit=False
+            )
 
             # Record navigation
             self.execution_repo.record_navigation(
@@ -335,21 +393,35 @@ class WorkflowExecutionService(BaseService):
                 {'actual_duration': duration, 'completion_data': completion_data}
             )
 
+            self._enqueue_event(execution_id, WorkflowStepCompletedEvent(
+                workflow_id=execution.workflow_id,
+                execution_id=execution_id,
+                step_id=step_id,
+                step_name=step_execution.step.name,
+                step_type=step_execution.step.step_type,
+                actual_duration=duration,
+                user_id=user_id
+            ))
+
             # Determine next steps
             next_steps = self._determine_next_steps(execution, step_id, completion_data)
 
             # Update execution based on next steps
+            completed = False
             if not next_steps:
                 # No next steps - check if workflow is complete
                 if self._is_workflow_complete(execution):
+                    self._enqueue_progress_event(execution, user_id)
+                    # Commits the step together with the completion
                     self._complete_execution(execution_id, user_id)
+                    completed = True
                 else:
                     # Set to outcome selection or manual navigation mode
                     execution.current_step_id = None
             else:
                 # Move to first next step
                 next_step_id = next_steps[0].id
-                self.execution_repo.update_current_step(execution_id, next_step_id)
+                self.execution_repo.update_current_step(execution_id, next_step_id, commit=False)
 
                 # Create step executions for next steps
                 for next_step in next_steps:
@@ -357,6 +429,10 @@ class WorkflowExecutionService(BaseService):
                     if not existing:
                         self.execution_repo.create_step_execution(execution_id, next_step.id, 'ready')
 
+            if not completed:
+                self._enqueue_progress_event(execution, user_id)
+                self.db_session.commit()
+
             logger.info(f"Completed step {step_id} in execution {execution_id}")
             return self.get_execution(execution_id, user_id)
 
@@ -364,6 +440,7 @@ class WorkflowExecutionService(BaseService):
             raise
         except Exception as e:
             logger.error(f"Error completing step: {str(e)}")
+            self.db_session.rollback()
             raise
 
     def make_decision(self, execution_id: int, step_id: int, decision_option_id: int,
@@ -640,8 +717,10 @@ class WorkflowExecutionService(BaseService):
                 'total_duration': total_duration
             }
 
-            # Update execution status
-            self.execution_repo.update_execution_status(execution_id, 'completed', completion_data)
+            # Update execution status, committed below with its event
+            self.execution_repo.update_execution_status(
+                execution_id, 'completed', completion_data, commit=False
+            )
 
             # Record completion navigation
             self.execution_repo.record_navigation(
@@ -649,20 +728,63 @@ class WorkflowExecutionService(BaseService):
                 {'total_duration': total_duration}
             )
 
-            # Emit completion event
+            # Emit completion event, committed with the status change
             event = EntityUpdatedEvent(
                 entity_id=execution_id,
                 entity_type="WorkflowExecution",
                 user_id=user_id
             )
-            global_event_bus.publish(event)
+            self._enqueue_event(execution_id, event)
+            self._enqueue_event(execution_id, WorkflowCompletedEvent(
+                workflow_id=execution.workflow_id,
+                execution_id=execution_id,
+                workflow_name=execution.workflow.name,
+                outcome_id=execution.selected_outcome_id,
+                total_duration=total_duration,
+                user_id=user_id
+            ))
+            self.db_session.commit()
 
             logger.info(f"Completed workflow execution {execution_id}")
 
         except Exception as e:
             logger.error(f"Error completing execution: {str(e)}")
+            self.db_session.rollback()
             raise
 
+    def _enqueue_event(self, execution_id: int, event: DomainEvent) -> None:
+        """
+        Add an execution event to the outbox in the current transaction.
+
+        Args:
+            execution_id: Execution the event belongs to; its events are
+                delivered in order
+            event: Event to deliver once the transaction commits
+        """
+        global_event_bus.enqueue(
+            self.db_session, event, ordering_key=f"WorkflowExecution:{execution_id}"
+        )
+
+    def _enqueue_progress_event(self, execution: WorkflowExecution, user_id: int) -> None:
+        """
+        Add a progress update for an execution to the outbox.
+
+        Args:
+            execution: Execution whose progress changed
+            user_id: User whose action changed it
+        """
+        self.db_session.flush()
+        progress = self.execution_repo.calculate_execution_progress(execution.id)
+        self._enqueue_event(execution.id, WorkflowProgressUpdateEvent(
+            workflow_id=execution.workflow_id,
+            execution_id=execution.id,
+            total_steps=progress['total_steps'],
+            completed_steps=progress['completed_steps'],
+            progress_percentage=progress['progress_percentage'],
+            estimated_remaining=progress['estimated_remaining_time'],
+            user_id=user_id
+        ))
+
     def _process_decision_action(self, execution_id: int, result_action: str) -> None:
         """
         Process the result action from a decision.
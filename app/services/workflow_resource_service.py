@@ -1,8 +1,10 @@
 # File: app/services/workflow_resource_service.py
 
 import logging
-from typing import List, Optional, Dict, Any, Tuple
-from datetime import datetime, timedelta
+import threading
+import time
+from typing import List, Optional, Dict, Any, Tuple, FrozenSet, Iterable, NamedTuple
+from datetime import date, datetime, timedelta
 from sqlalchemy.orm import Session
 
 from app.services.base_service import BaseService
@@ -11,19 +13,69 @@ from app.services.dynamic_material_service import DynamicMaterialService
 from app.db.models.workflow import (
     WorkflowExecution, WorkflowStep, WorkflowStepResource, WorkflowStepExecution
 )
+from app.core.events import (
+    DomainEvent, EventBus, MaterialStockChanged, ToolCheckedOut, ToolReturned, ToolStatusChanged,
+    ToolMaintenanceScheduled, ToolMaintenanceCompleted,
+    WorkflowResourceReservedEvent, WorkflowResourceReleasedEvent,
+    WorkflowUpdatedEvent, WorkflowDeletedEvent
+)
 from app.core.exceptions import (
     EntityNotFoundException, ValidationException, BusinessRuleException
 )
 
 logger = logging.getLogger(__name__)
 
+# Most workflows whose readiness is kept in the process-wide cache
+READINESS_CACHE_SIZE = 256
+
+# Cached readiness is dropped when an event touches one of its resources;
+# changes made without an event (such as editing a material directly) show
+# up after at most this long
+READINESS_CACHE_TTL_SECONDS = 300
+
+# Tools in these states cannot be used, whatever their checkouts
+OUT_OF_SERVICE_TOOL_STATUSES = ("MAINTENANCE", "DAMAGED", "LOST", "RETIRED")
+
+# Events after which cached readiness of the resources they name is stale.
+# Inventory events are not among them: their material IDs are not the
+# dynamic material IDs that workflow resources refer to
+READINESS_EVENT_TYPES = (
+    MaterialStockChanged,
+    ToolCheckedOut, ToolReturned, ToolStatusChanged,
+    ToolMaintenanceScheduled, ToolMaintenanceCompleted,
+    WorkflowResourceReservedEvent, WorkflowResourceReleasedEvent,
+    WorkflowUpdatedEvent, WorkflowDeletedEvent,
+)
+
+
+class _CachedReadiness(NamedTuple):
+    """A cached readiness result and the resources it depends on."""
+
+    day: date
+    material_ids: FrozenSet[int]
+    tool_ids: FrozenSet[int]
+    cached_at: float
+    readiness: Dict[str, Any]
+
 
 class WorkflowResourceService(BaseService):
     """
     Service for managing workflow resource integration with storage systems.
     Handles material reservations, tool availability, and resource planning.
+
+    Availability of all of a workflow's materials and tools is read with a
+    fixed number of queries. Readiness results are cached per workflow for
+    the whole process and dropped by material stock, tool checkout, maintenance
+    and reservation events (see subscribe_to_events).
     """
 
+    # Readiness by workflow ID, shared by all instances
+    _readiness_cache: Dict[int, _CachedReadiness] = {}
+    _readiness_lock = threading.Lock()
+    # Bumped by every invalidation, so a result computed while resources
+    # changed is not cached
+    _readiness_generation = 0
+
     def __init__(self, session: Session):
         """
         Initialize the workflow resource service.
@@ -41,6 +93,7 @@ class WorkflowResourceService(BaseService):
         self.execution_repo = factory.create_workflow_execution_repository()
         self.workflow_repo = factory.create_workflow_repository()
         self.step_repo = factory.create_workflow_step_repository()
+        self.resource_repo = factory.create_workflow_resource_repository()
 
     # ==================== Resource Planning ====================
 
@@ -67,7 +120,7 @@ class WorkflowResourceService(BaseService):
 
             # Check availability
             material_availability = self._check_material_availability(material_requirements)
-            tool_availability = self._check_tool_availability(tool_requirements)
+            tool_availability = self._check_tool_availability(tool_requirements, workflow.project_id)
 
             # Calculate costs if possible
             estimated_costs = self._calculate_resource_costs(material_requirements, tool_requirements)
@@ -91,16 +144,22 @@ class WorkflowResourceService(BaseService):
             logger.error(f"Error analyzing workflow resources: {str(e)}")
             raise
 
-    def check_execution_readiness(self, workflow_id: int) -> Dict[str, Any]:
+    def check_execution_readiness(self, workflow_id: int, use_cache: bool = True) -> Dict[str, Any]:
         """
         Check if a workflow is ready for execution based on resource availability.
 
         Args:
             workflow_id: Workflow ID to check
+            use_cache: Serve a cached result while none of the workflow's
+                resources changed; a fresh result is cached either way
 
         Returns:
             Readiness assessment
         """
+        cached, generation = self._get_cached_readiness(workflow_id)
+        if use_cache and cached is not None:
+            return cached
+
         try:
             analysis = self.analyze_workflow_resources(workflow_id)
 
@@ -134,6 +193,7 @@ class WorkflowResourceService(BaseService):
                 'recommendations': self._generate_readiness_recommendations(analysis, blocking_issues)
             }
 
+            self._cache_readiness(workflow_id, analysis, readiness, generation)
             return readiness
 
         except Exception as e:
@@ -180,6 +240,10 @@ class WorkflowResourceService(BaseService):
                 execution_id, execution.status, {'execution_data': execution_data}
             )
 
+            self.invalidate_readiness(
+                material_ids=[r['material_id'] for r in material_reservations],
+                tool_ids=[r['tool_id'] for r in tool_reservations],
+            )
             logger.info(f"Reserved resources for execution {execution_id}")
 
             return {
@@ -231,6 +295,10 @@ class WorkflowResourceService(BaseService):
                 execution_id, execution.status, {'execution_data': execution_data}
             )
 
+            self.invalidate_readiness(
+                material_ids=[r.get('material_id') for r in reservations.get('material_reservations', [])],
+                tool_ids=[r.get('tool_id') for r in reservations.get('tool_reservations', [])],
+            )
             logger.info(f"Released {material_count} materials and {tool_count} tools for execution {execution_id}")
             return True
 
@@ -332,6 +400,116 @@ class WorkflowResourceService(BaseService):
             logger.error(f"Error recording step resource usage: {str(e)}")
             return False
 
+    # ==================== Readiness Cache ====================
+
+    @classmethod
+    def subscribe_to_events(cls, event_bus: EventBus) -> None:
+        """
+        Drop cached readiness when stock, tools or reservations change.
+
+        Call once at startup with the bus the material, tool and workflow
+        services publish to.
+
+        Args:
+            event_bus: Event bus to subscribe to
+        """
+        for event_type in READINESS_EVENT_TYPES:
+            event_bus.subscribe(event_type, cls._on_resource_events, batch=True)
+
+    @classmethod
+    def invalidate_readiness(
+        cls,
+        material_ids: Iterable[int] = (),
+        tool_ids: Iterable[int] = (),
+        workflow_ids: Iterable[int] = (),
+    ) -> int:
+        """
+        Drop cached readiness of workflows that use any of the given resources.
+
+        Args:
+            material_ids: Dynamic material IDs that changed
+            tool_ids: Tool IDs that changed
+            workflow_ids: Workflows whose own definition changed
+
+        Returns:
+            Number of cached results dropped
+        """
+        material_ids, tool_ids, workflow_ids = set(material_ids), set(tool_ids), set(workflow_ids)
+        with cls._readiness_lock:
+            cls._readiness_generation += 1
+            stale = [
+                workflow_id for workflow_id, entry in cls._readiness_cache.items()
+                if workflow_id in workflow_ids
+                or not entry.material_ids.isdisjoint(material_ids)
+                or not entry.tool_ids.isdisjoint(tool_ids)
+            ]
+            for workflow_id in stale:
+                del cls._readiness_cache[workflow_id]
+        if stale:
+            logger.debug(f"Dropped cached readiness of workflows {stale}")
+        return len(stale)
+
+    @classmethod
+    def clear_readiness_cache(cls) -> None:
+        """Drop all cached readiness results."""
+        with cls._readiness_lock:
+            cls._readiness_generation += 1
+            cls._readiness_cache.clear()
+
+    @classmethod
+    def _on_resource_events(cls, events: List[DomainEvent]) -> None:
+        """Invalidate the readiness of workflows using resources the events name."""
+        changed = {'material': set(), 'tool': set()}
+        workflow_ids = set()
+        for event in events:
+            if isinstance(event, MaterialStockChanged):
+                items = [('material', event.material_id)]
+            elif isinstance(event, (WorkflowResourceReservedEvent, WorkflowResourceReleasedEvent)):
+                items = [(event.resource_type, event.resource_id)]
+            elif isinstance(event, (WorkflowUpdatedEvent, WorkflowDeletedEvent)):
+                workflow_ids.add(event.workflow_id)
+                continue
+            else:
+                # Tool checkout, return, status and maintenance events
+                items = [('tool', event.tool_id)]
+            for item_type, item_id in items:
+                if item_type in changed:
+                    changed[item_type].add(item_id)
+        cls.invalidate_readiness(changed['material'], changed['tool'], workflow_ids)
+
+    @classmethod
+    def _get_cached_readiness(cls, workflow_id: int) -> Tuple[Optional[Dict[str, Any]], int]:
+        """Get a still-valid cached readiness result and the current generation."""
+        with cls._readiness_lock:
+            entry = cls._readiness_cache.get(workflow_id)
+            generation = cls._readiness_generation
+        if (
+            entry is not None
+            and entry.day == date.today()
+            and time.monotonic() - entry.cached_at < READINESS_CACHE_TTL_SECONDS
+        ):
+            return entry.readiness, generation
+        return None, generation
+
+    @classmethod
+    def _cache_readiness(cls, workflow_id: int, analysis: Dict[str, Any],
+                         readiness: Dict[str, Any], generation: int) -> None:
+        """Cache a readiness result unless resources changed while it was computed."""
+        entry = _CachedReadiness(
+            day=date.today(),
+            material_ids=frozenset(m['material_id'] for m in analysis['material_requirements']),
+            tool_ids=frozenset(t['tool_id'] for t in analysis['tool_requirements']),
+            cached_at=time.monotonic(),
+            readiness=readiness,
+        )
+        with cls._readiness_lock:
+            if generation != cls._readiness_generation:
+                return
+            cls._readiness_cache.pop(workflow_id, None)
+            while len(cls._readiness_cache) >= READINESS_CACHE_SIZE:
+                del cls._readiness_cache[next(iter(cls._readiness_cache))]
+            cls._readiness_cache[workflow_id] = entry
+
     # ==================== Private Helper Methods ====================
 
     def _aggregate_material_requirements(self, steps: List[WorkflowStep]) -> List[Dict[str, Any]]:
@@ -401,70 +579,85 @@ class WorkflowResourceService(BaseService):
         return list(tool_usage.values())
 
     def _check_material_availability(self, material_requirements: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Check availability of required materials."""
-        availability = []
+        """
+        Check availability of required materials.
 
+        Stock of all materials is read in one batch; quantities reserved by
+        running executions are not available.
+        """
+        material_ids = [requirement['material_id'] for requirement in material_requirements]
+        stock = self.resource_repo.get_material_stock(material_ids)
+        reserved = self.resource_repo.get_reserved_material_quantities(material_ids)
+
+        availability = []
         for requirement in material_requirements:
             material_id = requirement['material_id']
             required_quantity = requirement['total_quantity']
+            material = stock.get(material_id)
+            on_hand = material['quantity'] if material else 0
+            reserved_quantity = reserved.get(material_id, 0)
+            available_quantity = max(on_hand - reserved_quantity, 0)
 
-            try:
-                material = self.dynamic_material_service.get_material(material_id)
-                if material:
-                    available_quantity = material.quantity or 0
-                    available = available_quantity >= required_quantity
-
-                    availability.append({
-                        'material_id': material_id,
-                        'name': material.name,
-                        'required_quantity': required_quantity,
-                        'available_quantity': available_quantity,
-                        'available': available,
-                        'required': requirement['any_required'],
-                        'unit': requirement['unit']
-                    })
-                else:
-                    availability.append({
-                        'material_id': material_id,
-                        'name': f'Material_{material_id}',
-                        'required_quantity': required_quantity,
-                        'available_quantity': 0,
-                        'available': False,
-                        'required': requirement['any_required'],
-                        'unit': requirement['unit']
-                    })
-
-            except Exception as e:
-                logger.error(f"Error checking material {material_id}: {str(e)}")
-                availability.append({
-                    'material_id': material_id,
-                    'name': f'Material_{material_id}',
-                    'required_quantity': required_quantity,
-                    'available_quantity': 0,
-                    'available': False,
-                    'required': requirement['any_required'],
-                    'unit': requirement.get('unit', 'units'),
-                    'error': str(e)
-                })
+            availability.append({
+                'material_id': material_id,
+                'name': material['name'] if material else f'Material_{material_id}',
+                'required_quantity': required_quantity,
+                'on_hand_quantity': on_hand,
+                'reserved_quantity': reserved_quantity,
+                'available_quantity': available_quantity,
+                'available': material is not None and available_quantity >= required_quantity,
+                'required': requirement['any_required'],
+                'unit': requirement['unit'] or (material['unit'] if material else None)
+            })
 
         return availability
 
-    def _check_tool_availability(self, tool_requirements: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Check availability of required tools."""
-        availability = []
+    def _check_tool_availability(self, tool_requirements: List[Dict[str, Any]],
+                                 project_id: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Check availability of required tools.
 
+        A tool is unavailable when it is out of service, in a maintenance
+        window, or checked out other than to the workflow's project.
+        """
+        tools = self.resource_repo.get_tool_availability(
+            [requirement['tool_id'] for requirement in tool_requirements], project_id
+        )
+
+        availability = []
         for requirement in tool_requirements:
             tool_id = requirement['tool_id']
+            tool = tools.get(tool_id)
+            if tool is None:
+                reason = 'not_found'
+            elif tool['status'] in OUT_OF_SERVICE_TOOL_STATUSES:
+                reason = tool['status'].lower()
+            elif tool['active_maintenance']:
+                reason = 'maintenance'
+            elif tool['open_checkouts'] > tool['project_checkouts'] or (
+                    tool['status'] == 'CHECKED_OUT' and not tool['project_checkouts']):
+                reason = 'checked_out'
+            else:
+                reason = None
+
+            availability_window = None
+            if tool is not None:
+                checked_out_until = tool['checked_out_until'] if reason == 'checked_out' else None
+                availability_window = {
+                    'available_from': checked_out_until.isoformat() if checked_out_until else None,
+                    'next_maintenance': (
+                        tool['next_maintenance'].isoformat() if tool['next_maintenance'] else None
+                    ),
+                }
 
-            # In a real implementation, check tool availability from tool service
-            # For now, assume tools are available
             availability.append({
                 'tool_id': tool_id,
-                'name': f'Tool_{tool_id}',
+                'name': tool['name'] if tool else f'Tool_{tool_id}',
                 'total_usage_time': requirement['total_usage_time'],
-                'available': True,  # Would check actual availability
+                'available': reason is None,
+                'unavailable_reason': reason,
                 'required': requirement['any_required'],
-                'availability_window': None  # Would check scheduling
+                'availability_window': availability_window
             })
 
         return availability
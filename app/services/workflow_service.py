@@ -16,7 +16,9 @@ from app.db.models.workflow import (
 from app.core.exceptions import (
     EntityNotFoundException, ValidationException, BusinessRuleException
 )
-from app.core.events import global_event_bus, EntityCreatedEvent, EntityUpdatedEvent
+from app.core.events import (
+    global_event_bus, EntityCreatedEvent, EntityUpdatedEvent, WorkflowStartedEvent
+)
 from app.services.enum_service import EnumService
 
 logger = logging.getLogger(__name__)
@@ -448,6 +450,18 @@ class WorkflowService(BaseService):
                 user_id=user_id
             )
             global_event_bus.publish(event)
+            global_event_bus.enqueue(
+                self.db_session,
+                WorkflowStartedEvent(
+                    workflow_id=workflow_id,
+                    execution_id=execution.id,
+                    workflow_name=workflow.name,
+                    selected_outcome_id=selected_outcome_id,
+                    user_id=user_id
+                ),
+                ordering_key=f"WorkflowExecution:{execution.id}"
+            )
+            self.db_session.commit()
 
             logger.info(f"Started execution {execution.id} for workflow {workflow_id} by user {user_id}")
             return execution
@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+"""
+Backfill the daily sales and purchase rollups.
+
+The sale, refund and purchase services keep the rollups of the days they
+touch up to date; run this once after creating the rollup tables, or after
+changing records behind the services' backs, to rebuild a range of days
+from the raw sales, refunds and purchases.
+"""
+
+import sys
+import logging
+import argparse
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Optional
+
+# Add project root to Python path
+script_dir = Path(__file__).resolve().parent
+project_root = script_dir.parent if script_dir.name == "scripts" else script_dir
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+logger = logging.getLogger(__name__)
+
+
+def backfill_analytics_rollups(
+    start: datetime, end: Optional[datetime] = None
+) -> Dict[str, int]:
+    """
+    Rebuild the rollups of every day from start to end.
+
+    Args:
+        start: First day to rebuild
+        end: Last day to rebuild (defaults to today)
+
+    Returns:
+        Dictionary with the number of sales and purchase rollup rows written
+    """
+    from app.db.session import SessionLocal
+    from app.services.analytics_rollup_service import AnalyticsRollupService
+
+    db = SessionLocal()
+    try:
+        written = AnalyticsRollupService(db).backfill(start, end)
+    finally:
+        db.close()
+
+    logger.info(
+        f"Analytics rollups: {written['sales_rows']} sales rows, "
+        f"{written['purchase_rows']} purchase rows"
+    )
+    return written
+
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+    )
+    parser = argparse.ArgumentParser(description="Backfill the daily sales and purchase rollups.")
+    parser.add_argument(
+        "--start", type=datetime.fromisoformat, required=True,
+        help="First day to rebuild (YYYY-MM-DD)",
+    )
+    parser.add_argument(
+        "--end", type=datetime.fromisoformat, default=None,
+        help="Last day to rebuild (YYYY-MM-DD, defaults to today)",
+    )
+    args = parser.parse_args()
+    backfill_analytics_rollups(args.start, args.end)
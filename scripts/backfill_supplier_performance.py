@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+"""
+Backfill the running supplier performance aggregates.
+
+The purchase and supplier services keep the aggregates up to date as
+purchases are received and suppliers rated; run this once after creating
+the aggregate table, or after changing purchases or ratings behind the
+services' backs, to recompute them from the purchase and rating history.
+"""
+
+import sys
+import logging
+import argparse
+from pathlib import Path
+from typing import Optional
+
+# Add project root to Python path
+script_dir = Path(__file__).resolve().parent
+project_root = script_dir.parent if script_dir.name == "scripts" else script_dir
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+logger = logging.getLogger(__name__)
+
+
+def backfill_supplier_performance(supplier_id: Optional[int] = None) -> int:
+    """
+    Recompute the aggregates of every supplier, or of one.
+
+    Args:
+        supplier_id: Only rebuild this supplier's aggregates
+
+    Returns:
+        Number of suppliers with aggregates written
+    """
+    from app.db.session import SessionLocal
+    from app.services.supplier_performance_service import SupplierPerformanceService
+
+    db = SessionLocal()
+    try:
+        written = SupplierPerformanceService(db).rebuild(supplier_id)
+    finally:
+        db.close()
+
+    logger.info(f"Supplier performance: {written} suppliers")
+    return written
+
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+    )
+    parser = argparse.ArgumentParser(
+        description="Backfill the running supplier performance aggregates."
+    )
+    parser.add_argument(
+        "--supplier-id", type=int, default=None,
+        help="Only rebuild this supplier (defaults to all suppliers)",
+    )
+    args = parser.parse_args()
+    backfill_supplier_performance(args.supplier_id)
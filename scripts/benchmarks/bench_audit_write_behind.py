@@ -0,0 +1,123 @@
+#!/usr/bin/env python
+"""
+Benchmark audit trail recording cost.
+
+Records a stream of entity-change audit entries against a file-backed
+SQLite database, once committing each record as it is made (what a
+repository-backed AuditService does) and once through the write-behind
+AuditWriter. Reports the time the caller spends per record and the time
+until every record is durable.
+"""
+
+import sys
+import time
+import logging
+import argparse
+import tempfile
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).resolve().parents[2]
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+
+def parse_arguments():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Compare per-record commits with the write-behind audit writer."
+    )
+    parser.add_argument(
+        "--records", type=int, default=5000, help="Audit records per run"
+    )
+    parser.add_argument(
+        "--batch-size", type=int, default=500, help="Rows per write-behind insert"
+    )
+    return parser.parse_args()
+
+
+def build_database(directory: str):
+    """Create a file-backed database with the audit log table."""
+    from app.db.models.audit import AuditRecord
+
+    engine = create_engine(f"sqlite:///{directory}/audit_bench.db")
+    AuditRecord.__table__.create(bind=engine)
+    return engine, sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+def record_all(audit, count: int) -> None:
+    """Record the audit stream through a service."""
+    for i in range(count):
+        audit.record_entity_change(
+            "Material", i, "update",
+            {"quantity": {"old": i, "new": i + 1}, "status": {"old": "in_stock", "new": "low_stock"}},
+            entity_name=f"Material {i}", user_id=i % 20 + 1, metadata={"source": "bench"},
+        )
+
+
+class CommitPerRecordRepository:
+    """Stores each audit record in its own transaction."""
+
+    def __init__(self, session_factory):
+        from app.db.models.audit import AuditRecord
+
+        self.model = AuditRecord
+        self.session_factory = session_factory
+
+    def create(self, data):
+        session = self.session_factory()
+        try:
+            values = dict(data)
+            values["audit_metadata"] = values.pop("metadata")
+            session.add(self.model(**values))
+            session.commit()
+        finally:
+            session.close()
+
+
+def main():
+    """Main entry point for the benchmark."""
+    args = parse_arguments()
+    logging.getLogger("app.services.audit_service").setLevel(logging.WARNING)
+    from app.services.audit_service import AuditService
+    from app.services.audit_writer import AuditWriter
+
+    with tempfile.TemporaryDirectory() as directory:
+        engine, session_factory = build_database(directory)
+
+        audit = AuditService(None, audit_repository=CommitPerRecordRepository(session_factory))
+        started = time.perf_counter()
+        record_all(audit, args.records)
+        direct = time.perf_counter() - started
+
+        writer = AuditWriter(session_factory, batch_size=args.batch_size, flush_interval=1.0)
+        audit = AuditService(None, audit_writer=writer)
+        started = time.perf_counter()
+        record_all(audit, args.records)
+        caller = time.perf_counter() - started
+        writer.stop()
+        durable = time.perf_counter() - started
+        engine.dispose()
+
+    logger.info(f"{args.records} audit records")
+    logger.info(
+        f"Commit per record: {direct * 1e6 / args.records:.0f} us per record, "
+        f"{direct:.2f} s until durable"
+    )
+    logger.info(
+        f"Write-behind:      {caller * 1e6 / args.records:.1f} us per record, "
+        f"{durable:.2f} s until durable ({writer.get_stats()['written']} written)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+#!/usr/bin/env python
+"""
+Benchmark authentication overhead per request.
+
+Resolves bearer tokens through get_current_user the way every authenticated
+request does, once with the principal cache disabled and once enabled, and
+reports the time and database queries spent per request. A pool of users
+with a few roles each makes requests round-robin, so with the cache enabled
+only each token's first request reaches the database.
+"""
+
+import sys
+import time
+import logging
+import argparse
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).resolve().parents[2]
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from sqlalchemy import create_engine, event, insert
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+
+def parse_arguments():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Measure get_current_user cost with and without the principal cache."
+    )
+    parser.add_argument(
+        "--requests", type=int, default=5000, help="Authenticated requests per run"
+    )
+    parser.add_argument(
+        "--users", type=int, default=100, help="Distinct users (one token each)"
+    )
+    return parser.parse_args()
+
+
+def build_database(args):
+    """Create an in-memory database with users, roles and permissions."""
+    from app.db.models.base import Base
+    from app.db.models.associations import role_permission, user_role
+    from app.db.models.role import Permission, Role
+    from app.db.models.user import User
+
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    Base.metadata.create_all(bind=engine)
+    session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    db = session_factory()
+    roles = [Role(name=f"role_{i}", description="bench") for i in range(3)]
+    permissions = [
+        Permission(code=f"perm_{i}", name=f"Permission {i}", resource="bench")
+        for i in range(9)
+    ]
+    users = [
+        User(
+            email=f"user{i}@example.com", username=f"user{i}",
+            hashed_password="not-a-real-hash", is_active=True,
+        )
+        for i in range(args.users)
+    ]
+    db.add_all(roles + permissions + users)
+    db.flush()
+    db.execute(insert(role_permission), [
+        {"role_id": role.id, "permission_id": permission.id}
+        for index, role in enumerate(roles)
+        for permission in permissions[index * 3:(index + 1) * 3]
+    ])
+    db.execute(insert(user_role), [
+        {"user_id": user.id, "role_id": role.id}
+        for user in users
+        for role in roles[:2]
+    ])
+    db.commit()
+    user_ids = [user.id for user in users]
+    db.close()
+    return engine, session_factory, user_ids
+
+
+def measure(args, engine, session_factory, tokens, ttl: float) -> dict:
+    """Authenticate the request stream and collect query counts and timings."""
+    from app.api.deps import get_current_active_user, get_current_user
+    from app.services.principal_cache import PrincipalCache
+
+    PrincipalCache._instance = PrincipalCache(ttl=ttl)
+    statements = []
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", count)
+    started = time.perf_counter()
+    try:
+        for request_number in range(args.requests):
+            db = session_factory()
+            try:
+                user = get_current_user(db=db, token=tokens[request_number % len(tokens)])
+                user = get_current_active_user(current_user=user)
+                # PermissionsChecker reads the roles of every authenticated user
+                set(role.name for role in user.roles)
+            finally:
+                db.close()
+    finally:
+        event.remove(engine, "before_cursor_execute", count)
+    elapsed = time.perf_counter() - started
+
+    return {
+        "queries_per_request": len(statements) / args.requests,
+        "us_per_request": elapsed * 1_000_000 / args.requests,
+        "stats": PrincipalCache.get_instance().get_stats(),
+    }
+
+
+def main():
+    """Main entry point for the benchmark."""
+    args = parse_arguments()
+    from app.core.security import create_access_token
+
+    engine, session_factory, user_ids = build_database(args)
+    tokens = [create_access_token(user_id) for user_id in user_ids]
+
+    uncached = measure(args, engine, session_factory, tokens, ttl=0)
+    cached = measure(args, engine, session_factory, tokens, ttl=30)
+
+    logger.info(f"{args.requests} requests from {args.users} users")
+    logger.info(
+        f"Without principal cache: {uncached['queries_per_request']:.2f} queries, "
+        f"{uncached['us_per_request']:.0f} us per request"
+    )
+    logger.info(
+        f"With principal cache:    {cached['queries_per_request']:.2f} queries, "
+        f"{cached['us_per_request']:.0f} us per request "
+        f"({cached['stats']['hits']} hits, {cached['stats']['misses']} misses)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+#!/usr/bin/env python
+"""
+Benchmark the shared application cache on hot read paths.
+
+Simulates a stream of requests, each with its own session, that read
+settings, a user's permissions and the enum catalog - the lookups nearly
+every page load makes. Runs the stream once without a cache, as every
+request did while services got no CacheService, and once with the single
+CacheService owned by the application container, then reports queries per
+request, time per request and the cache hit rate.
+"""
+
+import sys
+import time
+import logging
+import argparse
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).resolve().parents[2]
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from sqlalchemy import create_engine, event, insert
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+
+def parse_arguments():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Compare settings, role and enum reads with and without the shared cache."
+    )
+    parser.add_argument(
+        "--requests", type=int, default=2000, help="Simulated requests per run"
+    )
+    parser.add_argument(
+        "--users", type=int, default=50, help="Distinct users making requests"
+    )
+    parser.add_argument(
+        "--settings", type=int, default=20, help="Settings read per request"
+    )
+    return parser.parse_args()
+
+
+def build_database(args):
+    """Create an in-memory database with settings, roles and permissions."""
+    from app.db.models.base import Base
+    from app.db.models.associations import role_permission, user_role
+    from app.db.models.role import Permission, Role
+    from app.db.models.settings import SettingsDefinition, SettingsValue
+
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    Base.metadata.create_all(bind=engine)
+    session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    db = session_factory()
+    for i in range(args.settings):
+        definition = SettingsDefinition(
+            key=f"bench.setting_{i}", name=f"Setting {i}", data_type="string",
+            category="bench", applies_to="user",
+        )
+        definition.default_value = f"default {i}"
+        db.add(definition)
+    db.flush()
+    for i in range(0, args.settings, 2):
+        value = SettingsValue(scope_type="system", scope_id="1", setting_key=f"bench.setting_{i}")
+        value.value = f"system {i}"
+        db.add(value)
+
+    roles = [Role(name=f"role_{i}", description="bench") for i in range(3)]
+    permissions = [
+        Permission(code=f"perm_{i}", name=f"Permission {i}", resource="bench")
+        for i in range(12)
+    ]
+    db.add_all(roles + permissions)
+    db.flush()
+    db.execute(insert(role_permission), [
+        {"role_id": role.id, "permission_id": permission.id}
+        for index, role in enumerate(roles)
+        for permission in permissions[index * 4:(index + 1) * 4]
+    ])
+    db.execute(insert(user_role), [
+        {"user_id": user_id, "role_id": role.id}
+        for user_id in range(1, args.users + 1)
+        for role in roles[:2]
+    ])
+    db.commit()
+    db.close()
+    return engine, session_factory
+
+
+def run_requests(args, session_factory, cache_service) -> None:
+    """Serve the simulated requests, each with a fresh session."""
+    from app.services.enum_service import EnumService
+    from app.services.role_service import RoleService
+    from app.services.settings_service import SettingsService
+
+    for request_number in range(args.requests):
+        db = session_factory()
+        try:
+            settings_service = SettingsService(db, cache_service=cache_service)
+            for i in range(args.settings):
+                settings_service.get_setting(f"bench.setting_{i}")
+
+            role_service = RoleService(db, cache_service=cache_service)
+            role_service.get_user_permissions(request_number % args.users + 1)
+
+            EnumService(db).get_all_enums("en")
+        finally:
+            db.close()
+
+
+def measure(args, engine, session_factory, cache_service) -> dict:
+    """Run the request stream and collect query counts and timings."""
+    statements = []
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", count)
+    started = time.perf_counter()
+    try:
+        run_requests(args, session_factory, cache_service)
+    finally:
+        event.remove(engine, "before_cursor_execute", count)
+    elapsed = time.perf_counter() - started
+
+    results = {
+        "queries_per_request": len(statements) / args.requests,
+        "ms_per_request": elapsed * 1000 / args.requests,
+    }
+    if cache_service is not None:
+        results["hit_rate"] = cache_service.get_stats()["hit_rate"]
+    return results
+
+
+def main():
+    """Main entry point for the benchmark."""
+    args = parse_arguments()
+    from app.services.cache_service import CacheService
+
+    engine, session_factory = build_database(args)
+
+    uncached = measure(args, engine, session_factory, None)
+    cache_service = CacheService(config={"max_size": 10000, "maintenance_interval": 0})
+    cached = measure(args, engine, session_factory, cache_service)
+
+    logger.info(
+        f"{args.requests} requests, {args.users} users, {args.settings} settings each"
+    )
+    logger.info(
+        f"Without cache: {uncached['queries_per_request']:.1f} queries, "
+        f"{uncached['ms_per_request']:.2f} ms per request"
+    )
+    logger.info(
+        f"Shared cache:  {cached['queries_per_request']:.1f} queries, "
+        f"{cached['ms_per_request']:.2f} ms per request "
+        f"(hit rate {cached['hit_rate']:.1%})"
+    )
+
+
+if __name__ == "__main__":
+    main()
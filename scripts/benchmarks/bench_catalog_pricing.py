@@ -0,0 +1,169 @@
+#!/usr/bin/env python
+"""
+Benchmark pricing a 100k-product catalog.
+
+Fills a file-backed SQLite database with products, then prices the whole
+catalog twice: once loading every product object and applying the pricing
+calculator's formulas one product at a time, and once reading the cost
+columns in one query and pricing them together with PricingService, which
+uses NumPy when it is installed.
+"""
+
+import sys
+import time
+import random
+import logging
+import argparse
+import tempfile
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).resolve().parents[2]
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+PARAMETERS = {
+    "overhead": 20.0,
+    "target_margin": 40.0,
+    "shipping_cost": 6.0,
+    "packaging_cost": 1.5,
+    "platform_fees": 6.5,
+    "marketing_cost": 2.0,
+}
+
+
+def parse_arguments():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Compare per-product and columnar catalog pricing."
+    )
+    parser.add_argument("--products", type=int, default=100000, help="Products in the catalog")
+    parser.add_argument(
+        "--material-change", type=float, default=8.0, help="What-if material cost change (%%)"
+    )
+    return parser.parse_args()
+
+
+def build_database(directory: str, args):
+    """Create the product table and fill it with a random catalog."""
+    from app.db.models.base import Base
+    from app.db.models.inventory import Inventory
+    from app.db.models.material import Material
+    from app.db.models.product import Product
+    from app.db.models.tool import Tool
+
+    engine = create_engine(f"sqlite:///{directory}/pricing_bench.db")
+    # Loading a product eagerly joins its inventory record and that record's item
+    tables = [model.__table__ for model in (Product, Inventory, Material, Tool)]
+    Base.metadata.create_all(bind=engine, tables=tables)
+
+    rng = random.Random(47)
+    rows = []
+    for product_id in range(1, args.products + 1):
+        material, hardware = rng.uniform(5, 60), rng.uniform(0, 15)
+        labor, overhead = rng.uniform(5, 80), rng.uniform(0, 10)
+        split = rng.random() < 0.9
+        rows.append({
+            "id": product_id,
+            "name": f"Product {product_id}",
+            "sku": f"BENCH-{product_id:06d}",
+            "selling_price": round(rng.uniform(30, 400), 2),
+            "total_cost": material + hardware + labor + overhead,
+            "material_cost": material if split else None,
+            "hardware_cost": hardware if split else None,
+            "labor_cost": labor if split else None,
+            "overhead_cost": overhead if split else None,
+        })
+    with engine.begin() as conn:
+        for start in range(0, len(rows), 20000):
+            conn.execute(insert(Product.__table__), rows[start:start + 20000])
+    return engine, sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+def price_objects(session, material_change: float) -> dict:
+    """Load every product and price it on its own, as a per-product loop would."""
+    from app.db.models.product import Product
+
+    kept = 1 - PARAMETERS["platform_fees"] / 100
+    margins = []
+    suggested = []
+    for product in session.query(Product).order_by(Product.id).all():
+        split = any(
+            value is not None
+            for value in (product.material_cost, product.hardware_cost,
+                          product.labor_cost, product.overhead_cost)
+        )
+        material = (product.material_cost or 0.0) if split else (product.total_cost or 0.0)
+        direct = (
+            material * (1 + material_change / 100)
+            + (product.hardware_cost or 0.0)
+            + (product.labor_cost or 0.0)
+        )
+        base = (
+            direct * (1 + PARAMETERS["overhead"] / 100)
+            + (product.overhead_cost or 0.0)
+            + PARAMETERS["packaging_cost"]
+            + PARAMETERS["marketing_cost"]
+        )
+        landed = base + PARAMETERS["shipping_cost"]
+        suggested.append(landed / (kept - PARAMETERS["target_margin"] / 100))
+        price = product.selling_price or 0.0
+        margins.append((price * kept - landed) * 100 / price if price > 0 else None)
+    priced = [margin for margin in margins if margin is not None]
+    return {"avg_margin": sum(priced) / len(priced), "suggested": suggested}
+
+
+def main():
+    """Main entry point for the benchmark."""
+    args = parse_arguments()
+    from app.services import pricing_service
+    from app.services.pricing_service import PricingService
+
+    with tempfile.TemporaryDirectory() as directory:
+        engine, session_factory = build_database(directory, args)
+
+        session = session_factory()
+        started = time.perf_counter()
+        per_object = price_objects(session, args.material_change)
+        object_time = time.perf_counter() - started
+        session.close()
+
+        session = session_factory()
+        service = PricingService(session)
+        started = time.perf_counter()
+        columnar = service.reprice_catalog(
+            PARAMETERS, cost_changes={"material": args.material_change}, limit=100
+        )
+        columnar_time = time.perf_counter() - started
+
+        started = time.perf_counter()
+        columns = service.repository.get_pricing_columns()
+        query_time = time.perf_counter() - started
+        session.close()
+        engine.dispose()
+
+    matches = abs(per_object["avg_margin"] - columnar["summary"]["avg_margin_after"]) < 0.01
+    backend = "NumPy" if pricing_service.np is not None else "pure Python"
+    logger.info(f"{args.products} products, material cost {args.material_change:+.1f}%")
+    logger.info(f"Per-product objects: {object_time * 1000:.0f} ms")
+    logger.info(
+        f"Columnar ({backend}):  {columnar_time * 1000:.0f} ms for today and the what-if "
+        f"({query_time * 1000:.0f} ms of it reading {len(columns['id'])} rows of columns)"
+    )
+    logger.info(
+        f"Average margin after the change: {columnar['summary']['avg_margin_after']:.2f}%; "
+        f"results match: {matches}"
+    )
+
+
+if __name__ == "__main__":
+    main()
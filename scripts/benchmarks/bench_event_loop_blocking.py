@@ -0,0 +1,144 @@
+#!/usr/bin/env python
+"""
+Benchmark event loop responsiveness under slow database-bound requests.
+
+Mounts the tags router on a bare FastAPI app whose tag service sleeps to
+simulate a slow query, fires a burst of concurrent tag requests and measures
+the latency of a trivial probe endpoint served from the same event loop.
+While handlers ran their blocking service calls on the loop, every probe
+waited behind the whole burst; with the work in the threadpool the probe
+latency stays flat and the burst completes in roughly
+``requests / THREADPOOL_MAX_WORKERS * delay``.
+"""
+
+import sys
+import time
+import asyncio
+import logging
+import argparse
+import statistics
+from pathlib import Path
+from unittest import mock
+
+# Add project root to Python path
+project_root = Path(__file__).resolve().parents[2]
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+import anyio.to_thread
+import httpx
+from fastapi import FastAPI
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+
+def parse_arguments():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Measure event loop latency under concurrent blocking requests."
+    )
+    parser.add_argument(
+        "--requests", type=int, default=200, help="Concurrent slow requests to send"
+    )
+    parser.add_argument(
+        "--delay-ms", type=float, default=50.0, help="Simulated query time per request"
+    )
+    parser.add_argument(
+        "--probes", type=int, default=20, help="Probe requests sent during the burst"
+    )
+    parser.add_argument(
+        "--workers", type=int, default=40, help="Threadpool size (THREADPOOL_MAX_WORKERS)"
+    )
+    return parser.parse_args()
+
+
+class SlowTagService:
+    """Tag service stand-in whose calls block like a slow query."""
+
+    def __init__(self, delay: float):
+        self.delay = delay
+
+    def get_tag(self, tag_id):
+        time.sleep(self.delay)
+        return {"id": tag_id}
+
+    def get_asset_count_by_tag(self, tag_id):
+        return 0
+
+
+def build_app() -> FastAPI:
+    """Build a FastAPI app with the tags router and a probe endpoint."""
+    from app.api.deps import get_current_active_user, get_db
+    from app.api.endpoints import tags
+
+    app = FastAPI()
+    app.include_router(tags.router, prefix="/tags")
+    app.dependency_overrides[get_db] = lambda: None
+    app.dependency_overrides[get_current_active_user] = lambda: object()
+
+    @app.get("/probe")
+    async def probe():
+        return {"ok": True}
+
+    return app
+
+
+async def run_benchmark(args) -> dict:
+    """Run the burst and the probes concurrently and collect timings."""
+    anyio.to_thread.current_default_thread_limiter().total_tokens = args.workers
+    app = build_app()
+    transport = httpx.ASGITransport(app=app)
+    probe_latencies = []
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+
+        async def probe_loop():
+            for _ in range(args.probes):
+                started = time.perf_counter()
+                await client.get("/probe")
+                probe_latencies.append((time.perf_counter() - started) * 1000)
+                await asyncio.sleep(0.01)
+
+        started = time.perf_counter()
+        burst = [client.get(f"/tags/tag-{i}/count") for i in range(args.requests)]
+        responses, _ = await asyncio.gather(asyncio.gather(*burst), probe_loop())
+        elapsed = time.perf_counter() - started
+
+    failures = sum(1 for response in responses if response.status_code != 200)
+    return {
+        "elapsed_s": elapsed,
+        "requests_per_s": args.requests / elapsed,
+        "failures": failures,
+        "probe_p50_ms": statistics.median(probe_latencies),
+        "probe_max_ms": max(probe_latencies),
+    }
+
+
+def main():
+    """Main entry point for the benchmark."""
+    args = parse_arguments()
+    service = SlowTagService(args.delay_ms / 1000)
+
+    with mock.patch(
+        "app.services.service_factory.ServiceFactory.get_tag_service",
+        return_value=service,
+    ):
+        results = asyncio.run(run_benchmark(args))
+
+    logger.info(
+        f"{args.requests} requests x {args.delay_ms:.0f} ms with {args.workers} workers: "
+        f"{results['elapsed_s']:.2f}s ({results['requests_per_s']:.0f} req/s, "
+        f"{results['failures']} failed)"
+    )
+    logger.info(
+        f"Probe latency during burst: p50 {results['probe_p50_ms']:.1f} ms, "
+        f"max {results['probe_max_ms']:.1f} ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+#!/usr/bin/env python
+"""
+Benchmark event stream fan-out.
+
+Connects many stream clients to one EventStreamHub on a single event loop,
+as one worker process would serve them, and publishes workflow progress
+events on the event bus from a request thread. Each client follows one
+execution; an execution is followed by several clients. Reports events and
+deliveries per second, and the publish-to-client latency.
+"""
+
+import sys
+import time
+import json
+import asyncio
+import logging
+import argparse
+import threading
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).resolve().parents[2]
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from app.core.events import EventBus, WorkflowProgressUpdateEvent
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+
+def parse_arguments():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Measure event stream fan-out to many clients.")
+    parser.add_argument(
+        "--clients", type=int, default=1000, help="Connected stream clients"
+    )
+    parser.add_argument(
+        "--executions", type=int, default=100, help="Executions the clients follow"
+    )
+    parser.add_argument(
+        "--events", type=int, default=20000, help="Progress events published"
+    )
+    return parser.parse_args()
+
+
+async def consume(hub, client, expected: int, latencies: list) -> None:
+    """Read a client's stream until it received its share of events."""
+    received = 0
+    async for chunk in hub.stream(client):
+        for message in chunk.split(b"\n\n"):
+            if not message.startswith(b"id:"):
+                continue
+            received += 1
+            if received % 50 == 0:
+                data = json.loads(message.split(b"data: ", 1)[1])
+                latencies.append(time.perf_counter() - data["estimated_remaining"])
+        if received >= expected:
+            return
+
+
+def publish(bus: EventBus, args) -> None:
+    """Publish progress events round-robin over the executions."""
+    for index in range(args.events):
+        execution_id = index % args.executions
+        bus.publish(WorkflowProgressUpdateEvent(
+            execution_id=execution_id,
+            completed_steps=index,
+            # Carries the publish time to the consumers
+            estimated_remaining=time.perf_counter(),
+        ))
+        if index % 500 == 0:
+            # Let the loop drain, as request threads would pace themselves
+            time.sleep(0.001)
+
+
+async def run(args) -> dict:
+    """Connect the clients, publish from a thread and wait for delivery."""
+    from app.services.event_stream import EventStreamHub
+
+    bus = EventBus()
+    hub = EventStreamHub(
+        bus, client_queue_size=args.events, event_types=[WorkflowProgressUpdateEvent]
+    )
+    events_per_execution = args.events // args.executions
+    latencies = []
+    consumers = []
+    for index in range(args.clients):
+        client = hub.connect(user_id=index + 1_000_000, execution_ids=[index % args.executions])
+        consumers.append(asyncio.create_task(
+            consume(hub, client, events_per_execution, latencies)
+        ))
+
+    started = time.perf_counter()
+    publisher = threading.Thread(target=publish, args=(bus, args))
+    publisher.start()
+    await asyncio.gather(*consumers)
+    elapsed = time.perf_counter() - started
+    publisher.join()
+
+    latencies.sort()
+    return {
+        "elapsed": elapsed,
+        "deliveries": events_per_execution * args.clients,
+        "p50_ms": latencies[len(latencies) // 2] * 1000,
+        "p99_ms": latencies[int(len(latencies) * 0.99)] * 1000,
+    }
+
+
+def main():
+    """Main entry point for the benchmark."""
+    args = parse_arguments()
+    results = asyncio.run(run(args))
+
+    logger.info(
+        f"{args.clients} clients following {args.executions} executions, "
+        f"{args.events} events ({args.clients // args.executions} clients per event)"
+    )
+    logger.info(
+        f"{args.events / results['elapsed']:,.0f} events/sec, "
+        f"{results['deliveries'] / results['elapsed']:,.0f} deliveries/sec"
+    )
+    logger.info(
+        f"Publish-to-client latency: p50 {results['p50_ms']:.1f} ms, p99 {results['p99_ms']:.1f} ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+#!/usr/bin/env python
+"""
+Benchmark point-in-time stock queries on a multi-year inventory ledger.
+
+Fills a file-backed SQLite database with several years of inventory
+transactions, then asks for single items' stock and the whole inventory's
+stock at random past dates: once replaying the ledger back from the current
+stock, and once from the nearest snapshot after backfilling monthly and
+daily snapshots.
+"""
+
+import sys
+import time
+import random
+import logging
+import argparse
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).resolve().parents[2]
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from sqlalchemy import create_engine, func, insert
+from sqlalchemy.orm import sessionmaker
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+
+def parse_arguments():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Compare ledger replay with snapshot-based stock queries."
+    )
+    parser.add_argument("--items", type=int, default=2000, help="Items in inventory")
+    parser.add_argument("--years", type=int, default=3, help="Years of ledger history")
+    parser.add_argument(
+        "--transactions", type=int, default=500000, help="Inventory transactions in the ledger"
+    )
+    parser.add_argument("--queries", type=int, default=50, help="Queries of each kind")
+    return parser.parse_args()
+
+
+def build_database(directory: str, args):
+    """Create the ledger tables and fill them with a random history."""
+    from app.db.models.base import Base
+    from app.db.models.enums import TransactionType
+    from app.db.models.inventory import Inventory, InventorySnapshot, InventoryTransaction
+
+    engine = create_engine(f"sqlite:///{directory}/ledger_bench.db")
+    tables = [model.__table__ for model in (Inventory, InventoryTransaction, InventorySnapshot)]
+    Base.metadata.create_all(bind=engine, tables=tables)
+
+    rng = random.Random(43)
+    now = datetime.now()
+    span = args.years * 365 * 24 * 3600
+    stock = [0.0] * (args.items + 1)
+    rows = []
+    for index in range(args.transactions):
+        item_id = rng.randint(1, args.items)
+        change = float(rng.choice([5, 10, 20])) if stock[item_id] < 10 else float(-rng.randint(1, 8))
+        stock[item_id] += change
+        rows.append({
+            "item_type": "material",
+            "item_id": item_id,
+            "quantity": change,
+            "transaction_type": TransactionType.PURCHASE if change > 0 else TransactionType.USAGE,
+            # Spread evenly over the period, oldest first
+            "transaction_date": now - timedelta(seconds=span * (1 - index / args.transactions)),
+        })
+    with engine.begin() as conn:
+        for start in range(0, len(rows), 50000):
+            conn.execute(insert(InventoryTransaction.__table__), rows[start:start + 50000])
+        conn.execute(insert(Inventory.__table__), [
+            {"item_type": "material", "item_id": item_id, "quantity": stock[item_id]}
+            for item_id in range(1, args.items + 1)
+        ])
+    return engine, sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+def run_queries(session, args, dates: list, items: list) -> dict:
+    """Time single-item and whole-inventory stock queries at past dates."""
+    from app.repositories.inventory_transaction_repository import InventoryTransactionRepository
+
+    repository = InventoryTransactionRepository(session)
+    started = time.perf_counter()
+    single = [
+        repository.get_stock_as_of("material", item_id, as_of)
+        for item_id, as_of in zip(items, dates)
+    ]
+    single_time = (time.perf_counter() - started) / args.queries
+
+    started = time.perf_counter()
+    totals = []
+    for as_of in dates[:10]:
+        levels = repository.stock_levels_as_of(as_of)
+        totals.append(session.query(func.sum(levels.c.quantity)).scalar())
+    total_time = (time.perf_counter() - started) / len(totals)
+    return {
+        "single": single,
+        "single_ms": single_time * 1000,
+        "totals": totals,
+        "total_ms": total_time * 1000,
+    }
+
+
+def main():
+    """Main entry point for the benchmark."""
+    args = parse_arguments()
+    logging.getLogger("app.services.inventory_service").setLevel(logging.WARNING)
+    from app.services.inventory_service import InventoryService
+
+    with tempfile.TemporaryDirectory() as directory:
+        engine, session_factory = build_database(directory, args)
+
+        rng = random.Random(7)
+        now = datetime.now()
+        dates = [now - timedelta(days=rng.uniform(0, args.years * 365)) for _ in range(args.queries)]
+        items = [rng.randint(1, args.items) for _ in range(args.queries)]
+
+        session = session_factory()
+        replayed = run_queries(session, args, dates, items)
+
+        started = time.perf_counter()
+        snapshots = InventoryService(session).backfill_stock_snapshots(
+            datetime.now() - timedelta(days=args.years * 365)
+        )
+        backfill = time.perf_counter() - started
+        from_snapshots = run_queries(session, args, dates, items)
+        session.close()
+        engine.dispose()
+
+    matches = all(
+        abs(a - b) < 1e-6 for a, b in zip(replayed["single"], from_snapshots["single"])
+    ) and all(abs(a - b) < 1e-6 for a, b in zip(replayed["totals"], from_snapshots["totals"]))
+    logger.info(
+        f"{args.transactions} transactions over {args.years} years for {args.items} items"
+    )
+    logger.info(
+        f"Replay from current stock: {replayed['single_ms']:.2f} ms per item, "
+        f"{replayed['total_ms']:.0f} ms per whole inventory"
+    )
+    logger.info(
+        f"From nearest snapshot:     {from_snapshots['single_ms']:.2f} ms per item, "
+        f"{from_snapshots['total_ms']:.0f} ms per whole inventory"
+    )
+    logger.info(
+        f"Backfilled {snapshots} snapshots in {backfill:.1f} s; results match: {matches}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+#!/usr/bin/env python
+"""
+Benchmark inventory valuation.
+
+Fills a file-backed SQLite database with inventory rows for products,
+materials and tools, then values the inventory the way it used to be done
+(list the inventory, look up each item by primary key) and with the single
+joined valuation query, both for the current stock and replayed to an
+earlier date from the inventory transactions.
+"""
+
+import sys
+import time
+import random
+import logging
+import argparse
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).resolve().parents[2]
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+
+def parse_arguments():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Compare per-item lookups with the joined valuation query."
+    )
+    parser.add_argument(
+        "--items", type=int, default=100000, help="Inventory rows to value"
+    )
+    parser.add_argument(
+        "--transactions", type=int, default=100000,
+        help="Inventory transactions recorded over the last 90 days",
+    )
+    return parser.parse_args()
+
+
+def build_database(directory: str, args):
+    """Create and fill the inventory, item and transaction tables."""
+    from app.db.models.base import Base
+    from app.db.models.enums import MeasurementUnit, ToolCategory, TransactionType
+    from app.db.models.inventory import Inventory, InventoryTransaction
+    from app.db.models.material import Material
+    from app.db.models.product import Product
+    from app.db.models.tool import Tool
+
+    engine = create_engine(f"sqlite:///{directory}/valuation_bench.db")
+    tables = [model.__table__ for model in (Inventory, InventoryTransaction, Product, Material, Tool)]
+    Base.metadata.create_all(bind=engine, tables=tables)
+
+    rng = random.Random(41)
+    per_type = args.items // 3
+    now = datetime.now()
+    with engine.begin() as conn:
+        conn.execute(insert(Product.__table__), [
+            {"id": i, "name": f"Product {i}", "sku": f"P-{i}", "total_cost": rng.uniform(5, 200)}
+            for i in range(1, per_type + 1)
+        ])
+        conn.execute(insert(Material.__table__), [
+            {
+                "id": i, "name": f"Material {i}", "material_type": "material",
+                "unit": MeasurementUnit.PIECE, "cost_price": rng.uniform(0.1, 50),
+            }
+            for i in range(1, per_type + 1)
+        ])
+        conn.execute(insert(Tool.__table__), [
+            {
+                "id": i, "name": f"Tool {i}", "category": next(iter(ToolCategory)),
+                "purchase_price": rng.uniform(10, 500),
+            }
+            for i in range(1, args.items - 2 * per_type + 1)
+        ])
+        conn.execute(insert(Inventory.__table__), [
+            {
+                "item_type": item_type,
+                "item_id": item_id,
+                "quantity": float(rng.randint(0, 100)),
+                "storage_location": f"Shelf {item_id % 40}",
+            }
+            for item_type, count in (
+                ("product", per_type), ("material", per_type), ("tool", args.items - 2 * per_type)
+            )
+            for item_id in range(1, count + 1)
+        ])
+        conn.execute(insert(InventoryTransaction.__table__), [
+            {
+                "item_type": "material",
+                "item_id": rng.randint(1, per_type),
+                "quantity": float(rng.choice([-3, -1, 1, 5])),
+                "transaction_type": TransactionType.PURCHASE,
+                "transaction_date": now - timedelta(minutes=rng.randint(1, 90 * 24 * 60)),
+            }
+            for _ in range(args.transactions)
+        ])
+    return engine, sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+def value_per_item(session) -> float:
+    """Value the inventory by loading each item separately."""
+    from app.db.models.inventory import Inventory
+    from app.db.models.material import Material
+    from app.db.models.product import Product
+    from app.db.models.tool import Tool
+
+    models = {"product": (Product, "total_cost"), "material": (Material, "cost_price"), "tool": (Tool, "purchase_price")}
+    total = 0.0
+    for inventory in session.query(Inventory).all():
+        if not inventory.quantity or inventory.quantity <= 0:
+            continue
+        model, cost = models[inventory.item_type]
+        item = session.get(model, inventory.item_id)
+        total += inventory.quantity * (getattr(item, cost) or 0.0)
+    return total
+
+
+def timed(function, *args, **kwargs):
+    """Call a function and return its result and duration."""
+    started = time.perf_counter()
+    result = function(*args, **kwargs)
+    return result, time.perf_counter() - started
+
+
+def main():
+    """Main entry point for the benchmark."""
+    args = parse_arguments()
+    logging.getLogger("app.services.inventory_service").setLevel(logging.WARNING)
+    from app.services.inventory_service import InventoryService
+
+    with tempfile.TemporaryDirectory() as directory:
+        engine, session_factory = build_database(directory, args)
+
+        session = session_factory()
+        old_total, per_item = timed(value_per_item, session)
+        session.close()
+
+        session = session_factory()
+        service = InventoryService(session)
+        current, joined = timed(service.calculate_inventory_value)
+        _, totals_only = timed(service.calculate_inventory_value, include_items=False)
+        month_ago = datetime.now() - timedelta(days=30)
+        _, replayed = timed(service.calculate_inventory_value, as_of_date=month_ago)
+        session.close()
+        engine.dispose()
+
+    logger.info(f"{args.items} inventory rows, {args.transactions} transactions")
+    logger.info(f"Per-item lookups:      {per_item * 1000:.0f} ms (total {old_total:,.2f})")
+    logger.info(
+        f"Joined query:          {joined * 1000:.0f} ms (total {current['total_value']:,.2f}, "
+        f"{len(current['items'])} items listed)"
+    )
+    logger.info(f"Totals only:           {totals_only * 1000:.0f} ms")
+    logger.info(f"Replayed to 30 days ago: {replayed * 1000:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
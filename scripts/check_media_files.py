@@ -0,0 +1,53 @@
+#!/usr/bin/env python
+"""
+Check that media asset files exist.
+
+Stats every media asset's file at its canonical storage location and
+reports the assets whose file is missing, so the preview and download
+paths never have to go looking for them. Runs periodically from the
+application (see MEDIA_FILE_CHECK_INTERVAL_MINUTES) and can also be run
+by hand or from cron.
+"""
+
+import sys
+import logging
+from pathlib import Path
+from typing import Any, Dict
+
+# Add project root to Python path
+script_dir = Path(__file__).resolve().parent
+project_root = script_dir.parent if script_dir.name == "scripts" else script_dir
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+logger = logging.getLogger(__name__)
+
+
+def check_media_files() -> Dict[str, Any]:
+    """
+    Run the media file consistency check.
+
+    Returns:
+        Consistency report from MediaAssetService.check_file_consistency
+    """
+    from app.db.session import SessionLocal
+    from app.services.media_asset_service import MediaAssetService
+
+    db = SessionLocal()
+    try:
+        report = MediaAssetService(db).check_file_consistency()
+    finally:
+        db.close()
+
+    logger.info(
+        f"Media file check: {report['checked']} checked, "
+        f"{len(report['missing'])} missing, {report['non_canonical']} not canonical"
+    )
+    return report
+
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+    )
+    check_media_files()
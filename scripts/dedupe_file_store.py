@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+"""
+Deduplicate the HideSync file store.
+
+Moves files written before content-addressed storage to their checksum
+paths, so identical uploads share a single blob, and recounts references
+in file_meta_data. Run migration 002 first.
+"""
+
+import sys
+import logging
+import argparse
+from pathlib import Path
+
+# Add project root to Python path
+script_dir = Path(__file__).resolve().parent
+project_root = script_dir.parent if script_dir.name == "scripts" else script_dir
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+
+def parse_arguments():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Deduplicate the HideSync file store.")
+    parser.add_argument(
+        "--base-path", help="File store root (defaults to MEDIA_ASSETS_BASE_PATH)"
+    )
+    parser.add_argument(
+        "--dry-run", action="store_true", help="Report savings without changing anything"
+    )
+    return parser.parse_args()
+
+
+def main():
+    """Run the deduplication."""
+    args = parse_arguments()
+
+    from app.core.config import settings
+    from app.db.session import SessionLocal
+    from app.repositories.file_metadata_repository import FileMetadataRepository
+    from app.services.file_storage_service import FileStorageService
+
+    base_path = args.base_path or settings.MEDIA_ASSETS_BASE_PATH
+    db = SessionLocal()
+    try:
+        service = FileStorageService(
+            base_path=base_path,
+            metadata_repository=FileMetadataRepository(db),
+            generate_thumbnails=False,
+        )
+        stats = service.deduplicate_store(dry_run=args.dry_run)
+    finally:
+        db.close()
+
+    prefix = "Would reclaim" if args.dry_run else "Reclaimed"
+    logger.info(
+        f"{prefix} {stats['bytes_reclaimed']} bytes: {stats['blobs']} blobs, "
+        f"{stats['rows_relinked']} rows relinked, {stats['files_removed']} files removed"
+    )
+    if stats["missing"]:
+        logger.warning(f"{stats['missing']} metadata rows point to missing files")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+# scripts/migrations/002_add_file_metadata_ref_count.py
+
+"""
+Migration to prepare file metadata for content-addressed storage.
+
+Adds a ref_count column to file_meta_data, indexes the checksum column used
+to look up existing blobs, and seeds ref_count from the current rows. Moving
+existing files to their checksum paths is done separately by
+scripts/dedupe_file_store.py, since it needs access to the file store.
+"""
+
+from sqlalchemy.sql import text
+
+# Migration metadata
+VERSION = "002"
+DESCRIPTION = "Add reference counting to file metadata"
+
+
+def up(session):
+    """
+    Apply the migration.
+
+    Args:
+        session: SQLAlchemy Session
+    """
+    conn = session.connection()
+
+    conn.execute(text(
+        "ALTER TABLE file_meta_data ADD COLUMN ref_count INTEGER NOT NULL DEFAULT 1"
+    ))
+    conn.execute(text(
+        "CREATE INDEX IF NOT EXISTS ix_file_meta_data_checksum ON file_meta_data(checksum)"
+    ))
+
+    # Seed counts for rows that already share content
+    conn.execute(text("""
+    UPDATE file_meta_data
+    SET ref_count = (
+        SELECT COUNT(*) FROM file_meta_data AS other
+        WHERE other.checksum = file_meta_data.checksum
+    )
+    WHERE checksum IS NOT NULL
+    """))
+
+    session.commit()
+
+
+def down(session):
+    """
+    Revert the migration.
+
+    Args:
+        session: SQLAlchemy Session
+    """
+    conn = session.connection()
+
+    conn.execute(text("DROP INDEX IF EXISTS ix_file_meta_data_checksum"))
+    conn.execute(text("ALTER TABLE file_meta_data DROP COLUMN ref_count"))
+
+    session.commit()
@@ -0,0 +1,43 @@
+# scripts/migrations/003_add_media_asset_checksum.py
+
+"""
+Migration to add a content checksum to media assets.
+
+The checksum is the strong ETag for preview and download responses and the
+reference value for the periodic integrity scrub. Existing assets are
+backfilled by the first scrub run (scripts/scrub_file_store.py).
+"""
+
+from sqlalchemy.sql import text
+
+# Migration metadata
+VERSION = "003"
+DESCRIPTION = "Add checksum to media assets"
+
+
+def up(session):
+    """
+    Apply the migration.
+
+    Args:
+        session: SQLAlchemy Session
+    """
+    conn = session.connection()
+
+    conn.execute(text("ALTER TABLE media_assets ADD COLUMN checksum VARCHAR(64)"))
+
+    session.commit()
+
+
+def down(session):
+    """
+    Revert the migration.
+
+    Args:
+        session: SQLAlchemy Session
+    """
+    conn = session.connection()
+
+    conn.execute(text("ALTER TABLE media_assets DROP COLUMN checksum"))
+
+    session.commit()
@@ -0,0 +1,59 @@
+# scripts/migrations/004_canonicalize_media_asset_paths.py
+
+"""
+Migration to canonicalize media asset storage locations.
+
+Earlier releases stored paths relative to the working directory and the
+service probed several candidate locations on every preview and download.
+This resolves each asset's file once, from the directory the application
+runs in, and rewrites storage_location to its absolute path. Assets whose
+file cannot be found keep their location resolved against the working
+directory and show up in the media file consistency check.
+"""
+
+from sqlalchemy.sql import text
+
+from app.services.media_path_index import canonical_storage_path, locate_legacy_file
+
+# Migration metadata
+VERSION = "004"
+DESCRIPTION = "Canonicalize media asset storage locations"
+
+
+def up(session):
+    """
+    Apply the migration.
+
+    Args:
+        session: SQLAlchemy Session
+    """
+    conn = session.connection()
+
+    rows = conn.execute(text(
+        "SELECT id, file_name, storage_location FROM media_assets "
+        "WHERE storage_location IS NOT NULL AND storage_location != ''"
+    )).fetchall()
+
+    for asset_id, file_name, storage_location in rows:
+        resolved = locate_legacy_file(
+            asset_id, file_name, storage_location
+        ) or canonical_storage_path(storage_location)
+        if resolved != storage_location:
+            conn.execute(
+                text("UPDATE media_assets SET storage_location = :path WHERE id = :id"),
+                {"path": resolved, "id": asset_id},
+            )
+
+    session.commit()
+
+
+def down(session):
+    """
+    Revert the migration.
+
+    Absolute paths work with every release, so there is nothing to undo.
+
+    Args:
+        session: SQLAlchemy Session
+    """
+    pass
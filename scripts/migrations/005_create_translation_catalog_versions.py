@@ -0,0 +1,49 @@
+# scripts/migrations/005_create_translation_catalog_versions.py
+
+"""
+Migration to create the translation catalog version table.
+
+Each row is the change counter of one entity type's translations. Workers
+poll it to refresh their in-process translation catalogs. Rows are created
+on the first translation write after the migration, so no seeding is needed.
+"""
+
+from sqlalchemy.sql import text
+
+# Migration metadata
+VERSION = "005"
+DESCRIPTION = "Create translation catalog versions"
+
+
+def up(session):
+    """
+    Apply the migration.
+
+    Args:
+        session: SQLAlchemy Session
+    """
+    conn = session.connection()
+
+    conn.execute(text("""
+    CREATE TABLE IF NOT EXISTS translation_catalog_versions (
+        catalog VARCHAR(100) PRIMARY KEY,
+        version INTEGER NOT NULL DEFAULT 0,
+        updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+    )
+    """))
+
+    session.commit()
+
+
+def down(session):
+    """
+    Revert the migration.
+
+    Args:
+        session: SQLAlchemy Session
+    """
+    conn = session.connection()
+
+    conn.execute(text("DROP TABLE IF EXISTS translation_catalog_versions"))
+
+    session.commit()
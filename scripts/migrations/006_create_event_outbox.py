@@ -0,0 +1,67 @@
+# scripts/migrations/006_create_event_outbox.py
+
+"""
+Migration to create the event outbox table.
+
+Domain events are written here in the same transaction as the change that
+raised them and delivered to their handlers by the outbox dispatcher.
+"""
+
+from sqlalchemy.sql import text
+
+# Migration metadata
+VERSION = "006"
+DESCRIPTION = "Create event outbox"
+
+
+def up(session):
+    """
+    Apply the migration.
+
+    Args:
+        session: SQLAlchemy Session
+    """
+    conn = session.connection()
+
+    conn.execute(text("""
+    CREATE TABLE IF NOT EXISTS event_outbox (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        event_id VARCHAR(36) NOT NULL UNIQUE,
+        event_type VARCHAR(100) NOT NULL,
+        payload TEXT NOT NULL,
+        ordering_key VARCHAR(200),
+        status VARCHAR(20) NOT NULL DEFAULT 'pending',
+        attempts INTEGER NOT NULL DEFAULT 0,
+        next_attempt_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+        delivered_handlers TEXT,
+        last_error TEXT,
+        locked_by VARCHAR(64),
+        locked_until TIMESTAMP,
+        created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+        delivered_at TIMESTAMP
+    )
+    """))
+    conn.execute(text(
+        "CREATE INDEX IF NOT EXISTS idx_event_outbox_due "
+        "ON event_outbox (status, next_attempt_at)"
+    ))
+    conn.execute(text(
+        "CREATE INDEX IF NOT EXISTS idx_event_outbox_ordering "
+        "ON event_outbox (ordering_key, status, id)"
+    ))
+
+    session.commit()
+
+
+def down(session):
+    """
+    Revert the migration.
+
+    Args:
+        session: SQLAlchemy Session
+    """
+    conn = session.connection()
+
+    conn.execute(text("DROP TABLE IF EXISTS event_outbox"))
+
+    session.commit()
@@ -0,0 +1,63 @@
+# scripts/migrations/007_create_audit_log.py
+
+"""
+Migration to create the audit log table.
+
+Audit records are buffered in memory and written here in batches by the
+audit writer.
+"""
+
+from sqlalchemy.sql import text
+
+# Migration metadata
+VERSION = "007"
+DESCRIPTION = "Create audit log"
+
+
+def up(session):
+    """
+    Apply the migration.
+
+    Args:
+        session: SQLAlchemy Session
+    """
+    conn = session.connection()
+
+    conn.execute(text("""
+    CREATE TABLE IF NOT EXISTS audit_log (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        entity_type VARCHAR(100) NOT NULL,
+        entity_id VARCHAR(255) NOT NULL,
+        entity_name VARCHAR(255),
+        action VARCHAR(50) NOT NULL,
+        changes TEXT,
+        user_id INTEGER,
+        timestamp TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+        ip_address VARCHAR(45),
+        metadata TEXT
+    )
+    """))
+    conn.execute(text(
+        "CREATE INDEX IF NOT EXISTS idx_audit_log_entity "
+        "ON audit_log (entity_type, entity_id, timestamp)"
+    ))
+    conn.execute(text(
+        "CREATE INDEX IF NOT EXISTS idx_audit_log_user "
+        "ON audit_log (user_id, timestamp)"
+    ))
+
+    session.commit()
+
+
+def down(session):
+    """
+    Revert the migration.
+
+    Args:
+        session: SQLAlchemy Session
+    """
+    conn = session.connection()
+
+    conn.execute(text("DROP TABLE IF EXISTS audit_log"))
+
+    session.commit()
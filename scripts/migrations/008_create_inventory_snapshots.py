@@ -0,0 +1,66 @@
+# scripts/migrations/008_create_inventory_snapshots.py
+
+"""
+Migration to create inventory snapshots and the ledger indexes.
+
+Snapshots hold each item's stock at a point in time, so point-in-time
+stock is a snapshot plus the inventory transactions recorded since. The
+covering indexes let those transaction scans read the index alone.
+"""
+
+from sqlalchemy.sql import text
+
+# Migration metadata
+VERSION = "008"
+DESCRIPTION = "Create inventory snapshots and ledger indexes"
+
+
+def up(session):
+    """
+    Apply the migration.
+
+    Args:
+        session: SQLAlchemy Session
+    """
+    conn = session.connection()
+
+    conn.execute(text("""
+    CREATE TABLE IF NOT EXISTS inventory_snapshots (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        snapshot_date TIMESTAMP NOT NULL,
+        item_type VARCHAR(50) NOT NULL,
+        item_id INTEGER NOT NULL,
+        quantity FLOAT NOT NULL,
+        CONSTRAINT uq_inventory_snapshots_item UNIQUE (snapshot_date, item_type, item_id)
+    )
+    """))
+    conn.execute(text(
+        "CREATE INDEX IF NOT EXISTS idx_inventory_snapshots_item "
+        "ON inventory_snapshots (item_type, item_id, snapshot_date)"
+    ))
+    conn.execute(text(
+        "CREATE INDEX IF NOT EXISTS idx_inventory_transactions_item_date "
+        "ON inventory_transactions (item_type, item_id, transaction_date, quantity)"
+    ))
+    conn.execute(text(
+        "CREATE INDEX IF NOT EXISTS idx_inventory_transactions_date "
+        "ON inventory_transactions (transaction_date, item_type, item_id, quantity)"
+    ))
+
+    session.commit()
+
+
+def down(session):
+    """
+    Revert the migration.
+
+    Args:
+        session: SQLAlchemy Session
+    """
+    conn = session.connection()
+
+    conn.execute(text("DROP INDEX IF EXISTS idx_inventory_transactions_date"))
+    conn.execute(text("DROP INDEX IF EXISTS idx_inventory_transactions_item_date"))
+    conn.execute(text("DROP TABLE IF EXISTS inventory_snapshots"))
+
+    session.commit()
@@ -0,0 +1,86 @@
+# scripts/migrations/009_add_low_stock_indexes.py
+
+"""
+Migration to maintain the low-stock set instead of scanning for it.
+
+Inventory records get a needs_reorder flag, kept up to date by the
+inventory service and backfilled here from the items' reorder points, with
+a partial index over the flagged rows. Material status, kept in step with
+quantity and reorder point by the model, is indexed and brought up to date,
+and dynamic materials get a partial index over their low-stock rows.
+"""
+
+from sqlalchemy.sql import text
+
+# Migration metadata
+VERSION = "009"
+DESCRIPTION = "Add low-stock flag and indexes"
+
+
+def up(session):
+    """
+    Apply the migration.
+
+    Args:
+        session: SQLAlchemy Session
+    """
+    conn = session.connection()
+
+    conn.execute(text(
+        "ALTER TABLE inventory ADD COLUMN needs_reorder BOOLEAN NOT NULL DEFAULT 0"
+    ))
+    conn.execute(text("""
+    UPDATE inventory SET needs_reorder = 1
+    WHERE (
+        item_type = 'product' AND quantity <= (
+            SELECT reorder_point FROM products
+            WHERE products.id = inventory.item_id AND reorder_point > 0
+        )
+    ) OR (
+        item_type = 'material' AND quantity <= (
+            SELECT reorder_point FROM materials
+            WHERE materials.id = inventory.item_id AND reorder_point > 0
+        )
+    )
+    """))
+    conn.execute(text(
+        "CREATE INDEX IF NOT EXISTS idx_inventory_needs_reorder "
+        "ON inventory (item_type, item_id) WHERE needs_reorder = 1"
+    ))
+
+    conn.execute(text("""
+    UPDATE materials SET status = CASE
+        WHEN quantity <= 0 THEN 'OUT_OF_STOCK'
+        WHEN quantity <= reorder_point THEN 'LOW_STOCK'
+        ELSE 'IN_STOCK'
+    END
+    WHERE status IS NULL OR status IN ('IN_STOCK', 'LOW_STOCK', 'OUT_OF_STOCK')
+    """))
+    conn.execute(text(
+        "CREATE INDEX IF NOT EXISTS ix_materials_status ON materials (status)"
+    ))
+
+    conn.execute(text(
+        "CREATE INDEX IF NOT EXISTS idx_dynamic_materials_low_stock "
+        "ON dynamic_materials (name) "
+        "WHERE quantity <= reorder_point AND quantity > 0 AND status != 'discontinued'"
+    ))
+
+    session.commit()
+
+
+def down(session):
+    """
+    Revert the migration.
+
+    Args:
+        session: SQLAlchemy Session
+    """
+    conn = session.connection()
+
+    conn.execute(text("DROP INDEX IF EXISTS idx_dynamic_materials_low_stock"))
+    conn.execute(text("DROP INDEX IF EXISTS ix_materials_status"))
+    conn.execute(text("DROP INDEX IF EXISTS idx_inventory_needs_reorder"))
+    conn.execute(text("ALTER TABLE inventory DROP COLUMN needs_reorder"))
+
+    session.commit()
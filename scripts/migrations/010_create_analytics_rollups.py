@@ -0,0 +1,83 @@
+# scripts/migrations/010_create_analytics_rollups.py
+
+"""
+Migration to create the daily sales and purchase rollups.
+
+Analytics read sales totals per day, channel and product type, and
+purchase totals per day and supplier, instead of scanning every order. The
+services keep the rollups current by rebuilding the days they touch, which
+the creation-time and refund-date indexes keep to a range scan; fill them
+for existing data with scripts/backfill_analytics_rollups.py.
+"""
+
+from sqlalchemy.sql import text
+
+# Migration metadata
+VERSION = "010"
+DESCRIPTION = "Create daily sales and purchase rollups"
+
+
+def up(session):
+    """
+    Apply the migration.
+
+    Args:
+        session: SQLAlchemy Session
+    """
+    conn = session.connection()
+
+    conn.execute(text("""
+    CREATE TABLE IF NOT EXISTS sales_daily_rollups (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        day DATE NOT NULL,
+        channel VARCHAR(50) NOT NULL DEFAULT '',
+        product_type VARCHAR(50) NOT NULL DEFAULT '',
+        order_count INTEGER NOT NULL DEFAULT 0,
+        revenue FLOAT NOT NULL DEFAULT 0,
+        net_revenue FLOAT NOT NULL DEFAULT 0,
+        fees FLOAT NOT NULL DEFAULT 0,
+        cogs FLOAT NOT NULL DEFAULT 0,
+        refunds FLOAT NOT NULL DEFAULT 0,
+        refund_count INTEGER NOT NULL DEFAULT 0,
+        CONSTRAINT uq_sales_daily_rollups_key UNIQUE (day, channel, product_type)
+    )
+    """))
+    conn.execute(text("""
+    CREATE TABLE IF NOT EXISTS purchase_daily_rollups (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        day DATE NOT NULL,
+        supplier_id INTEGER NOT NULL DEFAULT 0,
+        purchase_count INTEGER NOT NULL DEFAULT 0,
+        spend FLOAT NOT NULL DEFAULT 0,
+        CONSTRAINT uq_purchase_daily_rollups_key UNIQUE (day, supplier_id)
+    )
+    """))
+    conn.execute(text(
+        "CREATE INDEX IF NOT EXISTS ix_sales_created_at ON sales (created_at)"
+    ))
+    conn.execute(text(
+        "CREATE INDEX IF NOT EXISTS ix_purchases_created_at ON purchases (created_at)"
+    ))
+    conn.execute(text(
+        "CREATE INDEX IF NOT EXISTS ix_refunds_refund_date ON refunds (refund_date)"
+    ))
+
+    session.commit()
+
+
+def down(session):
+    """
+    Revert the migration.
+
+    Args:
+        session: SQLAlchemy Session
+    """
+    conn = session.connection()
+
+    conn.execute(text("DROP INDEX IF EXISTS ix_refunds_refund_date"))
+    conn.execute(text("DROP INDEX IF EXISTS ix_purchases_created_at"))
+    conn.execute(text("DROP INDEX IF EXISTS ix_sales_created_at"))
+    conn.execute(text("DROP TABLE IF EXISTS purchase_daily_rollups"))
+    conn.execute(text("DROP TABLE IF EXISTS sales_daily_rollups"))
+
+    session.commit()
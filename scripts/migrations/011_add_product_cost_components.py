@@ -0,0 +1,48 @@
+# scripts/migrations/011_add_product_cost_components.py
+
+"""
+Migration to store product cost components as columns.
+
+Material, hardware, labor and overhead cost sit next to total_cost so bulk
+pricing reads the whole catalog's cost inputs in one query. Products whose
+cost was never split keep the components empty and are priced from
+total_cost.
+"""
+
+from sqlalchemy.sql import text
+
+# Migration metadata
+VERSION = "011"
+DESCRIPTION = "Add product cost component columns"
+
+COLUMNS = ("material_cost", "hardware_cost", "labor_cost", "overhead_cost")
+
+
+def up(session):
+    """
+    Apply the migration.
+
+    Args:
+        session: SQLAlchemy Session
+    """
+    conn = session.connection()
+
+    for column in COLUMNS:
+        conn.execute(text(f"ALTER TABLE products ADD COLUMN {column} FLOAT"))
+
+    session.commit()
+
+
+def down(session):
+    """
+    Revert the migration.
+
+    Args:
+        session: SQLAlchemy Session
+    """
+    conn = session.connection()
+
+    for column in reversed(COLUMNS):
+        conn.execute(text(f"ALTER TABLE products DROP COLUMN {column}"))
+
+    session.commit()
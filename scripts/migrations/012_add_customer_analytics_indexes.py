@@ -0,0 +1,53 @@
+# scripts/migrations/012_add_customer_analytics_indexes.py
+
+"""
+Migration to index sales and customers for customer analytics.
+
+Customer lifetime value, RFM scores and rankings are aggregated per
+customer over the sales table, which the (customer_id, created_at) index
+serves in customer order. The updated_at indexes keep the data version
+check, which decides whether cached analytics are still current, to two
+index lookups.
+"""
+
+from sqlalchemy.sql import text
+
+# Migration metadata
+VERSION = "012"
+DESCRIPTION = "Add customer analytics indexes"
+
+INDEXES = {
+    "ix_sales_customer_id_created_at": "sales (customer_id, created_at)",
+    "ix_sales_updated_at": "sales (updated_at)",
+    "ix_customers_updated_at": "customers (updated_at)",
+}
+
+
+def up(session):
+    """
+    Apply the migration.
+
+    Args:
+        session: SQLAlchemy Session
+    """
+    conn = session.connection()
+
+    for name, target in INDEXES.items():
+        conn.execute(text(f"CREATE INDEX IF NOT EXISTS {name} ON {target}"))
+
+    session.commit()
+
+
+def down(session):
+    """
+    Revert the migration.
+
+    Args:
+        session: SQLAlchemy Session
+    """
+    conn = session.connection()
+
+    for name in reversed(list(INDEXES)):
+        conn.execute(text(f"DROP INDEX IF EXISTS {name}"))
+
+    session.commit()
@@ -0,0 +1,63 @@
+# scripts/migrations/013_create_supplier_performance.py
+
+"""
+Migration to create the running supplier performance aggregates.
+
+One row per supplier holds the count, sum and sum of squares of its
+purchases' lead times, its on-time receipts and a moving average of its
+ratings. The purchase and supplier services update the row as purchases
+are received and ratings recorded; fill it for existing data with
+scripts/backfill_supplier_performance.py.
+"""
+
+from sqlalchemy.sql import text
+
+# Migration metadata
+VERSION = "013"
+DESCRIPTION = "Create supplier performance aggregates"
+
+
+def up(session):
+    """
+    Apply the migration.
+
+    Args:
+        session: SQLAlchemy Session
+    """
+    conn = session.connection()
+
+    conn.execute(text("""
+    CREATE TABLE IF NOT EXISTS supplier_performance (
+        supplier_id INTEGER PRIMARY KEY REFERENCES suppliers (id),
+        receipt_count INTEGER NOT NULL DEFAULT 0,
+        lead_time_sum FLOAT NOT NULL DEFAULT 0,
+        lead_time_sum_sq FLOAT NOT NULL DEFAULT 0,
+        due_count INTEGER NOT NULL DEFAULT 0,
+        on_time_count INTEGER NOT NULL DEFAULT 0,
+        rating_count INTEGER NOT NULL DEFAULT 0,
+        rating_ema FLOAT,
+        last_received_at DATETIME,
+        last_rated_at DATETIME
+    )
+    """))
+    conn.execute(text(
+        "CREATE INDEX IF NOT EXISTS ix_supplier_performance_rating_ema "
+        "ON supplier_performance (rating_ema, rating_count)"
+    ))
+
+    session.commit()
+
+
+def down(session):
+    """
+    Revert the migration.
+
+    Args:
+        session: SQLAlchemy Session
+    """
+    conn = session.connection()
+
+    conn.execute(text("DROP INDEX IF EXISTS ix_supplier_performance_rating_ema"))
+    conn.execute(text("DROP TABLE IF EXISTS supplier_performance"))
+
+    session.commit()
@@ -0,0 +1,50 @@
+# scripts/migrations/014_add_tool_availability_indexes.py
+
+"""
+Migration to index tool checkouts and maintenance for readiness checks.
+
+Workflow readiness reads the open checkouts and the maintenance that is not
+completed of all tools a workflow needs in one query each; the (tool_id,
+status) indexes serve both without scanning the full history.
+"""
+
+from sqlalchemy.sql import text
+
+# Migration metadata
+VERSION = "014"
+DESCRIPTION = "Add tool availability indexes"
+
+INDEXES = {
+    "ix_tool_checkouts_tool_id_status": "tool_checkouts (tool_id, status)",
+    "ix_tool_maintenance_tool_id_status": "tool_maintenance (tool_id, status)",
+}
+
+
+def up(session):
+    """
+    Apply the migration.
+
+    Args:
+        session: SQLAlchemy Session
+    """
+    conn = session.connection()
+
+    for name, target in INDEXES.items():
+        conn.execute(text(f"CREATE INDEX IF NOT EXISTS {name} ON {target}"))
+
+    session.commit()
+
+
+def down(session):
+    """
+    Revert the migration.
+
+    Args:
+        session: SQLAlchemy Session
+    """
+    conn = session.connection()
+
+    for name in reversed(list(INDEXES)):
+        conn.execute(text(f"DROP INDEX IF EXISTS {name}"))
+
+    session.commit()
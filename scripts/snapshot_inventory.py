@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+"""
+Take stock snapshots of the inventory ledger.
+
+Records every item's stock at the start of today and prunes daily
+snapshots older than INVENTORY_SNAPSHOT_DAILY_DAYS, keeping the one at the
+start of each month. Point-in-time stock queries then scan the ledger only
+from the nearest snapshot. Runs periodically from the application (see
+INVENTORY_SNAPSHOT_INTERVAL_HOURS); run it by hand with --backfill-from to
+snapshot an existing ledger.
+"""
+
+import sys
+import logging
+import argparse
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+# Add project root to Python path
+script_dir = Path(__file__).resolve().parent
+project_root = script_dir.parent if script_dir.name == "scripts" else script_dir
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+logger = logging.getLogger(__name__)
+
+
+def snapshot_inventory(backfill_from: Optional[datetime] = None) -> Dict[str, Any]:
+    """
+    Take today's stock snapshot and prune old daily snapshots.
+
+    Args:
+        backfill_from: Also take the monthly and daily snapshots missing
+            since this date
+
+    Returns:
+        Dictionary with the number of snapshots taken and pruned
+    """
+    from app.core.config import settings
+    from app.db.session import SessionLocal
+    from app.services.inventory_service import InventoryService
+
+    db = SessionLocal()
+    try:
+        service = InventoryService(db)
+        if backfill_from:
+            taken = service.backfill_stock_snapshots(
+                backfill_from, daily_days=settings.INVENTORY_SNAPSHOT_DAILY_DAYS
+            )
+        else:
+            service.take_stock_snapshot()
+            taken = 1
+        pruned = service.prune_stock_snapshots(settings.INVENTORY_SNAPSHOT_DAILY_DAYS)
+    finally:
+        db.close()
+
+    logger.info(f"Inventory snapshots: {taken} taken, {pruned} pruned")
+    return {"taken": taken, "pruned": pruned}
+
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+    )
+    parser = argparse.ArgumentParser(description="Take stock snapshots of the inventory ledger.")
+    parser.add_argument(
+        "--backfill-from", type=datetime.fromisoformat, default=None,
+        help="Snapshot an existing ledger since this date (YYYY-MM-DD)",
+    )
+    snapshot_inventory(parser.parse_args().backfill_from)
@@ -0,0 +1,122 @@
+# tests/test_audit_writer.py
+import json
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.db.models.audit import AuditRecord
+from app.db.models.base import Base
+from app.db.models.enums import ToolCategory
+from app.db.models.inventory import Inventory
+from app.db.models.material import Material
+from app.db.models.product import Product
+from app.db.models.tool import Tool, ToolCheckout, ToolMaintenance
+from app.services.audit_service import AuditService
+from app.services.audit_writer import AuditWriter
+from app.services.entity_audit import USER_ID_KEY, register_entity_audit
+
+engine = create_engine(
+    "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+)
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+@pytest.fixture()
+def db():
+    AuditRecord.__table__.create(bind=engine)
+    session = TestingSessionLocal()
+    yield session
+    session.close()
+    AuditRecord.__table__.drop(bind=engine)
+
+
+@pytest.fixture()
+def inserts():
+    statements = []
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("INSERT"):
+            statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", count)
+    yield statements
+    event.remove(engine, "before_cursor_execute", count)
+
+
+def test_records_are_written_in_batches_on_stop(db, inserts):
+    writer = AuditWriter(TestingSessionLocal, batch_size=100, flush_interval=60)
+    audit = AuditService(db, audit_writer=writer)
+
+    for i in range(250):
+        audit.record_entity_change("Tool", i, "update", {"name": {"old": "a", "new": "b"}}, user_id=1)
+    audit.record_api_access("/api/v1/tools", "get", 200, user_id=1, duration_ms=1.5)
+    writer.stop()
+
+    assert db.query(AuditRecord).count() == 251
+    assert len(inserts) <= 3
+    record = db.query(AuditRecord).filter(AuditRecord.entity_type == "API").one()
+    assert record.action == "GET 200"
+    assert json.loads(record.audit_metadata)["duration_ms"] == 1.5
+
+
+def test_overflow_policies_bound_the_buffer(db):
+    for policy, kept in (("drop_oldest", [3, 4]), ("drop_newest", [0, 1])):
+        writer = AuditWriter(
+            TestingSessionLocal, batch_size=100, flush_interval=60, max_buffer=2, overflow_policy=policy
+        )
+        writer._stopping.set()  # Keep the writer thread from starting
+        for i in range(5):
+            writer.write({"entity_type": "Tool", "entity_id": str(i), "action": "update"})
+
+        assert writer.get_stats()["dropped"] == 3
+        assert [record["entity_id"] for record in writer._buffer] == [str(i) for i in kept]
+
+    with pytest.raises(ValueError):
+        AuditWriter(TestingSessionLocal, overflow_policy="ignore")
+
+
+def test_failed_writes_are_retried(db):
+    writer = AuditWriter(TestingSessionLocal, batch_size=10, flush_interval=60)
+    writer._stopping.set()
+    writer.write({"entity_type": "Tool", "entity_id": "1", "action": "update"})
+    AuditRecord.__table__.drop(bind=engine)
+
+    assert writer.flush() == 0
+    assert writer.get_stats()["buffer_size"] == 1
+
+    AuditRecord.__table__.create(bind=engine)
+    assert writer.flush() == 1
+
+
+def test_committed_entity_changes_are_recorded_and_read_back(db):
+    tables = [model.__table__ for model in (Tool, ToolCheckout, ToolMaintenance, Inventory, Product, Material)]
+    Base.metadata.create_all(bind=engine, tables=tables)
+    writer = AuditWriter(TestingSessionLocal, batch_size=100, flush_interval=60)
+    AuditedSession = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    register_entity_audit(AuditedSession, writer)
+    session = AuditedSession()
+    session.info[USER_ID_KEY] = 7
+    try:
+        session.add(Tool(id=1, name="Edger", category=ToolCategory.CUTTING, status="IN_STOCK"))
+        session.commit()
+        session.get(Tool, 1).name = "Round edger"
+        session.commit()
+        session.get(Tool, 1).name = "Discarded"
+        session.flush()
+        session.rollback()
+        session.delete(session.get(Tool, 1))
+        session.commit()
+    finally:
+        session.close()
+        writer.stop()
+        Base.metadata.drop_all(bind=engine, tables=tables)
+
+    history = AuditService(db).get_entity_history("Tool", 1)
+
+    assert [record["action"] for record in history] == ["create", "update", "delete"]
+    assert {record["user_id"] for record in history} == {7}
+    assert history[1]["changes"] == {"name": {"old": "Edger", "new": "Round edger"}}
+    assert history[2]["changes"]["name"] == {"old": "Round edger", "new": None}
+    assert AuditService(db).get_entity_history("Tool", 1, actions=["update"])[0]["entity_name"] == "Round edger"
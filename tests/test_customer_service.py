@@ -0,0 +1,109 @@
+# tests/test_customer_service.py
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.core.exceptions import ValidationException
+from app.db.models.base import Base
+from app.db.models.customer import Customer
+from app.db.models.enums import CustomerStatus, CustomerTier, SaleStatus
+from app.db.models.product import Product
+from app.db.models.refund import Refund
+from app.db.models.sales import Sale, SaleItem
+from app.services.customer_service import CustomerService
+
+engine = create_engine(
+    "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+)
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+TABLES = [model.__table__ for model in (Customer, Sale, SaleItem, Product, Refund)]
+
+
+@pytest.fixture()
+def db():
+    Base.metadata.create_all(bind=engine, tables=TABLES)
+    CustomerService._analytics_cache.clear()
+    session = TestingSessionLocal()
+    yield session
+    session.close()
+    Base.metadata.drop_all(bind=engine, tables=TABLES)
+
+
+def add_customers(db):
+    now = datetime.now()
+    db.add_all([
+        Customer(id=1, name="Ada", email="ada@example.com", tier=CustomerTier.VIP),
+        Customer(id=2, name="Bo", email="bo@example.com"),
+        Customer(id=3, name="Cy", email="cy@example.com", status=CustomerStatus.INACTIVE),
+        Customer(id=4, name="Di", email="di@example.com"),
+    ])
+    for customer_id, days_ago, amount, status in [
+        (1, 200, 300.0, SaleStatus.COMPLETED),
+        (1, 5, 200.0, SaleStatus.COMPLETED),
+        (2, 10, 80.0, SaleStatus.COMPLETED),
+        (2, 3, 999.0, SaleStatus.CANCELLED),
+        (3, 120, 20.0, SaleStatus.COMPLETED),
+    ]:
+        db.add(Sale(
+            customer_id=customer_id, total_amount=amount, status=status,
+            created_at=now - timedelta(days=days_ago),
+        ))
+    db.commit()
+
+
+def test_customer_analytics_are_aggregated_and_ranked(db):
+    add_customers(db)
+    analytics = CustomerService(db).get_customer_analytics()
+
+    assert analytics["total_customers"] == 4
+    assert analytics["active_customers"] == 3
+    assert analytics["customers_with_orders"] == 3
+    assert analytics["average_lifetime_value"] == pytest.approx(200.0)
+    assert analytics["customer_distribution"]["status"]["INACTIVE"] == 1
+    assert analytics["customer_distribution"]["tier"]["VIP"] == 1
+    assert sum(analytics["rfm_segments"].values()) == 3
+
+    top = analytics["top_customers"]
+    assert [(c["id"], c["rank"], c["total_spent"], c["order_count"]) for c in top] == [
+        (1, 1, 500.0, 2), (2, 2, 80.0, 1), (3, 3, 20.0, 1),
+    ]
+    assert top[0]["email"] == "ada@example.com"
+    assert top[0]["average_order_value"] == 250.0
+    assert top[0]["monetary_score"] > top[2]["monetary_score"]
+    assert top[2]["recency_score"] < top[1]["recency_score"]
+
+
+def test_customer_analytics_are_cached_per_data_version(db):
+    add_customers(db)
+    service = CustomerService(db)
+    first = service.get_customer_analytics()
+    assert service.get_customer_analytics() is first
+
+    db.add(Sale(customer_id=4, total_amount=1000.0, status=SaleStatus.COMPLETED))
+    db.commit()
+    second = service.get_customer_analytics()
+    assert second is not first
+    assert second["top_customers"][0]["id"] == 4
+
+
+def test_customer_value_analysis_filters_period_and_tier(db):
+    add_customers(db)
+    service = CustomerService(db)
+    now = datetime.now()
+
+    analysis = service.get_customer_value_analysis(start_date=now - timedelta(days=30))
+    summary = analysis["summary"]
+    assert [row["customer_id"] for row in analysis["customers"]] == [1, 2]
+    assert summary["total_revenue"] == 280.0
+    assert summary["new_customers"] == 2  # First orders within the period
+    assert summary["inactive_customers"] == 0
+
+    vip = service.get_customer_value_analysis(tier="vip")
+    assert vip["total_customers"] == 1
+    assert [row["revenue"] for row in vip["customers"]] == [500.0]
+
+    with pytest.raises(ValidationException):
+        service.get_customer_value_analysis(tier="gold")
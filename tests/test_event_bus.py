@@ -0,0 +1,78 @@
+# tests/test_event_bus.py
+import asyncio
+from dataclasses import dataclass
+
+from app.core.events import EntityUpdatedEvent, EventBus, ToolCreated
+
+
+@dataclass(eq=False)
+class ToolUpdatedEvent(EntityUpdatedEvent):
+    pass
+
+
+def test_handlers_of_base_classes_receive_subclass_events():
+    bus = EventBus()
+    received = []
+    bus.subscribe(EntityUpdatedEvent, lambda event: received.append(("base", event.entity_id)))
+    bus.subscribe(ToolUpdatedEvent, lambda event: received.append(("tool", event.entity_id)))
+
+    bus.publish(ToolUpdatedEvent(entity_id=1, entity_type="Tool"))
+    bus.publish(EntityUpdatedEvent(entity_id=2, entity_type="Pattern"))
+
+    assert received == [("tool", 1), ("base", 1), ("base", 2)]
+
+
+def test_plans_follow_subscription_changes():
+    bus = EventBus()
+    received = []
+
+    def handler(event):
+        received.append(event.entity_id)
+
+    bus.publish(ToolUpdatedEvent(entity_id=1, entity_type="Tool"))
+    bus.subscribe(EntityUpdatedEvent, handler)
+    bus.publish(ToolUpdatedEvent(entity_id=2, entity_type="Tool"))
+    assert bus.unsubscribe(EntityUpdatedEvent, handler)
+    bus.publish(ToolUpdatedEvent(entity_id=3, entity_type="Tool"))
+
+    assert received == [2]
+    assert bus.get_plan(ToolUpdatedEvent).is_empty
+
+
+def test_batch_handlers_receive_lists():
+    bus = EventBus()
+    single, batches = [], []
+    bus.subscribe(EntityUpdatedEvent, lambda event: single.append(event.entity_id))
+    bus.subscribe(
+        EntityUpdatedEvent,
+        lambda events: batches.append([event.entity_id for event in events]),
+        batch=True,
+    )
+
+    bus.publish_batch([
+        EntityUpdatedEvent(entity_id=1, entity_type="Tool"),
+        ToolCreated(tool_id=9),
+        ToolUpdatedEvent(entity_id=2, entity_type="Tool"),
+    ])
+    bus.publish(EntityUpdatedEvent(entity_id=3, entity_type="Tool"))
+
+    assert single == [1, 2, 3]
+    assert batches == [[1, 2], [3]]
+
+
+def test_async_publish_runs_sync_and_async_handlers():
+    bus = EventBus()
+    received = []
+
+    async def async_handler(event):
+        received.append(("async", event.entity_id))
+
+    bus.subscribe(EntityUpdatedEvent, async_handler)
+    bus.subscribe(EntityUpdatedEvent, lambda events: received.append(("batch", len(events))), batch=True)
+
+    asyncio.run(bus.publish_batch_async([
+        EntityUpdatedEvent(entity_id=1, entity_type="Tool"),
+        EntityUpdatedEvent(entity_id=2, entity_type="Tool"),
+    ]))
+
+    assert sorted(received) == [("async", 1), ("async", 2), ("batch", 2)]
@@ -0,0 +1,99 @@
+# tests/test_event_stream.py
+import asyncio
+import json
+
+from app.core.events import EventBus, WorkflowProgressUpdateEvent
+from app.services.event_stream import EventStreamHub
+from app.services.notification_service import NotificationCreated
+
+
+def progress(execution_id, user_id=None):
+    return WorkflowProgressUpdateEvent(execution_id=execution_id, user_id=user_id)
+
+
+async def read(hub, client, count):
+    messages = []
+    stream = hub.stream(client)
+    async for chunk in stream:
+        messages += [m for m in chunk.split(b"\n\n") if m.startswith((b"id:", b"event:"))]
+        if len(messages) >= count:
+            break
+    await stream.aclose()
+    return messages
+
+
+def test_events_are_routed_by_user_and_execution():
+    async def scenario():
+        bus = EventBus()
+        hub = EventStreamHub(bus, event_types=[WorkflowProgressUpdateEvent])
+        follower = hub.connect(user_id=1, execution_ids=[7])
+        other = hub.connect(user_id=2)
+
+        bus.publish(progress(7))
+        bus.publish(progress(8, user_id=1))
+        bus.publish(progress(9))
+        await asyncio.sleep(0)
+
+        assert len(await read(hub, follower, 2)) == 2
+        assert other.queue.empty()
+        hub.disconnect(other)
+        assert hub.get_stats()["clients"] == 0
+
+    asyncio.run(scenario())
+
+
+def test_resume_replays_missed_events_once():
+    async def scenario():
+        bus = EventBus()
+        hub = EventStreamHub(bus, event_types=[WorkflowProgressUpdateEvent])
+        first = hub.connect(user_id=1, execution_ids=[7])
+        bus.publish(progress(7))
+        await asyncio.sleep(0)
+        [message] = await read(hub, first, 1)
+        last_event_id = message.split(b"\n", 1)[0][len(b"id: "):].decode()
+
+        bus.publish(progress(7))
+        bus.publish(progress(7))
+        resumed = hub.connect(user_id=1, execution_ids=[7], last_event_id=last_event_id)
+        await asyncio.sleep(0)
+        assert resumed.queue.qsize() == 2
+
+        stale = hub.connect(user_id=1, last_event_id="other-process:3")
+        assert (await read(hub, stale, 1))[0].startswith(b"event: reset")
+
+    asyncio.run(scenario())
+
+
+def test_slow_client_is_cut_off():
+    async def scenario():
+        bus = EventBus()
+        hub = EventStreamHub(bus, client_queue_size=3, event_types=[WorkflowProgressUpdateEvent])
+        client = hub.connect(user_id=1, execution_ids=[7])
+        for _ in range(5):
+            bus.publish(progress(7))
+        await asyncio.sleep(0)
+
+        assert client.overflowed
+        assert (await read(hub, client, 1)) == [b"event: overflow\ndata: {}"]
+
+    asyncio.run(scenario())
+
+
+def test_notification_payload_carries_its_fields():
+    async def scenario():
+        bus = EventBus()
+        hub = EventStreamHub(bus, event_types=[NotificationCreated])
+        client = hub.connect(user_id=1)
+        bus.publish(NotificationCreated(
+            notification_id="n-1", notification_type="INVENTORY_LOW", user_id=1, priority="HIGH",
+        ))
+        await asyncio.sleep(0)
+
+        [message] = await read(hub, client, 1)
+        data = json.loads(message.split(b"data: ", 1)[1])
+        assert data["event_type"] == "NotificationCreated"
+        assert (data["notification_id"], data["notification_type"], data["priority"]) == (
+            "n-1", "INVENTORY_LOW", "HIGH",
+        )
+
+    asyncio.run(scenario())
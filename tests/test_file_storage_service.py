@@ -0,0 +1,118 @@
+# tests/test_file_storage_service.py
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.db.models.base import Base
+from app.db.models.file_metadata import FileMetadata
+from app.repositories.file_metadata_repository import FileMetadataRepository
+from app.services.file_storage_service import FileStorageService
+from app.services.image_derivative_service import ImageDerivativeService
+
+
+@pytest.fixture()
+def store(tmp_path):
+    # A database file, so concurrent requests get their own connections
+    engine = create_engine(f"sqlite:///{tmp_path / 'files.db'}")
+    Base.metadata.create_all(bind=engine, tables=[FileMetadata.__table__])
+    Session = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    base_path = tmp_path / "files"
+    sessions = []
+
+    # Each call is one request: its own session and service on the shared store
+    def new_service():
+        session = Session()
+        sessions.append(session)
+        return FileStorageService(
+            str(base_path),
+            metadata_repository=FileMetadataRepository(session),
+            generate_thumbnails=False,
+            derivative_service=ImageDerivativeService(str(base_path)),
+        )
+
+    yield new_service
+    for session in sessions:
+        session.close()
+    engine.dispose()
+
+
+def test_second_upload_reuses_the_blob_until_the_last_reference_goes(store):
+    service = store()
+    first = service.store_file(b"saddle stitch", "a.txt")
+    second = service.store_file(b"saddle stitch", "b.txt")
+
+    assert first["file_id"] != second["file_id"]
+    assert first["storage_path"] == second["storage_path"]
+    blob = service.base_path / first["storage_path"]
+    assert service.get_file_metadata(second["file_id"])["ref_count"] == 2
+
+    assert service.delete_file(first["file_id"], permanent=True)
+    assert blob.read_bytes() == b"saddle stitch"
+    assert service.get_file_metadata(second["file_id"])["ref_count"] == 1
+
+    assert service.delete_file(second["file_id"], permanent=True)
+    assert not blob.exists()
+
+
+def test_upload_restores_a_blob_deleted_after_it_was_reused(store):
+    uploads, deletes = store(), store()
+    first = uploads.store_file(b"edge paint", "a.txt")
+    # Keeps SQLite from reusing the deleted row's ID for the new one
+    uploads.store_file(b"dye", "c.txt")
+    create = uploads.metadata_repository.create_file_metadata
+
+    # The last other reference is permanently deleted after the upload
+    # chose to reuse the blob, before its own row is committed
+    def delete_then_create(data):
+        deletes.delete_file(first["file_id"], permanent=True)
+        return create(data)
+
+    uploads.metadata_repository.create_file_metadata = delete_then_create
+    second = uploads.store_file(b"edge paint", "b.txt")
+
+    assert (uploads.base_path / second["storage_path"]).read_bytes() == b"edge paint"
+
+
+def test_delete_keeps_a_blob_referenced_during_the_delete(store):
+    uploads, deletes = store(), store()
+    first = uploads.store_file(b"burnished", "a.txt")
+    recount = deletes.metadata_repository.sync_ref_count
+    second = {}
+
+    # An upload of the same bytes commits after the delete counted no references
+    def recount_then_upload(checksum):
+        count = recount(checksum)
+        if not second:
+            second.update(uploads.store_file(b"burnished", "b.txt"))
+        return count
+
+    deletes.metadata_repository.sync_ref_count = recount_then_upload
+    assert deletes.delete_file(first["file_id"], permanent=True)
+
+    assert (uploads.base_path / second["storage_path"]).read_bytes() == b"burnished"
+
+
+def test_deduplicate_store_collapses_legacy_copies(store):
+    service = store()
+    session = service.metadata_repository.session
+    for index in range(2):
+        path = service.base_path / "legacy" / f"{index}.txt"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(b"veg tan")
+        session.add(FileMetadata(
+            filename=path.name,
+            original_filename=path.name,
+            content_type="text/plain",
+            size=7,
+            storage_path=f"legacy/{index}.txt",
+        ))
+    session.commit()
+
+    stats = service.deduplicate_store()
+
+    rows = session.query(FileMetadata).all()
+    assert stats["blobs"] == 1 and stats["rows_relinked"] == 2 and stats["files_removed"] == 2
+    assert len({row.storage_path for row in rows}) == 1
+    assert [row.ref_count for row in rows] == [2, 2]
+    assert (service.base_path / rows[0].storage_path).read_bytes() == b"veg tan"
+    assert not (service.base_path / "legacy" / "0.txt").exists()
@@ -0,0 +1,248 @@
+# tests/test_inventory_service.py
+import json
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.core.events import EventBus, get_event_class
+from app.core.exceptions import InsufficientInventoryException
+from app.db.models.base import Base
+from app.db.models.enums import (
+    InventoryAdjustmentType,
+    InventoryStatus,
+    MeasurementUnit,
+    ToolCategory,
+    TransactionType,
+)
+from app.db.models.event_outbox import OutboxEvent
+from app.db.models.inventory import Inventory, InventorySnapshot, InventoryTransaction
+from app.db.models.material import Material
+from app.db.models.product import Product
+from app.db.models.tool import Tool
+from app.services.inventory_service import BackInStock, InventoryService, LowStock
+
+engine = create_engine(
+    "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+)
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+TABLES = [
+    model.__table__
+    for model in (
+        Inventory, InventoryTransaction, InventorySnapshot, Product, Material, Tool, OutboxEvent,
+    )
+]
+
+
+@pytest.fixture()
+def db():
+    Base.metadata.create_all(bind=engine, tables=TABLES)
+    session = TestingSessionLocal()
+    yield session
+    session.close()
+    Base.metadata.drop_all(bind=engine, tables=TABLES)
+
+
+def add_stock(db):
+    db.add_all([
+        Product(id=1, name="Wallet", sku="W-1", total_cost=20.0),
+        Material(id=1, name="Veg tan", material_type="material", unit=MeasurementUnit.PIECE, cost_price=2.5),
+        Tool(id=1, name="Edger", category=next(iter(ToolCategory)), purchase_price=40.0),
+        Inventory(item_type="product", item_id=1, quantity=3, storage_location="A1"),
+        Inventory(item_type="material", item_id=1, quantity=10, storage_location="B2"),
+        Inventory(item_type="tool", item_id=1, quantity=1),
+        Inventory(item_type="tool", item_id=2, quantity=0),
+    ])
+    db.commit()
+
+
+def test_inventory_is_valued_in_one_query(db):
+    add_stock(db)
+    value = InventoryService(db).calculate_inventory_value()
+
+    assert value["total_value"] == 125.0
+    assert value["item_count"] == 3
+    assert value["by_type"]["material"] == {"count": 1, "value": 25.0}
+    assert [item["name"] for item in value["items"]] == ["Wallet", "Edger", "Veg tan"]
+    assert value["items"][2]["unit"] == "PIECE"
+
+    totals = InventoryService(db).calculate_inventory_value(include_items=False)
+    assert totals["total_value"] == 125.0
+    assert totals["by_type"] == value["by_type"]
+    assert totals["items"] == []
+
+
+def test_valuation_as_of_date_replays_later_transactions(db):
+    add_stock(db)
+    now = datetime.now()
+    db.add_all([
+        InventoryTransaction(
+            item_type="material", item_id=1, quantity=6,
+            transaction_type=TransactionType.PURCHASE, transaction_date=now - timedelta(days=1),
+        ),
+        InventoryTransaction(
+            item_type="product", item_id=1, quantity=-2,
+            transaction_type=TransactionType.PURCHASE, transaction_date=now - timedelta(days=2),
+        ),
+        InventoryTransaction(
+            item_type="tool", item_id=1, quantity=1,
+            transaction_type=TransactionType.PURCHASE, transaction_date=now - timedelta(days=10),
+        ),
+    ])
+    db.commit()
+
+    value = InventoryService(db).calculate_inventory_value(as_of_date=now - timedelta(days=5))
+
+    # 5 wallets and 4 sides of leather then; the edger was already in stock
+    assert value["total_value"] == 5 * 20.0 + 4 * 2.5 + 40.0
+    assert {item["item_type"]: item["quantity"] for item in value["items"]} == {
+        "product": 5, "material": 4, "tool": 1,
+    }
+
+
+def test_stock_as_of_starts_from_the_latest_snapshot(db):
+    db.add(Inventory(item_type="material", item_id=1, quantity=8))
+    day = datetime(2024, 1, 1)
+    for offset, change in enumerate([10, -3, 5, -2, 4, -6]):
+        db.add(InventoryTransaction(
+            item_type="material", item_id=1, quantity=change,
+            transaction_type=TransactionType.PURCHASE,
+            transaction_date=day + timedelta(days=offset * 10, hours=12),
+        ))
+    db.commit()
+    service = InventoryService(db)
+    replayed = [service.get_stock_as_of("material", 1, day + timedelta(days=d)) for d in range(0, 60, 5)]
+
+    assert service.backfill_stock_snapshots(day, daily_days=0) > 1
+    db.query(Inventory).one().quantity = 1000  # Ignored once snapshots exist
+    db.commit()
+
+    assert [service.get_stock_as_of("material", 1, day + timedelta(days=d)) for d in range(0, 60, 5)] == replayed
+    assert replayed[:3] == [0, 10, 10]
+    report = service._generate_movement_report({
+        "item_type": "material", "item_id": 1,
+        "start_date": "2024-01-15", "end_date": "2024-02-05",
+    })
+    assert report["summary"]["total_quantity_in"] == 5
+    assert report["summary"]["total_quantity_out"] == 2
+    assert (report["summary"]["opening_quantity"], report["summary"]["closing_quantity"]) == (7, 10)
+
+
+def test_bulk_adjust_is_all_or_nothing(db):
+    add_stock(db)
+    service = InventoryService(db)
+    with pytest.raises(InsufficientInventoryException):
+        service.bulk_adjust(
+            [
+                {"item_type": "material", "item_id": 1, "quantity_change": 5},
+                {"item_type": "product", "item_id": 1, "quantity_change": -4},
+            ],
+            InventoryAdjustmentType.USAGE,
+            "Sale #1",
+        )
+    assert db.query(InventoryTransaction).count() == 0
+
+    results = service.bulk_adjust(
+        [
+            {"item_type": "material", "item_id": 1, "quantity_change": -4},
+            {"item_type": "product", "item_id": 1, "quantity_change": -3},
+            {"item_type": "material", "item_id": 1, "quantity_change": -4},
+            {"item_type": "tool", "item_id": 3, "quantity_change": 2},
+        ],
+        InventoryAdjustmentType.USAGE,
+        "Sale #2",
+    )
+
+    assert {(r["item_type"], r["new_quantity"], r["status"]) for r in results} == {
+        ("material", 2, "IN_STOCK"), ("product", 0, "OUT_OF_STOCK"), ("tool", 2, "IN_STOCK"),
+    }
+    assert db.query(InventoryTransaction).count() == 4
+    product = db.query(Inventory).filter_by(item_type="product", item_id=1).one()
+    assert product.status == InventoryStatus.OUT_OF_STOCK
+
+
+def test_concurrent_bulk_adjustments_never_oversell(tmp_path):
+    file_engine = create_engine(f"sqlite:///{tmp_path}/inventory.db")
+    Base.metadata.create_all(bind=file_engine, tables=TABLES)
+    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=file_engine)
+    setup = SessionLocal()
+    setup.add(Inventory(item_type="product", item_id=1, quantity=150))
+    setup.commit()
+    setup.close()
+
+    def sell(_):
+        session = SessionLocal()
+        try:
+            InventoryService(session).bulk_adjust(
+                [{"item_type": "product", "item_id": 1, "quantity_change": -1}],
+                InventoryAdjustmentType.USAGE,
+                "Sale",
+            )
+            return True
+        except InsufficientInventoryException:
+            return False
+        finally:
+            session.close()
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        sold = sum(pool.map(sell, range(200)))
+
+    check = SessionLocal()
+    assert sold == 150
+    assert check.query(Inventory).one().quantity == 0
+    assert check.query(InventoryTransaction).count() == 150
+    check.close()
+    file_engine.dispose()
+
+
+def enqueued_transitions(db):
+    rows = db.query(OutboxEvent).filter(OutboxEvent.event_type.in_(["LowStock", "BackInStock"]))
+    return [
+        get_event_class(row.event_type).from_dict(json.loads(row.payload))
+        for row in rows.order_by(OutboxEvent.id)
+    ]
+
+
+def test_reorder_point_crossings_are_enqueued_once(db):
+    db.add_all([
+        Material(id=1, name="Veg tan", material_type="material", unit=MeasurementUnit.PIECE, reorder_point=5),
+        Inventory(item_type="material", item_id=1, quantity=10),
+    ])
+    db.commit()
+    service = InventoryService(db, event_bus=EventBus())
+
+    def sell(quantity):
+        service.bulk_adjust(
+            [{"item_type": "material", "item_id": 1, "quantity_change": -quantity}],
+            InventoryAdjustmentType.USAGE,
+            "Sale",
+        )
+
+    sell(4)
+    sell(3)
+    sell(1)
+    assert [type(e) for e in enqueued_transitions(db)] == [LowStock]
+    assert service.repository.count_needs_reorder() == 1
+    assert [item["quantity"] for item in service.get_low_stock_items()] == [2]
+
+    service.bulk_adjust(
+        [{"item_type": "material", "item_id": 1, "quantity_change": 10}],
+        InventoryAdjustmentType.RESTOCK,
+        "Delivery",
+    )
+    db.query(Material).one().reorder_point = 20
+    db.commit()
+    service.reevaluate_status("material", 1)
+    service.reevaluate_status("material", 1)
+
+    transitions = enqueued_transitions(db)
+    assert [(type(e), e.current_quantity) for e in transitions] == [
+        (LowStock, 3), (BackInStock, 12), (LowStock, 12),
+    ]
+    inventory_id = transitions[0].inventory_id
+    assert {row.ordering_key for row in db.query(OutboxEvent)} == {f"Inventory:{inventory_id}"}
+    assert service.get_low_stock_items()[0]["percent_of_reorder"] == 60.0
+    assert service.get_low_stock_items(threshold_percentage=50) == []
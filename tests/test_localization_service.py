@@ -0,0 +1,145 @@
+# tests/test_localization_service.py
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from app.db.models.entity_translation import EntityTranslation, TranslationCatalogVersion
+from app.services.localization_service import LocalizationService
+from app.services.translation_catalog import TranslationCatalog, get_fallback_chain
+
+TEST_DATABASE_URL = "sqlite://"
+
+engine = create_engine(TEST_DATABASE_URL)
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+@pytest.fixture()
+def db():
+    EntityTranslation.__table__.create(bind=engine)
+    TranslationCatalogVersion.__table__.create(bind=engine)
+    session = TestingSessionLocal()
+    yield session
+    session.close()
+    TranslationCatalogVersion.__table__.drop(bind=engine)
+    EntityTranslation.__table__.drop(bind=engine)
+
+
+@pytest.fixture()
+def query_counter():
+    statements = []
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", count)
+    yield statements
+    event.remove(engine, "before_cursor_execute", count)
+
+
+def make_tools():
+    return [
+        SimpleNamespace(
+            id=tool_id,
+            name=f"Tool {tool_id}",
+            description="original",
+            specifications="spec",
+        )
+        for tool_id in range(1, 101)
+    ]
+
+
+def test_bulk_hydrate_entities_uses_one_query_per_page(db, query_counter):
+    service = LocalizationService(db)
+    service.catalog = None
+    service.default_locale = "en"
+
+    # 100 tools: German names for even IDs, English fallback descriptions for
+    # every third ID, no translations at all for specifications
+    for tool_id in range(1, 101):
+        if tool_id % 2 == 0:
+            db.add(EntityTranslation(
+                entity_type="tool", entity_id=tool_id, locale="de",
+                field_name="name", translated_value=f"Werkzeug {tool_id}",
+            ))
+        if tool_id % 3 == 0:
+            db.add(EntityTranslation(
+                entity_type="tool", entity_id=tool_id, locale="en",
+                field_name="description", translated_value=f"Tool {tool_id} (en)",
+            ))
+    db.commit()
+
+    tools = make_tools()
+
+    query_counter.clear()
+    service.bulk_hydrate_entities(tools, "tool", "de")
+
+    assert len(query_counter) == 1
+    assert tools[1].name == "Werkzeug 2"
+    assert tools[0].name == "Tool 1"
+    assert tools[2].description == "Tool 3 (en)"
+    assert tools[1].description == "original"
+    assert all(tool.specifications == "spec" for tool in tools)
+
+
+def test_fallback_chain_walks_parent_locales():
+    assert get_fallback_chain("de-AT", "en") == ["de-at", "de", "en"]
+    assert get_fallback_chain("en", "en") == ["en"]
+
+
+def test_catalog_serves_warm_pages_without_queries(db, query_counter):
+    catalog = TranslationCatalog(poll_interval=3600)
+    service = LocalizationService(db, catalog=catalog)
+    service.default_locale = "en"
+
+    db.add(EntityTranslation(
+        entity_type="tool", entity_id=1, locale="de",
+        field_name="name", translated_value="Hammer",
+    ))
+    db.commit()
+
+    service.bulk_hydrate_entities(make_tools(), "tool", "de-AT")
+
+    query_counter.clear()
+    tools = make_tools()
+    service.bulk_hydrate_entities(tools, "tool", "de-AT")
+
+    assert query_counter == []
+    assert tools[0].name == "Hammer"
+
+
+def test_catalog_picks_up_writes_from_other_workers(db):
+    catalog = TranslationCatalog(poll_interval=0)
+    service = LocalizationService(db, catalog=catalog)
+    service.default_locale = "en"
+
+    tools = make_tools()
+    service.bulk_hydrate_entities(tools, "tool", "de")
+    assert tools[0].name == "Tool 1"
+
+    # Written through the repository, as another worker would, so the local
+    # catalog only learns about it from the bumped version
+    service.translation_repo.upsert_translation("tool", 1, "de", "name", "Hammer")
+
+    tools = make_tools()
+    service.bulk_hydrate_entities(tools, "tool", "de")
+    assert tools[0].name == "Hammer"
+
+
+def test_catalog_serves_a_translation_written_through_the_service(db):
+    catalog = TranslationCatalog(poll_interval=3600)
+    service = LocalizationService(db, catalog=catalog)
+    service.default_locale = "en"
+
+    tools = make_tools()
+    service.bulk_hydrate_entities(tools, "tool", "de")
+    assert tools[0].name == "Tool 1"
+
+    service.create_or_update_translation("tool", 1, "de", "name", "Hammer", user_id=1)
+
+    tools = make_tools()
+    service.bulk_hydrate_entities(tools, "tool", "de")
+    assert tools[0].name == "Hammer"
+    assert db.query(TranslationCatalogVersion).filter_by(catalog="tool").one().version == 1
@@ -0,0 +1,22 @@
+# tests/test_media_asset_service.py
+from types import SimpleNamespace
+
+from app.services.media_asset_service import MediaAssetService
+from app.services.media_path_index import MediaPathIndex
+
+
+def test_path_index_is_not_served_after_another_worker_replaces_the_file(tmp_path):
+    old_file, new_file = tmp_path / "old.png", tmp_path / "new.png"
+    old_file.write_bytes(b"old")
+    new_file.write_bytes(b"new")
+    index = MediaPathIndex()
+    service = MediaAssetService(None, derivative_service=object(), path_index=index)
+
+    asset = SimpleNamespace(storage_location=str(old_file), checksum="old-sum")
+    assert service.find_file_path("a-1", asset) == str(old_file)
+    assert service.find_file_path("a-1", asset) == str(old_file)
+    assert index.get_stats()["hits"] == 1
+
+    # Another worker's update_file only invalidated its own index
+    asset = SimpleNamespace(storage_location=str(new_file), checksum="new-sum")
+    assert service.find_file_path("a-1", asset) == str(new_file)
@@ -0,0 +1,142 @@
+# tests/test_outbox_dispatcher.py
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.core.events import EntityUpdatedEvent, EventBus
+from app.db.models.event_outbox import OutboxEvent
+from app.services.outbox_dispatcher import OutboxDispatcher
+
+engine = create_engine(
+    "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+)
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+@pytest.fixture()
+def db():
+    OutboxEvent.__table__.create(bind=engine)
+    session = TestingSessionLocal()
+    yield session
+    session.close()
+    OutboxEvent.__table__.drop(bind=engine)
+
+
+def make_dispatcher(bus, **kwargs):
+    return OutboxDispatcher(TestingSessionLocal, bus, base_backoff=0, **kwargs)
+
+
+def enqueue(db, bus, entity_id, ordering_key=None):
+    bus.enqueue(
+        db, EntityUpdatedEvent(entity_id=entity_id, entity_type="Tool"), ordering_key=ordering_key
+    )
+
+
+def test_enqueued_events_are_delivered_only_after_commit(db):
+    bus = EventBus()
+    received = []
+    bus.subscribe(EntityUpdatedEvent, lambda event: received.append(event.entity_id))
+    dispatcher = make_dispatcher(bus)
+
+    enqueue(db, bus, 1)
+    db.rollback()
+    enqueue(db, bus, 2)
+    db.commit()
+
+    assert dispatcher.dispatch_once() == 1
+    assert received == [2]
+    assert db.query(OutboxEvent).one().status == "delivered"
+    assert dispatcher.dispatch_once() == 0
+
+
+def test_failed_handler_is_retried_without_rerunning_others(db):
+    bus = EventBus()
+    calls = {"audit": 0, "flaky": 0}
+
+    def audit(event):
+        calls["audit"] += 1
+
+    def flaky(event):
+        calls["flaky"] += 1
+        if calls["flaky"] == 1:
+            raise RuntimeError("temporarily unavailable")
+
+    bus.subscribe(EntityUpdatedEvent, audit)
+    bus.subscribe(EntityUpdatedEvent, flaky)
+    dispatcher = make_dispatcher(bus)
+    enqueue(db, bus, 1)
+    db.commit()
+
+    dispatcher.dispatch_once()
+    row = db.query(OutboxEvent).one()
+    assert (row.status, row.attempts) == ("pending", 1)
+
+    dispatcher.dispatch_once()
+    db.refresh(row)
+    assert row.status == "delivered"
+    assert calls == {"audit": 1, "flaky": 2}
+
+
+def test_failing_event_holds_back_its_ordering_key(db):
+    bus = EventBus()
+    received = []
+
+    def handler(event):
+        if event.entity_id == 1 and 1 not in received:
+            received.append(1)
+            raise RuntimeError("fail once")
+        received.append(event.entity_id)
+
+    bus.subscribe(EntityUpdatedEvent, handler)
+    dispatcher = make_dispatcher(bus)
+    enqueue(db, bus, 1, ordering_key="Tool:1")
+    enqueue(db, bus, 2, ordering_key="Tool:1")
+    enqueue(db, bus, 3)
+    db.commit()
+
+    dispatcher.dispatch_once()
+    assert received == [1, 3]
+
+    dispatcher.dispatch_once()
+    assert received == [1, 3, 1, 2]
+
+
+def test_event_is_marked_dead_after_max_attempts(db):
+    bus = EventBus()
+
+    def broken(event):
+        raise RuntimeError("always fails")
+
+    bus.subscribe(EntityUpdatedEvent, broken)
+    dispatcher = make_dispatcher(bus, max_attempts=2)
+    enqueue(db, bus, 1)
+    db.commit()
+
+    dispatcher.dispatch_once()
+    dispatcher.dispatch_once()
+    row = db.query(OutboxEvent).one()
+    assert (row.status, row.attempts) == ("dead", 2)
+    assert "always fails" in row.last_error
+
+
+def test_expired_claims_are_taken_over(db):
+    bus = EventBus()
+    received = []
+    bus.subscribe(EntityUpdatedEvent, lambda event: received.append(event.entity_id))
+    enqueue(db, bus, 1)
+    db.commit()
+    row = db.query(OutboxEvent).one()
+    row.locked_by = "crashed-dispatcher"
+    row.locked_until = datetime.now() + timedelta(seconds=60)
+    db.commit()
+
+    dispatcher = make_dispatcher(bus)
+    assert dispatcher.dispatch_once() == 0
+
+    row.locked_until = datetime.now() - timedelta(seconds=1)
+    db.commit()
+    assert dispatcher.dispatch_once() == 1
+    assert received == [1]
@@ -0,0 +1,78 @@
+# tests/test_pricing_service.py
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.core.exceptions import ValidationException
+from app.db.models.base import Base
+from app.db.models.enums import ProjectType
+from app.db.models.product import Product
+from app.services.pricing_service import PricingService
+
+engine = create_engine(
+    "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+)
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+TABLES = [Product.__table__]
+
+
+@pytest.fixture()
+def db():
+    Base.metadata.create_all(bind=engine, tables=TABLES)
+    session = TestingSessionLocal()
+    yield session
+    session.close()
+    Base.metadata.drop_all(bind=engine, tables=TABLES)
+
+
+def add_products(db):
+    db.add_all([
+        Product(
+            id=1, name="Wallet", sku="W-1", product_type=ProjectType.WALLET, selling_price=100.0,
+            total_cost=45.0, material_cost=20.0, hardware_cost=5.0, labor_cost=15.0, overhead_cost=5.0,
+        ),
+        # Cost never split: priced from total_cost
+        Product(id=2, name="Belt", sku="B-1", product_type=ProjectType.BELT, selling_price=50.0, total_cost=40.0),
+        Product(id=3, name="Prototype", sku="P-1", product_type=ProjectType.WALLET, total_cost=10.0),
+    ])
+    db.commit()
+
+
+def test_catalog_is_priced_with_the_calculator_formulas(db):
+    add_products(db)
+    parameters = {"overhead": 10, "target_margin": 30, "platform_fees": 10, "shipping_cost": 5}
+    result = PricingService(db).reprice_catalog(parameters)
+    products = {p["product_id"]: p for p in result["products"]}
+
+    # (20 + 5 + 15) * 1.1 + 5 overhead = 49; + 5 shipping over 90% and 60% kept
+    assert products[1]["total_cost"] == 49.0
+    assert products[1]["break_even_price"] == round(54 / 0.9, 2)
+    assert products[1]["suggested_price"] == 90.0
+    assert products[1]["margin_after"] == round((100 * 0.9 - 54) / 100 * 100, 2)
+    assert products[2]["total_cost"] == 44.0
+    assert products[3]["margin_after"] is None
+    assert [p["product_id"] for p in result["products"]] == [2, 1, 3]
+    assert result["summary"]["priced_products"] == 2
+    assert result["summary"]["below_break_even_before"] == 1
+
+
+def test_what_if_cost_changes_apply_per_component(db):
+    add_products(db)
+    service = PricingService(db)
+    result = service.reprice_catalog({"target_margin": 40}, cost_changes={"material": 10})
+    products = {p["product_id"]: p for p in result["products"]}
+
+    assert products[1]["total_cost"] == 47.0
+    assert products[1]["suggested_price_change"] == round(2 / 0.6, 2)
+    assert (products[2]["margin_before"], products[2]["margin_after"]) == (20.0, 12.0)
+    assert result["summary"]["avg_margin_after"] < result["summary"]["avg_margin_before"]
+
+    wallets = service.reprice_catalog({"target_margin": 40}, product_type="wallet", limit=1)
+    assert wallets["summary"]["products"] == 2
+    assert [p["product_id"] for p in wallets["products"]] == [1]
+
+    with pytest.raises(ValidationException):
+        service.reprice_catalog({"target_margin": 60, "platform_fees": 40})
+    with pytest.raises(ValidationException):
+        service.reprice_catalog({"target_margin": 40}, cost_changes={"leather": 8})
@@ -0,0 +1,52 @@
+# tests/test_product_service.py
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.db.models.base import Base
+from app.db.models.inventory import Inventory, InventoryTransaction
+from app.db.models.material import Material
+from app.db.models.product import Product
+from app.db.models.tool import Tool
+from app.schemas.product import ProductUpdate
+from app.services.cache_service import CacheService
+from app.services.inventory_service import InventoryService
+from app.services.product_service import ProductService
+
+engine = create_engine(
+    "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+)
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Product.inventory is joined-loaded, and Inventory joins its material and tool
+TABLES = [
+    model.__table__
+    for model in (Inventory, InventoryTransaction, Product, Material, Tool)
+]
+
+
+@pytest.fixture()
+def db():
+    Base.metadata.create_all(bind=engine, tables=TABLES)
+    session = TestingSessionLocal()
+    yield session
+    session.close()
+    Base.metadata.drop_all(bind=engine, tables=TABLES)
+
+
+def test_update_product_invalidates_the_shared_cache(db):
+    db.add(Product(id=1, name="Wallet", sku="W-1", total_cost=20.0))
+    db.commit()
+    cache = CacheService(config={"maintenance_interval": 0})
+    service = ProductService(db, inventory_service=InventoryService(db), cache_service=cache)
+
+    assert service.get_by_id(1).name == "Wallet"
+    cache.set("Product:detail:1", {"name": "Wallet"})
+    cache.set("Product:list:skip=0", [{"name": "Wallet"}])
+
+    updated = service.update_product(1, ProductUpdate(name="Card wallet"), user_id=1)
+
+    assert updated.name == "Card wallet"
+    for key in ("Product:1", "Product:detail:1", "Product:list:skip=0"):
+        assert cache.get(key) is None
+    assert service.get_by_id(1).name == "Card wallet"
@@ -0,0 +1,148 @@
+# tests/test_sale_service.py
+from datetime import datetime
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.core.exceptions import ValidationException
+from app.db.models.base import Base
+from app.db.models.customer import Customer
+from app.db.models.analytics_rollup import PurchaseDailyRollup, SalesDailyRollup
+from app.db.models.enums import PaymentStatus, ProjectType, PurchaseStatus, SaleStatus
+from app.db.models.product import Product
+from app.db.models.purchase import Purchase
+from app.db.models.refund import Refund
+from app.db.models.sales import Sale, SaleItem
+from app.services.analytics_rollup_service import AnalyticsRollupService
+from app.services.cache_service import CacheService
+from app.services.customer_service import CustomerService
+from app.services.refund_service import RefundService
+from app.services.sale_service import SaleService
+
+engine = create_engine(
+    "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+)
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+TABLES = [
+    model.__table__
+    for model in (
+        Customer, Sale, SaleItem, Product, Refund, Purchase,
+        SalesDailyRollup, PurchaseDailyRollup,
+    )
+]
+
+
+@pytest.fixture()
+def db():
+    Base.metadata.create_all(bind=engine, tables=TABLES)
+    session = TestingSessionLocal()
+    yield session
+    session.close()
+    Base.metadata.drop_all(bind=engine, tables=TABLES)
+
+
+def add_sales(db):
+    db.add(Customer(id=1, name="Ada", email="ada@example.com"))
+    for day, amount, status, payment in [
+        (datetime(2024, 3, 4, 10), 100.0, SaleStatus.COMPLETED, PaymentStatus.PAID),  # Monday
+        (datetime(2024, 3, 10, 18), 50.0, SaleStatus.COMPLETED, PaymentStatus.PAID),  # Sunday
+        (datetime(2024, 3, 11, 9), 30.0, SaleStatus.CANCELLED, PaymentStatus.REFUNDED),
+        (datetime(2024, 4, 2, 12), 20.0, SaleStatus.INQUIRY, PaymentStatus.PENDING),
+    ]:
+        db.add(Sale(
+            customer_id=1, total_amount=amount, net_revenue=amount * 0.9,
+            status=status, payment_status=payment, created_at=day,
+        ))
+    db.commit()
+
+
+def test_sales_metrics_come_from_grouped_totals(db):
+    add_sales(db)
+    metrics = SaleService(db).get_sales_metrics(datetime(2024, 3, 1), datetime(2024, 4, 30))
+
+    assert metrics["metrics"]["total_revenue"] == 170.0
+    assert metrics["metrics"]["net_revenue"] == 153.0
+    assert metrics["metrics"]["total_orders"] == 3
+    assert metrics["status_counts"][SaleStatus.COMPLETED.value] == 2
+    assert metrics["status_counts"][SaleStatus.CANCELLED.value] == 1
+    assert metrics["payment_status_counts"][PaymentStatus.PAID.value] == 2
+    assert sum(metrics["status_counts"].values()) == 4
+
+
+def test_revenue_is_bucketed_in_sql(db):
+    add_sales(db)
+    service = SaleService(db)
+    start, end = datetime(2024, 3, 1), datetime(2024, 4, 30)
+
+    weekly = service.get_revenue_by_period("week", start, end)
+    assert [(p["period"], p["revenue"], p["order_count"]) for p in weekly] == [
+        ("2024-03-04", 150.0, 2), ("2024-04-01", 20.0, 1),
+    ]
+    monthly = service.get_revenue_by_period("month", start, end)
+    assert [(p["period"], p["revenue"]) for p in monthly] == [("2024-03-01", 150.0), ("2024-04-01", 20.0)]
+    assert [p["period"] for p in service.get_revenue_by_period("day", start, end)] == [
+        "2024-03-04", "2024-03-10", "2024-04-02",
+    ]
+    with pytest.raises(ValidationException):
+        service.get_revenue_by_period("fortnight", start, end)
+
+
+def test_rollups_match_raw_totals_and_follow_transitions(db):
+    add_sales(db)
+    db.add_all([
+        Product(id=1, name="Wallet", sku="W-1", product_type=ProjectType.WALLET),
+        SaleItem(sale_id=1, name="Wallet", product_id=1, price=80.0, quantity=1),
+        SaleItem(sale_id=1, name="Monogram", type="CUSTOM", price=20.0, quantity=1),
+        Refund(sale_id=2, refund_amount=15.0, reason="Scuffed", status="PROCESSED",
+               refund_date=datetime(2024, 3, 12, 9)),
+        Purchase(supplier_id=7, total=40.0, status=PurchaseStatus.ORDERED,
+                 created_at=datetime(2024, 3, 5)),
+        Purchase(supplier_id=7, total=99.0, status=PurchaseStatus.CANCELLED,
+                 created_at=datetime(2024, 3, 5)),
+    ])
+    db.get(Sale, 2).channel = "etsy"
+    db.commit()
+    rollups = AnalyticsRollupService(db)
+    assert rollups.backfill(datetime(2024, 3, 1), datetime(2024, 4, 30), chunk_days=7) == {
+        "sales_rows": 4, "purchase_rows": 1,
+    }
+
+    monthly = rollups.get_period_totals(datetime(2024, 3, 1), datetime(2024, 4, 30))
+    metrics = SaleService(db).get_sales_metrics(datetime(2024, 3, 1), datetime(2024, 4, 30))
+    assert sum(p["revenue"] for p in monthly.values()) == metrics["metrics"]["total_revenue"]
+    assert sum(p["net_revenue"] for p in monthly.values()) == metrics["metrics"]["net_revenue"]
+    assert monthly["2024-03"]["refunds"] == 15.0
+    assert (monthly["2024-03"]["expenses"], monthly["2024-03"]["purchase_count"]) == (40.0, 1)
+    assert {
+        (row["product_type"], row["order_count"], row["revenue"])
+        for row in rollups.get_sales_breakdown(datetime(2024, 3, 1), datetime(2024, 4, 30), "product_type")
+    } == {("WALLET", 1, 100.0), ("", 2, 70.0)}
+    assert [row["channel"] for row in rollups.get_sales_breakdown(
+        datetime(2024, 3, 1), datetime(2024, 4, 30), "channel"
+    )] == ["", "etsy"]
+
+    # Processing a refund rebuilds the refund day
+    db.add(Refund(id=2, sale_id=1, refund_amount=25.0, reason="Late", status="PENDING"))
+    db.commit()
+    refund = RefundService(db).process_refund(2, "tx-1", "card")
+    today = rollups.get_period_totals(refund.refund_date, refund.refund_date, "day")
+    assert [(p["refunds"], p["sales_count"]) for p in today.values()] == [(25.0, 0)]
+
+
+
+def test_writes_drop_the_cached_sale_detail(db):
+    add_sales(db)
+    cache = CacheService(config={"maintenance_interval": 0})
+    customers = CustomerService(db, cache_service=cache)
+    sales = SaleService(db, cache_service=cache, customer_service=customers)
+
+    cache.set("Sale:detail:4", {"channel": None})
+    sales.update(4, {"channel": "etsy"})
+    assert cache.get("Sale:detail:4") is None
+
+    # Sale detail embeds the customer, so customer writes drop it too
+    cache.set("Sale:detail:4", {"customer": {"name": "Ada"}})
+    customers.update_customer(1, {"name": "Ada Lovelace"})
+    assert cache.get("Sale:detail:4") is None
@@ -0,0 +1,93 @@
+# tests/test_settings_service.py
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from app.db.models.settings import SettingsDefinition, SettingsValue
+from app.services.cache_service import CacheService
+from app.services.settings_service import SettingsService
+
+TEST_DATABASE_URL = "sqlite://"
+
+engine = create_engine(TEST_DATABASE_URL)
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+@pytest.fixture()
+def db():
+    SettingsDefinition.__table__.create(bind=engine)
+    SettingsValue.__table__.create(bind=engine)
+    session = TestingSessionLocal()
+    yield session
+    session.close()
+    SettingsValue.__table__.drop(bind=engine)
+    SettingsDefinition.__table__.drop(bind=engine)
+
+
+@pytest.fixture()
+def query_counter():
+    statements = []
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", count)
+    yield statements
+    event.remove(engine, "before_cursor_execute", count)
+
+
+def add_definition(db, key, default):
+    definition = SettingsDefinition(key=key, name=key, data_type="json", applies_to="all")
+    definition.default_value = default
+    db.add(definition)
+
+
+def add_value(db, scope_type, scope_id, key, value):
+    setting_value = SettingsValue(scope_type=scope_type, scope_id=scope_id, setting_key=key)
+    setting_value.value = value
+    db.add(setting_value)
+
+
+def test_resolved_settings_follow_scope_chain_in_one_query(db, query_counter):
+    for key in ("theme", "page_size", "currency", "locale"):
+        add_definition(db, key, f"default {key}")
+    db.flush()
+    add_value(db, "system", "1", "theme", "light")
+    add_value(db, "system", "1", "page_size", 50)
+    add_value(db, "organization", "7", "page_size", 25)
+    add_value(db, "organization", "7", "currency", "EUR")
+    add_value(db, "user", "3", "currency", "USD")
+    add_value(db, "user", "4", "locale", "de")
+    db.commit()
+
+    service = SettingsService(db)
+    query_counter.clear()
+    resolved = service.get_resolved_settings(user_id=3, organization_id=7)
+
+    assert len(query_counter) == 1
+    assert resolved == {
+        "theme": "light",
+        "page_size": 25,
+        "currency": "USD",
+        "locale": "default locale",
+    }
+
+    # Memoized for the rest of the request
+    service.get_resolved_settings(user_id=3, organization_id=7)
+    assert len(query_counter) == 1
+
+
+def test_resolved_settings_cache_is_invalidated_by_writes(db):
+    add_definition(db, "currency", "GBP")
+    db.commit()
+    cache = CacheService(config={"maintenance_interval": 0})
+
+    assert SettingsService(db, cache_service=cache).get_resolved_settings(user_id=3)["currency"] == "GBP"
+
+    SettingsService(db, cache_service=cache).set_setting("currency", "USD", "user", "3")
+    assert SettingsService(db, cache_service=cache).get_resolved_settings(user_id=3)["currency"] == "USD"
+
+    SettingsService(db, cache_service=cache).set_setting("currency", "EUR", "system", "1")
+    assert SettingsService(db, cache_service=cache).get_resolved_settings(user_id=4)["currency"] == "EUR"
+    assert SettingsService(db, cache_service=cache).get_resolved_settings(user_id=3)["currency"] == "USD"
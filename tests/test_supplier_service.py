@@ -0,0 +1,114 @@
+# tests/test_supplier_service.py
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.db.models.analytics_rollup import PurchaseDailyRollup
+from app.db.models.base import Base
+from app.db.models.enums import PurchaseStatus
+from app.db.models.purchase import Purchase, PurchaseItem
+from app.db.models.supplier import Supplier
+from app.db.models.supplier_history import SupplierHistory
+from app.db.models.supplier_performance import SupplierPerformance
+from app.db.models.supplier_rating import SupplierRating
+from app.repositories.supplier_rating_repository import SupplierRatingRepository
+from app.services.purchase_service import PurchaseService
+from app.services.supplier_performance_service import SupplierPerformanceService
+from app.services.supplier_service import SupplierService
+
+engine = create_engine(
+    "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+)
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+TABLES = [
+    model.__table__
+    for model in (
+        Supplier, SupplierHistory, SupplierRating, SupplierPerformance,
+        Purchase, PurchaseItem, PurchaseDailyRollup,
+    )
+]
+
+
+@pytest.fixture()
+def db():
+    Base.metadata.create_all(bind=engine, tables=TABLES)
+    session = TestingSessionLocal()
+    yield session
+    session.close()
+    Base.metadata.drop_all(bind=engine, tables=TABLES)
+
+
+def add_suppliers(db):
+    db.add_all([
+        Supplier(id=1, name="Tannery", category="LEATHER", rating=1),
+        Supplier(id=2, name="Buckles", category="HARDWARE", rating=1),
+    ])
+    now = datetime.now()
+    for purchase_id, supplier_id, ordered_days_ago, due_in_days in [
+        (1, 1, 10, 0),   # received today, due today: on time
+        (2, 1, 4, -2),   # due two days ago: late
+        (3, 2, 6, None),  # no expected delivery date
+    ]:
+        db.add(Purchase(
+            id=purchase_id, supplier_id=supplier_id, total=100.0,
+            status=PurchaseStatus.IN_TRANSIT,
+            date=now - timedelta(days=ordered_days_ago),
+            delivery_date=(
+                now + timedelta(days=due_in_days) if due_in_days is not None else None
+            ),
+        ))
+    db.commit()
+
+
+def test_receipts_update_running_lead_time_and_on_time_aggregates(db):
+    add_suppliers(db)
+    purchases = PurchaseService(db)
+    for purchase_id in (1, 2, 3):
+        purchases.update_purchase(purchase_id, {"status": PurchaseStatus.RECEIVED})
+    # Moving on from received does not count the purchase again
+    purchases.update_purchase(1, {"status": PurchaseStatus.COMPLETE})
+
+    tannery, buckles = SupplierPerformanceService(db).get_supplier_performance()
+    assert tannery["receipts"] == 2
+    assert tannery["avg_lead_time"] == pytest.approx(7.0, abs=0.1)
+    assert tannery["lead_time_stddev"] == pytest.approx(3.0, abs=0.1)
+    assert tannery["on_time_delivery_rate"] == 50.0
+    assert buckles["receipts"] == 1
+    assert buckles["on_time_delivery_rate"] is None
+
+    statistics = SupplierService(db).get_supplier_statistics()
+    assert statistics["delivery_performance"]["receipts"] == 3
+    assert statistics["delivery_performance"]["on_time_delivery_rate"] == 50.0
+    assert statistics["category_distribution"] == {"LEATHER": 1, "HARDWARE": 1}
+    assert statistics["total_suppliers"] == 2
+
+
+def test_ratings_keep_a_moving_average_that_ranks_suppliers(db):
+    add_suppliers(db)
+    service = SupplierService(
+        db, supplier_rating_repository=SupplierRatingRepository(db)
+    )
+    for supplier_id, rating in [(1, 5), (1, 3), (2, 4), (2, 5)]:
+        service.update_supplier_rating(supplier_id, rating)
+
+    top = service.get_top_suppliers(limit=5, min_ratings=2)
+    assert [supplier.id for supplier in top] == [1, 2]
+    assert [s.id for s in service.get_top_suppliers(category="LEATHER", min_ratings=1)] == [1]
+
+    incremental = {
+        row.supplier_id: (row.rating_count, row.rating_ema)
+        for row in db.query(SupplierPerformance)
+    }
+    assert incremental == {1: (2, pytest.approx(4.4)), 2: (2, pytest.approx(4.3))}
+
+    # Rebuilding from the rating history gives the same aggregates
+    assert SupplierPerformanceService(db).rebuild() == 2
+    db.expire_all()
+    rebuilt = {
+        row.supplier_id: (row.rating_count, row.rating_ema)
+        for row in db.query(SupplierPerformance)
+    }
+    assert rebuilt == incremental
@@ -0,0 +1,51 @@
+# tests/test_tool_service.py
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.db.models.base import Base
+from app.db.models.enums import ToolCategory
+from app.db.models.inventory import Inventory
+from app.db.models.material import Material
+from app.db.models.product import Product
+from app.db.models.tool import Tool, ToolCheckout, ToolMaintenance
+from app.services.cache_service import CacheService
+from app.services.tool_service import ToolService
+
+engine = create_engine(
+    "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+)
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Tool.inventory is joined-loaded, and Inventory joins its product and material
+TABLES = [
+    model.__table__
+    for model in (Tool, ToolCheckout, ToolMaintenance, Inventory, Product, Material)
+]
+
+
+@pytest.fixture()
+def db():
+    Base.metadata.create_all(bind=engine, tables=TABLES)
+    session = TestingSessionLocal()
+    yield session
+    session.close()
+    Base.metadata.drop_all(bind=engine, tables=TABLES)
+
+
+def test_get_tool_does_not_serve_a_cached_row_after_an_update(db):
+    db.add(Tool(id=1, name="Edger", category=ToolCategory.CUTTING, status="IN_STOCK"))
+    db.commit()
+    cache = CacheService(config={"maintenance_interval": 0})
+
+    # Each request gets its own session but shares the cache
+    def get_tool_name(tool_id):
+        session = TestingSessionLocal()
+        try:
+            return ToolService(session, cache_service=cache).get_tool(tool_id).name
+        finally:
+            session.close()
+
+    assert get_tool_name(1) == "Edger"
+    ToolService(db, cache_service=cache).update_tool(1, {"name": "Round edger"}, user_id=1)
+    assert get_tool_name(1) == "Round edger"
@@ -0,0 +1,139 @@
+# tests/test_workflow_resource_service.py
+from datetime import date, datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.core.events import EventBus, ToolReturned
+from app.db.models.base import Base
+from app.db.models.dynamic_material import DynamicMaterial
+from app.db.models.enums import ToolCategory
+from app.db.models.tool import Tool, ToolCheckout, ToolMaintenance
+from app.db.models.workflow import WorkflowExecution
+from app.services.dynamic_material_service import DynamicMaterialService
+from app.services.workflow_resource_service import WorkflowResourceService
+
+engine = create_engine(
+    "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+)
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+TABLES = [
+    model.__table__
+    for model in (DynamicMaterial, Tool, ToolCheckout, ToolMaintenance, WorkflowExecution)
+]
+
+
+@pytest.fixture()
+def db():
+    Base.metadata.create_all(bind=engine, tables=TABLES)
+    WorkflowResourceService.clear_readiness_cache()
+    session = TestingSessionLocal()
+    yield session
+    session.close()
+    Base.metadata.drop_all(bind=engine, tables=TABLES)
+
+
+def requirement(material_id, quantity):
+    return {"material_id": material_id, "total_quantity": quantity, "unit": "sqft",
+            "any_required": True}
+
+
+def tool_requirement(tool_id):
+    return {"tool_id": tool_id, "total_usage_time": 30, "any_required": True}
+
+
+def test_material_availability_subtracts_active_reservations(db):
+    db.add_all([
+        DynamicMaterial(id=1, material_type_id=1, name="Veg tan", quantity=10, unit="sqft"),
+        DynamicMaterial(id=2, material_type_id=1, name="Thread", quantity=5, unit="m"),
+    ])
+    for status, reservation_status in [("active", "active"), ("paused", "active"),
+                                       ("active", "released"), ("completed", "active")]:
+        db.add(WorkflowExecution(
+            workflow_id=1, started_by=1, status=status,
+            execution_data={"resource_reservations": {
+                "status": reservation_status,
+                "material_reservations": [
+                    {"material_id": 1, "quantity": 3, "status": "reserved"},
+                ],
+            }},
+        ))
+    db.commit()
+
+    availability = WorkflowResourceService(db)._check_material_availability(
+        [requirement(1, 5), requirement(2, 5), requirement(3, 1)]
+    )
+    veg_tan, thread, missing = availability
+    assert (veg_tan["on_hand_quantity"], veg_tan["reserved_quantity"]) == (10, 6)
+    assert veg_tan["available_quantity"] == 4
+    assert not veg_tan["available"]
+    assert thread["available"] and thread["reserved_quantity"] == 0
+    assert not missing["available"] and missing["name"] == "Material_3"
+
+
+def test_tool_availability_uses_checkouts_and_maintenance_windows(db):
+    today = date.today()
+    db.add_all([
+        Tool(id=tool_id, name=name, category=ToolCategory.CUTTING, status=status)
+        for tool_id, name, status in [
+            (1, "Free knife", "IN_STOCK"),
+            (2, "Borrowed knife", "CHECKED_OUT"),
+            (3, "Project knife", "CHECKED_OUT"),
+            (4, "Knife in service", "IN_STOCK"),
+            (5, "Lost knife", "LOST"),
+        ]
+    ])
+    for tool_id, project_id in [(2, 8), (3, 7)]:
+        db.add(ToolCheckout(
+            tool_id=tool_id, checked_out_by="Ada", project_id=project_id,
+            checked_out_date=datetime.now(), due_date=today + timedelta(days=3),
+        ))
+    db.add_all([
+        ToolMaintenance(tool_id=4, maintenance_type="SHARPENING", status="SCHEDULED", date=today),
+        ToolMaintenance(tool_id=1, maintenance_type="SHARPENING", status="SCHEDULED",
+                        date=today + timedelta(days=10)),
+        ToolMaintenance(tool_id=1, maintenance_type="REPAIR", status="COMPLETED",
+                        date=today - timedelta(days=1)),
+    ])
+    db.commit()
+
+    availability = WorkflowResourceService(db)._check_tool_availability(
+        [tool_requirement(tool_id) for tool_id in (1, 2, 3, 4, 5, 6)], project_id=7
+    )
+    by_id = {tool["tool_id"]: tool for tool in availability}
+    assert [tool_id for tool_id, tool in by_id.items() if tool["available"]] == [1, 3]
+    assert by_id[1]["availability_window"]["next_maintenance"] == (
+        today + timedelta(days=10)
+    ).isoformat()
+    assert by_id[2]["unavailable_reason"] == "checked_out"
+    assert by_id[2]["availability_window"]["available_from"] == (
+        today + timedelta(days=3)
+    ).isoformat()
+    assert by_id[4]["unavailable_reason"] == "maintenance"
+    assert by_id[5]["unavailable_reason"] == "lost"
+    assert by_id[6]["unavailable_reason"] == "not_found"
+
+
+def test_cached_readiness_is_dropped_by_resource_events(db):
+    service = WorkflowResourceService(db)
+    for workflow_id, material_id, tool_id in [(1, 10, 20), (2, 11, 21)]:
+        analysis = {
+            "material_requirements": [{"material_id": material_id}],
+            "tool_requirements": [{"tool_id": tool_id}],
+        }
+        generation = service._get_cached_readiness(workflow_id)[1]
+        service._cache_readiness(workflow_id, analysis, {"workflow_id": workflow_id}, generation)
+    assert service.check_execution_readiness(1) == {"workflow_id": 1}
+
+    bus = EventBus()
+    WorkflowResourceService.subscribe_to_events(bus)
+    bus.publish(ToolReturned(checkout_id=1, tool_id=20))
+    assert service._get_cached_readiness(1)[0] is None
+    assert service._get_cached_readiness(2)[0] == {"workflow_id": 2}
+
+    db.add(DynamicMaterial(id=11, material_type_id=1, name="Thread", quantity=5, unit="m"))
+    db.commit()
+    DynamicMaterialService(db, event_bus=bus).adjust_stock(11, -4, notes="Torn")
+    assert service._get_cached_readiness(2)[0] is None